@@ -7,18 +7,17 @@ with the Total Battle game. It handles:
 - Text input and deletion
 - Coordinate input
 - Window-relative positioning
+- Batched input with explicit per-action delays (see input_dispatcher.py)
 
 The actions are designed to work with both the browser and standalone versions of the game,
 taking into account DPI scaling and window positioning.
 """
 
-from typing import Tuple, Optional
-import pyautogui
-import pydirectinput
-from time import sleep
+from typing import Tuple, Optional, Callable, List
 import logging
 from scout.window_manager import WindowManager
 from scout.config_manager import ConfigManager
+from scout.input_dispatcher import InputDispatcher
 
 logger = logging.getLogger(__name__)
 
@@ -38,26 +37,48 @@ class GameActions:
     - Window positioning
     - Input timing and delays
     - Error handling and logging
+    
+    All input goes through an InputDispatcher: each action is sent as one
+    batch, and its delays are explicit pauses of that action (there is no
+    global pause after every input call).
     """
     
-    def __init__(self, window_manager: WindowManager):
+    def __init__(self, window_manager: WindowManager, dispatcher: Optional[InputDispatcher] = None):
         """
         Initialize the GameActions controller.
         
         Args:
             window_manager: WindowManager instance for window tracking and coordinate conversion
+            dispatcher: Input dispatcher (default: SendInput on Windows, dry run elsewhere)
         """
         self.window_manager = window_manager
         self.config_manager = ConfigManager()
+        self.input = dispatcher or InputDispatcher()
+        
+        # Default delays in seconds (each action accepts its own)
+        self.click_delay = 0.05  # Between moving the cursor and pressing the button
+        self.type_delay = 0.03  # Between typed characters (0 sends the text in one batch)
+        self.field_delay = 0.1  # Between the steps of filling in a field (focus, clear, type, confirm)
+        self.move_delay = 0.5  # For the game to move the view after coordinate input
         
-        # Configure pyautogui
-        pyautogui.PAUSE = 0.1  # Add small delay between actions
-        pyautogui.FAILSAFE = True  # Enable failsafe corner
+        # Handlers notified after the game view was moved (coordinate input, drag)
+        self._on_movement_handlers: List[Callable[[], None]] = []
         
-        # Default delays (can be adjusted)
-        self.click_delay = 0.2
-        self.type_delay = 0.1
-        self.move_delay = 0.5
+    def _to_screen(self, x: int, y: int, relative_to_window: bool) -> Tuple[int, int]:
+        """
+        Convert coordinates to screen coordinates.
+        
+        Args:
+            x: X coordinate
+            y: Y coordinate
+            relative_to_window: If True, coordinates are relative to game window
+            
+        Returns:
+            Screen coordinates
+        """
+        if relative_to_window:
+            return self.window_manager.client_to_screen(x, y)
+        return x, y
         
     def move_mouse_to(self, x: int, y: int, relative_to_window: bool = True) -> None:
         """
@@ -69,20 +90,15 @@ class GameActions:
             relative_to_window: If True, coordinates are relative to game window
         """
         try:
-            if relative_to_window:
-                # Convert window-relative to screen coordinates
-                screen_x, screen_y = self.window_manager.client_to_screen(x, y)
-            else:
-                screen_x, screen_y = x, y
-                
+            screen_x, screen_y = self._to_screen(x, y, relative_to_window)
             logger.debug(f"Moving mouse to screen coordinates: ({screen_x}, {screen_y})")
-            pyautogui.moveTo(screen_x, screen_y)
+            self.input.move(screen_x, screen_y)
             
         except Exception as e:
             logger.error(f"Failed to move mouse: {e}", exc_info=True)
             
     def click_at(self, x: int, y: int, relative_to_window: bool = True, 
-                button: str = 'left', clicks: int = 1) -> None:
+                button: str = 'left', clicks: int = 1, delay: Optional[float] = None) -> None:
         """
         Click at specified coordinates.
         
@@ -92,24 +108,26 @@ class GameActions:
             relative_to_window: If True, coordinates are relative to game window
             button: Mouse button to click ('left', 'right', 'middle')
             clicks: Number of clicks to perform
+            delay: Pause between moving and clicking (default: click_delay)
         """
         try:
-            self.move_mouse_to(x, y, relative_to_window)
-            sleep(self.click_delay)
-            pyautogui.click(button=button, clicks=clicks)
+            screen_x, screen_y = self._to_screen(x, y, relative_to_window)
+            settle = self.click_delay if delay is None else delay
+            self.input.click(screen_x, screen_y, button=button, clicks=clicks, settle=settle)
             
         except Exception as e:
             logger.error(f"Failed to click at position: {e}", exc_info=True)
             
-    def input_text(self, text: str) -> None:
+    def input_text(self, text: str, interval: Optional[float] = None) -> None:
         """
         Type text at current cursor position.
         
         Args:
             text: Text to type
+            interval: Pause between characters (default: type_delay)
         """
         try:
-            pyautogui.write(text, interval=self.type_delay)
+            self.input.write(text, self.type_delay if interval is None else interval)
             
         except Exception as e:
             logger.error(f"Failed to input text: {e}", exc_info=True)
@@ -117,9 +135,10 @@ class GameActions:
     def clear_text_field(self) -> None:
         """Clear the current text field using Ctrl+A and Backspace."""
         try:
-            pyautogui.hotkey('ctrl', 'a')
-            sleep(self.type_delay)
-            pyautogui.press('backspace')
+            with self.input.batch():
+                self.input.hotkey('ctrl', 'a')
+                self.input.pause(self.type_delay)
+                self.input.key('backspace')
             
         except Exception as e:
             logger.error(f"Failed to clear text field: {e}", exc_info=True)
@@ -141,16 +160,20 @@ class GameActions:
             input_x = input_settings.get('input_field_x', 0)
             input_y = input_settings.get('input_field_y', 0)
             
-            # Click the input field
+            # Click the field, replace its text and confirm, giving the game
+            # time to focus, clear and take each step
             logger.debug(f"Clicking coordinate input field at ({input_x}, {input_y})")
-            self.click_at(input_x, input_y, relative_to_window=False)
-            
-            # Clear existing text and input new coordinates
-            self.clear_text_field()
-            self.input_text(f"{x},{y}")
-            pyautogui.press('enter')
+            with self.input.batch():
+                self.click_at(input_x, input_y, relative_to_window=False)
+                self.input.pause(self.field_delay)
+                self.clear_text_field()
+                self.input.pause(self.field_delay)
+                self.input_text(f"{x},{y}")
+                self.input.pause(self.field_delay)
+                self.input.key('enter')
+                self.input.pause(self.move_delay)  # Wait for game to process
             
-            sleep(self.move_delay)  # Wait for game to process
+            self._notify_movement()
             return True
             
         except Exception as e:
@@ -158,7 +181,8 @@ class GameActions:
             return False
             
     def drag_mouse(self, start_x: int, start_y: int, end_x: int, end_y: int, 
-                   relative_to_window: bool = True, duration: float = 0.5) -> None:
+                   relative_to_window: bool = True, duration: float = 0.5,
+                   delay: Optional[float] = None) -> None:
         """
         Perform a mouse drag operation from start to end coordinates.
         
@@ -169,19 +193,36 @@ class GameActions:
             end_y: Ending Y coordinate
             relative_to_window: If True, coordinates are relative to game window
             duration: Duration of the drag operation in seconds
+            delay: Pause between moving to the start and pressing (default: click_delay)
         """
         try:
-            if relative_to_window:
-                start_screen_x, start_screen_y = self.window_manager.client_to_screen(start_x, start_y)
-                end_screen_x, end_screen_y = self.window_manager.client_to_screen(end_x, end_y)
-            else:
-                start_screen_x, start_screen_y = start_x, start_y
-                end_screen_x, end_screen_y = end_x, end_y
+            start_screen_x, start_screen_y = self._to_screen(start_x, start_y, relative_to_window)
+            end_screen_x, end_screen_y = self._to_screen(end_x, end_y, relative_to_window)
                 
             logger.debug(f"Dragging mouse from ({start_screen_x}, {start_screen_y}) to ({end_screen_x}, {end_screen_y})")
-            pyautogui.moveTo(start_screen_x, start_screen_y)
-            sleep(self.click_delay)
-            pyautogui.dragTo(end_screen_x, end_screen_y, duration=duration, button='left')
+            self.input.drag(start_screen_x, start_screen_y, end_screen_x, end_screen_y,
+                            duration=duration, settle=self.click_delay if delay is None else delay)
+            self._notify_movement()
             
         except Exception as e:
-            logger.error(f"Failed to perform mouse drag: {e}", exc_info=True) 
\ No newline at end of file
+            logger.error(f"Failed to perform mouse drag: {e}", exc_info=True)
+            
+    def register_on_movement(self, handler: Callable[[], None]) -> None:
+        """
+        Register a handler called after the game view was moved.
+        
+        Handlers run after coordinate input and mouse drags complete, e.g. to
+        trigger an OCR update instead of waiting for the next poll.
+        
+        Args:
+            handler: Function taking no arguments
+        """
+        self._on_movement_handlers.append(handler)
+        
+    def _notify_movement(self) -> None:
+        """Call all registered movement handlers."""
+        for handler in self._on_movement_handlers:
+            try:
+                handler()
+            except Exception as e:
+                logger.error(f"Error in movement handler: {e}", exc_info=True) 
\ No newline at end of file
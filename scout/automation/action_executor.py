@@ -9,6 +9,7 @@ This module handles the execution of individual automation actions, including:
 """
 
 from typing import Dict, Optional, List, Callable, Tuple, Any, Union
+from functools import partial
 import time
 import logging
 from dataclasses import dataclass
@@ -19,6 +20,7 @@ from scout.automation.actions import (
     ClickParams, DragParams, TypeParams, WaitParams,
     TemplateSearchParams, OCRWaitParams, ConditionalParams, LoopParams
 )
+from scout.automation.action_handlers_flow import FlowActionHandlers
 
 logger = logging.getLogger(__name__)
 
@@ -51,6 +53,29 @@ class ActionExecutor:
         
         # Internal state
         self._variable_store: Dict[str, Any] = {}
+        
+        # Handler table (looked up once per action type, not per execution).
+        # Frame waits (WAIT_FOR_TEMPLATE, WAIT_FOR_CHANGE) block until a frame
+        # matches, which the timer-driven GUI executor cannot do; without a
+        # handler here the compiler skips them with a warning.
+        self._handlers: Dict[ActionType, Callable[[Any, bool], bool]] = {
+            ActionType.CLICK: self._handle_click,
+            ActionType.RIGHT_CLICK: self._handle_click,
+            ActionType.DOUBLE_CLICK: self._handle_click,
+            ActionType.DRAG: self._handle_drag,
+            ActionType.TYPE_TEXT: self._handle_type,
+            ActionType.WAIT: self._handle_wait,
+            ActionType.TEMPLATE_SEARCH: self._handle_template_search,
+            ActionType.WAIT_FOR_OCR: self._handle_ocr_wait,
+            ActionType.CONDITIONAL: self._handle_conditional,
+            ActionType.LOOP: self._handle_loop,
+        }
+        
+        # Condition evaluation for compiled conditionals and loops
+        self._flow_handlers = FlowActionHandlers(
+            context, log_callback,
+            lambda action, simulate, variable_store: self._dispatch_action(action, simulate)
+        )
     
     def reset_state(self) -> None:
         """Reset the executor state."""
@@ -115,6 +140,66 @@ class ActionExecutor:
             self.last_action_result = False
             return False
     
+    def get_handler(self, action_type: ActionType) -> Optional[Callable[[AutomationAction, bool, Dict[str, Any]], bool]]:
+        """
+        Get a pre-bound handler for an action type (used by the sequence compiler).
+        
+        The returned function has the same logging, result tracking and error
+        handling as execute_action()/simulate_action(), without the lookup.
+        
+        Args:
+            action_type: Type of action
+            
+        Returns:
+            Function taking (action, simulate, variable_store), or None if the
+            action type is not supported
+        """
+        method = self._handlers.get(action_type)
+        if method is None:
+            return None
+        return partial(self._run_handler, method)
+    
+    def _run_handler(self, method: Callable[[Any, bool], bool], action: AutomationAction,
+                     simulate: bool, variable_store: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        Run a bound handler for an action.
+        
+        Args:
+            method: Handler method
+            action: The action to run
+            simulate: Whether to simulate the action
+            variable_store: Store for variables (unused by the basic handlers)
+            
+        Returns:
+            True if the action was successful, False otherwise
+        """
+        try:
+            mode = "Simulating" if simulate else "Executing"
+            self.log_callback(f"{mode} {action.action_type.name}: {action.params.description or 'No description'}")
+            result = method(action.params, simulate)
+            self.last_action_result = result
+            return result
+        except Exception as e:
+            logger.exception(f"Error executing action {action.action_type.name}: {e}")
+            self.log_callback(f"Error executing action: {e}")
+            self.last_action_result = False
+            return False
+    
+    def evaluate_condition(self, condition: str, variable_store: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        Evaluate a condition string (used by compiled conditionals and loops).
+        
+        Args:
+            condition: Condition to evaluate
+            variable_store: Store for variables (defaults to the executor's store)
+            
+        Returns:
+            True if the condition evaluates to true, False otherwise
+        """
+        if variable_store is None:
+            variable_store = self._variable_store
+        return self._flow_handlers._evaluate_condition(condition, variable_store)
+    
     def _validate_action(self, action: AutomationAction) -> bool:
         """
         Validate action parameters.
@@ -152,27 +237,11 @@ class ActionExecutor:
         mode = "Simulating" if simulate else "Executing"
         self.log_callback(f"{mode} {action_type.name}: {action.params.description or 'No description'}")
         
-        # Handle different action types
-        # Note: This will be moved to action_handlers.py in the next step
-        if action_type == ActionType.CLICK:
-            return self._handle_click(action.params, simulate)
-        elif action_type == ActionType.DRAG:
-            return self._handle_drag(action.params, simulate)
-        elif action_type == ActionType.TYPE:
-            return self._handle_type(action.params, simulate)
-        elif action_type == ActionType.WAIT:
-            return self._handle_wait(action.params, simulate)
-        elif action_type == ActionType.TEMPLATE_SEARCH:
-            return self._handle_template_search(action.params, simulate)
-        elif action_type == ActionType.OCR_WAIT:
-            return self._handle_ocr_wait(action.params, simulate)
-        elif action_type == ActionType.CONDITIONAL:
-            return self._handle_conditional(action.params, simulate)
-        elif action_type == ActionType.LOOP:
-            return self._handle_loop(action.params, simulate)
-        else:
+        handler = self._handlers.get(action_type)
+        if handler is None:
             self.log_callback(f"Unknown action type: {action_type}")
             return False
+        return handler(action.params, simulate)
     
     # Placeholder methods for action handlers
     # These will be moved to action_handlers.py in the next step
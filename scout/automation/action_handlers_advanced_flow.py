@@ -16,12 +16,16 @@ import logging
 from typing import Dict, Optional, List, Callable, Tuple, Any, Union
 import re
 import concurrent.futures
+import contextvars
 
 from scout.automation.core import ExecutionContext
 from scout.automation.actions import (
     ActionType, AutomationAction, ActionParamsCommon,
     SwitchCaseParams, TryCatchParams, ParallelExecutionParams, BreakpointParams
 )
+from scout.automation.expressions import evaluate, evaluate_condition, ExpressionError
+from scout.automation.scopes import VariableScope, ScopeConflictError, merge_changes
+from scout.automation.cancellation import CancellationToken, current_token, use_token
 
 logger = logging.getLogger(__name__)
 
@@ -64,10 +68,6 @@ class AdvancedFlowActionHandlers:
             cases = params.cases
             default_actions = params.default_actions
             
-            # Replace variables in expression if variable store is provided
-            if variable_store and isinstance(expression, str):
-                expression = self._replace_variables(expression, variable_store)
-            
             # Log the action
             self.log_callback(
                 f"{'Simulating' if simulate else 'Executing'} switch/case on expression: '{expression}'"
@@ -135,15 +135,15 @@ class AdvancedFlowActionHandlers:
             try_actions = params.try_actions
             catch_actions = params.catch_actions
             finally_actions = params.finally_actions
-            store_error_variable = params.store_error_variable
+            store_error_variable = params.error_variable
             
             # Log the action
             self.log_callback(
                 f"{'Simulating' if simulate else 'Executing'} try/catch block"
             )
             
-            # Create a copy of the variable store
-            local_vars = variable_store.copy() if variable_store else {}
+            # Block writes go to a child scope (nothing is copied up front)
+            local_vars = VariableScope(variable_store)
             
             # Execute try block
             self.log_callback("Executing 'try' block")
@@ -179,10 +179,8 @@ class AdvancedFlowActionHandlers:
                     self.log_callback("Finally block execution failed")
                     return False
             
-            # Update the original variable store with any changes
-            if variable_store:
-                for key, value in local_vars.items():
-                    variable_store[key] = value
+            # Merge the block's changes into the original variable store
+            local_vars.commit()
             
             # Return success if either try succeeded or catch was executed
             return try_success or (not try_success and catch_actions)
@@ -206,7 +204,7 @@ class AdvancedFlowActionHandlers:
             True if all parallel executions succeeded, False otherwise
         """
         try:
-            action_groups = params.action_groups
+            action_groups = params.actions
             max_workers = params.max_workers or 4  # Default to 4 workers
             wait_for_all = params.wait_for_all
             
@@ -220,42 +218,44 @@ class AdvancedFlowActionHandlers:
             if simulate:
                 self.log_callback("Simulation: Executing only the first action group")
                 if action_groups:
-                    return self._execute_action_list(action_groups[0].actions, simulate, variable_store)
+                    return self._execute_action_list(action_groups[0], simulate, variable_store)
                 return True
             
-            # Create a thread-safe copy of the variable store for each group
-            # Each group gets its own copy to avoid conflicts
-            group_variable_stores = []
-            for _ in action_groups:
-                group_variable_stores.append(variable_store.copy() if variable_store else {})
+            # Each group writes to its own child scope of the variable store;
+            # pushing a scope is O(1) and containers are copied only when modified
+            group_scopes = [VariableScope(variable_store) for _ in action_groups]
+            
+            # Each group runs under a child token of the current execution, so a
+            # stop request or a lost race ends it at its next check or sleep
+            parent_token = current_token()
+            group_tokens = [CancellationToken(parent_token) for _ in action_groups]
             
             # Function to execute a single action group
             def execute_group(group_index):
-                group = action_groups[group_index]
-                group_vars = group_variable_stores[group_index]
+                group_vars = group_scopes[group_index]
                 
                 self.log_callback(f"Starting execution of parallel group {group_index+1}")
-                success = self._execute_action_list(group.actions, simulate, group_vars)
+                with use_token(group_tokens[group_index]):
+                    success = self._execute_action_list(action_groups[group_index], simulate, group_vars)
                 self.log_callback(f"Parallel group {group_index+1} completed with success={success}")
                 
                 return success, group_vars
             
             # Execute action groups in parallel
             results = []
-            with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-                futures = [executor.submit(execute_group, i) for i in range(len(action_groups))]
+            completed_scopes = []
+            executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
+            try:
+                # Each worker runs in a copy of the caller's context (profiled action)
+                futures = [executor.submit(contextvars.copy_context().run, execute_group, i)
+                           for i in range(len(action_groups))]
                 
                 # Wait for all futures to complete if wait_for_all is True
                 if wait_for_all:
                     for future in concurrent.futures.as_completed(futures):
                         success, group_vars = future.result()
                         results.append(success)
-                        
-                        # Merge variables back into the main store
-                        # Note: This can cause conflicts if multiple groups modify the same variables
-                        if variable_store:
-                            for key, value in group_vars.items():
-                                variable_store[key] = value
+                        completed_scopes.append(group_vars)
                 else:
                     # Just wait for the first one to complete
                     done, not_done = concurrent.futures.wait(
@@ -263,20 +263,35 @@ class AdvancedFlowActionHandlers:
                     )
                     
                     # Get result from the first completed future
-                    for future in done:
-                        success, group_vars = future.result()
-                        results.append(success)
-                        
-                        # Merge variables back into the main store
-                        if variable_store:
-                            for key, value in group_vars.items():
-                                variable_store[key] = value
-                        
-                        # Cancel remaining futures
-                        for future in not_done:
-                            future.cancel()
-                        
-                        break
+                    success, group_vars = next(iter(done)).result()
+                    results.append(success)
+                    completed_scopes.append(group_vars)
+                    
+                    # Stop the losing groups (running ones return at their next check)
+                    for token in group_tokens:
+                        token.cancel("parallel race finished")
+            finally:
+                # Queued groups never start; cancelled ones are not waited for,
+                # so a race returns as soon as its winner is done
+                executor.shutdown(wait=wait_for_all, cancel_futures=True)
+                for token in group_tokens:
+                    token.release()
+            
+            # Merge the groups' changes in completion order
+            if variable_store is not None:
+                try:
+                    conflicts = merge_changes(
+                        variable_store, [scope.changes() for scope in completed_scopes],
+                        params.conflict_policy
+                    )
+                except ScopeConflictError as e:
+                    self.log_callback(f"Parallel groups conflict: {e}")
+                    return False
+                if conflicts:
+                    self.log_callback(
+                        f"Parallel groups changed the same variables ({', '.join(sorted(conflicts))}), "
+                        f"merged with policy '{params.conflict_policy}'"
+                    )
             
             # Check if all required executions succeeded
             if wait_for_all:
@@ -310,10 +325,8 @@ class AdvancedFlowActionHandlers:
             condition = params.condition
             message = params.message or "Breakpoint reached"
             
-            # Replace variables in condition and message
+            # Replace variables in the message (the condition resolves its own variables)
             if variable_store:
-                if condition:
-                    condition = self._replace_variables(condition, variable_store)
                 message = self._replace_variables(message, variable_store)
             
             # Log the action
@@ -377,7 +390,7 @@ class AdvancedFlowActionHandlers:
     
     def _evaluate_condition(self, condition: str, variable_store: Optional[Dict[str, Any]] = None) -> bool:
         """
-        Evaluate a condition string.
+        Evaluate a condition string (parsed once and cached, see scout.automation.expressions).
         
         Args:
             condition: Condition string to evaluate
@@ -387,58 +400,16 @@ class AdvancedFlowActionHandlers:
             True if the condition evaluates to true, False otherwise
         """
         try:
-            # Replace variables in the condition
-            if variable_store:
-                condition = self._replace_variables(condition, variable_store)
-            
-            # Check for comparison operators
-            if " == " in condition:
-                left, right = condition.split(" == ", 1)
-                return self._parse_value(left.strip()) == self._parse_value(right.strip())
-            elif " != " in condition:
-                left, right = condition.split(" != ", 1)
-                return self._parse_value(left.strip()) != self._parse_value(right.strip())
-            elif " > " in condition:
-                left, right = condition.split(" > ", 1)
-                return self._parse_value(left.strip()) > self._parse_value(right.strip())
-            elif " >= " in condition:
-                left, right = condition.split(" >= ", 1)
-                return self._parse_value(left.strip()) >= self._parse_value(right.strip())
-            elif " < " in condition:
-                left, right = condition.split(" < ", 1)
-                return self._parse_value(left.strip()) < self._parse_value(right.strip())
-            elif " <= " in condition:
-                left, right = condition.split(" <= ", 1)
-                return self._parse_value(left.strip()) <= self._parse_value(right.strip())
-            elif " and " in condition.lower():
-                left, right = condition.lower().split(" and ", 1)
-                return self._evaluate_condition(left.strip(), variable_store) and \
-                       self._evaluate_condition(right.strip(), variable_store)
-            elif " or " in condition.lower():
-                left, right = condition.lower().split(" or ", 1)
-                return self._evaluate_condition(left.strip(), variable_store) or \
-                       self._evaluate_condition(right.strip(), variable_store)
-            elif condition.lower() == "true":
-                return True
-            elif condition.lower() == "false":
-                return False
-            
-            # If it's just a variable name, check if it exists and is truthy
-            if variable_store and condition in variable_store:
-                return bool(variable_store[condition])
-            
-            # Default to false for unknown conditions
-            self.log_callback(f"Unknown condition format: {condition}")
-            return False
-            
-        except Exception as e:
-            logger.exception(f"Error evaluating condition '{condition}': {e}")
+            return evaluate_condition(condition, variable_store)
+        except ExpressionError as e:
+            logger.error(f"Error evaluating condition '{condition}': {e}")
             self.log_callback(f"Condition evaluation failed: {e}")
             return False
     
     def _evaluate_expression(self, expression: Any, variable_store: Optional[Dict[str, Any]] = None) -> Any:
         """
-        Evaluate an expression, which could be a variable reference or a literal value.
+        Evaluate an expression, which could be a variable reference, a literal
+        value or a compound expression.
         
         Args:
             expression: Expression to evaluate
@@ -450,16 +421,12 @@ class AdvancedFlowActionHandlers:
         # If expression is not a string, return it as is
         if not isinstance(expression, str):
             return expression
-            
-        # If it's a variable reference, get the value from the variable store
-        if expression.startswith("${") and expression.endswith("}"):
-            var_name = expression[2:-1]
-            if variable_store and var_name in variable_store:
-                return variable_store[var_name]
-            return None
-            
-        # Otherwise, parse it as a value
-        return self._parse_value(expression)
+        
+        try:
+            return evaluate(expression, variable_store)
+        except ExpressionError:
+            # Free text (e.g. several words) is used as a literal value
+            return self._parse_value(self._replace_variables(expression, variable_store or {}))
     
     def _parse_value(self, value_str: str) -> Any:
         """
@@ -10,6 +10,7 @@ This module implements handlers for basic automation actions:
 
 import time
 import logging
+import random
 from typing import Dict, Optional, List, Callable, Tuple, Any, Union
 import re
 
@@ -18,6 +19,8 @@ from scout.automation.actions import (
     ActionType, AutomationAction, ActionParamsCommon,
     ClickParams, DragParams, TypeParams, WaitParams
 )
+from scout.automation.cancellation import cancellable_sleep
+from scout.automation.profiler import profile_phase
 
 logger = logging.getLogger(__name__)
 
@@ -58,15 +61,17 @@ class BasicActionHandlers:
             if not simulate:
                 # Perform the actual click
                 if self.context.input_controller:
-                    self.context.input_controller.click(x, y)
+                    with profile_phase("input"):
+                        self.context.input_controller.click(x, y, params.button)
                 else:
                     self.log_callback("No input controller available")
                     return False
             
             # Add delay if specified
             if params.delay_after > 0:
-                if not simulate:
-                    time.sleep(params.delay_after / 1000.0)  # Convert to seconds
+                if not simulate and not cancellable_sleep(params.delay_after / 1000.0):  # Convert to seconds
+                    self.log_callback("Delay cancelled")
+                    return False
                 self.log_callback(f"Delayed for {params.delay_after}ms")
             
             return True
@@ -90,30 +95,32 @@ class BasicActionHandlers:
         try:
             start_x, start_y = params.start_x, params.start_y
             end_x, end_y = params.end_x, params.end_y
-            duration_ms = params.duration_ms
+            duration = params.duration
             
             # Log the action
             self.log_callback(
                 f"{'Simulating' if simulate else 'Executing'} drag from "
-                f"({start_x}, {start_y}) to ({end_x}, {end_y}) over {duration_ms}ms"
+                f"({start_x}, {start_y}) to ({end_x}, {end_y}) over {duration}s"
             )
             
             if not simulate:
                 # Perform the actual drag
                 if self.context.input_controller:
-                    self.context.input_controller.drag(
-                        start_x, start_y, 
-                        end_x, end_y, 
-                        duration_ms / 1000.0  # Convert to seconds
-                    )
+                    with profile_phase("input"):
+                        self.context.input_controller.drag(
+                            start_x, start_y, 
+                            end_x, end_y, 
+                            duration
+                        )
                 else:
                     self.log_callback("No input controller available")
                     return False
             
             # Add delay if specified
             if params.delay_after > 0:
-                if not simulate:
-                    time.sleep(params.delay_after / 1000.0)  # Convert to seconds
+                if not simulate and not cancellable_sleep(params.delay_after / 1000.0):  # Convert to seconds
+                    self.log_callback("Delay cancelled")
+                    return False
                 self.log_callback(f"Delayed for {params.delay_after}ms")
             
             return True
@@ -148,15 +155,17 @@ class BasicActionHandlers:
             if not simulate:
                 # Perform the actual typing
                 if self.context.input_controller:
-                    self.context.input_controller.type_text(text)
+                    with profile_phase("input"):
+                        self.context.input_controller.type_text(text)
                 else:
                     self.log_callback("No input controller available")
                     return False
             
             # Add delay if specified
             if params.delay_after > 0:
-                if not simulate:
-                    time.sleep(params.delay_after / 1000.0)  # Convert to seconds
+                if not simulate and not cancellable_sleep(params.delay_after / 1000.0):  # Convert to seconds
+                    self.log_callback("Delay cancelled")
+                    return False
                 self.log_callback(f"Delayed for {params.delay_after}ms")
             
             return True
@@ -178,14 +187,18 @@ class BasicActionHandlers:
             True if the action was successful, False otherwise
         """
         try:
-            duration_ms = params.duration_ms
+            duration = params.duration
+            if params.random_variation:
+                duration = max(0.0, duration + random.uniform(-params.random_variation, params.random_variation))
             
             # Log the action
-            self.log_callback(f"{'Simulating' if simulate else 'Executing'} wait for {duration_ms}ms")
+            self.log_callback(f"{'Simulating' if simulate else 'Executing'} wait for {duration:.2f}s")
             
             if not simulate:
-                # Perform the actual wait
-                time.sleep(duration_ms / 1000.0)  # Convert to seconds
+                # Perform the actual wait (returns early when execution is cancelled)
+                if not cancellable_sleep(duration):
+                    self.log_callback("Wait cancelled")
+                    return False
             
             return True
             
@@ -22,6 +22,8 @@ from dataclasses import dataclass, field
 
 from scout.automation.core import ExecutionContext
 from scout.automation.actions import ActionType, AutomationAction, ActionParamsCommon
+from scout.automation.expressions import evaluate, ExpressionError
+from scout.automation.scopes import mutable_value
 
 logger = logging.getLogger(__name__)
 
@@ -428,7 +430,7 @@ class DataActionHandlers:
                 
                 # Append the value
                 if not simulate:
-                    variable_store[list_var].append(input_value)
+                    mutable_value(variable_store, list_var).append(input_value)
                     self.log_callback(f"Appended '{input_value}' to list '{list_var}'")
             
             elif operation == "get":
@@ -487,7 +489,7 @@ class DataActionHandlers:
                 
                 # Clear the list
                 if not simulate:
-                    variable_store[list_var].clear()
+                    mutable_value(variable_store, list_var).clear()
                     self.log_callback(f"Cleared list '{list_var}'")
             
             else:
@@ -547,7 +549,7 @@ class DataActionHandlers:
                 
                 # Set the key-value pair
                 if not simulate:
-                    variable_store[dict_var][processed_key] = processed_value
+                    mutable_value(variable_store, dict_var)[processed_key] = processed_value
                     self.log_callback(f"Set '{processed_key}' to '{processed_value}' in dictionary '{dict_var}'")
             
             elif operation == "get":
@@ -656,7 +658,7 @@ class DataActionHandlers:
                 
                 # Clear the dictionary
                 if not simulate:
-                    variable_store[dict_var].clear()
+                    mutable_value(variable_store, dict_var).clear()
                     self.log_callback(f"Cleared dictionary '{dict_var}'")
             
             elif operation == "delete":
@@ -680,7 +682,7 @@ class DataActionHandlers:
                 
                 # Delete the key
                 if not simulate:
-                    del variable_store[dict_var][processed_key]
+                    del mutable_value(variable_store, dict_var)[processed_key]
                     self.log_callback(f"Deleted key '{processed_key}' from dictionary '{dict_var}'")
             
             else:
@@ -1093,52 +1095,21 @@ class DataActionHandlers:
         """
         Safely evaluate an expression with variables.
         
+        Expressions are parsed once by scout.automation.expressions and cached;
+        variables are read from the store directly (no copy, no eval).
+        
         Args:
             expression: Expression to evaluate
             variable_store: Store of variables
             
         Returns:
             Result of the evaluation
+            
+        Raises:
+            ValueError: If the expression is invalid or cannot be evaluated
         """
         try:
-            # Create a safe environment with limited builtins
-            safe_globals = {
-                "__builtins__": {
-                    "abs": abs,
-                    "bool": bool,
-                    "float": float,
-                    "int": int,
-                    "len": len,
-                    "max": max,
-                    "min": min,
-                    "round": round,
-                    "str": str,
-                    "sum": sum
-                }
-            }
-            
-            # Add math functions
-            import math
-            safe_globals.update({
-                "math": {
-                    "ceil": math.ceil,
-                    "floor": math.floor,
-                    "sqrt": math.sqrt,
-                    "sin": math.sin,
-                    "cos": math.cos,
-                    "tan": math.tan,
-                    "pi": math.pi,
-                    "e": math.e
-                }
-            })
-            
-            # Use variable store as locals
-            safe_locals = variable_store.copy() if variable_store else {}
-            
-            # Evaluate the expression
-            return eval(expression, safe_globals, safe_locals)
-            
-        except Exception as e:
-            logger.exception(f"Error evaluating expression '{expression}': {e}")
+            return evaluate(expression, variable_store)
+        except ExpressionError as e:
+            logger.error(f"Error evaluating expression '{expression}': {e}")
             raise ValueError(f"Error evaluating expression: {e}")
-        
\ No newline at end of file
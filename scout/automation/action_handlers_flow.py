@@ -13,13 +13,15 @@ and iteration requirements.
 import time
 import logging
 from typing import Dict, Optional, List, Callable, Tuple, Any, Union
-import re
 
 from scout.automation.core import ExecutionContext
 from scout.automation.actions import (
     ActionType, AutomationAction, ActionParamsCommon,
     ConditionalParams, LoopParams
 )
+from scout.automation.compiler import build_actions
+from scout.automation.expressions import evaluate_condition, ExpressionError
+from scout.automation.scopes import VariableScope
 
 logger = logging.getLogger(__name__)
 
@@ -41,7 +43,6 @@ class FlowActionHandlers:
         self.context = context
         self.log_callback = log_callback
         self.execute_action_callback = execute_action_callback
-        self.variable_pattern = re.compile(r'\${([^}]+)}')
     
     def handle_if_condition(self, params: ConditionalParams, simulate: bool, 
                            variable_store: Optional[Dict[str, Any]] = None) -> bool:
@@ -105,28 +106,33 @@ class FlowActionHandlers:
         try:
             # Extract parameters
             count = params.count if hasattr(params, 'count') else 1
-            actions = params.actions if hasattr(params, 'actions') else []
+            # Parse the body once, not on every iteration
+            actions = build_actions(params.actions) if hasattr(params, 'actions') else []
             
             # Log the action
             self.log_callback(
                 f"{'Simulating' if simulate else 'Executing'} repeat loop: {count} iterations"
             )
             
-            # Execute the loop
-            for i in range(count):
-                self.log_callback(f"Loop iteration {i+1}/{count}")
-                
-                # Execute the actions
-                if actions:
-                    result = self._execute_action_list(actions, simulate, variable_store)
-                    if not result:
-                        self.log_callback(f"Loop iteration {i+1} failed, breaking loop")
+            # Execute the loop in an O(1) child scope, merged back when the loop ends
+            scope = VariableScope(variable_store)
+            try:
+                for i in range(count):
+                    self.log_callback(f"Loop iteration {i+1}/{count}")
+                    
+                    # Execute the actions
+                    if actions:
+                        result = self._execute_action_list(actions, simulate, scope)
+                        if not result:
+                            self.log_callback(f"Loop iteration {i+1} failed, breaking loop")
+                            return False
+                    
+                    # Check if we should continue
+                    if self.context.should_stop():
+                        self.log_callback("Execution stopped, breaking loop")
                         return False
-                
-                # Check if we should continue
-                if self.context.should_stop():
-                    self.log_callback("Execution stopped, breaking loop")
-                    return False
+            finally:
+                scope.commit()
             
             return True
             
@@ -151,7 +157,8 @@ class FlowActionHandlers:
         try:
             # Extract parameters
             condition = params.condition if hasattr(params, 'condition') else "False"
-            actions = params.actions if hasattr(params, 'actions') else []
+            # Parse the body once, not on every iteration
+            actions = build_actions(params.actions) if hasattr(params, 'actions') else []
             max_iterations = params.max_iterations if hasattr(params, 'max_iterations') else 100
             
             # Log the action
@@ -159,28 +166,32 @@ class FlowActionHandlers:
                 f"{'Simulating' if simulate else 'Executing'} while loop: condition '{condition}'"
             )
             
-            # Execute the loop
+            # Execute the loop in an O(1) child scope, merged back when the loop ends
+            scope = VariableScope(variable_store)
             iteration = 0
-            while self._evaluate_condition(condition, variable_store):
-                iteration += 1
-                self.log_callback(f"Loop iteration {iteration}")
-                
-                # Check max iterations
-                if iteration > max_iterations:
-                    self.log_callback(f"Reached maximum iterations ({max_iterations}), breaking loop")
-                    return False
-                
-                # Execute the actions
-                if actions:
-                    result = self._execute_action_list(actions, simulate, variable_store)
-                    if not result:
-                        self.log_callback(f"Loop iteration {iteration} failed, breaking loop")
+            try:
+                while self._evaluate_condition(condition, scope):
+                    iteration += 1
+                    self.log_callback(f"Loop iteration {iteration}")
+                    
+                    # Check max iterations
+                    if iteration > max_iterations:
+                        self.log_callback(f"Reached maximum iterations ({max_iterations}), breaking loop")
                         return False
-                
-                # Check if we should continue
-                if self.context.should_stop():
-                    self.log_callback("Execution stopped, breaking loop")
-                    return False
+                    
+                    # Execute the actions
+                    if actions:
+                        result = self._execute_action_list(actions, simulate, scope)
+                        if not result:
+                            self.log_callback(f"Loop iteration {iteration} failed, breaking loop")
+                            return False
+                    
+                    # Check if we should continue
+                    if self.context.should_stop():
+                        self.log_callback("Execution stopped, breaking loop")
+                        return False
+            finally:
+                scope.commit()
             
             return True
             
@@ -235,12 +246,8 @@ class FlowActionHandlers:
         Returns:
             True if all actions succeeded, False otherwise
         """
-        for action in actions:
-            # Convert action dict to AutomationAction if needed
-            if isinstance(action, dict):
-                from scout.automation.actions import create_action_from_dict
-                action = create_action_from_dict(action)
-            
+        # Convert action dicts to AutomationActions (a no-op for parsed actions)
+        for action in build_actions(actions):
             # Execute the action
             result = self.execute_action_callback(action, simulate, variable_store)
             if not result:
@@ -256,6 +263,9 @@ class FlowActionHandlers:
         """
         Evaluate a condition string.
         
+        The condition is parsed once (see scout.automation.expressions) and
+        the compiled form is reused, so while loops re-evaluate it cheaply.
+        
         Args:
             condition: Condition string to evaluate
             variable_store: Store for variables
@@ -264,79 +274,8 @@ class FlowActionHandlers:
             True if the condition evaluates to true, False otherwise
         """
         try:
-            # Replace variables in the condition
-            if variable_store and '${' in condition:
-                for match in self.variable_pattern.finditer(condition):
-                    var_name = match.group(1)
-                    if var_name in variable_store:
-                        var_value = variable_store[var_name]
-                        # Handle different types of values
-                        if isinstance(var_value, str):
-                            replacement = f"'{var_value}'"
-                        else:
-                            replacement = str(var_value)
-                        condition = condition.replace(f"${{{var_name}}}", replacement)
-            
-            # Check for comparison operators
-            if " == " in condition:
-                left, right = condition.split(" == ", 1)
-                return self._parse_value(left.strip()) == self._parse_value(right.strip())
-            elif " != " in condition:
-                left, right = condition.split(" != ", 1)
-                return self._parse_value(left.strip()) != self._parse_value(right.strip())
-            elif " > " in condition:
-                left, right = condition.split(" > ", 1)
-                return self._parse_value(left.strip()) > self._parse_value(right.strip())
-            elif " >= " in condition:
-                left, right = condition.split(" >= ", 1)
-                return self._parse_value(left.strip()) >= self._parse_value(right.strip())
-            elif " < " in condition:
-                left, right = condition.split(" < ", 1)
-                return self._parse_value(left.strip()) < self._parse_value(right.strip())
-            elif " <= " in condition:
-                left, right = condition.split(" <= ", 1)
-                return self._parse_value(left.strip()) <= self._parse_value(right.strip())
-            
-            # Check for boolean value
-            if condition.lower() == "true":
-                return True
-            if condition.lower() == "false":
-                return False
-            
-            # If it's just a variable name, check if it exists and is truthy
-            if variable_store and condition in variable_store:
-                return bool(variable_store[condition])
-            
-            # Default to false for unknown conditions
-            self.log_callback(f"Unknown condition format: {condition}")
-            return False
-            
-        except Exception as e:
-            logger.exception(f"Error evaluating condition '{condition}': {e}")
+            return evaluate_condition(condition, variable_store)
+        except ExpressionError as e:
+            logger.error(f"Error evaluating condition '{condition}': {e}")
             self.log_callback(f"Condition evaluation failed: {e}")
             return False
-    
-    def _parse_value(self, value_str: str) -> Any:
-        """
-        Parse a string value into the appropriate Python type.
-        
-        Args:
-            value_str: String value to parse
-            
-        Returns:
-            Parsed value
-        """
-        # Remove quotes from string literals
-        if (value_str.startswith("'") and value_str.endswith("'")) or \
-           (value_str.startswith('"') and value_str.endswith('"')):
-            return value_str[1:-1]
-        
-        # Try to parse as number
-        try:
-            if '.' in value_str:
-                return float(value_str)
-            else:
-                return int(value_str)
-        except ValueError:
-            # Not a number, return as is
-            return value_str
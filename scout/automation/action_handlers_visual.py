@@ -4,6 +4,7 @@ Visual Action Handlers
 This module implements handlers for vision-based automation actions:
 - Template Search (image recognition)
 - OCR Wait (text recognition)
+- Template and region change waits (served by the shared frame pipeline)
 
 These handlers use computer vision techniques to interact with the game
 based on visual elements rather than fixed coordinates.
@@ -11,6 +12,7 @@ based on visual elements rather than fixed coordinates.
 
 import time
 import logging
+from pathlib import Path
 from typing import Dict, Optional, List, Callable, Tuple, Any, Union
 import re
 import numpy as np
@@ -18,8 +20,15 @@ import numpy as np
 from scout.automation.core import ExecutionContext
 from scout.automation.actions import (
     ActionType, AutomationAction, ActionParamsCommon,
-    TemplateSearchParams, OCRWaitParams
+    TemplateSearchParams, OCRWaitParams, TemplateWaitParams, RegionChangeWaitParams
 )
+from scout.automation.frame_waits import (
+    FrameCondition, TEMPLATE_APPEARS, TEMPLATE_DISAPPEARS, REGION_CHANGES
+)
+from scout.automation.cancellation import cancellable_sleep
+from scout.automation.clock import monotonic
+from scout.automation.profiler import profile_phase
+from scout.ocr_word_index import TiledWordIndexer
 
 logger = logging.getLogger(__name__)
 
@@ -39,6 +48,8 @@ class VisualActionHandlers:
         self.context = context
         self.log_callback = log_callback
         self.variable_pattern = re.compile(r'\${([^}]+)}')
+        # Word indexes per OCR search region, reused across waits
+        self._word_indexers: Dict[Optional[tuple], TiledWordIndexer] = {}
     
     def handle_template_search(self, params: TemplateSearchParams, simulate: bool, 
                               variable_store: Optional[Dict[str, Any]] = None) -> bool:
@@ -54,16 +65,14 @@ class VisualActionHandlers:
             True if the template was found, False otherwise
         """
         try:
-            template_name = params.template_name
+            # Templates are loaded by file name, e.g. "templates/ok_button.png" -> "ok_button"
+            template_name = Path(params.template_path).stem
             search_region = params.search_region
-            match_threshold = params.match_threshold
-            max_matches = params.max_matches
-            store_variable = params.store_variable
             
             # Log the action
             self.log_callback(
                 f"{'Simulating' if simulate else 'Executing'} template search for '{template_name}' "
-                f"(threshold: {match_threshold}, max matches: {max_matches})"
+                f"(confidence: {params.confidence}, max matches: {params.max_matches})"
             )
             
             if not self.context.template_matcher:
@@ -80,46 +89,36 @@ class VisualActionHandlers:
                 return True
                 
             # Capture the current screen
-            screenshot = self.context.screen_capture.capture()
+            with profile_phase("capture"):
+                screenshot = self.context.screen_capture.capture()
             if screenshot is None:
                 self.log_callback("Failed to capture screen")
                 return False
                 
-            # Define search region if specified
-            region = None
-            if search_region:
-                region = (
-                    search_region.get('x', 0),
-                    search_region.get('y', 0),
-                    search_region.get('width', screenshot.shape[1]),
-                    search_region.get('height', screenshot.shape[0])
-                )
-                
             # Perform the template search
-            matches = self.context.template_matcher.find_template(
-                screenshot, 
-                template_name,
-                threshold=match_threshold,
-                max_matches=max_matches,
-                region=region
-            )
+            with profile_phase("match"):
+                found = self.context.template_matcher.find_matches(screenshot, [template_name])
+            matches = sorted(
+                (match for match in found
+                 if match.confidence >= params.confidence and self._in_region(match, search_region)),
+                key=lambda match: match.confidence, reverse=True
+            )[:max(1, params.max_matches)]
             
             # Log the results
-            match_count = len(matches) if matches else 0
-            self.log_callback(f"Found {match_count} matches for template '{template_name}'")
+            self.log_callback(f"Found {len(matches)} matches for template '{template_name}'")
             
-            # Store results in variable if requested
-            if store_variable and variable_store is not None and matches:
-                variable_store[store_variable] = matches
-                self.log_callback(f"Stored {match_count} matches in variable '${store_variable}'")
+            # Store the best match in variables if requested
+            if matches and params.save_to_variable and variable_store is not None:
+                self._store_match(matches[0], params.save_to_variable, variable_store)
+                self.log_callback(f"Stored match in variable '${params.save_to_variable}'")
             
             # Add delay if specified
             if params.delay_after > 0:
-                time.sleep(params.delay_after / 1000.0)  # Convert to seconds
+                cancellable_sleep(params.delay_after / 1000.0)  # Convert to seconds
                 self.log_callback(f"Delayed for {params.delay_after}ms")
             
             # Return success if at least one match was found
-            return match_count > 0
+            return bool(matches)
             
         except Exception as e:
             logger.exception(f"Error in template search action: {e}")
@@ -141,10 +140,10 @@ class VisualActionHandlers:
         """
         try:
             text_to_find = params.text
-            search_region = params.search_region
-            timeout_ms = params.timeout_ms
+            search_region = params.region
+            timeout = params.timeout
             case_sensitive = params.case_sensitive
-            store_variable = params.store_variable
+            store_variable = params.save_to_variable
             
             # Replace variables in text if variable store is provided
             if variable_store:
@@ -153,13 +152,13 @@ class VisualActionHandlers:
             # Log the action
             self.log_callback(
                 f"{'Simulating' if simulate else 'Executing'} OCR wait for text: '{text_to_find}' "
-                f"(timeout: {timeout_ms}ms, case sensitive: {case_sensitive})"
+                f"(timeout: {timeout}s, case sensitive: {case_sensitive})"
             )
             
-            if not self.context.ocr_engine:
-                self.log_callback("No OCR engine available")
-                return False
-                
+            # Named regions are read from the registry cache, no capture needed here
+            if params.region_name and getattr(self.context, 'ocr_regions', None):
+                return self._wait_for_region_text(params, text_to_find, simulate, variable_store)
+            
             if not self.context.screen_capture:
                 self.log_callback("No screen capture available")
                 return False
@@ -168,57 +167,78 @@ class VisualActionHandlers:
             if simulate:
                 self.log_callback("Simulation: Assuming text would be found")
                 return True
+            
+            # All strings that satisfy the wait; they are answered from one OCR pass
+            queries = [text_to_find] + [
+                self._replace_variables(alt, variable_store) if variable_store else alt
+                for alt in params.alternatives
+            ]
+            
+            # One tile cache per search region, kept across loop iterations and actions
+            region_key = tuple(search_region) if search_region else None
+            indexer = self._word_indexers.get(region_key)
+            if indexer is None:
+                indexer = TiledWordIndexer()
+                self._word_indexers[region_key] = indexer
                 
-            # Calculate end time for timeout
-            end_time = time.time() + (timeout_ms / 1000.0)
+            # Calculate end time for timeout (on the execution's clock)
+            end_time = monotonic() + timeout
             
             # Keep trying until timeout
-            while time.time() < end_time:
+            while monotonic() < end_time:
+                if self.context.should_stop():
+                    return False
+                
                 # Capture the current screen
-                screenshot = self.context.screen_capture.capture()
+                with profile_phase("capture"):
+                    screenshot = self.context.screen_capture.capture()
                 if screenshot is None:
                     self.log_callback("Failed to capture screen")
-                    time.sleep(0.1)  # Short delay before retry
+                    # Short delay before retry (cut short when cancelled)
+                    if not cancellable_sleep(0.1):
+                        return False
                     continue
                     
-                # Define search region if specified
-                region = None
+                # Crop to the search region if specified ([x, y, width, height])
+                offset_x, offset_y = 0, 0
+                image = screenshot
                 if search_region:
-                    region = (
-                        search_region.get('x', 0),
-                        search_region.get('y', 0),
-                        search_region.get('width', screenshot.shape[1]),
-                        search_region.get('height', screenshot.shape[0])
-                    )
+                    offset_x, offset_y, width, height = search_region
+                    image = screenshot[offset_y:offset_y + height, offset_x:offset_x + width]
                     
-                # Perform OCR on the region
-                ocr_result = self.context.ocr_engine.extract_text(
-                    screenshot, 
-                    region=region
-                )
+                # Build the word index (unchanged tiles reuse their previous OCR)
+                with profile_phase("ocr"):
+                    index = indexer.index(image)
+                match = index.find_first(queries, case_sensitive)
                 
-                # Check if the text is found
-                if not case_sensitive:
-                    ocr_result = ocr_result.lower()
-                    text_to_find = text_to_find.lower()
+                if match:
+                    center_x, center_y = match.center
+                    position = (offset_x + center_x, offset_y + center_y)
+                    self.log_callback(f"Found text '{match.text}' at {position}")
                     
-                if text_to_find in ocr_result:
-                    self.log_callback(f"Found text '{text_to_find}' in OCR result")
+                    # Remember the location so follow-up clicks need no second search
+                    execution_context = getattr(self.context, "execution_context", None)
+                    if execution_context is not None:
+                        execution_context.update_match_result(position, match.confidence / 100.0)
+                        execution_context.update_ocr_result(index.text)
                     
                     # Store results in variable if requested
                     if store_variable and variable_store is not None:
-                        variable_store[store_variable] = ocr_result
+                        variable_store[store_variable] = index.text
+                        variable_store[f"{store_variable}_x"] = position[0]
+                        variable_store[f"{store_variable}_y"] = position[1]
                         self.log_callback(f"Stored OCR result in variable '${store_variable}'")
                     
                     # Add delay if specified
                     if params.delay_after > 0:
-                        time.sleep(params.delay_after / 1000.0)  # Convert to seconds
+                        cancellable_sleep(params.delay_after / 1000.0)  # Convert to seconds
                         self.log_callback(f"Delayed for {params.delay_after}ms")
                         
                     return True
                 
-                # Short delay before next attempt
-                time.sleep(0.2)
+                # Short delay before next attempt (cut short when cancelled)
+                if not cancellable_sleep(0.2):
+                    return False
                 
             # Timeout reached without finding the text
             self.log_callback(f"Timeout reached without finding text '{text_to_find}'")
@@ -229,6 +249,194 @@ class VisualActionHandlers:
             self.log_callback(f"OCR wait action failed: {e}")
             return False
     
+    def _wait_for_region_text(self, params: OCRWaitParams, text_to_find: str, simulate: bool,
+                              variable_store: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        Wait for text to appear in a named region of the OCR region registry.
+        
+        The registry scheduler keeps the region values up to date, so this only
+        compares cached text and never captures the screen itself.
+        
+        Args:
+            params: OCR wait parameters (region_name must be set)
+            text_to_find: Text to wait for (variables already replaced)
+            simulate: Whether to simulate the action
+            variable_store: Store for variables (for storing results)
+            
+        Returns:
+            True if the text was found within the timeout, False otherwise
+        """
+        registry = self.context.ocr_regions
+        region_name = params.region_name
+        
+        if registry.get_region(region_name) is None:
+            self.log_callback(f"Unknown OCR region '{region_name}'")
+            return False
+            
+        if simulate:
+            self.log_callback(f"Simulation: Assuming text would be found in region '{region_name}'")
+            return True
+        
+        if not params.case_sensitive:
+            text_to_find = text_to_find.lower()
+        
+        # Only accept values captured after the wait started
+        start_time = time.time()
+        end_time = start_time + params.timeout
+        registry.request_refresh([region_name])
+        
+        while time.time() < end_time:
+            if self.context.should_stop():
+                return False
+                
+            result = registry.get_result(region_name)
+            if result is not None and result.timestamp >= start_time:
+                ocr_text = result.text if params.case_sensitive else result.text.lower()
+                if text_to_find in ocr_text:
+                    self.log_callback(f"Found text '{text_to_find}' in region '{region_name}'")
+                    
+                    if params.save_to_variable and variable_store is not None:
+                        variable_store[params.save_to_variable] = result.text
+                        self.log_callback(f"Stored OCR result in variable '${params.save_to_variable}'")
+                    
+                    if params.delay_after > 0:
+                        cancellable_sleep(params.delay_after / 1000.0)
+                        self.log_callback(f"Delayed for {params.delay_after}ms")
+                    return True
+            
+            # Wait for the scheduler to refresh the region
+            if not cancellable_sleep(0.1):
+                return False
+            
+        self.log_callback(f"Timeout reached without finding text '{text_to_find}' in region '{region_name}'")
+        return False
+    
+    def handle_template_wait(self, params: TemplateWaitParams, simulate: bool,
+                             variable_store: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        Handle a template wait action (wait for a template to appear or disappear).
+        
+        The wait subscribes to the frame pipeline, so concurrent waits share
+        one capture and match pass per frame.
+        
+        Args:
+            params: Template wait parameters
+            simulate: Whether to simulate the action
+            variable_store: Store for variables (for storing the match)
+            
+        Returns:
+            True if the template appeared/disappeared within the timeout, False otherwise
+        """
+        try:
+            template_name = params.template_name
+            if variable_store:
+                template_name = self._replace_variables(template_name, variable_store)
+            
+            self.log_callback(
+                f"{'Simulating' if simulate else 'Executing'} wait for template '{template_name}' "
+                f"to {params.mode} (timeout: {params.timeout}s)"
+            )
+            
+            if simulate:
+                self.log_callback(f"Simulation: Assuming template would {params.mode}")
+                return True
+            
+            kind = TEMPLATE_DISAPPEARS if params.mode == "disappear" else TEMPLATE_APPEARS
+            condition = FrameCondition(kind, template_name=template_name,
+                                       confidence=params.confidence, region=params.search_region)
+            wait = self.context.frame_pipeline.wait_for(
+                condition, params.timeout, self.context.should_stop)
+            
+            if not wait.satisfied:
+                self.log_callback(f"Timeout reached waiting for template '{template_name}' to {params.mode}")
+                return False
+            
+            self.log_callback(f"Template '{template_name}' {params.mode}ed after {wait.frames_checked} frames")
+            if wait.match is not None and params.save_to_variable and variable_store is not None:
+                self._store_match(wait.match, params.save_to_variable, variable_store)
+            return True
+            
+        except Exception as e:
+            logger.exception(f"Error in template wait action: {e}")
+            self.log_callback(f"Template wait action failed: {e}")
+            return False
+    
+    def handle_region_change_wait(self, params: RegionChangeWaitParams, simulate: bool,
+                                  variable_store: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        Handle a region change wait action.
+        
+        Args:
+            params: Region change wait parameters
+            simulate: Whether to simulate the action
+            variable_store: Store for variables
+            
+        Returns:
+            True if the region changed within the timeout, False otherwise
+        """
+        try:
+            region = params.region or None
+            self.log_callback(
+                f"{'Simulating' if simulate else 'Executing'} wait for change in region {region or 'window'} "
+                f"(timeout: {params.timeout}s)"
+            )
+            
+            if simulate:
+                self.log_callback("Simulation: Assuming region would change")
+                return True
+            
+            condition = FrameCondition(REGION_CHANGES, region=region, threshold=params.threshold)
+            wait = self.context.frame_pipeline.wait_for(
+                condition, params.timeout, self.context.should_stop)
+            
+            if not wait.satisfied:
+                self.log_callback(f"Timeout reached without a change in region {region or 'window'}")
+                return False
+            
+            self.log_callback(f"Region changed after {wait.frames_checked} frames")
+            return True
+            
+        except Exception as e:
+            logger.exception(f"Error in region change wait action: {e}")
+            self.log_callback(f"Region change wait action failed: {e}")
+            return False
+    
+    @staticmethod
+    def _store_match(match: Any, name: str, variable_store: Dict[str, Any]) -> None:
+        """
+        Store a template match as variables (bounds, center and confidence).
+        
+        Args:
+            match: GroupedMatch to store
+            name: Variable name
+            variable_store: Store for variables
+        """
+        x, y, width, height = match.bounds
+        variable_store[name] = [x, y, width, height]
+        variable_store[f"{name}_x"] = x + width // 2
+        variable_store[f"{name}_y"] = y + height // 2
+        variable_store[f"{name}_confidence"] = match.confidence
+    
+    @staticmethod
+    def _in_region(match: Any, region: Optional[List[int]]) -> bool:
+        """
+        Check whether the center of a match lies in a region.
+        
+        Args:
+            match: GroupedMatch to check
+            region: Region [x, y, width, height], or None for the whole frame
+            
+        Returns:
+            True if the match is inside the region
+        """
+        if not region:
+            return True
+        x, y, width, height = region
+        match_x, match_y, match_width, match_height = match.bounds
+        center_x = match_x + match_width / 2
+        center_y = match_y + match_height / 2
+        return x <= center_x < x + width and y <= center_y < y + height
+    
     def _replace_variables(self, text: str, variable_store: Dict[str, Any]) -> str:
         """
         Replace variables in text with their values from the variable store.
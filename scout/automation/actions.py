@@ -30,6 +30,8 @@ class ActionType(enum.Enum):
     # Visual actions
     TEMPLATE_SEARCH = "template_search"
     WAIT_FOR_OCR = "wait_for_ocr"
+    WAIT_FOR_TEMPLATE = "wait_for_template"
+    WAIT_FOR_CHANGE = "wait_for_change"
     
     # Flow control
     CONDITIONAL = "conditional"
@@ -69,6 +71,7 @@ class ActionParamsCommon:
         retry_interval: Interval between retries in seconds
         on_failure: What to do if the action fails
         failure_message: Message to display if the action fails
+        delay_after: Delay after the action in milliseconds
     """
     name: str = ""
     description: str = ""
@@ -78,6 +81,7 @@ class ActionParamsCommon:
     retry_interval: float = 1.0
     on_failure: str = "stop"  # stop, continue, retry
     failure_message: str = ""
+    delay_after: int = 0
 
 
 @dataclass
@@ -179,11 +183,51 @@ class OCRWaitParams(ActionParamsCommon):
         region: Region to search in (x, y, width, height)
         case_sensitive: Whether the search is case sensitive
         save_to_variable: Variable to save the OCR results to
+        region_name: Named region from the OCR region registry (overrides region)
+        alternatives: Additional texts that also satisfy the wait
     """
     text: str = ""
     region: Optional[List[int]] = None  # [x, y, width, height]
     case_sensitive: bool = False
     save_to_variable: str = ""
+    region_name: str = ""
+    alternatives: List[str] = field(default_factory=list)
+
+
+@dataclass
+class TemplateWaitParams(ActionParamsCommon):
+    """
+    Parameters for template wait actions.
+    
+    The timeout (seconds) is the common timeout parameter.
+    
+    Attributes:
+        template_name: Name of the template to wait for
+        mode: Whether to wait for the template to appear or disappear
+        confidence: Confidence threshold for matching
+        search_region: Region to watch (x, y, width, height)
+        save_to_variable: Variable to save the match to (appear mode)
+    """
+    template_name: str = ""
+    mode: str = "appear"  # appear, disappear
+    confidence: float = 0.8
+    search_region: Optional[List[int]] = None  # [x, y, width, height]
+    save_to_variable: str = ""
+
+
+@dataclass
+class RegionChangeWaitParams(ActionParamsCommon):
+    """
+    Parameters for region change wait actions.
+    
+    The timeout (seconds) is the common timeout parameter.
+    
+    Attributes:
+        region: Region to watch (x, y, width, height), whole window if empty
+        threshold: Mean pixel difference (0-255) that counts as a change
+    """
+    region: Optional[List[int]] = None  # [x, y, width, height]
+    threshold: float = 2.0
 
 
 @dataclass
@@ -408,10 +452,12 @@ class ParallelExecutionParams(ActionParamsCommon):
         actions: List of action groups to execute in parallel
         max_workers: Maximum number of worker threads
         wait_for_all: Whether to wait for all actions to complete
+        conflict_policy: How to merge variables changed by several groups
     """
     actions: List[List[Dict[str, Any]]] = field(default_factory=list)
     max_workers: int = 4
     wait_for_all: bool = True
+    conflict_policy: str = "last_wins"  # last_wins, first_wins, error
 
 
 @dataclass
@@ -436,9 +482,9 @@ class AutomationAction:
     
     def __init__(self, action_type: ActionType, params: Union[
         ClickParams, DragParams, TypeParams, WaitParams,
-        TemplateSearchParams, OCRWaitParams, ConditionalParams, LoopParams,
-        VariableSetParams, VariableIncrementParams, StringOperationParams,
-        ListOperationParams, DictOperationParams, MathOperationParams,
+        TemplateSearchParams, OCRWaitParams, TemplateWaitParams, RegionChangeWaitParams,
+        ConditionalParams, LoopParams, VariableSetParams, VariableIncrementParams,
+        StringOperationParams, ListOperationParams, DictOperationParams, MathOperationParams,
         FileOperationParams, LogParams, ScreenshotParams,
         SwitchCaseParams, TryCatchParams, ParallelExecutionParams, BreakpointParams
     ]):
@@ -641,6 +687,10 @@ def create_action_from_type(action_type: ActionType, **params) -> AutomationActi
         params_obj = TemplateSearchParams(**params)
     elif action_type == ActionType.WAIT_FOR_OCR:
         params_obj = OCRWaitParams(**params)
+    elif action_type == ActionType.WAIT_FOR_TEMPLATE:
+        params_obj = TemplateWaitParams(**params)
+    elif action_type == ActionType.WAIT_FOR_CHANGE:
+        params_obj = RegionChangeWaitParams(**params)
     elif action_type == ActionType.CONDITIONAL:
         params_obj = ConditionalParams(**params)
     elif action_type == ActionType.LOOP:
@@ -711,6 +761,11 @@ def validate_action_params(action_type: ActionType, params: Any) -> None:
     elif action_type == ActionType.WAIT_FOR_OCR:
         if not params.text:
             raise ValueError(f"OCR wait action requires text to wait for")
+    elif action_type == ActionType.WAIT_FOR_TEMPLATE:
+        if not params.template_name:
+            raise ValueError(f"Template wait action requires a template name")
+        if params.mode not in ("appear", "disappear"):
+            raise ValueError(f"Template wait mode must be 'appear' or 'disappear'")
     elif action_type == ActionType.CONDITIONAL:
         if not params.condition:
             raise ValueError(f"Conditional action requires a condition")
@@ -754,3 +809,5 @@ def validate_action_params(action_type: ActionType, params: Any) -> None:
     elif action_type == ActionType.PARALLEL_EXECUTION:
         if not params.actions:
             raise ValueError(f"Parallel execution action requires actions")
+        if params.conflict_policy not in ("last_wins", "first_wins", "error"):
+            raise ValueError(f"Unknown conflict policy: {params.conflict_policy}")
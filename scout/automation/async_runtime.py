@@ -0,0 +1,631 @@
+"""
+Async Automation Runtime
+
+This module provides an asyncio-based execution mode for automation sequences.
+It handles:
+- Running compiled plans as coroutines on one event loop thread
+- Awaitable waits on capture, template match and OCR events instead of
+  sleep-and-poll loops
+- Awaitable template and region change waits on the shared frame pipeline
+- Running independent sequences concurrently on that single thread
+- Parallel execution blocks as tasks (with real cancellation) instead of
+  a thread pool
+- Cooperative pause, resume and stop
+
+Events are published from any thread (usually Qt signal handlers on the GUI
+thread) and resolve waiting coroutines on the runtime loop. Handlers without
+an async implementation run in a worker thread via asyncio.to_thread, so a
+slow handler never blocks the other sequences.
+"""
+
+from typing import Dict, Optional, List, Callable, Tuple, Any, Awaitable
+from concurrent.futures import Future
+import asyncio
+import logging
+import random
+import threading
+import time
+
+from scout.automation.actions import ActionType, AutomationAction
+from scout.automation.compiler import (
+    SequenceCompiler, CompiledPlan, PlanRunner, PlanStep, CompileError, build_actions
+)
+from scout.automation.profiler import action_profiler, profile_phase
+from scout.automation.cancellation import CancellationToken, current_token, use_token
+from scout.automation.scopes import VariableScope, ScopeConflictError, merge_changes
+from scout.automation.frame_waits import (
+    FrameCondition, FrameWait, TEMPLATE_APPEARS, TEMPLATE_DISAPPEARS, REGION_CHANGES
+)
+from scout.ocr_word_index import TiledWordIndexer
+
+logger = logging.getLogger(__name__)
+
+# Async handler: (action, simulate, variable_store) -> awaitable success
+AsyncHandlerFunc = Callable[[AutomationAction, bool, Dict[str, Any]], Awaitable[bool]]
+
+# Event names published by the runtime's signal connections
+EVENT_CAPTURE = "capture"          # payload: frame (numpy array)
+EVENT_MATCH = "match"              # payload: (template_name, [x, y, w, h], confidence)
+EVENT_MATCH_BATCH = "match_batch"  # payload: {template_name: [(x, y, confidence), ...]}
+EVENT_OCR = "ocr"                  # payload: (text, region)
+EVENT_OCR_REGION = "ocr_region"    # payload: (region_name, text)
+
+class AsyncEventHub:
+    """
+    Thread-safe bridge from producer events to awaitable waits.
+
+    publish() may be called from any thread; waiters live on the runtime loop.
+    The latest payload of every event is kept, so a wait can check the
+    current state before suspending.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        """
+        Initialize the hub.
+
+        Args:
+            loop: Event loop the waiters run on
+        """
+        self.loop = loop
+        self._waiters: Dict[str, List[Tuple[Optional[Callable[[Any], bool]], asyncio.Future]]] = {}
+        self.latest: Dict[str, Tuple[float, Any]] = {}
+
+    def publish(self, event: str, payload: Any = None) -> None:
+        """
+        Publish an event (any thread).
+
+        Args:
+            event: Event name
+            payload: Event data
+        """
+        if self.loop.is_closed():
+            return
+        self.loop.call_soon_threadsafe(self._dispatch, event, payload, time.time())
+
+    def _dispatch(self, event: str, payload: Any, timestamp: float) -> None:
+        """Resolve the waiters of an event (runtime loop only)."""
+        self.latest[event] = (timestamp, payload)
+        waiters = self._waiters.get(event)
+        if not waiters:
+            return
+        remaining = []
+        for predicate, future in waiters:
+            if future.done():
+                continue
+            try:
+                matched = predicate is None or predicate(payload)
+            except Exception as e:
+                logger.error(f"Error in {event} event predicate: {e}")
+                matched = False
+            if matched:
+                future.set_result(payload)
+            else:
+                remaining.append((predicate, future))
+        self._waiters[event] = remaining
+
+    async def wait_for(self, event: str, predicate: Optional[Callable[[Any], bool]] = None,
+                       timeout: Optional[float] = None) -> Tuple[bool, Any]:
+        """
+        Wait for the next event that satisfies a predicate.
+
+        Args:
+            event: Event name
+            predicate: Optional test of the event payload
+            timeout: Optional maximum wait in seconds
+
+        Returns:
+            Tuple of (whether the event arrived, its payload)
+        """
+        future = self.loop.create_future()
+        waiter = (predicate, future)
+        self._waiters.setdefault(event, []).append(waiter)
+        try:
+            return True, await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            return False, None
+        finally:
+            # Timed out or cancelled waiters would otherwise stay until the event fires
+            if not future.done() or future.cancelled():
+                self._discard(event, waiter)
+
+    def _discard(self, event: str, waiter: Tuple[Optional[Callable[[Any], bool]], asyncio.Future]) -> None:
+        """Remove a waiter that stopped waiting (runtime loop only)."""
+        waiters = self._waiters.get(event)
+        if waiters and waiter in waiters:
+            waiters.remove(waiter)
+            if not waiters:
+                del self._waiters[event]
+
+class AsyncAutomationRuntime:
+    """
+    Runs automation sequences as coroutines on a dedicated event loop thread.
+    """
+
+    def __init__(self, core: Any, poll_interval: float = 0.2):
+        """
+        Initialize the runtime (the loop thread starts on first use).
+
+        Args:
+            core: AutomationCore providing positions, handlers and components
+            poll_interval: Fallback interval in seconds for waits whose event
+                           source is not connected
+        """
+        self.core = core
+        self.poll_interval = poll_interval
+        self.loop = asyncio.new_event_loop()
+        self.events = AsyncEventHub(self.loop)
+        self._thread: Optional[threading.Thread] = None
+
+        # Cooperative control (set/cleared on the loop thread)
+        self._resume_event = asyncio.Event()
+        self._stop_requested = False
+        self._tasks: Dict[str, asyncio.Task] = {}
+
+        self._async_handlers: Dict[ActionType, AsyncHandlerFunc] = {
+            ActionType.WAIT: self._wait,
+            ActionType.WAIT_FOR_OCR: self._wait_for_ocr,
+            ActionType.WAIT_FOR_TEMPLATE: self._wait_for_template,
+            ActionType.WAIT_FOR_CHANGE: self._wait_for_change,
+            ActionType.PARALLEL_EXECUTION: self._parallel_execution,
+        }
+        self.compiler = SequenceCompiler(self._resolve_handler)
+        self._word_indexers: Dict[Optional[tuple], TiledWordIndexer] = {}
+
+    # Lifecycle
+
+    def start(self) -> None:
+        """Start the event loop thread."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._thread = threading.Thread(target=self._run_loop, name="AsyncAutomationRuntime", daemon=True)
+        self._thread.start()
+        self.loop.call_soon_threadsafe(self._resume_event.set)
+
+    def _run_loop(self) -> None:
+        """Event loop thread."""
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """
+        Cancel all sequences and stop the loop thread.
+
+        Args:
+            timeout: Maximum wait in seconds
+        """
+        if self._thread is None:
+            return
+        self.stop()
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join(timeout)
+        self._thread = None
+
+    def connect_signal_bus(self, signal_bus: Any) -> None:
+        """
+        Publish capture, template match and OCR signals as runtime events.
+
+        Args:
+            signal_bus: Application SignalBus
+        """
+        signal_bus.window_capture_changed.connect(lambda frame: self.events.publish(EVENT_CAPTURE, frame))
+        signal_bus.template_match_found.connect(
+            lambda name, box, confidence: self.events.publish(EVENT_MATCH, (name, box, confidence)))
+        signal_bus.template_match_batch_complete.connect(
+            lambda matches: self.events.publish(EVENT_MATCH_BATCH, matches))
+        signal_bus.ocr_complete.connect(lambda text, region: self.events.publish(EVENT_OCR, (text, region)))
+
+    def connect_ocr_regions(self, registry: Any) -> None:
+        """
+        Publish OCR region updates as runtime events.
+
+        Args:
+            registry: OCRRegionRegistry
+        """
+        registry.region_updated.connect(lambda name, text: self.events.publish(EVENT_OCR_REGION, (name, text)))
+
+    # Control (any thread)
+
+    def submit(self, sequence: Any, simulate: bool = False,
+               variable_store: Optional[Dict[str, Any]] = None) -> Future:
+        """
+        Start a sequence on the runtime loop.
+
+        Args:
+            sequence: AutomationSequence to run
+            simulate: Whether to simulate the actions
+            variable_store: Optional store for variables (a new one by default)
+
+        Returns:
+            Future resolving to True if the sequence succeeded
+        """
+        self.start()
+        return asyncio.run_coroutine_threadsafe(
+            self._track(sequence.name, self.run_sequence(sequence, simulate, variable_store)), self.loop)
+
+    def submit_concurrent(self, sequences: List[Any], simulate: bool = False) -> Future:
+        """
+        Run independent sequences concurrently (each with its own variables).
+
+        Args:
+            sequences: AutomationSequences to run
+            simulate: Whether to simulate the actions
+
+        Returns:
+            Future resolving to the list of results, in order
+        """
+        self.start()
+
+        async def run_all() -> List[bool]:
+            return list(await asyncio.gather(*(
+                self._track(sequence.name, self.run_sequence(sequence, simulate))
+                for sequence in sequences
+            )))
+
+        return asyncio.run_coroutine_threadsafe(run_all(), self.loop)
+
+    def pause(self) -> None:
+        """Pause all sequences before their next action."""
+        self.loop.call_soon_threadsafe(self._resume_event.clear)
+
+    def resume(self) -> None:
+        """Resume paused sequences."""
+        self.loop.call_soon_threadsafe(self._resume_event.set)
+
+    def stop(self) -> None:
+        """Cancel all running sequences."""
+        def cancel_all() -> None:
+            self._stop_requested = True
+            self._resume_event.set()
+            for task in list(self._tasks.values()):
+                task.cancel()
+        self.loop.call_soon_threadsafe(cancel_all)
+
+    @property
+    def running_sequences(self) -> List[str]:
+        """Names of the sequences currently running."""
+        return list(self._tasks)
+
+    # Execution (runtime loop)
+
+    async def _track(self, name: str, coroutine: Awaitable[bool]) -> bool:
+        """Run a sequence coroutine as a named, cancellable task."""
+        self._stop_requested = False
+        # Handlers running in worker threads (asyncio.to_thread copies the
+        # task's context) observe this token, which is cancelled with the task
+        token = CancellationToken()
+        with use_token(token):
+            task = asyncio.ensure_future(coroutine)
+        key = name
+        suffix = 1
+        while key in self._tasks:
+            suffix += 1
+            key = f"{name}#{suffix}"
+        self._tasks[key] = task
+        try:
+            return await task
+        except asyncio.CancelledError:
+            token.cancel("sequence cancelled")
+            logger.info(f"Sequence {key} cancelled")
+            return False
+        finally:
+            self._tasks.pop(key, None)
+
+    async def run_sequence(self, sequence: Any, simulate: bool = False,
+                           variable_store: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        Compile and run a sequence.
+
+        Args:
+            sequence: AutomationSequence to run
+            simulate: Whether to simulate the actions
+            variable_store: Optional store for variables
+
+        Returns:
+            True if every action succeeded
+        """
+        try:
+            plan = self.compiler.compile(sequence, self._positions())
+        except CompileError as e:
+            logger.error(f"Cannot execute sequence {sequence.name}: {e}")
+            return False
+        logger.info(f"Executing sequence {sequence.name} (async)")
+        success = await self.run_plan(plan, simulate, variable_store if variable_store is not None else {})
+        logger.info(f"Sequence {sequence.name} completed with {'success' if success else 'failure'}")
+        return success
+
+    async def run_plan(self, plan: CompiledPlan, simulate: bool, variable_store: Dict[str, Any]) -> bool:
+        """
+        Run a compiled plan, awaiting each action.
+
+        Args:
+            plan: Plan compiled against this runtime's handlers
+            simulate: Whether to simulate the actions
+            variable_store: Store for variables
+
+        Returns:
+            True if every action succeeded
+        """
+        runner = PlanRunner(plan, self.core.flow_handlers._evaluate_condition, variable_store, simulate)
+        while True:
+            step = runner.advance()
+            if step is None:
+                if runner.error:
+                    logger.error(runner.error)
+                return runner.error is None
+
+            # Cooperative pause/stop point between actions
+            await self._resume_event.wait()
+            if self._stop_requested:
+                return False
+
+            runner.skip(step)
+            with action_profiler.action(plan.name, step.source, step.action.action_type.value) as record:
+                success = await step.handler(step.action, simulate, variable_store)
+                if record is not None:
+                    record.success = success
+            if not success:
+                logger.error(f"Action failed: step {step.source} ({step.action.action_type})")
+                return False
+
+    async def execute_action(self, action: AutomationAction, simulate: bool,
+                             variable_store: Dict[str, Any]) -> bool:
+        """
+        Execute a single (nested) action.
+
+        Args:
+            action: Action to execute
+            simulate: Whether to simulate the action
+            variable_store: Store for variables
+
+        Returns:
+            True if the action succeeded
+        """
+        if not action.params.enabled:
+            return True
+        handler = self._resolve_handler(action.action_type)
+        if handler is None:
+            logger.error(f"No handler found for action type: {action.action_type}")
+            return False
+        with action_profiler.action("", "", action.action_type.value) as record:
+            success = await handler(action, simulate, variable_store)
+            if record is not None:
+                record.success = success
+        return success
+
+    def _positions(self) -> Dict[str, Any]:
+        """Named positions of the automation core."""
+        return {position.name: position for position in self.core.get_all_positions()}
+
+    def _resolve_handler(self, action_type: ActionType) -> Optional[AsyncHandlerFunc]:
+        """Get the async handler of an action type (sync handlers run in a worker thread)."""
+        handler = self._async_handlers.get(action_type)
+        if handler is not None:
+            return handler
+        sync_handler = self.core.action_handlers.get(action_type)
+        if sync_handler is None:
+            return None
+
+        async def run_in_thread(action: AutomationAction, simulate: bool,
+                                variable_store: Dict[str, Any]) -> bool:
+            return bool(await asyncio.to_thread(sync_handler, action, simulate, variable_store))
+        return run_in_thread
+
+    # Async handlers
+
+    async def _wait(self, action: AutomationAction, simulate: bool, variable_store: Dict[str, Any]) -> bool:
+        """Wait action: sleep without holding a thread."""
+        params = action.params
+        duration = params.duration
+        if params.random_variation:
+            duration += random.uniform(-params.random_variation, params.random_variation)
+        if not simulate:
+            with profile_phase("sleep"):
+                await asyncio.sleep(max(0.0, duration))
+        return True
+
+    async def _wait_for_ocr(self, action: AutomationAction, simulate: bool,
+                            variable_store: Dict[str, Any]) -> bool:
+        """OCR wait action: resume on OCR region updates or new captures instead of polling."""
+        params = action.params
+        queries = [params.text] + list(params.alternatives)
+        queries = [self.core.visual_handlers._replace_variables(query, variable_store) for query in queries]
+        if simulate:
+            logger.info(f"Simulation: Assuming text {queries[0]!r} would be found")
+            return True
+
+        deadline = time.monotonic() + params.timeout
+        registry = getattr(self.core, "ocr_regions", None)
+        if params.region_name and registry is not None:
+            return await self._wait_for_region_text(registry, params, queries, deadline, variable_store)
+        return await self._wait_for_screen_text(params, queries, deadline, variable_store)
+
+    async def _wait_for_region_text(self, registry: Any, params: Any, queries: List[str],
+                                    deadline: float, variable_store: Dict[str, Any]) -> bool:
+        """Wait until a named OCR region shows one of the queries."""
+        name = params.region_name
+        if registry.get_region(name) is None:
+            logger.error(f"Unknown OCR region '{name}'")
+            return False
+
+        def contains(text: str) -> bool:
+            if params.case_sensitive:
+                return any(query in text for query in queries)
+            lowered = text.lower()
+            return any(query.lower() in lowered for query in queries)
+
+        start_time = time.time()
+        registry.request_refresh([name])
+        while True:
+            # The registry result may already be fresh (also covers missed events)
+            result = registry.get_result(name)
+            if result is not None and result.timestamp >= start_time and contains(result.text):
+                if params.save_to_variable:
+                    variable_store[params.save_to_variable] = result.text
+                return True
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                logger.info(f"Timeout reached without finding text in region '{name}'")
+                return False
+            with profile_phase("sleep"):
+                await self.events.wait_for(EVENT_OCR_REGION, lambda payload: payload[0] == name,
+                                           min(remaining, self.poll_interval * 5))
+
+    async def _wait_for_screen_text(self, params: Any, queries: List[str], deadline: float,
+                                    variable_store: Dict[str, Any]) -> bool:
+        """Wait until one of the queries appears on a captured frame."""
+        region_key = tuple(params.region) if params.region else None
+        indexer = self._word_indexers.get(region_key)
+        if indexer is None:
+            indexer = self._word_indexers[region_key] = TiledWordIndexer()
+
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                logger.info(f"Timeout reached without finding text '{queries[0]}'")
+                return False
+
+            # Next frame from the capture pipeline; capture directly if none arrives
+            with profile_phase("sleep"):
+                arrived, frame = await self.events.wait_for(EVENT_CAPTURE, timeout=min(remaining, self.poll_interval))
+            if not arrived:
+                capture = getattr(self.core, "screen_capture", None)
+                if capture is None:
+                    continue
+                with profile_phase("capture"):
+                    frame = await asyncio.to_thread(capture.capture)
+            if frame is None:
+                continue
+
+            offset_x, offset_y = 0, 0
+            image = frame
+            if params.region:
+                offset_x, offset_y, width, height = params.region
+                image = frame[offset_y:offset_y + height, offset_x:offset_x + width]
+
+            # OCR runs in a worker thread so other sequences keep running
+            with profile_phase("ocr"):
+                index = await asyncio.to_thread(indexer.index, image)
+            match = index.find_first(queries, params.case_sensitive)
+            if match:
+                center_x, center_y = match.center
+                if params.save_to_variable:
+                    variable_store[params.save_to_variable] = index.text
+                    variable_store[f"{params.save_to_variable}_x"] = offset_x + center_x
+                    variable_store[f"{params.save_to_variable}_y"] = offset_y + center_y
+                return True
+
+    async def _wait_for_template(self, action: AutomationAction, simulate: bool,
+                                 variable_store: Dict[str, Any]) -> bool:
+        """Template wait action: resume when the frame pipeline sees the template (dis)appear."""
+        params = action.params
+        template_name = self.core.visual_handlers._replace_variables(params.template_name, variable_store)
+        if simulate:
+            logger.info(f"Simulation: Assuming template {template_name!r} would {params.mode}")
+            return True
+
+        kind = TEMPLATE_DISAPPEARS if params.mode == "disappear" else TEMPLATE_APPEARS
+        wait = await self._wait_for_frame(
+            FrameCondition(kind, template_name=template_name, confidence=params.confidence,
+                           region=params.search_region),
+            params.timeout)
+        if not wait.satisfied:
+            logger.info(f"Timeout reached waiting for template '{template_name}' to {params.mode}")
+            return False
+        if wait.match is not None and params.save_to_variable:
+            self.core.visual_handlers._store_match(wait.match, params.save_to_variable, variable_store)
+        return True
+
+    async def _wait_for_change(self, action: AutomationAction, simulate: bool,
+                               variable_store: Dict[str, Any]) -> bool:
+        """Region change wait action: resume when the frame pipeline sees the region change."""
+        params = action.params
+        if simulate:
+            logger.info("Simulation: Assuming region would change")
+            return True
+
+        wait = await self._wait_for_frame(
+            FrameCondition(REGION_CHANGES, region=params.region or None, threshold=params.threshold),
+            params.timeout)
+        if not wait.satisfied:
+            logger.info(f"Timeout reached without a change in region {params.region or 'window'}")
+        return wait.satisfied
+
+    async def _wait_for_frame(self, condition: FrameCondition, timeout: Optional[float]) -> FrameWait:
+        """
+        Await a condition on the shared frame pipeline without holding a thread.
+
+        Args:
+            condition: Condition to wait for
+            timeout: Maximum wait in seconds
+
+        Returns:
+            The finished subscription
+        """
+        pipeline = self.core.frame_pipeline
+        future = self.loop.create_future()
+
+        def resolve(wait: FrameWait) -> None:
+            if not future.done():
+                future.set_result(wait)
+
+        wait = pipeline.subscribe(condition)
+        # Callbacks run on the pipeline thread; hand the result to the loop
+        wait.add_done_callback(lambda done: self.loop.call_soon_threadsafe(resolve, done))
+        try:
+            with profile_phase("sleep"):
+                await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            pipeline.unsubscribe(wait)
+        return wait
+
+    async def _parallel_execution(self, action: AutomationAction, simulate: bool,
+                                  variable_store: Dict[str, Any]) -> bool:
+        """Parallel execution action: run action groups as concurrent tasks on the loop."""
+        params = action.params
+        groups = [build_actions(group) for group in params.actions]
+
+        async def run_group(actions: List[AutomationAction], scope: VariableScope) -> Tuple[bool, VariableScope]:
+            for nested in actions:
+                if not await self.execute_action(nested, simulate, scope):
+                    return False, scope
+            return True, scope
+
+        # Each group writes to its own child scope, merged back on completion, and
+        # runs under a child token so that handlers in worker threads stop as well
+        tokens = [CancellationToken(current_token()) for _ in groups]
+        tasks = []
+        for group, token in zip(groups, tokens):
+            with use_token(token):
+                tasks.append(asyncio.ensure_future(run_group(group, VariableScope(variable_store))))
+        if not tasks:
+            return True
+
+        try:
+            if params.wait_for_all:
+                results = await asyncio.gather(*tasks)
+            else:
+                done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                for task in pending:
+                    task.cancel()
+                results = [task.result() for task in done]
+        finally:
+            # Finished groups ignore this; losers and groups of a cancelled
+            # sequence stop at their next check
+            for token in tokens:
+                token.cancel("parallel execution finished")
+                token.release()
+
+        try:
+            conflicts = merge_changes(variable_store, [scope.changes() for _, scope in results],
+                                      params.conflict_policy)
+        except ScopeConflictError as e:
+            logger.error(f"Parallel groups conflict: {e}")
+            return False
+        if conflicts:
+            logger.info(f"Parallel groups changed {', '.join(sorted(conflicts))}, "
+                        f"merged with policy '{params.conflict_policy}'")
+        successes = [success for success, _ in results]
+        return all(successes) if params.wait_for_all else any(successes)
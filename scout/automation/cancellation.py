@@ -0,0 +1,153 @@
+"""
+Cancellation Tokens
+
+This module provides cooperative cancellation for automation execution.
+It handles:
+- Cancellation tokens linked into a tree (cancelling a token cancels all
+  tokens derived from it, e.g. a sequence and its parallel groups)
+- The token of the current execution, carried in a context variable so that
+  handlers pick it up without extra parameters (asyncio tasks and
+  asyncio.to_thread workers inherit it; thread pool workers set it with
+  use_token)
+- Sleeps that return as soon as the token is cancelled (on the clock of
+  the current execution, see clock.py)
+
+Handlers never get interrupted: they notice cancellation in
+ExecutionContext.should_stop() and in cancellable_sleep(), and return.
+"""
+
+from typing import Optional, List, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+import logging
+import threading
+
+from scout.automation.clock import current_clock
+from scout.automation.profiler import profile_phase
+
+logger = logging.getLogger(__name__)
+
+class CancellationToken:
+    """
+    Cooperative cancellation flag that sleeping threads can wait on.
+    """
+
+    def __init__(self, parent: Optional['CancellationToken'] = None):
+        """
+        Initialize the token.
+
+        Args:
+            parent: Token whose cancellation also cancels this one
+        """
+        self.reason = ""
+        self._event = threading.Event()
+        self._children: List['CancellationToken'] = []
+        self._lock = threading.Lock()
+        self._parent = parent
+        if parent is not None:
+            parent._adopt(self)
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether the token was cancelled."""
+        return self._event.is_set()
+
+    def cancel(self, reason: str = "") -> None:
+        """
+        Cancel the token and all tokens derived from it.
+
+        Args:
+            reason: Optional description (for logging)
+        """
+        with self._lock:
+            if self._event.is_set():
+                return
+            self.reason = reason
+            self._event.set()
+            children, self._children = self._children, []
+        for child in children:
+            child.cancel(reason)
+
+    def child(self) -> 'CancellationToken':
+        """
+        Create a token that is cancelled together with this one.
+
+        Returns:
+            New child token
+        """
+        return CancellationToken(self)
+
+    def release(self) -> None:
+        """Unlink the token from its parent once the work it guards is over."""
+        parent, self._parent = self._parent, None
+        if parent is not None:
+            with parent._lock:
+                if self in parent._children:
+                    parent._children.remove(self)
+
+    def sleep(self, seconds: float) -> bool:
+        """
+        Sleep unless or until the token is cancelled.
+
+        Args:
+            seconds: Duration in seconds
+
+        Returns:
+            True if the full duration elapsed, False if cancelled
+        """
+        if seconds <= 0:
+            return not self.cancelled
+        return not self._event.wait(seconds)
+
+    def _adopt(self, child: 'CancellationToken') -> None:
+        """Link a child token (cancelling it right away if this one is cancelled)."""
+        with self._lock:
+            if not self._event.is_set():
+                self._children.append(child)
+                return
+        child.cancel(self.reason)
+
+# Token of the execution running in the current thread / task
+_current_token: ContextVar[Optional[CancellationToken]] = ContextVar("cancellation_token", default=None)
+
+def current_token() -> Optional[CancellationToken]:
+    """Get the cancellation token of the current execution (None outside executions)."""
+    return _current_token.get()
+
+@contextmanager
+def use_token(token: CancellationToken) -> Iterator[CancellationToken]:
+    """
+    Make a token the current one for the enclosed code.
+
+    Args:
+        token: Token to use
+
+    Yields:
+        The token
+    """
+    reset = _current_token.set(token)
+    try:
+        yield token
+    finally:
+        _current_token.reset(reset)
+
+def is_cancelled() -> bool:
+    """Whether the current execution was cancelled."""
+    token = _current_token.get()
+    return token is not None and token.cancelled
+
+def cancellable_sleep(seconds: float) -> bool:
+    """
+    Sleep on the current token and clock.
+
+    Under a virtual clock the sleep only advances simulated time.
+
+    Args:
+        seconds: Duration in seconds
+
+    Returns:
+        True if the full duration elapsed, False if the execution was cancelled
+    """
+    with profile_phase("sleep"):
+        # Outside executions there is no token and nothing can cancel the sleep
+        return current_clock().sleep(seconds, _current_token.get())
@@ -0,0 +1,172 @@
+"""
+Execution Clock
+
+This module provides the clock that automation handlers read and sleep on.
+It handles:
+- The real clock (wall time, monotonic time and real sleeps)
+- A virtual clock for simulation: sleeps advance simulated time instantly,
+  so sequences run at CPU speed with the same timing decisions
+- The clock of the current execution, carried in a context variable like
+  the cancellation token (asyncio tasks, to_thread workers and parallel
+  groups submitted with copied contexts inherit it)
+
+Handlers use now(), monotonic() and cancellable_sleep() instead of the time
+module, so the same code runs in real time and in simulation.
+"""
+
+from typing import Optional, Any, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+class Clock:
+    """
+    Real time.
+    """
+
+    virtual = False
+
+    def time(self) -> float:
+        """Get the wall time in seconds since the epoch."""
+        return time.time()
+
+    def monotonic(self) -> float:
+        """Get the monotonic time in seconds (for deadlines)."""
+        return time.monotonic()
+
+    def sleep(self, seconds: float, token: Optional[Any] = None) -> bool:
+        """
+        Sleep, returning early if the token is cancelled.
+
+        Args:
+            seconds: Duration in seconds
+            token: Optional CancellationToken to wait on
+
+        Returns:
+            True if the full duration elapsed, False if cancelled
+        """
+        if token is None:
+            time.sleep(max(0.0, seconds))
+            return True
+        return token.sleep(seconds)
+
+class VirtualClock(Clock):
+    """
+    Simulated time that only moves when something sleeps or advances it.
+
+    The clock is shared by all threads of a simulated execution, so sleeps
+    of concurrent parallel groups add up instead of overlapping.
+    """
+
+    virtual = True
+
+    def __init__(self, start: float = 0.0, epoch: Optional[float] = None,
+                 limit: Optional[float] = None):
+        """
+        Initialize the clock.
+
+        Args:
+            start: Initial monotonic time in seconds
+            epoch: Wall time at the start (default: the real time now)
+            limit: Monotonic time at which sleeps stop succeeding (ends
+                   simulations that would otherwise wait forever)
+        """
+        self.start = start
+        self.epoch = time.time() if epoch is None else epoch
+        self.limit = limit
+        self.slept = 0.0
+        self._now = start
+        self._lock = threading.Lock()
+
+    def time(self) -> float:
+        """Get the simulated wall time."""
+        return self.epoch + (self._now - self.start)
+
+    def monotonic(self) -> float:
+        """Get the simulated monotonic time."""
+        return self._now
+
+    @property
+    def elapsed(self) -> float:
+        """Simulated seconds since the start."""
+        return self._now - self.start
+
+    @property
+    def expired(self) -> bool:
+        """Whether the time limit was reached."""
+        return self.limit is not None and self._now >= self.limit
+
+    def advance(self, seconds: float) -> None:
+        """
+        Move the clock forward.
+
+        Args:
+            seconds: Duration in seconds (negative values are ignored)
+        """
+        if seconds <= 0:
+            return
+        with self._lock:
+            self._now += seconds
+            if self.limit is not None and self._now > self.limit:
+                self._now = self.limit
+
+    def sleep(self, seconds: float, token: Optional[Any] = None) -> bool:
+        """
+        Advance the clock by the sleep duration without sleeping.
+
+        Args:
+            seconds: Duration in seconds
+            token: Optional CancellationToken
+
+        Returns:
+            True if the full duration elapsed, False if cancelled or the
+            time limit was reached
+        """
+        if token is not None and token.cancelled:
+            return False
+        if self.expired:
+            return False
+        if seconds > 0:
+            before = self._now
+            self.advance(seconds)
+            with self._lock:
+                self.slept += self._now - before
+        return not self.expired
+
+REAL_CLOCK = Clock()
+
+# Clock of the execution running in the current thread / task
+_current_clock: ContextVar[Clock] = ContextVar("execution_clock", default=REAL_CLOCK)
+
+def current_clock() -> Clock:
+    """Get the clock of the current execution (the real clock by default)."""
+    return _current_clock.get()
+
+@contextmanager
+def use_clock(clock: Clock) -> Iterator[Clock]:
+    """
+    Make a clock the current one for the enclosed code.
+
+    Args:
+        clock: Clock to use
+
+    Yields:
+        The clock
+    """
+    reset = _current_clock.set(clock)
+    try:
+        yield clock
+    finally:
+        _current_clock.reset(reset)
+
+def now() -> float:
+    """Get the wall time of the current clock."""
+    return _current_clock.get().time()
+
+def monotonic() -> float:
+    """Get the monotonic time of the current clock."""
+    return _current_clock.get().monotonic()
@@ -0,0 +1,534 @@
+"""
+Sequence Compiler
+
+This module compiles automation sequences into flat execution plans ahead of
+time. It handles:
+- Parsing and validating every action once, before execution starts
+- Binding each action to its handler (unsupported action types are logged
+  and skipped instead of failing the plan)
+- Resolving named positions into coordinates
+- Interning the variable names a sequence uses
+- Lowering nested conditionals and loops into jumps over a flat step list
+- Caching plans, so looped and repeated sequences are not parsed again
+
+A plan is executed by a PlanRunner, which keeps a program counter and the
+loop counters. Control steps (jumps, loop bookkeeping) cost a list index and
+a comparison; only action steps call into handlers.
+"""
+
+from typing import Dict, List, Optional, Callable, Tuple, Any, Set
+from collections import OrderedDict
+from dataclasses import dataclass
+import enum
+import json
+import logging
+import re
+import sys
+import zlib
+
+from scout.automation.actions import (
+    ActionType, AutomationAction, create_action_from_type
+)
+from scout.automation.expressions import compile_expression, ExpressionError
+from scout.automation.profiler import action_profiler
+
+logger = logging.getLogger(__name__)
+
+# Bound handler: (action, simulate, variable_store) -> success
+HandlerFunc = Callable[[AutomationAction, bool, Dict[str, Any]], bool]
+HandlerResolver = Callable[[ActionType], Optional[HandlerFunc]]
+ConditionEvaluator = Callable[[str, Optional[Dict[str, Any]]], bool]
+
+# Parameter keys that hold nested action lists
+NESTED_ACTION_KEYS = ("then_actions", "else_actions", "actions", "try_actions",
+                      "catch_actions", "finally_actions", "default_actions")
+
+# Parameter keys that name a variable
+VARIABLE_NAME_KEYS = ("variable_name", "result_variable", "save_to_variable", "list_variable",
+                      "dict_variable", "variable", "collection", "error_variable")
+
+# Named position keys and the coordinate/offset keys they resolve into
+POSITION_KEYS = {
+    "position_name": ("x", "y", "offset_x", "offset_y"),
+    "start_position_name": ("start_x", "start_y", "start_offset_x", "start_offset_y"),
+    "end_position_name": ("end_x", "end_y", "end_offset_x", "end_offset_y"),
+}
+
+# Iteration limit of while loops (same as FlowActionHandlers.handle_while_loop)
+MAX_WHILE_ITERATIONS = 100
+
+VARIABLE_PATTERN = re.compile(r'\${([^}]+)}')
+
+class CompileError(ValueError):
+    """Raised when a sequence cannot be compiled."""
+
+    def __init__(self, source: str, message: str):
+        """
+        Initialize the error.
+
+        Args:
+            source: Location of the failing step (e.g. "3.then.1")
+            message: Description of the problem
+        """
+        super().__init__(f"Step {source}: {message}")
+        self.source = source
+
+class OpCode(enum.Enum):
+    """Operations of a compiled plan."""
+    ACTION = "action"                # Call the bound handler
+    JUMP = "jump"                    # Continue at target
+    JUMP_IF_FALSE = "jump_if_false"  # Continue at target if the condition is false
+    LOOP_INIT = "loop_init"          # Load a loop counter (skip to target if empty)
+    LOOP_NEXT = "loop_next"          # Count down, continue at target while iterations remain
+
+@dataclass
+class PlanStep:
+    """
+    A single step of a compiled plan.
+
+    Attributes:
+        op: Operation of the step
+        source: Location in the original sequence (e.g. "3.then.1")
+        top_index: Index of the top-level action the step belongs to
+        action: Parsed action (action steps and the steps lowered from a block)
+        handler: Bound handler (action steps)
+        condition: Condition string (conditional jumps and while loops)
+        target: Jump target (step index)
+        slot: Loop counter slot
+        count: Initial loop counter value
+        fail_on_exhausted: Whether running out of iterations fails the plan
+    """
+    op: OpCode
+    source: str
+    top_index: int
+    action: Optional[AutomationAction] = None
+    handler: Optional[HandlerFunc] = None
+    condition: str = ""
+    target: int = -1
+    slot: int = -1
+    count: int = 0
+    fail_on_exhausted: bool = False
+
+@dataclass
+class CompiledPlan:
+    """
+    A compiled sequence.
+
+    Attributes:
+        name: Name of the compiled sequence
+        steps: Flat list of steps
+        top_level_count: Number of actions in the original sequence
+        slot_count: Number of loop counters
+        variables: Interned names of the variables the sequence uses
+        fingerprint: Checksum of the source actions and positions
+    """
+    name: str
+    steps: List[PlanStep]
+    top_level_count: int
+    slot_count: int = 0
+    variables: Tuple[str, ...] = ()
+    fingerprint: int = 0
+
+    @property
+    def action_count(self) -> int:
+        """Number of action steps in the plan."""
+        return sum(1 for step in self.steps if step.op is OpCode.ACTION)
+
+def _resolve_positions(params: Dict[str, Any], positions: Optional[Dict[str, Any]]) -> None:
+    """Replace named positions in a params dict with coordinates."""
+    for name_key, (x_key, y_key, dx_key, dy_key) in POSITION_KEYS.items():
+        if name_key not in params:
+            continue
+        name = params.pop(name_key)
+        offset_x = params.pop(dx_key, 0)
+        offset_y = params.pop(dy_key, 0)
+        position = positions.get(name) if positions else None
+        if position is None:
+            raise ValueError(f"Unknown position '{name}'")
+        params[x_key] = position.x + offset_x
+        params[y_key] = position.y + offset_y
+
+def _convert_list(items: List[Any], positions: Optional[Dict[str, Any]]) -> List[Any]:
+    """Convert the action dicts of a nested list."""
+    return [build_action(item, positions) if isinstance(item, dict) and "type" in item else item
+            for item in items]
+
+def build_action(data: Any, positions: Optional[Dict[str, Any]] = None) -> AutomationAction:
+    """
+    Create an action (including nested actions) from its dictionary form.
+
+    Unlike AutomationAction.from_dict, the source dictionary is left untouched,
+    so stored sequences keep their plain JSON form.
+
+    Args:
+        data: Action dictionary or an AutomationAction (returned as-is)
+        positions: Optional named positions for resolving position names
+
+    Returns:
+        AutomationAction instance
+
+    Raises:
+        ValueError: If the action is invalid
+    """
+    if isinstance(data, AutomationAction):
+        return data
+
+    action_type = ActionType(data["type"])
+    params = dict(data.get("params", {}))
+
+    for key in NESTED_ACTION_KEYS:
+        items = params.get(key)
+        if not isinstance(items, list):
+            continue
+        if action_type == ActionType.PARALLEL_EXECUTION and key == "actions":
+            params[key] = [_convert_list(group, positions) if isinstance(group, list) else group
+                           for group in items]
+        else:
+            params[key] = _convert_list(items, positions)
+    if action_type == ActionType.SWITCH_CASE and isinstance(params.get("cases"), dict):
+        params["cases"] = {case: _convert_list(items, positions)
+                           for case, items in params["cases"].items()}
+
+    _resolve_positions(params, positions)
+    return create_action_from_type(action_type, **params)
+
+def build_actions(items: List[Any], positions: Optional[Dict[str, Any]] = None) -> List[AutomationAction]:
+    """
+    Create actions from a list of action dictionaries.
+
+    Args:
+        items: Action dictionaries and/or AutomationActions
+        positions: Optional named positions for resolving position names
+
+    Returns:
+        List of AutomationAction instances
+    """
+    return [build_action(item, positions) for item in items]
+
+def _skip_unsupported(action: AutomationAction, simulate: bool,
+                      variable_store: Optional[Dict[str, Any]] = None) -> bool:
+    """Handler of steps whose action type has no handler: log and skip."""
+    logger.warning(f"Skipping unsupported action type: {action.action_type.value}")
+    return True
+
+class _PlanBuilder:
+    """Emits the flat step list of one plan."""
+
+    def __init__(self, handler_resolver: HandlerResolver, positions: Optional[Dict[str, Any]]):
+        self.handler_resolver = handler_resolver
+        self.positions = positions
+        self.steps: List[PlanStep] = []
+        self.slot_count = 0
+        self.variables: Set[str] = set()
+
+    def add(self, step: PlanStep) -> PlanStep:
+        """Append a step."""
+        self.steps.append(step)
+        return step
+
+    def collect_variables(self, params: Any) -> None:
+        """Intern the variable names referenced by an action's parameters."""
+        for key, value in params.__dict__.items():
+            if key in VARIABLE_NAME_KEYS and isinstance(value, str) and value:
+                self.variables.add(sys.intern(value))
+            elif isinstance(value, str) and "${" in value:
+                self.variables.update(sys.intern(name) for name in VARIABLE_PATTERN.findall(value))
+
+    def check_condition(self, condition: str, source: str) -> None:
+        """Parse a condition now, so a malformed one fails the compile instead of evaluating False."""
+        try:
+            compile_expression(condition)
+        except ExpressionError as e:
+            raise CompileError(source, f"Invalid condition '{condition}': {e}") from e
+
+    def emit(self, item: Any, source: str, top_index: int) -> None:
+        """Emit the steps of an action (and its nested actions)."""
+        try:
+            action = build_action(item, self.positions)
+        except (ValueError, TypeError, KeyError) as e:
+            raise CompileError(source, str(e)) from e
+
+        params = action.params
+        if not params.enabled:
+            logger.debug(f"Skipping disabled step {source}: {action.action_type.name}")
+            return
+        self.collect_variables(params)
+
+        action_type = action.action_type
+        if action_type == ActionType.CONDITIONAL:
+            self.check_condition(params.condition, source)
+            branch = self.add(PlanStep(OpCode.JUMP_IF_FALSE, source, top_index, action,
+                                       condition=params.condition))
+            self.emit_block(params.then_actions, f"{source}.then", top_index)
+            if params.else_actions:
+                skip = self.add(PlanStep(OpCode.JUMP, source, top_index, action))
+                branch.target = len(self.steps)
+                self.emit_block(params.else_actions, f"{source}.else", top_index)
+                skip.target = len(self.steps)
+            else:
+                branch.target = len(self.steps)
+        elif action_type == ActionType.LOOP and params.loop_type == "count":
+            slot = self.next_slot()
+            init = self.add(PlanStep(OpCode.LOOP_INIT, source, top_index, action,
+                                     slot=slot, count=params.count))
+            body = len(self.steps)
+            self.emit_block(params.actions, f"{source}.loop", top_index)
+            self.add(PlanStep(OpCode.LOOP_NEXT, source, top_index, action, slot=slot, target=body))
+            init.target = len(self.steps)
+        elif action_type == ActionType.LOOP and params.loop_type == "while":
+            self.check_condition(params.condition, source)
+            slot = self.next_slot()
+            init = self.add(PlanStep(OpCode.LOOP_INIT, source, top_index, action,
+                                     slot=slot, count=MAX_WHILE_ITERATIONS))
+            test = len(self.steps)
+            branch = self.add(PlanStep(OpCode.JUMP_IF_FALSE, source, top_index, action,
+                                       condition=params.condition))
+            self.emit_block(params.actions, f"{source}.loop", top_index)
+            self.add(PlanStep(OpCode.LOOP_NEXT, source, top_index, action, condition=params.condition,
+                              slot=slot, target=test, fail_on_exhausted=True))
+            init.target = branch.target = len(self.steps)
+        else:
+            # Everything else (including blocks that run their own children,
+            # like try/catch and parallel execution) is a single handler call
+            handler = self.handler_resolver(action_type)
+            if handler is None:
+                # The runner this plan is for does not support the type; the
+                # rest of the sequence still runs
+                logger.warning(f"No handler for action type '{action_type.value}' "
+                               f"(step {source}), the step will be skipped")
+                handler = _skip_unsupported
+            self.add(PlanStep(OpCode.ACTION, source, top_index, action, handler))
+
+    def emit_block(self, items: List[Any], source: str, top_index: int) -> None:
+        """Emit a nested action list."""
+        for index, item in enumerate(items):
+            self.emit(item, f"{source}.{index + 1}", top_index)
+
+    def next_slot(self) -> int:
+        """Allocate a loop counter slot."""
+        self.slot_count += 1
+        return self.slot_count - 1
+
+class SequenceCompiler:
+    """
+    Compiles sequences into plans and caches the results.
+
+    Plans are cached per sequence name and reused as long as the sequence's
+    actions and the named positions are unchanged.
+    """
+
+    def __init__(self, handler_resolver: HandlerResolver, max_cache_size: int = 16):
+        """
+        Initialize the compiler.
+
+        Args:
+            handler_resolver: Function returning the bound handler of an action type
+            max_cache_size: Maximum number of cached plans
+        """
+        self.handler_resolver = handler_resolver
+        self.max_cache_size = max_cache_size
+        self._cache: "OrderedDict[str, CompiledPlan]" = OrderedDict()
+
+        # Statistics
+        self.compiled = 0
+        self.cache_hits = 0
+
+    @staticmethod
+    def fingerprint(actions: List[Any], positions: Optional[Dict[str, Any]] = None) -> int:
+        """
+        Get a checksum of a sequence's actions and the positions it may use.
+
+        Args:
+            actions: Action dictionaries
+            positions: Optional named positions
+
+        Returns:
+            Checksum of the compile inputs
+        """
+        position_data = {name: (pos.x, pos.y) for name, pos in (positions or {}).items()}
+        payload = json.dumps([actions, position_data], sort_keys=True, default=repr)
+        return zlib.crc32(payload.encode("utf-8"))
+
+    def compile(self, sequence: Any, positions: Optional[Dict[str, Any]] = None) -> CompiledPlan:
+        """
+        Compile an AutomationSequence.
+
+        Args:
+            sequence: Sequence to compile
+            positions: Optional named positions for resolving position names
+
+        Returns:
+            Compiled plan
+
+        Raises:
+            CompileError: If an action is invalid
+        """
+        return self.compile_actions(sequence.name, sequence.actions, positions)
+
+    def compile_actions(self, name: str, actions: List[Any],
+                        positions: Optional[Dict[str, Any]] = None) -> CompiledPlan:
+        """
+        Compile a list of actions.
+
+        Args:
+            name: Name of the plan (cache key)
+            actions: Action dictionaries and/or AutomationActions
+            positions: Optional named positions for resolving position names
+
+        Returns:
+            Compiled plan
+
+        Raises:
+            CompileError: If an action is invalid
+        """
+        fingerprint = self.fingerprint(actions, positions)
+        cached = self._cache.get(name)
+        if cached is not None and cached.fingerprint == fingerprint:
+            self._cache.move_to_end(name)
+            self.cache_hits += 1
+            return cached
+
+        builder = _PlanBuilder(self.handler_resolver, positions)
+        for index, item in enumerate(actions):
+            builder.emit(item, str(index + 1), index)
+
+        plan = CompiledPlan(
+            name=name,
+            steps=builder.steps,
+            top_level_count=len(actions),
+            slot_count=builder.slot_count,
+            variables=tuple(sorted(builder.variables)),
+            fingerprint=fingerprint
+        )
+        self.compiled += 1
+        self._cache[name] = plan
+        while len(self._cache) > self.max_cache_size:
+            self._cache.popitem(last=False)
+
+        logger.debug(f"Compiled sequence '{name}': {len(actions)} actions -> {len(plan.steps)} steps")
+        return plan
+
+    def clear(self) -> None:
+        """Remove all cached plans."""
+        self._cache.clear()
+
+class PlanRunner:
+    """
+    Executes a compiled plan.
+
+    The runner can be driven one action at a time (advance() then execute(),
+    for debuggers and schedulers) or run to completion with run().
+    """
+
+    def __init__(self, plan: CompiledPlan, condition_evaluator: ConditionEvaluator,
+                 variable_store: Optional[Dict[str, Any]] = None, simulate: bool = False):
+        """
+        Initialize the runner.
+
+        Args:
+            plan: Plan to execute
+            condition_evaluator: Function evaluating condition strings
+            variable_store: Store for variables
+            simulate: Whether to simulate the actions
+        """
+        self.plan = plan
+        self.condition_evaluator = condition_evaluator
+        self.variable_store = variable_store if variable_store is not None else {}
+        self.simulate = simulate
+        self.reset()
+
+    def reset(self) -> None:
+        """Restart the plan from its first step."""
+        self.pc = 0
+        self.counters = [0] * self.plan.slot_count
+        self.error: Optional[str] = None
+
+    @property
+    def finished(self) -> bool:
+        """Whether the plan has run to its end (or failed)."""
+        return self.error is not None or self.pc >= len(self.plan.steps)
+
+    def advance(self) -> Optional[PlanStep]:
+        """
+        Run control steps up to the next action step.
+
+        Returns:
+            The next action step (not yet executed), or None if the plan is
+            finished or failed (see error)
+        """
+        steps = self.plan.steps
+        while self.error is None and self.pc < len(steps):
+            step = steps[self.pc]
+            op = step.op
+            if op is OpCode.ACTION:
+                return step
+
+            self.pc += 1
+            if op is OpCode.JUMP:
+                self.pc = step.target
+            elif op is OpCode.JUMP_IF_FALSE:
+                if not self.condition_evaluator(step.condition, self.variable_store):
+                    self.pc = step.target
+            elif op is OpCode.LOOP_INIT:
+                self.counters[step.slot] = step.count
+                if step.count <= 0:
+                    self.pc = step.target
+            elif op is OpCode.LOOP_NEXT:
+                self.counters[step.slot] -= 1
+                if self.counters[step.slot] > 0:
+                    self.pc = step.target
+                elif step.fail_on_exhausted and self.condition_evaluator(step.condition, self.variable_store):
+                    self.error = f"Step {step.source}: reached maximum iterations ({MAX_WHILE_ITERATIONS})"
+                    logger.warning(self.error)
+        return None
+
+    def execute(self, step: PlanStep) -> bool:
+        """
+        Execute the action step returned by advance().
+
+        Args:
+            step: Action step at the program counter
+
+        Returns:
+            True if the action succeeded
+        """
+        self.pc += 1
+        if not action_profiler.enabled:
+            return bool(step.handler(step.action, self.simulate, self.variable_store))
+        with action_profiler.action(self.plan.name, step.source, step.action.action_type.value) as record:
+            record.success = bool(step.handler(step.action, self.simulate, self.variable_store))
+        return record.success
+
+    def skip(self, step: PlanStep) -> None:
+        """
+        Move past the action step returned by advance() without executing it
+        (for callers that perform the action themselves, e.g. timer-based waits).
+
+        Args:
+            step: Action step at the program counter
+        """
+        self.pc += 1
+
+    def run(self, should_continue: Optional[Callable[[], bool]] = None,
+            on_step: Optional[Callable[[PlanStep, bool], None]] = None) -> bool:
+        """
+        Run the plan to completion, stopping at the first failed action.
+
+        Args:
+            should_continue: Optional function checked before every action
+            on_step: Optional function called after every action with its result
+
+        Returns:
+            True if every action succeeded
+        """
+        while True:
+            step = self.advance()
+            if step is None:
+                return self.error is None
+            if should_continue is not None and not should_continue():
+                return False
+            success = self.execute(step)
+            if on_step is not None:
+                on_step(step, success)
+            if not success:
+                return False
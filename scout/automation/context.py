@@ -13,6 +13,7 @@ from scout.template_matcher import TemplateMatcher
 from scout.text_ocr import TextOCR
 from scout.actions import GameActions
 from scout.automation.position import Position
+from scout.automation.cancellation import CancellationToken, current_token
 
 @dataclass
 class ExecutionContext:
@@ -29,10 +30,12 @@ class ExecutionContext:
         text_ocr: TextOCR for text recognition
         game_actions: GameActions for interacting with the game
         overlay: Optional overlay for visual feedback
+        ocr_regions: Optional OCRRegionRegistry with cached region values
         debug_tab: Optional debug tab for logging
         simulation_mode: Whether to simulate actions without executing them
         step_delay: Delay between steps in seconds
         loop_enabled: Whether to loop the sequence execution
+        cancel_token: Cancellation token of the execution
     """
     positions: Dict[str, Position]
     window_manager: WindowManager
@@ -40,10 +43,12 @@ class ExecutionContext:
     text_ocr: TextOCR
     game_actions: GameActions
     overlay: Optional[Any] = None
+    ocr_regions: Optional[Any] = None
     debug_tab: Optional[Any] = None
     simulation_mode: bool = False
     step_delay: float = 0.5
     loop_enabled: bool = False
+    cancel_token: Optional[CancellationToken] = None
     
     # Variable store for automation sequences
     variables: Dict[str, Any] = field(default_factory=dict)
@@ -55,6 +60,19 @@ class ExecutionContext:
     last_match_confidence: Optional[float] = None
     last_ocr_text: Optional[str] = None
     
+    def should_stop(self) -> bool:
+        """
+        Check whether the running actions should stop.
+        
+        Parallel groups run under child tokens of the execution's token, so
+        the token of the calling thread (if any) takes precedence.
+        
+        Returns:
+            True if execution was cancelled, False otherwise
+        """
+        token = current_token() or self.cancel_token
+        return token is not None and token.cancelled
+    
     def update_result(self, result: bool, message: str) -> None:
         """
         Update the last result and message.
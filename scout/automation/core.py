@@ -23,6 +23,11 @@ from .action_handlers_flow import FlowActionHandlers
 from .action_handlers_advanced_flow import AdvancedFlowActionHandlers
 from .action_handlers_data import DataActionHandlers
 from .action_handlers_visual import VisualActionHandlers
+from .compiler import SequenceCompiler, PlanRunner, PlanStep, CompileError
+from .frame_waits import FramePipeline
+from .devices import GameActionsInput, WindowScreenCapture
+from .cancellation import CancellationToken, use_token, is_cancelled
+from .profiler import action_profiler
 
 logger = logging.getLogger(__name__)
 
@@ -35,7 +40,7 @@ class AutomationCore:
     """
     
     def __init__(self, window_manager, template_matcher, text_ocr,
-                game_actions, template_search, signal_bus):
+                game_actions, template_search, signal_bus, ocr_regions=None, overlay=None):
         """
         Initialize the automation core.
         
@@ -46,6 +51,8 @@ class AutomationCore:
             game_actions: Game-specific action implementation
             template_search: Template search functionality
             signal_bus: Signal bus for event communication
+            ocr_regions: Optional OCR region registry with cached region values
+            overlay: Optional overlay for visual feedback
         """
         logger.info("Initializing automation core")
         
@@ -56,12 +63,24 @@ class AutomationCore:
         self.game_actions = game_actions
         self.template_search = template_search
         self.signal_bus = signal_bus
+        self.ocr_regions = ocr_regions
+        self.overlay = overlay
         
         # Initialize managers
         self.position_manager = PositionManager()
         self.sequence_manager = SequenceManager()
         self.progress_tracker = ProgressTracker()
         
+        # Input and capture devices used by the action handlers (the
+        # simulation runtime swaps in recording and replaying devices)
+        self.input_controller = GameActionsInput(game_actions)
+        self.screen_capture = WindowScreenCapture(template_matcher)
+        
+        # Shared capture and match pass for event-driven waits
+        self.frame_pipeline = FramePipeline(self._capture_frame, template_matcher)
+        if signal_bus is not None:
+            self.frame_pipeline.connect_signal_bus(signal_bus)
+        
         # Create a log callback function
         def log_callback(message):
             """Callback function for action handlers to log messages"""
@@ -80,12 +99,26 @@ class AutomationCore:
         self.data_handlers = DataActionHandlers(self, log_callback)
         self.visual_handlers = VisualActionHandlers(self, log_callback)
         
+        # Handlers bound per action type; sequences are compiled against this
+        # table once instead of searching for a handler on every action
+        self.action_handlers = self._build_handler_table()
+        self.compiler = SequenceCompiler(self.action_handlers.get)
+        
+        # Per-action timing (disabled until profiler.set_enabled(True));
+        # written to profile_export_path after each sequence when set
+        self.profiler = action_profiler
+        self.profile_export_path = ""
+        
+        # Optional asyncio runtime (see enable_async_mode)
+        self.async_runtime = None
+        
         # Execution state
         self.is_executing = False
         self.current_sequence = None
         self.execution_context = None
         self.pause_requested = False
         self.stop_requested = False
+        self.cancel_token: Optional[CancellationToken] = None
         
         # Event handlers
         self._on_sequence_complete_handlers = []
@@ -93,6 +126,107 @@ class AutomationCore:
         
         logger.info("Automation core initialized")
     
+    def _build_handler_table(self) -> Dict[ActionType, Callable[[AutomationAction, bool, Dict[str, Any]], bool]]:
+        """
+        Build the table of bound handlers per action type.
+        
+        Returns:
+            Dictionary mapping action types to functions taking
+            (action, simulate, variable_store)
+        """
+        def bind(method, pass_variables: bool = True):
+            if pass_variables:
+                return lambda action, simulate, variable_store: method(action.params, simulate, variable_store)
+            return lambda action, simulate, variable_store: method(action.params, simulate)
+        
+        def handle_loop(action, simulate, variable_store):
+            if action.params.loop_type == "while":
+                return self.flow_handlers.handle_while_loop(action.params, simulate, variable_store)
+            return self.flow_handlers.handle_repeat_loop(action.params, simulate, variable_store)
+        
+        basic = self.basic_handlers
+        visual = self.visual_handlers
+        data = self.data_handlers
+        advanced = self.advanced_flow_handlers
+        return {
+            ActionType.CLICK: bind(basic.handle_click, False),
+            ActionType.RIGHT_CLICK: bind(basic.handle_click, False),
+            ActionType.DOUBLE_CLICK: bind(basic.handle_click, False),
+            ActionType.DRAG: bind(basic.handle_drag, False),
+            ActionType.TYPE_TEXT: bind(basic.handle_type),
+            ActionType.WAIT: bind(basic.handle_wait, False),
+            ActionType.TEMPLATE_SEARCH: bind(visual.handle_template_search),
+            ActionType.WAIT_FOR_OCR: bind(visual.handle_ocr_wait),
+            ActionType.WAIT_FOR_TEMPLATE: bind(visual.handle_template_wait),
+            ActionType.WAIT_FOR_CHANGE: bind(visual.handle_region_change_wait),
+            ActionType.CONDITIONAL: bind(self.flow_handlers.handle_if_condition),
+            ActionType.LOOP: handle_loop,
+            ActionType.VARIABLE_SET: bind(data.handle_variable_set),
+            ActionType.VARIABLE_INCREMENT: bind(data.handle_variable_increment),
+            ActionType.STRING_OPERATION: bind(data.handle_string_operation),
+            ActionType.LIST_OPERATION: bind(data.handle_list_operation),
+            ActionType.DICT_OPERATION: bind(data.handle_dict_operation),
+            ActionType.MATH_OPERATION: bind(data.handle_math_operation),
+            ActionType.FILE_OPERATION: bind(data.handle_file_operation),
+            ActionType.SWITCH_CASE: bind(advanced.handle_switch_case),
+            ActionType.TRY_CATCH: bind(advanced.handle_try_catch),
+            ActionType.PARALLEL_EXECUTION: bind(advanced.handle_parallel_execution),
+            ActionType.BREAKPOINT: bind(advanced.handle_breakpoint),
+        }
+    
+    def execute_action(self, action: AutomationAction, simulate: bool = False,
+                       variable_store: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        Execute a single action (used for nested actions of block handlers).
+        
+        Args:
+            action: Action to execute
+            simulate: Whether to simulate the action
+            variable_store: Store for variables
+            
+        Returns:
+            True if the action executed successfully, False otherwise
+        """
+        if not action.params.enabled:
+            return True
+        handler = self.action_handlers.get(action.action_type)
+        if handler is None:
+            logger.error(f"No handler found for action type: {action.action_type}")
+            return False
+        if variable_store is None:
+            variable_store = self.execution_context.variables if self.execution_context else {}
+        try:
+            if not self.profiler.enabled:
+                return handler(action, simulate, variable_store)
+            # Nested actions are profiled under their enclosing action
+            with self.profiler.action("", "", action.action_type.value) as record:
+                record.success = bool(handler(action, simulate, variable_store))
+            return record.success
+        except Exception as e:
+            logger.error(f"Error executing action {action.action_type}: {e}")
+            return False
+    
+    def _capture_frame(self):
+        """
+        Capture a frame with the current capture device.
+        
+        Returns:
+            Frame in BGR format, or None if the capture failed
+        """
+        return self.screen_capture.capture() if self.screen_capture else None
+    
+    def should_stop(self) -> bool:
+        """
+        Check whether the running actions should stop.
+        
+        True after a stop request, and inside a parallel group whose
+        siblings already won a first-completed race.
+        
+        Returns:
+            True if the current execution was cancelled, False otherwise
+        """
+        return self.stop_requested or is_cancelled()
+    
     def _log_callback(self, message: str) -> None:
         """
         Log a message to the debug tab if available.
@@ -516,6 +650,7 @@ class AutomationCore:
         try:
             self.is_executing = True
             self.current_sequence = sequence
+            self.cancel_token = CancellationToken()
             self.execution_context = ExecutionContext(
                 positions={pos.name: pos for pos in self.get_all_positions()},
                 window_manager=self.window_manager,
@@ -523,19 +658,27 @@ class AutomationCore:
                 text_ocr=self.text_ocr,
                 game_actions=self.game_actions,
                 variables={},
-                overlay=self.overlay
+                overlay=self.overlay,
+                ocr_regions=self.ocr_regions,
+                cancel_token=self.cancel_token
             )
             
             logger.info(f"Executing sequence: {sequence_name}")
             
             # Reset progress tracker
-            self.progress_tracker.reset(len(sequence.actions))
+            self.progress_tracker.start_tracking(len(sequence.actions))
             
-            # Execute each action in the sequence
-            success = self._execute_actions(sequence.actions)
+            # Compile the sequence (cached while unchanged) and run the plan;
+            # handlers and their sleeps observe the token of this execution
+            with use_token(self.cancel_token):
+                success = self._execute_actions(sequence.actions, sequence_name)
+            self.progress_tracker.stop_tracking()
             
             logger.info(f"Sequence {sequence_name} completed with {'success' if success else 'failure'}")
             
+            if self.profiler.enabled and self.profile_export_path:
+                self.profiler.export(self.profile_export_path)
+            
             # Notify sequence completion
             self._on_sequence_complete(sequence_name, success)
             
@@ -548,62 +691,157 @@ class AutomationCore:
             self.is_executing = False
             self.current_sequence = None
             self.execution_context = None
+            self.cancel_token = None
             self.pause_requested = False
             self.stop_requested = False
     
-    def _execute_actions(self, actions: List[AutomationAction]) -> bool:
+    def _execute_actions(self, actions: List[Any], name: str = "actions") -> bool:
         """
         Execute a list of actions.
         
+        The actions are compiled into a plan first, so parsing, validation
+        and handler lookup happen once per list instead of once per action.
+        
         Args:
-            actions: List of actions to execute
+            actions: List of action dictionaries or AutomationActions
+            name: Name of the list (key of the compiled plan cache)
             
         Returns:
             True if all actions executed successfully, False otherwise
         """
-        for i, action in enumerate(actions):
-            if self.stop_requested:
-                logger.info("Execution stopped by user")
-                return False
-            
-            while self.pause_requested:
+        context = self.execution_context
+        try:
+            plan = self.compiler.compile_actions(name, actions, context.positions if context else None)
+        except CompileError as e:
+            logger.error(f"Cannot execute {name}: {e}")
+            return False
+        
+        runner = PlanRunner(plan, self.flow_handlers._evaluate_condition,
+                            context.variables if context else {})
+        
+        # Progress counts top-level actions (the tracker is sized by them);
+        # an action is complete once a step of a later one runs, so the
+        # steps inside loops and branches do not count on their own
+        completed = 0
+        
+        def complete_until(top_index: int) -> None:
+            nonlocal completed
+            while completed < top_index:
+                completed += 1
+                self.progress_tracker.action_completed(True)
+                self._on_progress(completed, plan.top_level_count)
+        
+        def on_step(step: PlanStep, success: bool) -> None:
+            nonlocal completed
+            complete_until(step.top_index)
+            if not success:
+                completed += 1
+                self.progress_tracker.action_completed(False)
+                self._on_progress(completed, plan.top_level_count)
+                logger.error(f"Action failed: step {step.source} ({step.action.action_type})")
+        
+        try:
+            success = runner.run(self._wait_while_paused, on_step)
+            if runner.error:
+                logger.error(runner.error)
+            elif success:
+                # Actions after the last executed step (e.g. a skipped branch)
+                complete_until(plan.top_level_count)
+            return success
+        except Exception as e:
+            logger.error(f"Error executing {name}: {e}")
+            return False
+    
+    def _wait_while_paused(self) -> bool:
+        """
+        Block while execution is paused.
+        
+        Returns:
+            False if execution was stopped, True to continue
+        """
+        if self.stop_requested:
+            logger.info("Execution stopped by user")
+            return False
+        
+        while self.pause_requested:
+            if self.cancel_token is not None:
+                self.cancel_token.sleep(0.1)
+            else:
                 time.sleep(0.1)
-                if self.stop_requested:
-                    logger.info("Execution stopped by user during pause")
-                    return False
-            
-            # Update progress
-            self.progress_tracker.set_current_action(i + 1)
-            progress_data = self.progress_tracker.get_progress()
-            self._on_progress_update(progress_data)
-            
-            # Find a handler for this action type
-            handler = None
-            for h in self.action_handlers:
-                if h.can_handle(action.action_type):
-                    handler = h
-                    break
-            
-            if not handler:
-                logger.error(f"No handler found for action type: {action.action_type}")
-                return False
-            
-            # Execute the action
-            try:
-                success = handler.handle(action, self.execution_context)
-                if not success:
-                    logger.error(f"Action failed: {action.action_type}")
-                    return False
-            except Exception as e:
-                logger.error(f"Error executing action {action.action_type}: {e}")
+            if self.stop_requested:
+                logger.info("Execution stopped by user during pause")
                 return False
         
         return True
     
+    def enable_async_mode(self):
+        """
+        Enable the asyncio execution mode.
+        
+        The runtime runs sequences as coroutines on one event loop thread,
+        with waits resumed by capture, template match and OCR events.
+        
+        Returns:
+            The AsyncAutomationRuntime
+        """
+        if self.async_runtime is None:
+            from .async_runtime import AsyncAutomationRuntime
+            self.async_runtime = AsyncAutomationRuntime(self)
+            if self.signal_bus is not None:
+                self.async_runtime.connect_signal_bus(self.signal_bus)
+            if self.ocr_regions is not None:
+                self.async_runtime.connect_ocr_regions(self.ocr_regions)
+            self.async_runtime.start()
+            logger.info("Async execution mode enabled")
+        return self.async_runtime
+    
+    def execute_sequence_async(self, sequence_name: str, simulate: bool = False):
+        """
+        Execute a sequence on the asyncio runtime without blocking the caller.
+        
+        Args:
+            sequence_name: Name of the sequence to execute
+            simulate: Whether to simulate the actions
+            
+        Returns:
+            concurrent.futures.Future resolving to the success flag, or None
+            if the sequence was not found
+        """
+        sequence = self.get_sequence(sequence_name)
+        if not sequence:
+            logger.error(f"Cannot execute sequence: '{sequence_name}' not found")
+            return None
+        
+        future = self.enable_async_mode().submit(sequence, simulate)
+        future.add_done_callback(
+            lambda done: self._on_sequence_complete(sequence_name, not done.cancelled() and bool(done.result())))
+        return future
+    
+    def execute_sequences_concurrently(self, sequence_names: List[str], simulate: bool = False):
+        """
+        Execute independent sequences concurrently on the asyncio runtime.
+        
+        Args:
+            sequence_names: Names of the sequences to execute
+            simulate: Whether to simulate the actions
+            
+        Returns:
+            concurrent.futures.Future resolving to the list of success flags,
+            or None if a sequence was not found
+        """
+        sequences = [self.get_sequence(name) for name in sequence_names]
+        missing = [name for name, sequence in zip(sequence_names, sequences) if not sequence]
+        if missing:
+            logger.error(f"Cannot execute sequences: {', '.join(missing)} not found")
+            return None
+        return self.enable_async_mode().submit_concurrent(sequences, simulate)
+    
     def pause_execution(self) -> None:
         """
         Pause the current sequence execution.
         """
+        if self.async_runtime is not None:
+            self.async_runtime.pause()
         if self.is_executing:
             self.pause_requested = True
             logger.info("Execution pause requested")
@@ -612,6 +850,8 @@ class AutomationCore:
         """
         Resume the paused sequence execution.
         """
+        if self.async_runtime is not None:
+            self.async_runtime.resume()
         if self.is_executing and self.pause_requested:
             self.pause_requested = False
             logger.info("Execution resumed")
@@ -620,8 +860,14 @@ class AutomationCore:
         """
         Stop the current sequence execution.
         """
+        if self.async_runtime is not None:
+            self.async_runtime.stop()
         if self.is_executing:
             self.stop_requested = True
+            # Wake sleeping handlers and cancel running parallel groups
+            token = self.cancel_token
+            if token is not None:
+                token.cancel("stop requested")
             logger.info("Execution stop requested")
     
     def save_to_file(self, filename: str) -> bool:
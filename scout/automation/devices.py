@@ -0,0 +1,91 @@
+"""
+Automation Devices
+
+This module provides the input and capture devices the action handlers use.
+It handles:
+- Mouse and keyboard input through GameActions (click, drag, type)
+- Frame capture of the game window through the template matcher
+
+Handlers only talk to AutomationCore.input_controller and
+AutomationCore.screen_capture, so other implementations (such as the
+recording and replaying devices of the simulation runtime) can be swapped in.
+"""
+
+from typing import Optional, Any
+import logging
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+class GameActionsInput:
+    """
+    Input device backed by GameActions (window-relative coordinates).
+    """
+
+    def __init__(self, game_actions: Any):
+        """
+        Initialize the input device.
+
+        Args:
+            game_actions: GameActions instance
+        """
+        self.game_actions = game_actions
+
+    def click(self, x: int, y: int, button: str = "left", clicks: int = 1) -> None:
+        """
+        Click at window coordinates.
+
+        Args:
+            x: X coordinate
+            y: Y coordinate
+            button: Mouse button ('left', 'right', 'middle')
+            clicks: Number of clicks
+        """
+        self.game_actions.click_at(x, y, relative_to_window=True, button=button, clicks=clicks)
+
+    def drag(self, start_x: int, start_y: int, end_x: int, end_y: int, duration: float = 0.5) -> None:
+        """
+        Drag between window coordinates.
+
+        Args:
+            start_x: Starting X coordinate
+            start_y: Starting Y coordinate
+            end_x: Ending X coordinate
+            end_y: Ending Y coordinate
+            duration: Duration of the drag in seconds
+        """
+        self.game_actions.drag_mouse(start_x, start_y, end_x, end_y,
+                                     relative_to_window=True, duration=duration)
+
+    def type_text(self, text: str) -> None:
+        """
+        Type text at the current cursor position.
+
+        Args:
+            text: Text to type
+        """
+        self.game_actions.input_text(text)
+
+class WindowScreenCapture:
+    """
+    Capture device for the game window.
+    """
+
+    def __init__(self, template_matcher: Any):
+        """
+        Initialize the capture device.
+
+        Args:
+            template_matcher: TemplateMatcher whose window is captured
+        """
+        self.template_matcher = template_matcher
+
+    def capture(self) -> Optional[np.ndarray]:
+        """
+        Capture the game window.
+
+        Returns:
+            Frame in BGR format, or None if the capture failed
+        """
+        return self.template_matcher.capture_window()
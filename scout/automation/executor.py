@@ -2,16 +2,21 @@
 Sequence Executor
 
 This module handles the execution of automation sequences, including:
-- Step-by-step execution
+- Step-by-step execution of compiled plans
 - Simulation mode
 - Execution flow control
 - Debug logging
+
+Steps are scheduled on the Qt event loop with a single-shot QTimer: every
+timer tick runs one action, then re-arms the timer with the step delay. The
+call stack and memory stay flat no matter how long a sequence loops, and the
+GUI keeps processing events between steps and during wait actions.
 """
 
 from typing import Dict, Optional, List, Callable, Tuple, Any
-import time
+import random
 import logging
-from PyQt6.QtCore import QObject, pyqtSignal
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
 import win32api
 import win32con
 
@@ -22,6 +27,7 @@ from scout.automation.actions import (
     ActionType, AutomationAction, ActionParamsCommon
 )
 from scout.automation.action_executor import ActionExecutor
+from scout.automation.compiler import SequenceCompiler, CompiledPlan, PlanRunner, CompileError
 
 logger = logging.getLogger(__name__)
 
@@ -66,12 +72,22 @@ class SequenceExecutor(QObject):
         # Create action executor
         self.action_executor = ActionExecutor(context, self._log_debug)
         
+        # Sequences are compiled once and the plan is reused for every loop
+        self.compiler = SequenceCompiler(self.action_executor.get_handler)
+        self.plan: Optional[CompiledPlan] = None
+        self.runner: Optional[PlanRunner] = None
+        
         # Execution state
         self.current_sequence: Optional[AutomationSequence] = None
         self.current_step = 0
         self.is_paused = False
         self.is_running = False
         
+        # Scheduler: one step per timer tick, delays are timer intervals
+        self._step_timer = QTimer(self)
+        self._step_timer.setSingleShot(True)
+        self._step_timer.timeout.connect(self._execute_next_step)
+        
     def execute_sequence(self, sequence: AutomationSequence) -> None:
         """
         Start executing a sequence.
@@ -83,24 +99,33 @@ class SequenceExecutor(QObject):
             logger.warning("Cannot start execution while already running")
             return
             
+        # Reset action executor state
+        self.action_executor.reset_state()
+        
+        try:
+            self.plan = self.compiler.compile(sequence, self.context.positions)
+        except CompileError as e:
+            self._handle_error(f"Failed to compile sequence {sequence.name}: {e}")
+            return
+        self.runner = PlanRunner(
+            self.plan,
+            self.action_executor.evaluate_condition,
+            self.action_executor._variable_store,
+            self.context.simulation_mode
+        )
+        
         self.current_sequence = sequence
         self.current_step = 0
         self.is_running = True
         self.is_paused = False
         
-        # Reset action executor state
-        self.action_executor.reset_state()
-        
         logger.info(f"Starting execution of sequence: {sequence.name}")
         self._log_debug(f"Starting sequence: {sequence.name} (Loop: {'ON' if self.context.loop_enabled else 'OFF'})")
         
         # Emit signal that execution has started
         self.execution_started.emit(sequence.name)
         
-        try:
-            self._execute_next_step()
-        except Exception as e:
-            self._handle_error(f"Failed to start sequence: {e}")
+        self._schedule(0.0)
             
     def pause_execution(self) -> None:
         """Pause sequence execution."""
@@ -108,6 +133,7 @@ class SequenceExecutor(QObject):
             return
             
         self.is_paused = True
+        self._step_timer.stop()
         self._log_debug("Execution paused")
         self.execution_paused.emit()
         
@@ -119,29 +145,41 @@ class SequenceExecutor(QObject):
         self.is_paused = False
         self._log_debug("Execution resumed")
         self.execution_resumed.emit()
-        self._execute_next_step()
+        self._schedule(0.0)
         
     def step_execution(self) -> None:
         """Execute a single step while paused."""
         if not self.is_running or not self.is_paused:
             return
             
-        self._execute_next_step()
+        self._run_step()
         
     def stop_execution(self) -> None:
         """Stop sequence execution."""
         if not self.is_running:
             return
             
+        self._step_timer.stop()
         self.is_running = False
         self.is_paused = False
         self.current_sequence = None
+        self.runner = None
         self.current_step = 0
         self._log_debug("Execution stopped")
         
+    def _schedule(self, delay: float) -> None:
+        """
+        Schedule the next step on the event loop.
+        
+        Args:
+            delay: Delay in seconds before the next step
+        """
+        if self.is_running and not self.is_paused:
+            self._step_timer.start(max(0, int(delay * 1000)))
+            
     def _execute_next_step(self) -> None:
-        """Execute the next step in the sequence."""
-        if not self.is_running or not self.current_sequence:
+        """Execute the next step in the sequence (called by the step timer)."""
+        if not self.is_running or not self.current_sequence or not self.runner:
             return
             
         if self.is_paused:
@@ -153,58 +191,89 @@ class SequenceExecutor(QObject):
             self.stop_execution()
             return
             
-        if self.current_step >= len(self.current_sequence.actions):
-            self._complete_sequence()
-            return
+        delay = self._run_step()
+        if delay is not None:
+            self._schedule(delay)
             
+    def _run_step(self) -> Optional[float]:
+        """
+        Run the action at the program counter.
+        
+        Returns:
+            Delay in seconds before the next step, or None if nothing is to be
+            scheduled (sequence finished, failed or stopped)
+        """
         try:
-            action_data = self.current_sequence.actions[self.current_step]
-            action = AutomationAction.from_dict(action_data)
-            
-            # Skip disabled actions
-            if not action.params.enabled:
-                self._log_debug(f"Skipping disabled step {self.current_step + 1}: {action.action_type.name}")
-                self.current_step += 1
-                self._execute_next_step()
-                return
+            # Jumps and loop counters are resolved here, no parsing involved
+            step = self.runner.advance()
+            if step is None:
+                if self.runner.error:
+                    self._handle_error(self.runner.error)
+                    return None
+                return self._complete_sequence()
                 
-            self._log_debug(f"Executing step {self.current_step + 1}: {action.action_type.name}")
+            self.current_step = step.top_index
+            self._log_debug(f"Executing step {step.source}: {step.action.action_type.name}")
+            self.runner.simulate = self.context.simulation_mode
             
-            # Execute or simulate the action
-            if self.context.simulation_mode:
-                self.action_executor.simulate_action(action)
+            delay = self.context.step_delay
+            if step.action.action_type == ActionType.WAIT and not self.runner.simulate:
+                # Waits become the timer interval instead of blocking the GUI thread
+                self.runner.skip(step)
+                delay += self._wait_duration(step.action.params)
+                self._log_debug(f"Waiting {delay:.2f}s")
             else:
-                self.action_executor.execute_action(action)
+                self.runner.execute(step)
                 
             # Update progress
             self.step_completed.emit(self.current_step)
-            self.execution_progress.emit(self.current_step + 1, len(self.current_sequence.actions))
-            self.current_step += 1
-            
-            # Schedule next step if not stopped
-            if not self.is_paused and self.is_running:
-                time.sleep(self.context.step_delay)
-                self._execute_next_step()
+            self.execution_progress.emit(self.current_step + 1, self.plan.top_level_count)
+            return delay
                 
         except Exception as e:
             self._handle_error(f"Failed to execute step {self.current_step + 1}: {e}")
+            return None
+            
+    def _wait_duration(self, params: Any) -> float:
+        """
+        Get the duration of a wait action in seconds.
+        
+        Args:
+            params: Wait action parameters
             
-    def _complete_sequence(self) -> None:
-        """Handle sequence completion."""
+        Returns:
+            Duration including the random variation (never negative)
+        """
+        duration = getattr(params, "duration", 0.0)
+        variation = getattr(params, "random_variation", 0.0)
+        if variation:
+            duration += random.uniform(-variation, variation)
+        return max(0.0, duration)
+            
+    def _complete_sequence(self) -> Optional[float]:
+        """
+        Handle sequence completion.
+        
+        Returns:
+            Delay before the next loop, or None if execution ended
+        """
         if self.context.loop_enabled and self.is_running:
-            # Reset step counter and continue execution
+            # Rewind the plan and continue execution (the plan is not recompiled)
             self.current_step = 0
+            self.runner.reset()
             self._log_debug("Sequence completed - restarting due to loop enabled")
-            time.sleep(self.context.step_delay)  # Add delay between loops
-            self._execute_next_step()
-        else:
-            # Normal completion
-            self.is_running = False
-            self._log_debug("Sequence completed")
-            self.sequence_completed.emit()
+            return self.context.step_delay  # Add delay between loops
+        
+        # Normal completion
+        self.is_running = False
+        self._log_debug("Sequence completed")
+        self.sequence_completed.emit()
+        self.execution_completed.emit()
+        return None
         
     def _handle_error(self, message: str) -> None:
         """Handle execution error."""
+        self._step_timer.stop()
         self.is_running = False
         logger.error(message)
         self._log_debug(f"ERROR: {message}")
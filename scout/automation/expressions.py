@@ -0,0 +1,463 @@
+"""
+Automation Expressions
+
+This module provides the small expression language used by conditions,
+switch expressions and data actions. It handles:
+- Tokenizing and parsing expressions once into closures (cached per string)
+- Operator precedence: or, and, not, comparisons, + -, * / // %, unary, **
+- Chained comparisons as in Python (``0 <= ${x} <= 10`` means
+  ``0 <= ${x} and ${x} <= 10``, with ${x} evaluated once)
+- Variables as ${name} or bare names, resolved through slots: every distinct
+  variable is looked up once per evaluation, the closures index a list
+- Literals (numbers, quoted strings, true/false/none, lists) and a fixed set
+  of safe functions (abs, len, min, max, round, math.sqrt, ...)
+
+Expressions never reach eval(), so they cannot call arbitrary Python code.
+
+For compatibility with the old string-splitting evaluator:
+- A bare name that is not a variable evaluates to the name itself
+  (so ``${state} == idle`` compares against the string "idle"), except
+  where its truth is tested: as the whole condition or an operand of
+  not/and/or it is None, so ``found`` or ``while keep_going`` is false
+  while the flag is unset
+- Several bare words in a row are one string, as written
+  (``${state} == waiting for raid`` compares against "waiting for raid")
+- Comparisons between a number and a numeric string compare numerically
+  (OCR results are stored as strings), and the strings "true"/"false"
+  equal the keywords true/false
+"""
+
+from typing import Dict, List, Optional, Callable, Tuple, Any
+from functools import lru_cache
+import logging
+import math
+import operator
+import re
+import sys
+
+logger = logging.getLogger(__name__)
+
+# Evaluation closure: slot values -> result
+Node = Callable[[List[Any]], Any]
+
+_MISSING = object()
+
+class ExpressionError(ValueError):
+    """Raised when an expression cannot be parsed or evaluated."""
+
+# Functions available to expressions
+FUNCTIONS: Dict[str, Callable[..., Any]] = {
+    "abs": abs, "bool": bool, "float": float, "int": int, "len": len,
+    "max": max, "min": min, "round": round, "str": str, "sum": sum,
+    "math.ceil": math.ceil, "math.floor": math.floor, "math.sqrt": math.sqrt,
+    "math.sin": math.sin, "math.cos": math.cos, "math.tan": math.tan,
+}
+
+# Named constants (matched case-insensitively for the keywords)
+CONSTANTS: Dict[str, Any] = {"true": True, "false": False, "none": None, "null": None}
+MATH_CONSTANTS: Dict[str, Any] = {"math.pi": math.pi, "math.e": math.e}
+
+_TOKEN_PATTERN = re.compile(r"""
+    \s*(?:
+        (?P<number>\d+\.\d*|\.\d+|\d+)
+      | (?P<string>'(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*")
+      | (?P<variable>\$\{[^}]+\})
+      | (?P<name>[A-Za-z_][A-Za-z0-9_]*(?:\.[A-Za-z_][A-Za-z0-9_]*)*)
+      | (?P<op>\*\*|//|==|!=|<=|>=|&&|\|\||[-+*/%<>!(),\[\]])
+    )""", re.VERBOSE)
+
+_ESCAPE_PATTERN = re.compile(r"\\(.)")
+_ESCAPES = {"n": "\n", "t": "\t"}
+
+def _unescape(match: "re.Match") -> str:
+    """Resolve a backslash escape in a string literal."""
+    return _ESCAPES.get(match.group(1), match.group(1))
+
+_KEYWORD_OPS = {"and": "and", "or": "or", "not": "not", "in": "in"}
+_SYMBOL_ALIASES = {"&&": "and", "||": "or", "!": "not"}
+
+def _tokenize(text: str) -> Tuple[List[Tuple[str, Any]], List[Tuple[int, int]]]:
+    """Split an expression into (kind, value) tokens and their (start, end) positions."""
+    tokens = []
+    spans = []
+    position = 0
+    text = text.rstrip()
+    while position < len(text):
+        match = _TOKEN_PATTERN.match(text, position)
+        if match is None or match.end() == position:
+            raise ExpressionError(f"Unexpected character {text[position:].strip()[:1]!r} at {position}")
+        spans.append((match.start(match.lastgroup), match.end()))
+        position = match.end()
+        kind = match.lastgroup
+        value = match.group(kind)
+        if kind == "number":
+            tokens.append(("const", float(value) if "." in value else int(value)))
+        elif kind == "string":
+            tokens.append(("const", _ESCAPE_PATTERN.sub(_unescape, value[1:-1])))
+        elif kind == "variable":
+            tokens.append(("var", value[2:-1].strip()))
+        elif kind == "name":
+            lowered = value.lower()
+            if lowered in _KEYWORD_OPS:
+                tokens.append(("op", _KEYWORD_OPS[lowered]))
+            elif lowered in CONSTANTS:
+                tokens.append(("const", CONSTANTS[lowered]))
+            else:
+                tokens.append(("name", value))
+        else:
+            tokens.append(("op", _SYMBOL_ALIASES.get(value, value)))
+    tokens.append(("end", None))
+    spans.append((len(text), len(text)))
+    return tokens, spans
+
+def _to_number(value: Any) -> Any:
+    """Convert a numeric string to a number (other values are returned unchanged)."""
+    if isinstance(value, str):
+        try:
+            return float(value) if any(c in value for c in ".eE") else int(value)
+        except ValueError:
+            return value
+    return value
+
+def _is_number(value: Any) -> bool:
+    """Whether a value is a real number (not a bool)."""
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+def _to_bool(value: Any) -> Any:
+    """Convert "true"/"false" (any case) to a bool (other values are returned unchanged)."""
+    if isinstance(value, str):
+        lowered = value.strip().lower()
+        if lowered in ("true", "false"):
+            return lowered == "true"
+    return value
+
+def _compare(op: Callable[[Any, Any], bool]) -> Callable[[Any, Any], bool]:
+    """
+    Wrap a comparison so that numbers and numeric strings compare numerically,
+    and booleans and "true"/"false" strings compare as booleans.
+    """
+    def compare(left: Any, right: Any) -> bool:
+        if isinstance(left, bool) and isinstance(right, str):
+            right = _to_bool(right)
+        elif isinstance(right, bool) and isinstance(left, str):
+            left = _to_bool(left)
+        elif _is_number(left) and isinstance(right, str):
+            right = _to_number(right)
+        elif _is_number(right) and isinstance(left, str):
+            left = _to_number(left)
+        return op(left, right)
+    return compare
+
+# Comparisons (precedence 4); "not in" is handled by the parser
+_COMPARISONS: Dict[str, Callable[[Any, Any], bool]] = {
+    "==": _compare(operator.eq), "!=": _compare(operator.ne),
+    "<": _compare(operator.lt), "<=": _compare(operator.le),
+    ">": _compare(operator.gt), ">=": _compare(operator.ge),
+    "in": lambda left, right: left in right,
+}
+
+_BINARY_OPS: Dict[str, Tuple[int, Callable[[Any, Any], Any]]] = {
+    "+": (5, operator.add), "-": (5, operator.sub),
+    "*": (6, operator.mul), "/": (6, operator.truediv),
+    "//": (6, operator.floordiv), "%": (6, operator.mod),
+    "**": (8, operator.pow),
+}
+
+class _Parser:
+    """Pratt parser producing evaluation closures."""
+
+    def __init__(self, text: str):
+        self.text = text
+        self.tokens, self.spans = _tokenize(text)
+        self.index = 0
+        self.slots: Dict[str, int] = {}
+
+    def peek(self) -> Tuple[str, Any]:
+        return self.tokens[self.index]
+
+    def take(self) -> Tuple[str, Any]:
+        token = self.tokens[self.index]
+        self.index += 1
+        return token
+
+    def expect(self, value: str) -> None:
+        kind, token = self.take()
+        if kind != "op" or token != value:
+            raise ExpressionError(f"Expected {value!r}, found {token!r}")
+
+    def slot(self, name: str) -> int:
+        """Get the slot index of a variable."""
+        name = sys.intern(name)
+        if name not in self.slots:
+            self.slots[name] = len(self.slots)
+        return self.slots[name]
+
+    def parse(self) -> Node:
+        node = self.expression(0)
+        kind, token = self.peek()
+        if kind != "end":
+            raise ExpressionError(f"Unexpected {token!r}")
+        return node
+
+    def expression(self, min_precedence: int) -> Node:
+        left = self.unary()
+        while True:
+            kind, token = self.peek()
+            if kind != "op":
+                return left
+
+            if token == "or" and min_precedence <= 1:
+                self.take()
+                right = self.truth(self.expression(2))
+                left = (lambda a, b: lambda s: a(s) or b(s))(self.truth(left), right)
+            elif token == "and" and min_precedence <= 2:
+                self.take()
+                right = self.truth(self.expression(3))
+                left = (lambda a, b: lambda s: a(s) and b(s))(self.truth(left), right)
+            elif min_precedence <= 4 and self.comparison_ahead():
+                left = self.comparison(left)
+            elif token in _BINARY_OPS and _BINARY_OPS[token][0] >= min_precedence:
+                precedence, function = _BINARY_OPS[token]
+                self.take()
+                # ** is right-associative, everything else left-associative
+                right = self.expression(precedence if token == "**" else precedence + 1)
+                left = (lambda f, a, b: lambda s: f(a(s), b(s)))(function, left, right)
+            else:
+                return left
+
+    def comparison_ahead(self) -> Optional[Callable[[Any, Any], bool]]:
+        """Get the comparison function at the current token (None if there is none)."""
+        kind, token = self.peek()
+        if kind != "op":
+            return None
+        if token == "not" and self.tokens[self.index + 1] == ("op", "in"):
+            return lambda left, right: left not in right
+        return _COMPARISONS.get(token)
+
+    def comparison(self, left: Node) -> Node:
+        """Parse a (possibly chained) comparison whose first operand is parsed."""
+        pairs: List[Tuple[Callable[[Any, Any], bool], Node]] = []
+        while True:
+            function = self.comparison_ahead()
+            if function is None:
+                break
+            self.index += 2 if self.peek() == ("op", "not") else 1
+            pairs.append((function, self.expression(5)))
+
+        if len(pairs) == 1:
+            function, right = pairs[0]
+            return lambda s: function(left(s), right(s))
+
+        def chain(s: List[Any]) -> bool:
+            # a < b < c is a < b and b < c, every operand evaluated at most once
+            current = left(s)
+            for function, node in pairs:
+                value = node(s)
+                if not function(current, value):
+                    return False
+                current = value
+            return True
+        return chain
+
+    def truth(self, node: Node) -> Node:
+        """Make a bare name whose truth is tested None while unset (instead of its text)."""
+        index = getattr(node, "bare_name", None)
+        if index is None:
+            return node
+        return lambda s: None if s[index] is _MISSING else s[index]
+
+    def unary(self) -> Node:
+        kind, token = self.peek()
+        if kind == "op" and token == "not":
+            self.take()
+            operand = self.truth(self.expression(3))
+            return lambda s: not operand(s)
+        if kind == "op" and token in ("-", "+"):
+            self.take()
+            operand = self.expression(7)
+            return (lambda s: -operand(s)) if token == "-" else operand
+        return self.postfix(self.primary())
+
+    def postfix(self, node: Node) -> Node:
+        while self.peek() == ("op", "["):
+            self.take()
+            key = self.expression(0)
+            self.expect("]")
+            node = (lambda a, k: lambda s: a(s)[k(s)])(node, key)
+        return node
+
+    def primary(self) -> Node:
+        kind, token = self.take()
+        if kind == "end":
+            raise ExpressionError("Unexpected end of expression")
+        if kind == "const":
+            return lambda s: token
+        if kind == "var":
+            index = self.slot(token)
+            return lambda s: None if s[index] is _MISSING else s[index]
+        if kind == "name":
+            if self.peek() == ("op", "("):
+                return self.call(token)
+            if token in MATH_CONSTANTS:
+                value = MATH_CONSTANTS[token]
+                return lambda s: value
+            if self.peek()[0] in ("name", "const"):
+                return self.phrase()
+            # Bare names are variables, falling back to the name as a string
+            # (truth() drops the fallback where the name is tested)
+            index = self.slot(token)
+            node = lambda s: token if s[index] is _MISSING else s[index]
+            node.bare_name = index
+            return node
+        if kind == "op" and token == "(":
+            node = self.expression(0)
+            self.expect(")")
+            return node
+        if kind == "op" and token == "[":
+            items = self.items("]")
+            return lambda s: [item(s) for item in items]
+        raise ExpressionError(f"Unexpected {token!r}")
+
+    def phrase(self) -> Node:
+        """Parse bare words following a bare name as one string, as written."""
+        start = self.spans[self.index - 1][0]
+        while self.peek()[0] in ("name", "const"):
+            self.take()
+        text = self.text[start:self.spans[self.index - 1][1]]
+        return lambda s: text
+
+    def call(self, name: str) -> Node:
+        function = FUNCTIONS.get(name)
+        if function is None:
+            raise ExpressionError(f"Unknown function '{name}'")
+        self.take()
+        args = self.items(")")
+        return lambda s: function(*[arg(s) for arg in args])
+
+    def items(self, closing: str) -> List[Node]:
+        items = []
+        if self.peek() == ("op", closing):
+            self.take()
+            return items
+        while True:
+            items.append(self.expression(0))
+            kind, token = self.take()
+            if kind == "op" and token == closing:
+                return items
+            if kind != "op" or token != ",":
+                raise ExpressionError(f"Expected ',' or {closing!r}, found {token!r}")
+
+class CompiledExpression:
+    """
+    A parsed expression, ready to be evaluated against variable stores.
+    """
+
+    __slots__ = ("source", "names", "_node", "_condition")
+
+    def __init__(self, source: str):
+        """
+        Parse an expression.
+
+        Args:
+            source: Expression text
+
+        Raises:
+            ExpressionError: If the expression is invalid
+        """
+        parser = _Parser(source)
+        self.source = source
+        self._node = parser.parse()
+        self._condition = parser.truth(self._node)
+        self.names: Tuple[str, ...] = tuple(sorted(parser.slots, key=parser.slots.get))
+
+    def evaluate(self, variable_store: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        Evaluate the expression.
+
+        Args:
+            variable_store: Store for variables
+
+        Returns:
+            Result of the expression
+
+        Raises:
+            ExpressionError: If evaluation fails (e.g. a type error)
+        """
+        return self._run(self._node, variable_store)
+
+    def test(self, variable_store: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        Evaluate the expression as a condition.
+
+        Unlike evaluate(), a bare name making up the whole expression is
+        None while unset instead of its own text.
+
+        Args:
+            variable_store: Store for variables
+
+        Returns:
+            Truth value of the expression
+
+        Raises:
+            ExpressionError: If evaluation fails (e.g. a type error)
+        """
+        return bool(self._run(self._condition, variable_store))
+
+    def _run(self, node: Node, variable_store: Optional[Dict[str, Any]]) -> Any:
+        """Evaluate a closure of the expression against a variable store."""
+        store = {} if variable_store is None else variable_store
+        slots = [store.get(name, _MISSING) for name in self.names]
+        try:
+            return node(slots)
+        except ExpressionError:
+            raise
+        except Exception as e:
+            raise ExpressionError(f"Error evaluating '{self.source}': {e}") from e
+
+@lru_cache(maxsize=1024)
+def compile_expression(source: str) -> CompiledExpression:
+    """
+    Parse an expression (cached per expression text).
+
+    Args:
+        source: Expression text
+
+    Returns:
+        Compiled expression
+
+    Raises:
+        ExpressionError: If the expression is invalid
+    """
+    return CompiledExpression(source)
+
+def evaluate(source: str, variable_store: Optional[Dict[str, Any]] = None) -> Any:
+    """
+    Evaluate an expression.
+
+    Args:
+        source: Expression text
+        variable_store: Store for variables
+
+    Returns:
+        Result of the expression
+
+    Raises:
+        ExpressionError: If the expression is invalid or cannot be evaluated
+    """
+    return compile_expression(source).evaluate(variable_store)
+
+def evaluate_condition(source: str, variable_store: Optional[Dict[str, Any]] = None) -> bool:
+    """
+    Evaluate an expression as a condition.
+
+    Args:
+        source: Expression text
+        variable_store: Store for variables
+
+    Returns:
+        Truth value of the expression
+
+    Raises:
+        ExpressionError: If the expression is invalid or cannot be evaluated
+    """
+    return compile_expression(source).test(variable_store)
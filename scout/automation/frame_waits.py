@@ -0,0 +1,433 @@
+"""
+Frame Waits
+
+This module provides event-driven waits on the shared capture pipeline.
+It handles:
+- Subscriptions for "template appears", "template disappears" and
+  "region changes" predicates
+- One capture and one template match pass per frame, shared by every
+  active wait (the union of the waited-for templates is matched once)
+- Frames pushed by the capture pipeline (window_capture_changed) or pulled
+  by a pump thread while waits are active and no frames are pushed
+- Timeouts and cancellation of waits
+- Synchronous polling under a virtual clock (simulation), where waiting
+  for the pump thread would take real time
+
+Waiting sequences register a predicate and block on (or await) its
+subscription instead of looping over WAIT and TEMPLATE_SEARCH actions that
+each capture and match the full screen.
+"""
+
+from typing import Dict, Optional, List, Callable, Any
+from dataclasses import dataclass
+import logging
+import threading
+import time
+
+import numpy as np
+
+from scout.automation.clock import Clock, current_clock, now
+from scout.automation.profiler import profile_phase
+from scout.change_detector import RegionChangeDetector
+from scout.template_matcher import GroupedMatch
+
+logger = logging.getLogger(__name__)
+
+# Condition kinds
+TEMPLATE_APPEARS = "appear"
+TEMPLATE_DISAPPEARS = "disappear"
+REGION_CHANGES = "region_change"
+
+@dataclass
+class FrameCondition:
+    """
+    Predicate evaluated against every new frame.
+
+    Attributes:
+        kind: TEMPLATE_APPEARS, TEMPLATE_DISAPPEARS or REGION_CHANGES
+        template_name: Template to look for (template conditions)
+        confidence: Minimum match confidence (template conditions)
+        region: Region to restrict the condition to [x, y, width, height]
+        threshold: Mean pixel difference (0-255) that counts as a change
+    """
+    kind: str
+    template_name: str = ""
+    confidence: float = 0.8
+    region: Optional[List[int]] = None
+    threshold: float = 2.0
+
+class FrameWait:
+    """
+    Subscription of a condition to the frame pipeline.
+
+    A wait is satisfied at most once; afterwards it no longer receives frames.
+    """
+
+    def __init__(self, condition: FrameCondition):
+        """
+        Initialize the subscription.
+
+        Args:
+            condition: Condition to wait for
+        """
+        self.condition = condition
+        self.match: Optional[GroupedMatch] = None
+        self.frames_checked = 0
+        self.satisfied_at: Optional[float] = None
+        self.cancelled = False
+
+        self._event = threading.Event()
+        self._callbacks: List[Callable[['FrameWait'], None]] = []
+        self._lock = threading.Lock()
+        self._detector = (RegionChangeDetector(condition.threshold)
+                          if condition.kind == REGION_CHANGES else None)
+
+    @property
+    def satisfied(self) -> bool:
+        """Whether the condition was met."""
+        return self.satisfied_at is not None
+
+    @property
+    def done(self) -> bool:
+        """Whether the wait is over (satisfied or cancelled)."""
+        return self._event.is_set()
+
+    def add_done_callback(self, callback: Callable[['FrameWait'], None]) -> None:
+        """
+        Call a function when the wait is over (immediately if it already is).
+
+        The callback runs on the thread that processed the frame, so it
+        should only hand the result over (e.g. to an event loop).
+
+        Args:
+            callback: Function taking this wait
+        """
+        with self._lock:
+            if not self.done:
+                self._callbacks.append(callback)
+                return
+        callback(self)
+
+    def wait(self, timeout: Optional[float] = None,
+             should_stop: Optional[Callable[[], bool]] = None) -> bool:
+        """
+        Block until the condition is met, the timeout expires or the caller stops.
+
+        Args:
+            timeout: Maximum wait in seconds (None waits indefinitely)
+            should_stop: Optional function returning True to abort the wait
+
+        Returns:
+            True if the condition was met
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with profile_phase("sleep"):
+            while not self.done:
+                remaining = 0.1 if deadline is None else min(0.1, deadline - time.monotonic())
+                if remaining <= 0:
+                    break
+                # Short slices only so that stop requests are noticed
+                self._event.wait(remaining)
+                if should_stop is not None and should_stop():
+                    break
+        return self.satisfied
+
+    def cancel(self) -> None:
+        """Finish the wait without satisfying it."""
+        self.cancelled = True
+        self._finish()
+
+    def check(self, frame: np.ndarray, matches: Dict[str, List[GroupedMatch]]) -> bool:
+        """
+        Evaluate the condition against a frame.
+
+        Args:
+            frame: Captured frame (BGR)
+            matches: Template matches of the frame, by template name
+
+        Returns:
+            True if the condition is met
+        """
+        self.frames_checked += 1
+        condition = self.condition
+
+        if condition.kind == REGION_CHANGES:
+            image = frame
+            if condition.region:
+                x, y, width, height = condition.region
+                image = frame[y:y + height, x:x + width]
+            changed = self._detector.has_changed(image)
+            # The first frame only records the baseline
+            return changed and self.frames_checked > 1
+
+        found = [
+            match for match in matches.get(condition.template_name, [])
+            if match.confidence >= condition.confidence and self._in_region(match)
+        ]
+        if condition.kind == TEMPLATE_APPEARS:
+            if found:
+                self.match = max(found, key=lambda match: match.confidence)
+                return True
+            return False
+        return not found
+
+    def _in_region(self, match: GroupedMatch) -> bool:
+        """Whether the center of a match lies in the condition's region."""
+        if not self.condition.region:
+            return True
+        x, y, width, height = self.condition.region
+        match_x, match_y, match_width, match_height = match.bounds
+        center_x = match_x + match_width / 2
+        center_y = match_y + match_height / 2
+        return x <= center_x < x + width and y <= center_y < y + height
+
+    def _resolve(self) -> None:
+        """Mark the condition as met."""
+        self.satisfied_at = now()
+        self._finish()
+
+    def _finish(self) -> None:
+        """Wake the waiting thread and run the callbacks (once)."""
+        with self._lock:
+            if self.done:
+                return
+            self._event.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            try:
+                callback(self)
+            except Exception as e:
+                logger.error(f"Error in frame wait callback: {e}")
+
+class FramePipeline:
+    """
+    Shared capture and match pass for all active frame waits.
+
+    Frames come from feed() (connected to the capture pipeline's
+    window_capture_changed signal) or, while waits are active and nothing
+    is fed, from the capture function at the pump interval. Each frame is
+    processed once on the pump thread, whatever the number of waits.
+    """
+
+    def __init__(self, capture: Callable[[], Optional[np.ndarray]], template_matcher: Any,
+                 interval: float = 0.2):
+        """
+        Initialize the pipeline.
+
+        Args:
+            capture: Function returning the current frame (BGR) or None
+            template_matcher: TemplateMatcher used for template conditions
+            interval: Seconds between frames while waits are active
+        """
+        self.capture = capture
+        self.template_matcher = template_matcher
+        self.interval = interval
+
+        self._waits: List[FrameWait] = []
+        self._pending_frame: Optional[np.ndarray] = None
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+
+        # Statistics
+        self.frames_processed = 0
+        self.match_passes = 0
+
+    def connect_signal_bus(self, signal_bus: Any) -> None:
+        """
+        Use frames published by the capture pipeline.
+
+        Args:
+            signal_bus: Application SignalBus
+        """
+        signal_bus.window_capture_changed.connect(self.feed)
+
+    def subscribe(self, condition: FrameCondition) -> FrameWait:
+        """
+        Register a condition; it is checked against every following frame.
+
+        Args:
+            condition: Condition to wait for
+
+        Returns:
+            Subscription to wait on (call unsubscribe() when done with it)
+        """
+        wait = FrameWait(condition)
+        with self._condition:
+            self._waits.append(wait)
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._pump, name="FramePipeline", daemon=True)
+                self._thread.start()
+            self._condition.notify()
+        return wait
+
+    def unsubscribe(self, wait: FrameWait) -> None:
+        """
+        Remove a subscription (cancelling it if it is still waiting).
+
+        Args:
+            wait: Subscription returned by subscribe()
+        """
+        with self._condition:
+            if wait in self._waits:
+                self._waits.remove(wait)
+        if not wait.done:
+            wait.cancel()
+
+    def wait_for(self, condition: FrameCondition, timeout: Optional[float] = None,
+                 should_stop: Optional[Callable[[], bool]] = None) -> FrameWait:
+        """
+        Block until a condition is met on a new frame.
+
+        Args:
+            condition: Condition to wait for
+            timeout: Maximum wait in seconds
+            should_stop: Optional function returning True to abort the wait
+
+        Returns:
+            The finished subscription (check .satisfied and .match)
+        """
+        clock = current_clock()
+        if clock.virtual:
+            return self._poll(condition, timeout, should_stop, clock)
+        
+        wait = self.subscribe(condition)
+        try:
+            wait.wait(timeout, should_stop)
+        finally:
+            self.unsubscribe(wait)
+        return wait
+
+    def _poll(self, condition: FrameCondition, timeout: Optional[float],
+              should_stop: Optional[Callable[[], bool]], clock: Clock) -> FrameWait:
+        """
+        Wait for a condition by capturing frames on the calling thread.
+
+        Used under a virtual clock: one frame per pump interval of simulated
+        time, without the pump thread and without real sleeps.
+
+        Args:
+            condition: Condition to wait for
+            timeout: Maximum wait in seconds
+            should_stop: Optional function returning True to abort the wait
+            clock: Clock to sleep on
+
+        Returns:
+            The finished subscription
+        """
+        wait = FrameWait(condition)
+        deadline = None if timeout is None else clock.monotonic() + timeout
+        while not wait.done:
+            if should_stop is not None and should_stop():
+                break
+            with profile_phase("capture"):
+                frame = self.capture()
+            if frame is not None:
+                self.frames_processed += 1
+                if wait.check(frame, self._match(frame, [wait])):
+                    wait._resolve()
+                    break
+            if deadline is not None and clock.monotonic() >= deadline:
+                break
+            if not clock.sleep(self.interval):
+                break
+        if not wait.done:
+            wait.cancel()
+        return wait
+
+    def feed(self, frame: np.ndarray) -> None:
+        """
+        Hand a newly captured frame to the pipeline (any thread).
+
+        Frames are dropped while no waits are active; if frames arrive faster
+        than they are processed, only the latest one is kept.
+
+        Args:
+            frame: Captured frame (BGR)
+        """
+        with self._condition:
+            if not self._waits:
+                return
+            self._pending_frame = frame
+            self._condition.notify()
+
+    @property
+    def active_waits(self) -> int:
+        """Number of waits currently subscribed."""
+        with self._condition:
+            return len(self._waits)
+
+    def _pump(self) -> None:
+        """Pump thread: process fed frames, capture when none arrive in time."""
+        while True:
+            with self._condition:
+                if not self._waits:
+                    self._thread = None
+                    return
+                if self._pending_frame is None:
+                    self._condition.wait(self.interval)
+                frame, self._pending_frame = self._pending_frame, None
+                if not self._waits:
+                    continue
+
+            if frame is None:
+                try:
+                    frame = self.capture()
+                except Exception as e:
+                    logger.error(f"Error capturing frame for waits: {e}")
+                    frame = None
+                if frame is None:
+                    time.sleep(self.interval)
+                    continue
+            self.process_frame(frame)
+
+    def process_frame(self, frame: np.ndarray) -> None:
+        """
+        Check all active waits against one frame.
+
+        Args:
+            frame: Captured frame (BGR)
+        """
+        with self._condition:
+            waits = [wait for wait in self._waits if not wait.done]
+        if not waits:
+            return
+        self.frames_processed += 1
+        matches = self._match(frame, waits)
+
+        satisfied = []
+        for wait in waits:
+            try:
+                if wait.check(frame, matches):
+                    satisfied.append(wait)
+            except Exception as e:
+                logger.error(f"Error checking frame condition {wait.condition}: {e}")
+
+        if satisfied:
+            with self._condition:
+                self._waits = [wait for wait in self._waits if wait not in satisfied]
+            for wait in satisfied:
+                wait._resolve()
+
+    def _match(self, frame: np.ndarray, waits: List[FrameWait]) -> Dict[str, List[GroupedMatch]]:
+        """
+        Run one match pass for the union of the templates the waits look for.
+
+        Args:
+            frame: Captured frame (BGR)
+            waits: Waits to serve
+
+        Returns:
+            Matches by template name
+        """
+        template_names = sorted({
+            wait.condition.template_name for wait in waits
+            if wait.condition.kind != REGION_CHANGES and wait.condition.template_name
+        })
+        matches: Dict[str, List[GroupedMatch]] = {}
+        if template_names and self.template_matcher is not None:
+            self.match_passes += 1
+            with profile_phase("match"):
+                found = self.template_matcher.find_matches(frame, template_names)
+            for match in found:
+                matches.setdefault(match.template_name, []).append(match)
+        return matches
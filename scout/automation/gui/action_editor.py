@@ -17,7 +17,8 @@ from PyQt6.QtWidgets import (
 
 from scout.automation.actions import (
     ActionType, AutomationAction, ClickParams, DragParams, TypeParams,
-    WaitParams, TemplateSearchParams, OCRWaitParams, ConditionalParams, LoopParams,
+    WaitParams, TemplateSearchParams, OCRWaitParams, TemplateWaitParams,
+    RegionChangeWaitParams, ConditionalParams, LoopParams,
     SwitchCaseParams, TryCatchParams, ParallelExecutionParams, BreakpointParams,
     LogParams, ScreenshotParams
 )
@@ -72,6 +73,16 @@ ACTION_TYPES = {
         "description": "Wait for text to appear on screen",
         "category": "Visual"
     },
+    ActionType.WAIT_FOR_TEMPLATE: {
+        "name": "Template Wait",
+        "description": "Wait for a template to appear or disappear",
+        "category": "Visual"
+    },
+    ActionType.WAIT_FOR_CHANGE: {
+        "name": "Region Change Wait",
+        "description": "Wait for a screen region to change",
+        "category": "Visual"
+    },
     ActionType.CONDITIONAL: {
         "name": "Conditional",
         "description": "Execute actions if a condition is true",
@@ -268,6 +279,10 @@ class ActionEditorDialog(QDialog):
             self._create_template_search_params()
         elif action_type == ActionType.OCR_WAIT:
             self._create_ocr_wait_params()
+        elif action_type == ActionType.WAIT_FOR_TEMPLATE:
+            self._create_template_wait_params()
+        elif action_type == ActionType.WAIT_FOR_CHANGE:
+            self._create_change_wait_params()
         elif action_type == ActionType.IF_CONDITION:
             self._create_if_condition_params()
         elif action_type == ActionType.REPEAT_LOOP:
@@ -429,6 +444,65 @@ class ActionEditorDialog(QDialog):
         group.setLayout(form)
         self.params_layout.addWidget(group)
     
+    def _create_template_wait_params(self) -> None:
+        """Create widgets for template wait parameters."""
+        group = QGroupBox("Template Wait Parameters")
+        form = QFormLayout()
+        
+        self.template_combo = QComboBox()
+        self.template_combo.setEditable(True)
+        form.addRow("Template:", self.template_combo)
+        
+        self.wait_mode_combo = QComboBox()
+        self.wait_mode_combo.addItems(["appear", "disappear"])
+        form.addRow("Wait Until:", self.wait_mode_combo)
+        
+        self.threshold_spin = QDoubleSpinBox()
+        self.threshold_spin.setRange(0.1, 1.0)
+        self.threshold_spin.setSingleStep(0.05)
+        self.threshold_spin.setValue(0.8)
+        form.addRow("Confidence:", self.threshold_spin)
+        
+        self.timeout_spin = QDoubleSpinBox()
+        self.timeout_spin.setRange(0.1, 600.0)
+        self.timeout_spin.setSingleStep(0.1)
+        self.timeout_spin.setValue(30.0)
+        form.addRow("Timeout (s):", self.timeout_spin)
+        
+        self.watch_region_edit = QLineEdit()
+        self.watch_region_edit.setPlaceholderText("x, y, width, height (empty for whole window)")
+        form.addRow("Region:", self.watch_region_edit)
+        
+        self.result_var_edit = QLineEdit()
+        form.addRow("Result Variable:", self.result_var_edit)
+        
+        group.setLayout(form)
+        self.params_layout.addWidget(group)
+    
+    def _create_change_wait_params(self) -> None:
+        """Create widgets for region change wait parameters."""
+        group = QGroupBox("Region Change Wait Parameters")
+        form = QFormLayout()
+        
+        self.watch_region_edit = QLineEdit()
+        self.watch_region_edit.setPlaceholderText("x, y, width, height (empty for whole window)")
+        form.addRow("Region:", self.watch_region_edit)
+        
+        self.change_threshold_spin = QDoubleSpinBox()
+        self.change_threshold_spin.setRange(0.1, 255.0)
+        self.change_threshold_spin.setSingleStep(0.5)
+        self.change_threshold_spin.setValue(2.0)
+        form.addRow("Change Threshold:", self.change_threshold_spin)
+        
+        self.timeout_spin = QDoubleSpinBox()
+        self.timeout_spin.setRange(0.1, 600.0)
+        self.timeout_spin.setSingleStep(0.1)
+        self.timeout_spin.setValue(30.0)
+        form.addRow("Timeout (s):", self.timeout_spin)
+        
+        group.setLayout(form)
+        self.params_layout.addWidget(group)
+    
     def _create_if_condition_params(self) -> None:
         """Create widgets for if condition parameters."""
         group = QGroupBox("If Condition Parameters")
@@ -639,6 +713,10 @@ class ActionEditorDialog(QDialog):
             self._load_template_search_params(action.params)
         elif action.action_type == ActionType.OCR_WAIT:
             self._load_ocr_wait_params(action.params)
+        elif action.action_type == ActionType.WAIT_FOR_TEMPLATE:
+            self._load_template_wait_params(action.params)
+        elif action.action_type == ActionType.WAIT_FOR_CHANGE:
+            self._load_change_wait_params(action.params)
         elif action.action_type == ActionType.IF_CONDITION:
             self._load_if_condition_params(action.params)
         elif action.action_type == ActionType.REPEAT_LOOP:
@@ -721,6 +799,68 @@ class ActionEditorDialog(QDialog):
         if hasattr(self, 'result_var_edit'):
             self.result_var_edit.setText(params.result_var)
     
+    def _load_template_wait_params(self, params: TemplateWaitParams) -> None:
+        """Load template wait parameters."""
+        if hasattr(self, 'template_combo'):
+            self.template_combo.setCurrentText(params.template_name)
+        if hasattr(self, 'wait_mode_combo'):
+            self.wait_mode_combo.setCurrentText(params.mode)
+        if hasattr(self, 'threshold_spin'):
+            self.threshold_spin.setValue(params.confidence)
+        if hasattr(self, 'timeout_spin'):
+            self.timeout_spin.setValue(params.timeout)
+        if hasattr(self, 'watch_region_edit'):
+            self.watch_region_edit.setText(', '.join(map(str, params.search_region or [])))
+        if hasattr(self, 'result_var_edit'):
+            self.result_var_edit.setText(params.save_to_variable)
+    
+    def _load_change_wait_params(self, params: RegionChangeWaitParams) -> None:
+        """Load region change wait parameters."""
+        if hasattr(self, 'watch_region_edit'):
+            self.watch_region_edit.setText(', '.join(map(str, params.region or [])))
+        if hasattr(self, 'change_threshold_spin'):
+            self.change_threshold_spin.setValue(params.threshold)
+        if hasattr(self, 'timeout_spin'):
+            self.timeout_spin.setValue(params.timeout)
+    
+    def _watch_region(self) -> Optional[List[int]]:
+        """Parse the watched region field (x, y, width, height), None if empty or invalid."""
+        if not hasattr(self, 'watch_region_edit'):
+            return None
+        text = self.watch_region_edit.text().strip()
+        if not text:
+            return None
+        try:
+            region = [int(value) for value in text.replace(' ', '').split(',')]
+        except ValueError:
+            logger.warning(f"Ignoring invalid region '{text}'")
+            return None
+        if len(region) != 4:
+            logger.warning(f"Ignoring region '{text}': expected x, y, width, height")
+            return None
+        return region
+    
+    def _save_template_wait_params(self) -> TemplateWaitParams:
+        """Save template wait parameters."""
+        return TemplateWaitParams(
+            description=self.description_edit.text() if hasattr(self, 'description_edit') else "",
+            template_name=self.template_combo.currentText() if hasattr(self, 'template_combo') else "",
+            mode=self.wait_mode_combo.currentText() if hasattr(self, 'wait_mode_combo') else "appear",
+            confidence=self.threshold_spin.value() if hasattr(self, 'threshold_spin') else 0.8,
+            timeout=self.timeout_spin.value() if hasattr(self, 'timeout_spin') else 30.0,
+            search_region=self._watch_region(),
+            save_to_variable=self.result_var_edit.text() if hasattr(self, 'result_var_edit') else ""
+        )
+    
+    def _save_change_wait_params(self) -> RegionChangeWaitParams:
+        """Save region change wait parameters."""
+        return RegionChangeWaitParams(
+            description=self.description_edit.text() if hasattr(self, 'description_edit') else "",
+            region=self._watch_region(),
+            threshold=self.change_threshold_spin.value() if hasattr(self, 'change_threshold_spin') else 2.0,
+            timeout=self.timeout_spin.value() if hasattr(self, 'timeout_spin') else 30.0
+        )
+    
     def _load_if_condition_params(self, params: ConditionalParams) -> None:
         """Load if condition parameters."""
         if hasattr(self, 'condition_edit'):
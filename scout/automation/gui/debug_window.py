@@ -20,7 +20,7 @@ from PyQt6.QtWidgets import (
     QStatusBar, QToolBar, QAction
 )
 from PyQt6.QtCore import Qt, pyqtSignal, QTimer
-from PyQt6.QtGui import QImage, QPixmap, QIcon, QAction
+from PyQt6.QtGui import QImage, QPixmap, QIcon, QAction, QColor
 import cv2
 import numpy as np
 import logging
@@ -29,10 +29,13 @@ from datetime import datetime
 from scout.automation.core import AutomationPosition
 from scout.automation.actions import ActionType
 from scout.automation.gui.debug_tab import AutomationDebugTab
+from scout.automation.profiler import action_profiler
+from scout.config_manager import ConfigManager
+from scout.debug.tiled_preview import TiledPreviewView
 
 logger = logging.getLogger(__name__)
 
-class ImagePreview(QLabel):
+class ImagePreview(TiledPreviewView):
     """
     Widget for displaying image previews with overlays.
     
@@ -43,23 +46,29 @@ class ImagePreview(QLabel):
     - Mouse movement preview
     - Grid overlay option
     - Zoom and pan capabilities
+    
+    Only the visible part of the image is rendered, from cached mip-level
+    tiles, and overlays are Qt items, so zooming and panning do not
+    reprocess the whole frame.
     """
     
+    # Annotation colors
+    POSITION_COLOR = QColor(255, 165, 0)  # Orange
+    MATCH_COLOR = QColor(0, 255, 0)  # Green
+    OCR_COLOR = QColor(255, 0, 0)  # Red
+    MOUSE_COLOR = QColor(255, 255, 255)  # White
+    GRID_COLOR = QColor(128, 128, 128)
+    
     def __init__(self):
         """Initialize the image preview widget."""
         super().__init__()
         self.setMinimumSize(400, 300)
-        self.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.setText("No preview available")
         
         # Display settings
         self.show_positions = True
         self.show_templates = True
         self.show_ocr = True
         self.show_mouse = True
-        self.show_grid = False
-        self.grid_size = 50
-        self.zoom_level = 1.0
         
         # Current state
         self.current_image: Optional[np.ndarray] = None
@@ -68,8 +77,12 @@ class ImagePreview(QLabel):
         self.ocr_regions: List[tuple] = []  # [(text, x, y, w, h)]
         self.mouse_position: Optional[tuple] = None  # (x, y)
         
-        # Enable mouse tracking for coordinate display
-        self.setMouseTracking(True)
+        # Show pixel values under the cursor
+        self.mouse_moved.connect(self._show_pixel_info)
+        
+    def _match_color(self, confidence: float) -> QColor:
+        """Get the color of a template match."""
+        return self.MATCH_COLOR
         
     def update_image(self, image: np.ndarray) -> None:
         """Update the displayed image."""
@@ -77,192 +90,64 @@ class ImagePreview(QLabel):
             return
             
         self.current_image = image.copy()
-        self._update_display()
+        self.set_frame(self.current_image)
         
     def update_positions(self, positions: Dict[str, AutomationPosition]) -> None:
         """Update marked positions."""
         self.positions = positions
-        self._update_display()
+        self.set_positions(positions)
         
     def update_pattern_matches(self, matches: List[tuple]) -> None:
         """Update pattern match regions."""
         self.template_matches = matches
-        self._update_display()
+        self.set_template_matches(matches)
         
     def update_ocr_regions(self, regions: List[tuple]) -> None:
         """Update OCR text regions."""
         self.ocr_regions = regions
-        self._update_display()
+        self.set_ocr_regions(regions)
         
     def update_mouse_position(self, x: int, y: int) -> None:
         """Update mouse cursor position."""
         self.mouse_position = (x, y)
-        self._update_display()
-        
-    def set_zoom(self, zoom_level: float) -> None:
-        """Set the zoom level for the preview."""
-        self.zoom_level = max(0.1, min(5.0, zoom_level))
-        self._update_display()
+        self.set_mouse_position(self.mouse_position)
         
     def toggle_grid(self, show: bool) -> None:
         """Toggle grid overlay."""
-        self.show_grid = show
-        self._update_display()
+        self.set_grid(show)
         
     def set_grid_size(self, size: int) -> None:
         """Set grid size."""
-        self.grid_size = max(10, min(200, size))
-        if self.show_grid:
-            self._update_display()
-            
-    def mouseMoveEvent(self, event):
-        """Handle mouse movement to show coordinates."""
-        if self.current_image is not None:
-            # Calculate actual image coordinates based on display scaling
-            pixmap_rect = self.pixmap().rect()
-            widget_rect = self.rect()
-            
-            # Calculate scaling factors
-            scale_x = pixmap_rect.width() / self.current_image.shape[1]
-            scale_y = pixmap_rect.height() / self.current_image.shape[0]
-            
-            # Calculate image coordinates
-            x = int(event.position().x() / scale_x)
-            y = int(event.position().y() / scale_y)
-            
-            # Ensure coordinates are within image bounds
-            if 0 <= x < self.current_image.shape[1] and 0 <= y < self.current_image.shape[0]:
-                # Get pixel color at cursor position
-                if len(self.current_image.shape) == 3:  # Color image
-                    b, g, r = self.current_image[y, x]
-                    self.setToolTip(f"Position: ({x}, {y}) | RGB: ({r}, {g}, {b})")
-                else:  # Grayscale
-                    v = self.current_image[y, x]
-                    self.setToolTip(f"Position: ({x}, {y}) | Value: {v}")
+        self.set_grid(self.show_grid, max(10, min(200, size)))
             
-        super().mouseMoveEvent(event)
-            
-    def _update_display(self) -> None:
-        """Update the display with current overlays."""
+    def _show_pixel_info(self, x: int, y: int) -> None:
+        """Show the coordinates and pixel value under the cursor as tooltip."""
         if self.current_image is None:
             return
+        if 0 <= x < self.current_image.shape[1] and 0 <= y < self.current_image.shape[0]:
+            # Get pixel color at cursor position
+            if len(self.current_image.shape) == 3:  # Color image
+                b, g, r = self.current_image[y, x][:3]
+                self.setToolTip(f"Position: ({x}, {y}) | RGB: ({r}, {g}, {b})")
+            else:  # Grayscale
+                v = self.current_image[y, x]
+                self.setToolTip(f"Position: ({x}, {y}) | Value: {v}")
             
-        # Create copy for drawing
-        display = self.current_image.copy()
-        
-        # Draw positions
-        if self.show_positions:
-            for name, pos in self.positions.items():
-                cv2.drawMarker(
-                    display,
-                    (pos.x, pos.y),
-                    (255, 165, 0),  # Orange
-                    cv2.MARKER_CROSS,
-                    20,
-                    2
-                )
-                cv2.putText(
-                    display,
-                    name,
-                    (pos.x + 10, pos.y + 10),
-                    cv2.FONT_HERSHEY_SIMPLEX,
-                    0.5,
-                    (255, 165, 0),
-                    1
-                )
-                
-        # Draw template matches
-        if self.show_templates:
-            for name, x, y, w, h, conf in self.template_matches:
-                cv2.rectangle(
-                    display,
-                    (x, y),
-                    (x + w, y + h),
-                    (0, 255, 0),  # Green
-                    2
-                )
-                cv2.putText(
-                    display,
-                    f"{name} ({conf:.2f})",
-                    (x, y - 5),
-                    cv2.FONT_HERSHEY_SIMPLEX,
-                    0.5,
-                    (0, 255, 0),
-                    1
-                )
-                
-        # Draw OCR regions
-        if self.show_ocr:
-            for text, x, y, w, h in self.ocr_regions:
-                cv2.rectangle(
-                    display,
-                    (x, y),
-                    (x + w, y + h),
-                    (0, 0, 255),  # Red
-                    2
-                )
-                cv2.putText(
-                    display,
-                    text,
-                    (x, y - 5),
-                    cv2.FONT_HERSHEY_SIMPLEX,
-                    0.5,
-                    (0, 0, 255),
-                    1
-                )
-                
-        # Draw mouse position
-        if self.show_mouse and self.mouse_position:
-            x, y = self.mouse_position
-            cv2.circle(
-                display,
-                (x, y),
-                5,
-                (255, 255, 255),  # White
-                -1
-            )
-            
-        # Draw grid
-        if self.show_grid:
-            h, w = display.shape[:2]
-            # Draw vertical lines
-            for x in range(0, w, self.grid_size):
-                cv2.line(display, (x, 0), (x, h), (128, 128, 128), 1)
-            # Draw horizontal lines
-            for y in range(0, h, self.grid_size):
-                cv2.line(display, (0, y), (w, y), (128, 128, 128), 1)
-            
-        # Apply zoom if needed
-        if self.zoom_level != 1.0:
-            h, w = display.shape[:2]
-            new_h, new_w = int(h * self.zoom_level), int(w * self.zoom_level)
-            display = cv2.resize(display, (new_w, new_h), interpolation=cv2.INTER_AREA if self.zoom_level < 1.0 else cv2.INTER_LINEAR)
-            
-        # Convert to Qt image and display
-        if len(display.shape) == 3:  # Color image
-            height, width, channels = display.shape
-            bytes_per_line = channels * width
-            # Convert BGR to RGB
-            display_rgb = cv2.cvtColor(display, cv2.COLOR_BGR2RGB)
-            qt_image = QImage(
-                display_rgb.data,
-                width,
-                height,
-                bytes_per_line,
-                QImage.Format.Format_RGB888
-            )
-        else:  # Grayscale
-            height, width = display.shape
-            bytes_per_line = width
-            qt_image = QImage(
-                display.data,
-                width,
-                height,
-                bytes_per_line,
-                QImage.Format.Format_Grayscale8
-            )
-            
-        self.setPixmap(QPixmap.fromImage(qt_image))
+    def _update_display(self) -> None:
+        """Apply the display options (the image itself is not reprocessed)."""
+        self.set_layer_visible("positions", self.show_positions)
+        self.set_layer_visible("matches", self.show_templates)
+        self.set_layer_visible("ocr", self.show_ocr)
+        self.set_layer_visible("mouse", self.show_mouse)
+        
+    def reset_state(self) -> None:
+        """Remove the image and all overlays."""
+        self.current_image = None
+        self.positions = {}
+        self.template_matches = []
+        self.ocr_regions = []
+        self.mouse_position = None
+        self.clear()
 
 class AutomationDebugWindow(QMainWindow):
     """
@@ -441,6 +326,19 @@ class AutomationDebugWindow(QMainWindow):
         reset_view_action.triggered.connect(self._reset_view)
         toolbar.addAction(reset_view_action)
         
+        toolbar.addSeparator()
+        
+        # Action profiler toggle (persisted in the Debug settings)
+        self.profile_check = QCheckBox("Profile Actions")
+        self.profile_check.setChecked(action_profiler.enabled)
+        self.profile_check.toggled.connect(self._on_profile_toggled)
+        toolbar.addWidget(self.profile_check)
+        
+        # Export action profile
+        export_profile_action = QAction("Export Profile", self)
+        export_profile_action.triggered.connect(self._export_profile)
+        toolbar.addAction(export_profile_action)
+        
     def _on_preview_options_changed(self) -> None:
         """Handle changes to preview display options."""
         self.preview.show_positions = self.show_positions_check.isChecked()
@@ -474,9 +372,10 @@ class AutomationDebugWindow(QMainWindow):
         
         if filename:
             try:
-                # Save the image with overlays
-                if self.preview.pixmap():
-                    self.preview.pixmap().save(filename)
+                # Save the image with overlays (rendered at full resolution)
+                pixmap = self.preview.render_pixmap()
+                if not pixmap.isNull():
+                    pixmap.save(filename)
                     self.statusBar.showMessage(f"Screenshot saved to {filename}", 3000)
                     logger.info(f"Debug screenshot saved to {filename}")
                 else:
@@ -488,6 +387,42 @@ class AutomationDebugWindow(QMainWindow):
                 QMessageBox.critical(self, "Save Failed", f"Failed to save screenshot: {str(e)}")
                 logger.error(f"Failed to save debug screenshot: {e}")
                 
+    def _on_profile_toggled(self, checked: bool) -> None:
+        """
+        Enable or disable the action profiler and remember the choice.
+        
+        Args:
+            checked: Whether profiling is enabled
+        """
+        action_profiler.set_enabled(checked)
+        ConfigManager().update_debug_settings({"action_profiler": checked})
+        self.statusBar.showMessage(f"Action profiling {'enabled' if checked else 'disabled'}", 3000)
+        
+    def _export_profile(self) -> None:
+        """Write the action profile to JSON and show the hot spots in the log."""
+        if not action_profiler.records:
+            QMessageBox.warning(self, "Export Failed", "No profiled actions to export.")
+            return
+            
+        # Default to the configured profile path
+        path = ConfigManager().get_debug_settings()["action_profile_path"]
+        if not path:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            path, _ = QFileDialog.getSaveFileName(
+                self, "Export Action Profile",
+                f"action_profile_{timestamp}.json",
+                "JSON (*.json)"
+            )
+            if not path:
+                return
+                
+        if action_profiler.export(path):
+            for line in action_profiler.format_report():
+                self.execution_tab.add_log_message(line)
+            self.statusBar.showMessage(f"Action profile exported to {path}", 3000)
+        else:
+            QMessageBox.critical(self, "Export Failed", f"Failed to export action profile to {path}")
+        
     def _clear_all_logs(self) -> None:
         """Clear all logs and history."""
         self.execution_tab.clear_log()
@@ -573,9 +508,5 @@ class AutomationDebugWindow(QMainWindow):
         self.execution_tab.reset()
         self.template_table.setRowCount(0)
         self.ocr_text.clear()
-        self.preview.current_image = None
-        self.preview.positions = {}
-        self.preview.template_matches = []
-        self.preview.ocr_regions = []
-        self.preview.mouse_position = None
+        self.preview.reset_state()
         self.execution_tab.update_status("Idle")  # Use "Idle" as the default status
@@ -15,6 +15,7 @@ from PyQt6.QtGui import QPainter, QPen, QColor, QMouseEvent, QPaintEvent, QFont,
 import logging
 from scout.window_manager import WindowManager
 from scout.automation.core import AutomationPosition
+from scout.spatial_index import SpatialGridIndex
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +37,9 @@ class PositionMarker(QWidget):
     # Signal emitted when a position is selected from existing positions
     position_selected = pyqtSignal(str)
     
+    # Maximum width (pixels) of a position label, used to cull positions outside the repainted area
+    LABEL_MARGIN = 600
+    
     def __init__(self, window_manager: WindowManager):
         """Initialize the position marker overlay."""
         super().__init__(None)  # No parent widget
@@ -69,6 +73,7 @@ class PositionMarker(QWidget):
         self.is_marking = False
         self.is_selecting = False  # Mode for selecting existing positions
         self.hovered_position: Optional[str] = None  # Currently hovered position name
+        self.position_index = SpatialGridIndex(cell_size=64)  # Position name -> point, for hit-testing
         
         # Set cursor to crosshair
         self.setCursor(Qt.CursorShape.CrossCursor)
@@ -174,6 +179,8 @@ class PositionMarker(QWidget):
             positions: Dictionary of position name to AutomationPosition
         """
         self.marked_positions = positions
+        # Only moved, added or removed positions touch the index
+        self.position_index.sync({name: (pos.x, pos.y, pos.x, pos.y) for name, pos in positions.items()})
         self.update()
         
     def mousePressEvent(self, event: QMouseEvent) -> None:
@@ -240,21 +247,19 @@ class PositionMarker(QWidget):
             self.hovered_position = None
             return
             
-        mouse_x, mouse_y = self.mouse_position.x(), self.mouse_position.y()
-        
         # Check if mouse is near any position
-        for name, pos in self.marked_positions.items():
-            distance = ((pos.x - mouse_x) ** 2 + (pos.y - mouse_y) ** 2) ** 0.5
-            if distance <= self.selection_radius:
-                if self.hovered_position != name:
-                    self.hovered_position = name
-                    # Show tooltip with position info
-                    QToolTip.showText(
-                        self.mapToGlobal(self.mouse_position),
-                        f"{name}: ({pos.x}, {pos.y})\n{pos.description or ''}",
-                        self
-                    )
-                return
+        name = self.get_position_at(self.mouse_position)
+        if name is not None:
+            if self.hovered_position != name:
+                self.hovered_position = name
+                pos = self.marked_positions[name]
+                # Show tooltip with position info
+                QToolTip.showText(
+                    self.mapToGlobal(self.mouse_position),
+                    f"{name}: ({pos.x}, {pos.y})\n{pos.description or ''}",
+                    self
+                )
+            return
                 
         # No position hovered
         self.hovered_position = None
@@ -301,8 +306,15 @@ class PositionMarker(QWidget):
                 painter.setPen(QPen(self.font_color))
                 painter.drawText(x + 15, y - 5, text)
         
-        # Draw existing positions
-        for name, pos in self.marked_positions.items():
+        # Draw existing positions inside the repainted area (labels extend to the right of the cross)
+        clip = event.rect()
+        half_size = self.cross_size // 2
+        visible = self.position_index.query_rect((
+            clip.left() - self.LABEL_MARGIN, clip.top() - half_size - self.font_size * 2,
+            clip.right() + half_size + 1, clip.bottom() + half_size + 1
+        ))
+        for name in visible:
+            pos = self.marked_positions[name]
             # Highlight hovered position in selection mode
             is_hovered = (self.is_selecting and self.hovered_position == name)
             self._draw_position(painter, pos.x, pos.y, name, is_hovered, pos.description)
@@ -366,11 +378,7 @@ class PositionMarker(QWidget):
         Returns:
             Name of the position if found, None otherwise
         """
-        for name, pos in self.marked_positions.items():
-            distance = ((pos.x - point.x()) ** 2 + (pos.y - point.y()) ** 2) ** 0.5
-            if distance <= self.selection_radius:
-                return name
-        return None
+        return self.position_index.nearest(point.x(), point.y(), self.selection_radius)
         
     def get_all_position_names(self) -> List[str]:
         """
@@ -0,0 +1,423 @@
+"""
+Action Profiler
+
+This module provides an execution profiler for automation sequences.
+It handles:
+- Timing every executed action instance (including nested actions run by
+  block handlers), with self time separated from nested actions
+- Splitting action time into capture, match, OCR, input and sleep phases
+  (the rest is reported as "other")
+- Aggregating by action type and by source location in the sequence
+  (PlanStep.source, e.g. "3.loop.2")
+- A flame-graph-style hot-spot report, folded stacks for flamegraph.pl or
+  speedscope, and a JSON export
+
+Like perf_stats, profiling costs nothing while disabled. The action being
+profiled is kept in a context variable, so phases recorded anywhere below a
+handler (worker threads started with asyncio.to_thread included) are
+attributed to it.
+"""
+
+from typing import Optional, Dict, Any, List, Tuple, Deque, Iterator
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+import json
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# Phases in report order ("other" is the unattributed rest of the self time)
+PHASES = ("capture", "match", "ocr", "input", "sleep")
+OTHER = "other"
+
+@dataclass
+class ActionRecord:
+    """
+    One executed action instance.
+
+    Attributes:
+        sequence: Name of the sequence (compiled plan)
+        source: Location in the sequence (e.g. "3.loop.2")
+        action_type: Action type value (e.g. "click")
+        start: Start time (perf_counter seconds)
+        duration: Total duration in seconds
+        self_time: Duration minus nested actions in seconds
+        phases: Seconds per phase (self time only)
+        success: Whether the action succeeded
+        depth: Nesting depth (0 for plan steps)
+    """
+    sequence: str
+    source: str
+    action_type: str
+    start: float
+    duration: float = 0.0
+    self_time: float = 0.0
+    phases: Dict[str, float] = field(default_factory=dict)
+    success: bool = True
+    depth: int = 0
+
+    # Bookkeeping while the action runs
+    children_time: float = 0.0
+    active_phase: Optional[str] = None
+    stack: Tuple[str, ...] = ()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the record to a dictionary (times in milliseconds)."""
+        return {
+            "sequence": self.sequence,
+            "source": self.source,
+            "type": self.action_type,
+            "duration_ms": round(self.duration * 1000, 3),
+            "self_ms": round(self.self_time * 1000, 3),
+            "phases_ms": {phase: round(seconds * 1000, 3) for phase, seconds in self.phases.items()},
+            "success": self.success,
+            "depth": self.depth,
+        }
+
+@dataclass
+class ActionAggregate:
+    """
+    Totals of a group of action instances.
+
+    Attributes:
+        count: Number of instances
+        failures: Number of failed instances
+        total: Summed duration in seconds
+        self_total: Summed self time in seconds
+        max: Longest duration in seconds
+        phases: Summed seconds per phase
+    """
+    count: int = 0
+    failures: int = 0
+    total: float = 0.0
+    self_total: float = 0.0
+    max: float = 0.0
+    phases: Dict[str, float] = field(default_factory=dict)
+
+    def add(self, record: ActionRecord) -> None:
+        """Add an action instance."""
+        self.count += 1
+        if not record.success:
+            self.failures += 1
+        self.total += record.duration
+        self.self_total += record.self_time
+        if record.duration > self.max:
+            self.max = record.duration
+        for phase, seconds in record.phases.items():
+            self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the totals to a dictionary (times in milliseconds)."""
+        return {
+            "count": self.count,
+            "failures": self.failures,
+            "total_ms": round(self.total * 1000, 3),
+            "self_ms": round(self.self_total * 1000, 3),
+            "mean_ms": round(self.total * 1000 / self.count, 3) if self.count else 0.0,
+            "max_ms": round(self.max * 1000, 3),
+            "phases_ms": {phase: round(seconds * 1000, 3) for phase, seconds in self.phases.items()},
+        }
+
+def _source_frames(source: str) -> Tuple[str, ...]:
+    """
+    Split a source location into its enclosing steps.
+
+    "3.then.1.loop.0" -> ("3", "3.then.1", "3.then.1.loop.0")
+    """
+    parts = source.split(".")
+    frames = []
+    for index, part in enumerate(parts):
+        if part.isdigit():
+            frames.append(".".join(parts[:index + 1]))
+    return tuple(frames) or (source,)
+
+# Innermost action being profiled in the current thread / task
+_current_record: ContextVar[Optional[ActionRecord]] = ContextVar("profiled_action", default=None)
+
+class ExecutionProfiler:
+    """
+    Per-action timing for automation runs.
+    """
+
+    def __init__(self, max_records: int = 10000, enabled: bool = False):
+        """
+        Initialize the profiler.
+
+        Args:
+            max_records: Number of recent action instances kept for the JSON export
+            enabled: Whether profiling is active
+        """
+        self.enabled = enabled
+        self.records: Deque[ActionRecord] = deque(maxlen=max_records)
+        self.by_type: Dict[str, ActionAggregate] = {}
+        self.by_source: Dict[Tuple[str, str, str], ActionAggregate] = {}
+        self.stacks: Dict[Tuple[str, ...], float] = {}
+        self.wall_time = 0.0
+        self._lock = threading.Lock()
+
+    def set_enabled(self, enabled: bool) -> None:
+        """
+        Enable or disable profiling.
+
+        Args:
+            enabled: Whether profiling is active
+        """
+        self.enabled = enabled
+        logger.debug(f"Action profiling {'enabled' if enabled else 'disabled'}")
+
+    def reset(self) -> None:
+        """Drop all records and totals."""
+        with self._lock:
+            self.records.clear()
+            self.by_type.clear()
+            self.by_source.clear()
+            self.stacks.clear()
+            self.wall_time = 0.0
+
+    @contextmanager
+    def action(self, sequence: str, source: str, action_type: str) -> Iterator[Optional[ActionRecord]]:
+        """
+        Profile the execution of one action (context manager).
+
+        Set the yielded record's success flag to record failures.
+
+        Args:
+            sequence: Name of the sequence
+            source: Location in the sequence ("" for nested actions, which
+                    inherit the sequence and location of the enclosing action)
+            action_type: Action type value
+
+        Yields:
+            The record being filled (None while disabled)
+        """
+        if not self.enabled:
+            yield None
+            return
+
+        parent = _current_record.get()
+        if parent is not None:
+            sequence = sequence or parent.sequence
+            source = source or parent.source
+            stack = parent.stack + (action_type,)
+            depth = parent.depth + 1
+        else:
+            stack = (sequence,) + _source_frames(source)[:-1] + (f"{source} {action_type}",)
+            depth = 0
+
+        record = ActionRecord(sequence, source, action_type, time.perf_counter(), depth=depth, stack=stack)
+        reset = _current_record.set(record)
+        try:
+            yield record
+        finally:
+            _current_record.reset(reset)
+            record.duration = time.perf_counter() - record.start
+            record.self_time = max(0.0, record.duration - record.children_time)
+            attributed = sum(record.phases.values())
+            record.phases[OTHER] = max(0.0, record.self_time - attributed)
+            if parent is not None:
+                parent.children_time += record.duration
+            self._add(record)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """
+        Attribute the enclosed time to a phase of the current action.
+
+        Phases do not nest: inside a phase, further phases are ignored.
+
+        Args:
+            name: Phase name (see PHASES)
+        """
+        record = _current_record.get() if self.enabled else None
+        if record is None or record.active_phase is not None:
+            yield
+            return
+        record.active_phase = name
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            record.active_phase = None
+            record.phases[name] = record.phases.get(name, 0.0) + time.perf_counter() - start
+
+    def _add(self, record: ActionRecord) -> None:
+        """Add a finished action to the totals."""
+        with self._lock:
+            self.records.append(record)
+            if record.depth == 0:
+                self.wall_time += record.duration
+            aggregate = self.by_type.get(record.action_type)
+            if aggregate is None:
+                aggregate = self.by_type[record.action_type] = ActionAggregate()
+            aggregate.add(record)
+            key = (record.sequence, record.source, record.action_type)
+            aggregate = self.by_source.get(key)
+            if aggregate is None:
+                aggregate = self.by_source[key] = ActionAggregate()
+            aggregate.add(record)
+            self.stacks[record.stack] = self.stacks.get(record.stack, 0.0) + record.self_time
+
+    def folded_stacks(self) -> List[str]:
+        """
+        Get the self time per call stack in folded format.
+
+        Each line is "frame;frame;frame microseconds", the input format of
+        flamegraph.pl and speedscope.
+
+        Returns:
+            Lines sorted by stack
+        """
+        with self._lock:
+            stacks = sorted(self.stacks.items())
+        return [f"{';'.join(stack)} {int(seconds * 1e6)}" for stack, seconds in stacks if seconds > 0]
+
+    def hot_spots(self, limit: int = 20) -> List[Tuple[Tuple[str, str, str], ActionAggregate]]:
+        """
+        Get the source locations with the most self time.
+
+        Args:
+            limit: Maximum number of locations
+
+        Returns:
+            List of ((sequence, source, action_type), totals), slowest first
+        """
+        with self._lock:
+            items = list(self.by_source.items())
+        items.sort(key=lambda item: item[1].self_total, reverse=True)
+        return items[:limit]
+
+    def format_report(self, limit: int = 20, width: int = 30) -> List[str]:
+        """
+        Format a flame-graph-style text report.
+
+        The first part is a tree of the call stacks with bars proportional to
+        their total time; the second part lists the hot spots by location
+        with their phase split.
+
+        Args:
+            limit: Maximum number of hot spots
+            width: Width of the bars in characters
+
+        Returns:
+            Report lines
+        """
+        with self._lock:
+            stacks = dict(self.stacks)
+            wall_time = self.wall_time
+            action_count = sum(aggregate.count for aggregate in self.by_type.values())
+        if not stacks:
+            return ["No actions profiled"]
+
+        # Inclusive time per stack prefix
+        totals: Dict[Tuple[str, ...], float] = {}
+        for stack, seconds in stacks.items():
+            for depth in range(1, len(stack) + 1):
+                prefix = stack[:depth]
+                totals[prefix] = totals.get(prefix, 0.0) + seconds
+        grand_total = sum(seconds for prefix, seconds in totals.items() if len(prefix) == 1) or 1e-9
+
+        lines = [f"Action profile: {action_count} actions, {wall_time:.2f}s in plan steps", ""]
+        for prefix in sorted(totals):
+            seconds = totals[prefix]
+            share = seconds / grand_total
+            bar = "#" * max(1, int(round(share * width)))
+            lines.append(f"{bar:<{width}} {share * 100:5.1f}% {seconds:8.3f}s  {'  ' * (len(prefix) - 1)}{prefix[-1]}")
+
+        lines += ["", f"Hot spots (self time, top {limit}):"]
+        for (sequence, source, action_type), aggregate in self.hot_spots(limit):
+            split = " ".join(
+                f"{phase} {aggregate.phases[phase] / aggregate.self_total * 100:.0f}%"
+                for phase in PHASES + (OTHER,)
+                if aggregate.self_total > 0 and aggregate.phases.get(phase, 0.0) > 0
+            )
+            lines.append(
+                f"{aggregate.self_total:8.3f}s  n={aggregate.count:<5} "
+                f"mean {aggregate.total * 1000 / aggregate.count:8.1f}ms  "
+                f"{sequence} {source} {action_type}  [{split}]"
+            )
+        return lines
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Get the profile as a dictionary.
+
+        Returns:
+            Dictionary with "by_type", "by_source", "stacks" and "records"
+        """
+        with self._lock:
+            by_type = {name: aggregate.to_dict() for name, aggregate in sorted(self.by_type.items())}
+            by_source = [
+                {"sequence": sequence, "source": source, "type": action_type, **aggregate.to_dict()}
+                for (sequence, source, action_type), aggregate in self.by_source.items()
+            ]
+            records = [record.to_dict() for record in self.records]
+            wall_time = self.wall_time
+        by_source.sort(key=lambda item: item["self_ms"], reverse=True)
+        return {
+            "wall_ms": round(wall_time * 1000, 3),
+            "by_type": by_type,
+            "by_source": by_source,
+            "stacks": self.folded_stacks(),
+            "records": records,
+        }
+
+    def export(self, path: str) -> bool:
+        """
+        Write the profile to a JSON file.
+
+        Args:
+            path: Target file path
+
+        Returns:
+            True if the file was written
+        """
+        data = {"timestamp": time.strftime("%Y-%m-%d %H:%M:%S"), **self.summary()}
+        try:
+            target = Path(path)
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_text(json.dumps(data, indent=2), encoding="utf-8")
+            logger.info(f"Exported action profile to {target}")
+            return True
+        except Exception as e:
+            logger.error(f"Error exporting action profile: {e}")
+            return False
+
+    def export_folded(self, path: str) -> bool:
+        """
+        Write the folded stacks to a file (for flamegraph.pl or speedscope).
+
+        Args:
+            path: Target file path
+
+        Returns:
+            True if the file was written
+        """
+        try:
+            target = Path(path)
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_text("\n".join(self.folded_stacks()) + "\n", encoding="utf-8")
+            logger.info(f"Exported folded stacks to {target}")
+            return True
+        except Exception as e:
+            logger.error(f"Error exporting folded stacks: {e}")
+            return False
+
+# Shared profiler used by the automation runtime and handlers
+action_profiler = ExecutionProfiler()
+
+def profile_phase(name: str):
+    """
+    Attribute the enclosed time to a phase of the current action.
+
+    Args:
+        name: Phase name (see PHASES)
+
+    Returns:
+        Context manager
+    """
+    return action_profiler.phase(name)
@@ -0,0 +1,245 @@
+"""
+Variable Scopes
+
+This module provides layered, copy-on-write variable stores for automation.
+It handles:
+- O(1) child scopes for nested blocks and parallel groups: reads fall
+  through to the parent, writes and deletions stay in the child
+- Copy-on-write of list, dict and set values: an inherited container is
+  copied once per scope, on its first in-place modification (mutable_value)
+- Change sets that merge a child back into its parent, with conflict
+  policies for sibling scopes that changed the same variable
+
+A scope is a MutableMapping, so handlers use it exactly like the plain
+dict variable store at the top of a sequence.
+"""
+
+from typing import Dict, Optional, List, Iterator, Set, Any, MutableMapping
+from dataclasses import dataclass, field
+import copy
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Conflict policies for merging sibling change sets
+LAST_WINS = "last_wins"    # The change set merged last wins (completion order)
+FIRST_WINS = "first_wins"  # The change set merged first wins
+RAISE = "error"            # Conflicting changes fail the merge
+
+CONFLICT_POLICIES = (LAST_WINS, FIRST_WINS, RAISE)
+
+_MISSING = object()
+_DELETED = object()
+
+class ScopeConflictError(ValueError):
+    """Raised when sibling scopes changed the same variables under the 'error' policy."""
+
+    def __init__(self, names: List[str]):
+        super().__init__(f"Conflicting changes to variables: {', '.join(names)}")
+        self.names = names
+
+@dataclass
+class ChangeSet:
+    """
+    Changes a scope made relative to its parent.
+
+    Attributes:
+        updates: Variables written in the scope, with their new values
+        deletions: Variables deleted in the scope
+    """
+    updates: Dict[str, Any] = field(default_factory=dict)
+    deletions: Set[str] = field(default_factory=set)
+
+    @property
+    def names(self) -> Set[str]:
+        """Names of all changed variables."""
+        return set(self.updates) | self.deletions
+
+    def __bool__(self) -> bool:
+        return bool(self.updates or self.deletions)
+
+    def apply(self, store: MutableMapping[str, Any]) -> None:
+        """
+        Apply the changes to a store.
+
+        Args:
+            store: Variable store (dict or VariableScope)
+        """
+        store.update(self.updates)
+        for name in self.deletions:
+            store.pop(name, None)
+
+class VariableScope(MutableMapping):
+    """
+    Variable store layered over a parent store.
+
+    Creating a scope copies nothing; lookups walk up the chain of parents
+    until a scope has the variable.
+    """
+
+    __slots__ = ("parent", "_local")
+
+    def __init__(self, parent: Optional[MutableMapping[str, Any]] = None):
+        """
+        Initialize the scope.
+
+        Args:
+            parent: Store to read through to (dict or VariableScope)
+        """
+        self.parent = parent
+        self._local: Dict[str, Any] = {}
+
+    def __getitem__(self, name: str) -> Any:
+        value = self._local.get(name, _MISSING)
+        if value is _DELETED:
+            raise KeyError(name)
+        if value is not _MISSING:
+            return value
+        if self.parent is None:
+            raise KeyError(name)
+        return self.parent[name]
+
+    def get(self, name: str, default: Any = None) -> Any:
+        value = self._local.get(name, _MISSING)
+        if value is _DELETED:
+            return default
+        if value is not _MISSING:
+            return value
+        if self.parent is None:
+            return default
+        return self.parent.get(name, default)
+
+    def __contains__(self, name: object) -> bool:
+        value = self._local.get(name, _MISSING)
+        if value is not _MISSING:
+            return value is not _DELETED
+        return self.parent is not None and name in self.parent
+
+    def __setitem__(self, name: str, value: Any) -> None:
+        self._local[name] = value
+
+    def __delitem__(self, name: str) -> None:
+        if name not in self:
+            raise KeyError(name)
+        if self.parent is not None and name in self.parent:
+            self._local[name] = _DELETED
+        else:
+            del self._local[name]
+
+    def __iter__(self) -> Iterator[str]:
+        for name, value in self._local.items():
+            if value is not _DELETED:
+                yield name
+        if self.parent is not None:
+            for name in self.parent:
+                if name not in self._local:
+                    yield name
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return f"VariableScope({dict(self)!r})"
+
+    def push(self) -> 'VariableScope':
+        """
+        Create a child scope of this scope.
+
+        Returns:
+            New, empty child scope
+        """
+        return VariableScope(self)
+
+    def mutable(self, name: str) -> Any:
+        """
+        Get a variable for in-place modification.
+
+        Inherited lists, dicts and sets are copied into this scope first
+        (once), so modifications never leak into the parent or siblings.
+
+        Args:
+            name: Variable name
+
+        Returns:
+            The variable's value, owned by this scope
+
+        Raises:
+            KeyError: If the variable does not exist
+        """
+        value = self[name]
+        if name not in self._local and isinstance(value, (list, dict, set)):
+            value = copy.copy(value)
+            self._local[name] = value
+        return value
+
+    def changes(self) -> ChangeSet:
+        """
+        Get the changes made in this scope.
+
+        Returns:
+            ChangeSet relative to the parent
+        """
+        changes = ChangeSet()
+        for name, value in self._local.items():
+            if value is _DELETED:
+                changes.deletions.add(name)
+            else:
+                changes.updates[name] = value
+        return changes
+
+    def commit(self) -> None:
+        """Apply this scope's changes to its parent and start over empty."""
+        if self.parent is not None:
+            self.changes().apply(self.parent)
+        self._local.clear()
+
+def mutable_value(store: MutableMapping[str, Any], name: str) -> Any:
+    """
+    Get a variable for in-place modification from any variable store.
+
+    Args:
+        store: Variable store (dict or VariableScope)
+        name: Variable name
+
+    Returns:
+        The variable's value (copied into the scope first if inherited)
+    """
+    if isinstance(store, VariableScope):
+        return store.mutable(name)
+    return store[name]
+
+def merge_changes(store: MutableMapping[str, Any], change_sets: List[ChangeSet],
+                  policy: str = LAST_WINS) -> Set[str]:
+    """
+    Merge the change sets of sibling scopes into their parent store.
+
+    Args:
+        store: Parent variable store
+        change_sets: Change sets in merge order (e.g. completion order)
+        policy: LAST_WINS, FIRST_WINS or RAISE for variables changed by
+                more than one change set
+
+    Returns:
+        Names of the conflicting variables
+
+    Raises:
+        ScopeConflictError: On conflicts under the RAISE policy (nothing is merged)
+        ValueError: If the policy is unknown
+    """
+    if policy not in CONFLICT_POLICIES:
+        raise ValueError(f"Unknown conflict policy: {policy}")
+
+    seen: Set[str] = set()
+    conflicts: Set[str] = set()
+    for changes in change_sets:
+        names = changes.names
+        conflicts |= seen & names
+        seen |= names
+
+    if conflicts and policy == RAISE:
+        raise ScopeConflictError(sorted(conflicts))
+
+    ordered = reversed(change_sets) if policy == FIRST_WINS else change_sets
+    for changes in ordered:
+        changes.apply(store)
+    return conflicts
@@ -0,0 +1,379 @@
+"""
+Simulation Runtime
+
+This module provides deterministic, fast-forward simulation of sequences.
+It handles:
+- Running sequences on a virtual clock: delays, waits, polling intervals
+  and frame wait timeouts advance simulated time instead of sleeping
+- Pluggable frame sources standing in for the game window (a static frame,
+  replayed recordings, or a script that reacts to the inputs sent)
+- A recording input device: clicks, drags and typed text are logged with
+  their simulated time and passed to the frame source
+- Real template matching and OCR on the simulated frames, so conditions,
+  loops and waits take the branches they would take against the game
+
+Sequences run at CPU speed, so complex sequences can be regression-tested
+against recorded frames much faster than real time. Simulation drives the
+threaded execution path (AutomationCore.execute_sequence).
+"""
+
+from typing import Dict, Optional, List, Callable, Tuple, Any, Sequence
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from pathlib import Path
+import logging
+import random
+import threading
+import time
+
+import cv2
+import numpy as np
+
+from scout.automation.clock import VirtualClock, use_clock
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class InputEvent:
+    """
+    Input sent during a simulation.
+
+    Attributes:
+        time: Simulated time in seconds since the start
+        kind: Event kind ("click", "drag" or "type")
+        args: Event arguments (coordinates, button, text, ...)
+    """
+    time: float
+    kind: str
+    args: Dict[str, Any] = field(default_factory=dict)
+
+class FrameSource:
+    """
+    Source of the frames the simulated game window shows.
+
+    Subclasses return the frame visible at a simulated time and may react
+    to inputs (e.g. show the next screen after a click).
+    """
+
+    def frame_at(self, elapsed: float) -> Optional[np.ndarray]:
+        """
+        Get the frame visible at a simulated time.
+
+        Args:
+            elapsed: Simulated seconds since the start
+
+        Returns:
+            Frame in BGR format, or None if no frame is available
+        """
+        raise NotImplementedError
+
+    def on_input(self, event: InputEvent) -> None:
+        """
+        Handle an input sent to the simulated window.
+
+        Args:
+            event: Input event
+        """
+
+    def reset(self) -> None:
+        """Rewind the source before a simulation run."""
+
+class StaticFrameSource(FrameSource):
+    """
+    Source showing the same frame all the time.
+    """
+
+    def __init__(self, frame: np.ndarray):
+        """
+        Initialize the source.
+
+        Args:
+            frame: Frame in BGR format
+        """
+        self.frame = frame
+
+    def frame_at(self, elapsed: float) -> Optional[np.ndarray]:
+        return self.frame
+
+class ReplayFrameSource(FrameSource):
+    """
+    Source replaying recorded frames.
+
+    By default frames are shown at their recorded times. With
+    advance_on_input, each input moves on to the next frame instead, which
+    replays recordings taken once per step independently of timing.
+    """
+
+    def __init__(self, frames: Sequence[Tuple[float, np.ndarray]], loop: bool = False,
+                 advance_on_input: bool = False):
+        """
+        Initialize the source.
+
+        Args:
+            frames: (seconds since the start of the recording, frame) pairs
+            loop: Whether to start over after the last frame
+            advance_on_input: Whether inputs (instead of time) advance the replay
+        """
+        if not frames:
+            raise ValueError("Replay needs at least one frame")
+        ordered = sorted(frames, key=lambda item: item[0])
+        self.timestamps = [timestamp for timestamp, _ in ordered]
+        self.frames = [frame for _, frame in ordered]
+        self.loop = loop
+        self.advance_on_input = advance_on_input
+        self.position = 0
+
+    @classmethod
+    def from_directory(cls, path: str, interval: float = 1.0, **kwargs: Any) -> 'ReplayFrameSource':
+        """
+        Load a recording from a directory of images.
+
+        Files are replayed in name order. Files named by their time in
+        milliseconds (e.g. "001250.png") are shown at that time, others
+        one interval apart.
+
+        Args:
+            path: Directory containing .png or .jpg frames
+            interval: Seconds between frames without a time in their name
+            **kwargs: Further arguments for the source (loop, advance_on_input)
+
+        Returns:
+            Replay source
+
+        Raises:
+            ValueError: If the directory contains no readable frames
+        """
+        files = sorted(file for file in Path(path).iterdir()
+                       if file.suffix.lower() in (".png", ".jpg", ".jpeg"))
+        frames = []
+        for index, file in enumerate(files):
+            frame = cv2.imread(str(file))
+            if frame is None:
+                logger.warning(f"Skipping unreadable frame {file}")
+                continue
+            timestamp = int(file.stem) / 1000.0 if file.stem.isdigit() else index * interval
+            frames.append((timestamp, frame))
+        if not frames:
+            raise ValueError(f"No frames found in {path}")
+        logger.info(f"Loaded {len(frames)} frames for replay from {path}")
+        return cls(frames, **kwargs)
+
+    @property
+    def duration(self) -> float:
+        """Recorded time of the last frame."""
+        return self.timestamps[-1]
+
+    def frame_at(self, elapsed: float) -> Optional[np.ndarray]:
+        if self.advance_on_input:
+            index = self.position % len(self.frames) if self.loop else min(self.position, len(self.frames) - 1)
+            return self.frames[index]
+        if self.loop and self.duration > 0:
+            elapsed %= self.duration
+        # Latest frame recorded at or before the requested time
+        return self.frames[max(0, bisect_right(self.timestamps, elapsed) - 1)]
+
+    def on_input(self, event: InputEvent) -> None:
+        if self.advance_on_input:
+            self.position += 1
+
+    def reset(self) -> None:
+        self.position = 0
+
+class ScriptedFrameSource(FrameSource):
+    """
+    Source computing frames with a function of time and the inputs sent so far.
+    """
+
+    def __init__(self, script: Callable[[float, List[InputEvent]], Optional[np.ndarray]]):
+        """
+        Initialize the source.
+
+        Args:
+            script: Function taking (elapsed seconds, inputs so far) and returning a frame
+        """
+        self.script = script
+        self.inputs: List[InputEvent] = []
+
+    def frame_at(self, elapsed: float) -> Optional[np.ndarray]:
+        return self.script(elapsed, self.inputs)
+
+    def on_input(self, event: InputEvent) -> None:
+        self.inputs.append(event)
+
+    def reset(self) -> None:
+        self.inputs = []
+
+class SimulatedScreen:
+    """
+    Capture device showing the frames of a frame source.
+    """
+
+    def __init__(self, clock: VirtualClock, source: FrameSource):
+        """
+        Initialize the capture device.
+
+        Args:
+            clock: Clock of the simulation
+            source: Frame source
+        """
+        self.clock = clock
+        self.source = source
+        self.frames_captured = 0
+
+    def capture(self) -> Optional[np.ndarray]:
+        """
+        Capture the frame visible at the current simulated time.
+
+        Returns:
+            Frame in BGR format, or None if the source has none
+        """
+        self.frames_captured += 1
+        return self.source.frame_at(self.clock.elapsed)
+
+class SimulatedInput:
+    """
+    Input device recording inputs instead of sending them.
+    """
+
+    def __init__(self, clock: VirtualClock, source: FrameSource):
+        """
+        Initialize the input device.
+
+        Args:
+            clock: Clock of the simulation (drags advance it by their duration)
+            source: Frame source notified of every input
+        """
+        self.clock = clock
+        self.source = source
+        self.events: List[InputEvent] = []
+        self._lock = threading.Lock()
+
+    def click(self, x: int, y: int, button: str = "left", clicks: int = 1) -> None:
+        """Record a click."""
+        self._record("click", x=x, y=y, button=button, clicks=clicks)
+
+    def drag(self, start_x: int, start_y: int, end_x: int, end_y: int, duration: float = 0.5) -> None:
+        """Record a drag (taking its duration in simulated time)."""
+        self.clock.advance(duration)
+        self._record("drag", start_x=start_x, start_y=start_y, end_x=end_x, end_y=end_y, duration=duration)
+
+    def type_text(self, text: str) -> None:
+        """Record typed text."""
+        self._record("type", text=text)
+
+    def _record(self, kind: str, **args: Any) -> None:
+        """Log an input event and pass it to the frame source."""
+        event = InputEvent(self.clock.elapsed, kind, args)
+        with self._lock:
+            self.events.append(event)
+            self.source.on_input(event)
+
+@dataclass
+class SimulationResult:
+    """
+    Outcome of a simulation run.
+
+    Attributes:
+        sequence: Name of the simulated sequence
+        success: Whether the sequence succeeded
+        simulated_time: Simulated duration in seconds
+        wall_time: Real duration in seconds
+        timed_out: Whether the run hit the simulation's time limit
+        inputs: Inputs sent, in order
+        frames_captured: Number of frames the handlers captured
+    """
+    sequence: str
+    success: bool
+    simulated_time: float
+    wall_time: float
+    timed_out: bool = False
+    inputs: List[InputEvent] = field(default_factory=list)
+    frames_captured: int = 0
+
+    @property
+    def speedup(self) -> float:
+        """Simulated time per real second."""
+        return self.simulated_time / self.wall_time if self.wall_time > 0 else float("inf")
+
+class SimulationRuntime:
+    """
+    Runs sequences of an AutomationCore against a frame source on a virtual clock.
+
+    During a run the core's input and capture devices are replaced by
+    simulated ones, and the OCR region registry is disabled so that named
+    region waits read the simulated frames too. Sleeps of concurrent
+    parallel groups add up on the shared virtual clock.
+    """
+
+    def __init__(self, core: Any, frame_source: FrameSource, step_delay: float = 0.0,
+                 max_duration: float = 3600.0, seed: Optional[int] = None):
+        """
+        Initialize the runtime.
+
+        Args:
+            core: AutomationCore whose sequences are simulated
+            frame_source: Source of the simulated game window
+            step_delay: Simulated delay between top-level steps in seconds
+            max_duration: Simulated seconds after which a run is ended
+            seed: Seed for the random module before each run (random wait
+                  variations and values), None to leave it alone
+        """
+        self.core = core
+        self.frame_source = frame_source
+        self.step_delay = step_delay
+        self.max_duration = max_duration
+        self.seed = seed
+        self._clock: Optional[VirtualClock] = None
+        core.register_on_progress(self._on_progress)
+
+    def run(self, sequence_name: str) -> SimulationResult:
+        """
+        Simulate a sequence.
+
+        Args:
+            sequence_name: Name of the sequence to run
+
+        Returns:
+            Outcome of the run
+        """
+        clock = VirtualClock(limit=self.max_duration)
+        self.frame_source.reset()
+        screen = SimulatedScreen(clock, self.frame_source)
+        device = SimulatedInput(clock, self.frame_source)
+        if self.seed is not None:
+            random.seed(self.seed)
+
+        core = self.core
+        saved = (core.input_controller, core.screen_capture, core.ocr_regions)
+        core.input_controller, core.screen_capture, core.ocr_regions = device, screen, None
+        self._clock = clock
+        started = time.perf_counter()
+        try:
+            with use_clock(clock):
+                success = core.execute_sequence(sequence_name)
+        finally:
+            wall_time = time.perf_counter() - started
+            self._clock = None
+            core.input_controller, core.screen_capture, core.ocr_regions = saved
+
+        result = SimulationResult(
+            sequence=sequence_name,
+            success=success,
+            simulated_time=clock.elapsed,
+            wall_time=wall_time,
+            timed_out=clock.expired,
+            inputs=device.events,
+            frames_captured=screen.frames_captured,
+        )
+        logger.info(
+            f"Simulated {sequence_name}: {'success' if success else 'failure'} after "
+            f"{result.simulated_time:.1f}s simulated in {wall_time:.3f}s "
+            f"({len(result.inputs)} inputs, {result.frames_captured} frames)"
+            + (" - time limit reached" if result.timed_out else "")
+        )
+        return result
+
+    def _on_progress(self, current_step: int, total_steps: int) -> None:
+        """Apply the step delay after each top-level step of a simulation run."""
+        if self._clock is not None and self.step_delay > 0:
+            self._clock.sleep(self.step_delay)
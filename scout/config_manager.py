@@ -79,7 +79,12 @@ class ConfigManager:
             "cross_color_b": "0",
             "cross_size": "10",
             "cross_thickness": "1",
-            "cross_scale": "1.0"
+            "cross_scale": "1.0",
+            "backend": "opencv",
+            "display_rate": "30.0",
+            "interpolate": "true",
+            "perf_hud": "false",
+            "perf_export_path": ""
         }
         
         # Template matching settings
@@ -110,7 +115,16 @@ class ConfigManager:
             "region_top": "0",
             "region_width": "0",
             "region_height": "0",
-            "dpi_scale": "1.0"
+            "dpi_scale": "1.0",
+            "trigger_mode": "timer",
+            "safety_poll_interval": "10.0",
+            "change_threshold": "2.0",
+            "preprocessing": "default",
+            "preprocess_grayscale": "true",
+            "preprocess_threshold_enabled": "true",
+            "preprocess_threshold": "127",
+            "preprocess_noise_enabled": "false",
+            "preprocess_noise_kernel": "3"
         }
         
         # Debug settings
@@ -118,7 +132,9 @@ class ConfigManager:
             "enabled": "false",
             "save_screenshots": "true",
             "save_templates": "true",
-            "debug_screenshots_dir": "scout/debug_screenshots"
+            "debug_screenshots_dir": "scout/debug_screenshots",
+            "action_profiler": "false",
+            "action_profile_path": ""
         }
         
         # Template search settings
@@ -164,9 +180,61 @@ class ConfigManager:
                 "width": self.config.getint("OCR", "region_width", fallback=0),
                 "height": self.config.getint("OCR", "region_height", fallback=0),
                 "dpi_scale": self.config.getfloat("OCR", "dpi_scale", fallback=1.0)
+            },
+            "trigger_mode": self.config.get("OCR", "trigger_mode", fallback="timer"),
+            "safety_poll_interval": self.config.getfloat("OCR", "safety_poll_interval", fallback=10.0),
+            "change_threshold": self.config.getfloat("OCR", "change_threshold", fallback=2.0),
+            "preprocessing": self._get_ocr_preprocessing()
+        }
+
+    def _get_ocr_preprocessing(self) -> Optional[Dict[str, Any]]:
+        """
+        Get the OCR preprocessing chosen in the OCR debug tab.
+        
+        Returns:
+            Preprocessing parameters in the format of OCRTab.get_ocr_parameters(),
+            or None to use the default coordinate pipeline
+        """
+        if self.config.get("OCR", "preprocessing", fallback="default") != "custom":
+            return None
+        return {
+            "grayscale": self.config.getboolean("OCR", "preprocess_grayscale", fallback=True),
+            "threshold": {
+                "enabled": self.config.getboolean("OCR", "preprocess_threshold_enabled", fallback=True),
+                "value": self.config.getint("OCR", "preprocess_threshold", fallback=127)
+            },
+            "noise_reduction": {
+                "enabled": self.config.getboolean("OCR", "preprocess_noise_enabled", fallback=False),
+                "kernel_size": self.config.getint("OCR", "preprocess_noise_kernel", fallback=3)
             }
         }
 
+    def update_ocr_preprocessing(self, preprocessing: Optional[Dict[str, Any]]) -> None:
+        """
+        Store the OCR preprocessing chosen in the OCR debug tab.
+        
+        Args:
+            preprocessing: Preprocessing parameters in the format of
+                           OCRTab.get_ocr_parameters(), or None for the default pipeline
+        """
+        if not self.config.has_section("OCR"):
+            self.config.add_section("OCR")
+            
+        if preprocessing is None:
+            self.config["OCR"]["preprocessing"] = "default"
+        else:
+            threshold = preprocessing.get("threshold", {})
+            noise = preprocessing.get("noise_reduction", {})
+            self.config["OCR"]["preprocessing"] = "custom"
+            self.config["OCR"]["preprocess_grayscale"] = str(preprocessing.get("grayscale", True)).lower()
+            self.config["OCR"]["preprocess_threshold_enabled"] = str(threshold.get("enabled", True)).lower()
+            self.config["OCR"]["preprocess_threshold"] = str(int(threshold.get("value", 127)))
+            self.config["OCR"]["preprocess_noise_enabled"] = str(noise.get("enabled", False)).lower()
+            self.config["OCR"]["preprocess_noise_kernel"] = str(int(noise.get("kernel_size", 3)))
+        
+        self.save_config()
+        logger.debug(f"Updated OCR preprocessing: {preprocessing}")
+
     def update_ocr_settings(self, settings: Dict[str, Any]) -> None:
         """
         Update OCR settings.
@@ -187,6 +255,12 @@ class ConfigManager:
         self.config["OCR"]["region_height"] = str(region.get("height", 0))
         self.config["OCR"]["dpi_scale"] = str(region.get("dpi_scale", 1.0))
         
+        # Trigger settings keep their current values when not provided
+        for key, default in (("trigger_mode", "timer"), ("safety_poll_interval", "10.0"),
+                             ("change_threshold", "2.0")):
+            current = self.config.get("OCR", key, fallback=default)
+            self.config["OCR"][key] = str(settings.get(key, current))
+        
         self.save_config()
         logger.debug(f"Updated OCR settings: {settings}")
 
@@ -204,6 +278,8 @@ class ConfigManager:
             - grouping_threshold: Pixel distance for grouping matches
             - match_persistence: Number of frames to keep matches without updates
             - distance_threshold: Maximum pixel distance to consider matches as the same group
+            - appear_frames: Number of consecutive frames before a new match is shown
+            - kalman_smoothing: Whether tracked match positions are smoothed
         """
         config = self._load_config()
         
@@ -215,7 +291,9 @@ class ConfigManager:
             "templates_dir": config.get("template_matching", "templates_dir", fallback="scout/templates"),
             "grouping_threshold": config.getint("template_matching", "grouping_threshold", fallback=10),
             "match_persistence": config.getint("template_matching", "match_persistence", fallback=3),
-            "distance_threshold": config.getint("template_matching", "distance_threshold", fallback=100)
+            "distance_threshold": config.getint("template_matching", "distance_threshold", fallback=100),
+            "appear_frames": config.getint("template_matching", "appear_frames", fallback=1),
+            "kalman_smoothing": config.getboolean("template_matching", "kalman_smoothing", fallback=False)
         }
 
     def update_template_matching_settings(self, settings: Dict[str, Any]) -> None:
@@ -232,6 +310,8 @@ class ConfigManager:
                 - grouping_threshold: Pixel distance for grouping matches
                 - match_persistence: Number of frames to keep matches without updates
                 - distance_threshold: Maximum pixel distance to consider matches as the same group
+                - appear_frames: Number of consecutive frames before a new match is shown
+                - kalman_smoothing: Whether tracked match positions are smoothed
         """
         config = self._load_config()
         
@@ -246,6 +326,8 @@ class ConfigManager:
         config.set("template_matching", "grouping_threshold", str(settings.get("grouping_threshold", 10)))
         config.set("template_matching", "match_persistence", str(settings.get("match_persistence", 3)))
         config.set("template_matching", "distance_threshold", str(settings.get("distance_threshold", 100)))
+        config.set("template_matching", "appear_frames", str(settings.get("appear_frames", 1)))
+        config.set("template_matching", "kalman_smoothing", str(settings.get("kalman_smoothing", False)))
         
         self._save_config(config)
         logger.debug(f"Updated template matching settings: {settings}")
@@ -278,7 +360,12 @@ class ConfigManager:
             ),
             "cross_size": self.config.getint("Overlay", "cross_size", fallback=10),
             "cross_thickness": self.config.getint("Overlay", "cross_thickness", fallback=1),
-            "cross_scale": self.config.getfloat("Overlay", "cross_scale", fallback=1.0)
+            "cross_scale": self.config.getfloat("Overlay", "cross_scale", fallback=1.0),
+            "backend": self.config.get("Overlay", "backend", fallback="opencv"),
+            "display_rate": self.config.getfloat("Overlay", "display_rate", fallback=30.0),
+            "interpolate": self.config.getboolean("Overlay", "interpolate", fallback=True),
+            "perf_hud": self.config.getboolean("Overlay", "perf_hud", fallback=False),
+            "perf_export_path": self.config.get("Overlay", "perf_export_path", fallback="")
         }
 
     def update_overlay_settings(self, settings: Dict[str, Any]) -> None:
@@ -317,6 +404,16 @@ class ConfigManager:
         self.config["Overlay"]["cross_size"] = str(settings.get("cross_size", 10))
         self.config["Overlay"]["cross_thickness"] = str(settings.get("cross_thickness", 1))
         self.config["Overlay"]["cross_scale"] = str(settings.get("cross_scale", 1.0))
+        self.config["Overlay"]["backend"] = str(settings.get(
+            "backend", self.config.get("Overlay", "backend", fallback="opencv")))
+        self.config["Overlay"]["display_rate"] = str(settings.get(
+            "display_rate", self.config.getfloat("Overlay", "display_rate", fallback=30.0)))
+        self.config["Overlay"]["interpolate"] = str(settings.get(
+            "interpolate", self.config.getboolean("Overlay", "interpolate", fallback=True))).lower()
+        self.config["Overlay"]["perf_hud"] = str(settings.get(
+            "perf_hud", self.config.getboolean("Overlay", "perf_hud", fallback=False))).lower()
+        self.config["Overlay"]["perf_export_path"] = str(settings.get(
+            "perf_export_path", self.config.get("Overlay", "perf_export_path", fallback="")))
         
         self.save_config()
         logger.debug("Updated overlay settings")
@@ -361,6 +458,12 @@ class ConfigManager:
             - save_screenshots: Whether to save debug screenshots
             - save_templates: Whether to save template debug images
             - debug_screenshots_dir: Directory path for debug screenshots
+            - ui_refresh_rate: Maximum debug window refreshes per second
+            - image_format: Format of saved debug images ("png" or "webp")
+            - write_queue_size: Maximum number of debug images waiting to be written
+            - action_profiler: Whether automation actions are profiled
+            - action_profile_path: JSON file the action profile is written to
+              after each sequence (empty to disable)
         """
         if not self.config.has_section("Debug"):
             self.config.add_section("Debug")
@@ -369,10 +472,15 @@ class ConfigManager:
             "enabled": self.config.getboolean("Debug", "enabled", fallback=False),
             "save_screenshots": self.config.getboolean("Debug", "save_screenshots", fallback=True),
             "save_templates": self.config.getboolean("Debug", "save_templates", fallback=True),
-            "debug_screenshots_dir": self.config.get("Debug", "debug_screenshots_dir", fallback="scout/debug_screenshots")
+            "debug_screenshots_dir": self.config.get("Debug", "debug_screenshots_dir", fallback="scout/debug_screenshots"),
+            "ui_refresh_rate": self.config.getfloat("Debug", "ui_refresh_rate", fallback=10.0),
+            "image_format": self.config.get("Debug", "image_format", fallback="png"),
+            "write_queue_size": self.config.getint("Debug", "write_queue_size", fallback=8),
+            "action_profiler": self.config.getboolean("Debug", "action_profiler", fallback=False),
+            "action_profile_path": self.config.get("Debug", "action_profile_path", fallback="")
         }
 
-    def update_debug_settings(self, settings: Dict[str, bool]) -> None:
+    def update_debug_settings(self, settings: Dict[str, Any]) -> None:
         """
         Update debug settings.
         
@@ -381,12 +489,15 @@ class ConfigManager:
                      - enabled: Whether debug mode is enabled
                      - save_screenshots: Whether to save debug screenshots
                      - save_templates: Whether to save template debug images
+                     - action_profiler: Whether automation actions are profiled
+                     - action_profile_path: JSON file for the action profile
         """
         if not self.config.has_section("Debug"):
             self.config.add_section("Debug")
             
         for key, value in settings.items():
-            self.config["Debug"][key] = str(value).lower()
+            # Booleans are stored lowercase; paths keep their case
+            self.config["Debug"][key] = str(value).lower() if isinstance(value, bool) else str(value)
             
         self.save_config()
         logger.debug(f"Updated debug settings: {settings}")
@@ -14,6 +14,7 @@ import logging
 from pathlib import Path
 import os
 import time
+from scout.utils.frame_conversion import frame_cache, next_frame_id
 
 logger = logging.getLogger(__name__)
 
@@ -42,6 +43,7 @@ class ImageTab(QWidget):
         self.name = name
         self.current_image = None
         self.metadata = None
+        self.frame_id: Optional[int] = None
         
         # Create layout
         layout = QVBoxLayout()
@@ -96,18 +98,21 @@ class ImageTab(QWidget):
         
         logger.debug(f"Image tab '{name}' initialized")
     
-    def update_image(self, image: np.ndarray, metadata: Optional[Dict[str, Any]] = None) -> None:
+    def update_image(self, image: np.ndarray, metadata: Optional[Dict[str, Any]] = None,
+                     frame_id: Optional[int] = None) -> None:
         """
         Update the displayed image and metadata.
         
         Args:
             image: Image as numpy array
             metadata: Optional metadata to display
+            frame_id: Sequence number of the image (a new one is assigned if not given)
         """
         try:
             # Store image and metadata
             self.current_image = image.copy() if image is not None else None
             self.metadata = metadata
+            self.frame_id = frame_id if frame_id is not None else next_frame_id()
             
             # Update display
             self._update_display()
@@ -127,8 +132,8 @@ class ImageTab(QWidget):
             # Get display mode
             mode = self.display_combo.currentText()
             
-            # Process image based on mode
-            display_image = self.current_image.copy()
+            # Process image based on mode (the grid draws on its own copy)
+            display_image = self.current_image
             
             if mode == "Grayscale" and len(display_image.shape) == 3:
                 display_image = cv2.cvtColor(display_image, cv2.COLOR_BGR2GRAY)
@@ -143,21 +148,10 @@ class ImageTab(QWidget):
             if self.show_grid.isChecked():
                 display_image = self._add_grid(display_image)
             
-            # Convert image for display
-            if len(display_image.shape) == 2:  # Grayscale
-                h, w = display_image.shape
-                bytes_per_line = w
-                q_img = QImage(display_image.data, w, h, bytes_per_line, QImage.Format.Format_Grayscale8)
-            else:  # Color (assume BGR)
-                h, w, c = display_image.shape
-                bytes_per_line = 3 * w
-                rgb = cv2.cvtColor(display_image, cv2.COLOR_BGR2RGB)
-                q_img = QImage(rgb.data, w, h, bytes_per_line, QImage.Format.Format_RGB888)
-            
-            # Scale image while preserving aspect ratio
-            pixmap = QPixmap.fromImage(q_img)
-            scaled = pixmap.scaled(800, 600, Qt.AspectRatioMode.KeepAspectRatio, 
-                                 Qt.TransformationMode.SmoothTransformation)
+            # Convert and scale (shared with other views showing the same frame);
+            # the display settings are part of the key as they change the pixels
+            key = (self.frame_id, mode, self.show_grid.isChecked())
+            scaled = frame_cache.pixmap(display_image, (800, 600), key)
             
             # Update image
             self.image_label.setPixmap(scaled)
@@ -21,6 +21,7 @@ import time
 import cv2
 
 from scout.debug.preview import ImagePreview
+from scout.ocr_preprocessing import PreprocessingPipeline
 
 logger = logging.getLogger(__name__)
 
@@ -38,6 +39,7 @@ class OCRTab(QWidget):
     # Signals
     region_selected = pyqtSignal(tuple)  # Emitted when a region is selected (x, y, w, h)
     parameters_changed = pyqtSignal(dict)  # Emitted when OCR parameters are changed
+    pipeline_changed = pyqtSignal(object)  # Emitted with the new PreprocessingPipeline
     
     def __init__(self) -> None:
         """Initialize OCR tab."""
@@ -51,6 +53,9 @@ class OCRTab(QWidget):
         self.current_regions = []
         self.current_text = {}
         
+        # Preprocessing pipeline built from the current parameters
+        self.pipeline = PreprocessingPipeline.from_ocr_parameters(self.get_ocr_parameters())
+        
         logger.debug("OCR tab initialized")
     
     def _setup_ui(self) -> None:
@@ -323,10 +328,58 @@ class OCRTab(QWidget):
             }
         }
     
+    def set_ocr_parameters(self, params: Dict[str, Any]) -> None:
+        """
+        Show stored OCR parameters without emitting change signals.
+        
+        Args:
+            params: Dictionary in the format of get_ocr_parameters() (missing keys are kept)
+        """
+        widgets = (self.lang_combo, self.psm_combo, self.gray_check, self.thresh_check,
+                   self.thresh_spin, self.noise_check, self.noise_spin)
+        for widget in widgets:
+            widget.blockSignals(True)
+        try:
+            if "language" in params:
+                self.lang_combo.setCurrentText(params["language"])
+            if "psm" in params:
+                index = self.psm_combo.findText(f"{params['psm']} -", Qt.MatchFlag.MatchStartsWith)
+                if index >= 0:
+                    self.psm_combo.setCurrentIndex(index)
+            
+            preprocessing = params.get("preprocessing", {})
+            threshold = preprocessing.get("threshold", {})
+            noise = preprocessing.get("noise_reduction", {})
+            self.gray_check.setChecked(preprocessing.get("grayscale", self.gray_check.isChecked()))
+            self.thresh_check.setChecked(threshold.get("enabled", self.thresh_check.isChecked()))
+            self.thresh_spin.setValue(threshold.get("value", self.thresh_spin.value()))
+            self.noise_check.setChecked(noise.get("enabled", self.noise_check.isChecked()))
+            self.noise_spin.setValue(noise.get("kernel_size", self.noise_spin.value()))
+        finally:
+            for widget in widgets:
+                widget.blockSignals(False)
+        
+        self.pipeline = PreprocessingPipeline.from_ocr_parameters(self.get_ocr_parameters())
+    
+    def get_preprocessing_pipeline(self) -> PreprocessingPipeline:
+        """
+        Get the preprocessing pipeline for the current parameters.
+        
+        The returned pipeline can be handed to TextOCR.set_preprocessing() so
+        that the tuned preprocessing is used at runtime (the debug window does
+        this on every pipeline_changed signal).
+        
+        Returns:
+            Preprocessing pipeline
+        """
+        return self.pipeline
+    
     def _on_parameter_changed(self) -> None:
         """Handle OCR parameter changes."""
         params = self.get_ocr_parameters()
+        self.pipeline = PreprocessingPipeline.from_ocr_parameters(params)
         self.parameters_changed.emit(params)
+        self.pipeline_changed.emit(self.pipeline)
         self.status_label.setText("Parameters updated. Press 'Process Image' to apply.")
     
     def _on_process_clicked(self) -> None:
@@ -335,9 +388,12 @@ class OCRTab(QWidget):
             self.status_label.setText("No image loaded. Capture or load an image first.")
             return
         
+        # Run the preprocessing pipeline and show the processed image
+        processed = self.pipeline.process(self.current_image)
+        self.image_preview.set_image(processed.copy())
+        self.status_label.setText(f"Preprocessed: {self.pipeline.format_timings()}")
+        
         # In a real implementation, this would call the OCR engine
-        # For now, we'll just update the status
-        self.status_label.setText("Processing image... (OCR engine integration pending)")
         
         # This would be replaced with actual OCR processing
         # For demonstration, we'll just show a placeholder
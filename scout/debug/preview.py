@@ -7,16 +7,22 @@ This module provides a widget for displaying images with overlays for:
 - OCR regions
 - Mouse position
 - Grid
+
+The image is rendered by a TiledPreviewView: only the visible tiles are
+drawn, from a cached mip level matching the zoom, and overlays are Qt items.
+Positions, matches and OCR regions are also kept in a spatial index so
+hovering over the preview can hit-test them without scanning every item.
 """
 
-from typing import Optional, Dict, List, Tuple
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QImage, QPixmap, QPainter, QPen, QColor, QMouseEvent
+from typing import Optional, Dict, List, Tuple, Hashable
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QToolTip
+from PyQt6.QtCore import pyqtSignal
+from PyQt6.QtGui import QCursor
 import numpy as np
-import cv2
 import logging
 from scout.automation.core import AutomationPosition
+from scout.spatial_index import SpatialGridIndex
+from scout.debug.tiled_preview import TiledPreviewView
 
 logger = logging.getLogger(__name__)
 
@@ -48,25 +54,26 @@ class PreviewWidget(QWidget):
         layout = QVBoxLayout()
         layout.setContentsMargins(0, 0, 0, 0)
         
-        # Create image label
-        self.image_label = QLabel()
-        self.image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        layout.addWidget(self.image_label)
+        # Create tiled image view (handles zoom, panning and overlay items)
+        self.view = TiledPreviewView()
+        self.view.mouse_moved.connect(self._on_view_mouse_moved)
+        self.view.mouse_clicked.connect(self.mouse_clicked)
+        layout.addWidget(self.view)
         
         # Set layout
         self.setLayout(layout)
         
-        # Enable mouse tracking
-        self.setMouseTracking(True)
-        self.image_label.setMouseTracking(True)
-        
         # Current state
         self.current_image: Optional[np.ndarray] = None
-        self.display_image: Optional[QPixmap] = None
         self.positions: Dict[str, AutomationPosition] = {}
         self.template_matches: List[Tuple] = []  # [(name, x, y, w, h, conf)]
         self.ocr_regions: List[Tuple] = []  # [(text, x, y, w, h)]
         self.mouse_position: Optional[Tuple[int, int]] = None
+        self.hovered_item: Optional[Hashable] = None
+        
+        # Spatial index of all items in image coordinates, keyed by
+        # ("position", name), ("match", index) or ("ocr", index)
+        self.item_index = SpatialGridIndex(cell_size=64)
         
         # Display options
         self.show_positions = True
@@ -90,7 +97,7 @@ class PreviewWidget(QWidget):
             return
             
         self.current_image = image.copy()
-        self._update_display()
+        self.view.set_frame(self.current_image)
     
     def update_positions(self, positions: Dict[str, AutomationPosition]) -> None:
         """
@@ -100,7 +107,8 @@ class PreviewWidget(QWidget):
             positions: Dictionary of named positions
         """
         self.positions = positions
-        self._update_display()
+        self._sync_index("position", {name: (pos.x, pos.y, pos.x, pos.y) for name, pos in positions.items()})
+        self.view.set_positions(positions)
     
     def update_template_matches(self, matches: List[Tuple]) -> None:
         """
@@ -110,7 +118,8 @@ class PreviewWidget(QWidget):
             matches: List of template matches (name, x, y, w, h, conf)
         """
         self.template_matches = matches
-        self._update_display()
+        self._sync_index("match", {i: (x, y, x + w, y + h) for i, (_, x, y, w, h, _) in enumerate(matches)})
+        self.view.set_template_matches(matches)
     
     def update_ocr_regions(self, regions: List[Tuple]) -> None:
         """
@@ -120,7 +129,47 @@ class PreviewWidget(QWidget):
             regions: List of OCR regions (text, x, y, w, h)
         """
         self.ocr_regions = regions
-        self._update_display()
+        self._sync_index("ocr", {i: (x, y, x + w, y + h) for i, (_, x, y, w, h) in enumerate(regions)})
+        self.view.set_ocr_regions(regions)
+    
+    def _sync_index(self, kind: str, boxes: Dict[Hashable, Tuple[int, int, int, int]]) -> None:
+        """
+        Update the items of one kind in the spatial index.
+        
+        Args:
+            kind: Item kind ("position", "match" or "ocr")
+            boxes: Dictionary of item key to box (x1, y1, x2, y2)
+        """
+        for key in [key for key in self.item_index if key[0] == kind and key[1] not in boxes]:
+            self.item_index.remove(key)
+        for key, box in boxes.items():
+            self.item_index.insert((kind, key), box)
+    
+    def get_item_at(self, x: int, y: int, radius: int = 5) -> Optional[Hashable]:
+        """
+        Get the item closest to a point in image coordinates.
+        
+        Args:
+            x: X coordinate
+            y: Y coordinate
+            radius: Maximum distance to an item
+            
+        Returns:
+            Item key (kind, name or index), or None
+        """
+        return self.item_index.nearest(x, y, radius)
+    
+    def _describe_item(self, key: Hashable) -> str:
+        """Get the tooltip text of an indexed item."""
+        kind, ref = key
+        if kind == "position":
+            pos = self.positions[ref]
+            return f"{ref}: ({pos.x}, {pos.y})"
+        if kind == "match":
+            name, x, y, w, h, conf = self.template_matches[ref]
+            return f"{name} ({conf:.2f}) at ({x}, {y}) {w}x{h}"
+        text, x, y, w, h = self.ocr_regions[ref]
+        return f"OCR '{text}' at ({x}, {y}) {w}x{h}"
     
     def update_mouse_position(self, x: int, y: int) -> None:
         """
@@ -131,7 +180,7 @@ class PreviewWidget(QWidget):
             y: Y coordinate
         """
         self.mouse_position = (x, y)
-        self._update_display()
+        self.view.set_mouse_position(self.mouse_position)
     
     def toggle_grid(self, show: bool) -> None:
         """
@@ -162,240 +211,35 @@ class PreviewWidget(QWidget):
             zoom: Zoom level (1.0 = 100%)
         """
         self.zoom_level = max(0.1, min(5.0, zoom))
-        self._update_display()
+        self.view.set_zoom(self.zoom_level)
     
     def _update_display(self) -> None:
-        """Update the display with current image and overlays."""
-        if self.current_image is None:
-            return
-            
-        try:
-            # Convert image to RGB for Qt
-            if len(self.current_image.shape) == 2:  # Grayscale
-                display = cv2.cvtColor(self.current_image, cv2.COLOR_GRAY2RGB)
-            else:  # Color (assume BGR)
-                display = cv2.cvtColor(self.current_image, cv2.COLOR_BGR2RGB)
-            
-            # Create QImage
-            h, w = display.shape[:2]
-            bytes_per_line = 3 * w
-            q_img = QImage(display.data, w, h, bytes_per_line, QImage.Format.Format_RGB888)
-            
-            # Create pixmap for drawing
-            pixmap = QPixmap.fromImage(q_img)
-            
-            # Apply zoom
-            if self.zoom_level != 1.0:
-                new_w = int(w * self.zoom_level)
-                new_h = int(h * self.zoom_level)
-                pixmap = pixmap.scaled(new_w, new_h, Qt.AspectRatioMode.KeepAspectRatio, 
-                                     Qt.TransformationMode.SmoothTransformation)
-            
-            # Create painter for overlays
-            painter = QPainter(pixmap)
-            
-            # Draw grid if enabled
-            if self.show_grid:
-                self._draw_grid(painter, pixmap.width(), pixmap.height())
-            
-            # Draw positions if enabled
-            if self.show_positions:
-                self._draw_positions(painter)
-            
-            # Draw template matches if enabled
-            if self.show_templates:
-                self._draw_template_matches(painter)
-            
-            # Draw OCR regions if enabled
-            if self.show_ocr:
-                self._draw_ocr_regions(painter)
-            
-            # Draw mouse position if enabled
-            if self.show_mouse and self.mouse_position:
-                self._draw_mouse_position(painter)
-            
-            # End painting
-            painter.end()
-            
-            # Update display
-            self.display_image = pixmap
-            self.image_label.setPixmap(pixmap)
-            
-        except Exception as e:
-            logger.error(f"Error updating preview display: {e}")
-    
-    def _draw_grid(self, painter: QPainter, width: int, height: int) -> None:
-        """
-        Draw grid on the image.
-        
-        Args:
-            painter: QPainter to use
-            width: Image width
-            height: Image height
-        """
-        # Set pen for grid
-        pen = QPen(QColor(100, 100, 100, 100))
-        pen.setWidth(1)
-        painter.setPen(pen)
-        
-        # Calculate grid size based on zoom
-        grid_size = int(self.grid_size * self.zoom_level)
-        
-        # Draw vertical lines
-        for x in range(0, width, grid_size):
-            painter.drawLine(x, 0, x, height)
-        
-        # Draw horizontal lines
-        for y in range(0, height, grid_size):
-            painter.drawLine(0, y, width, y)
+        """Apply the display options to the view (the frame itself is not reprocessed)."""
+        self.view.set_layer_visible("positions", self.show_positions)
+        self.view.set_layer_visible("matches", self.show_templates)
+        self.view.set_layer_visible("ocr", self.show_ocr)
+        self.view.set_layer_visible("mouse", self.show_mouse)
+        self.view.set_grid(self.show_grid, self.grid_size)
     
-    def _draw_positions(self, painter: QPainter) -> None:
+    def _on_view_mouse_moved(self, x: int, y: int) -> None:
         """
-        Draw marked positions on the image.
+        Handle mouse movement over the image.
         
         Args:
-            painter: QPainter to use
-        """
-        for name, pos in self.positions.items():
-            # Calculate position with zoom
-            x = int(pos.x * self.zoom_level)
-            y = int(pos.y * self.zoom_level)
-            
-            # Set pen for position
-            pen = QPen(QColor(0, 255, 0))
-            pen.setWidth(2)
-            painter.setPen(pen)
-            
-            # Draw crosshair
-            size = 10
-            painter.drawLine(x - size, y, x + size, y)
-            painter.drawLine(x, y - size, x, y + size)
-            
-            # Draw name
-            painter.drawText(x + 5, y - 5, name)
-    
-    def _draw_template_matches(self, painter: QPainter) -> None:
-        """
-        Draw template matches on the image.
-        
-        Args:
-            painter: QPainter to use
-        """
-        for name, x, y, w, h, conf in self.template_matches:
-            # Calculate position with zoom
-            x = int(x * self.zoom_level)
-            y = int(y * self.zoom_level)
-            w = int(w * self.zoom_level)
-            h = int(h * self.zoom_level)
-            
-            # Set pen color based on confidence
-            if conf > 0.9:
-                color = QColor(0, 255, 0)  # Green for high confidence
-            elif conf > 0.7:
-                color = QColor(255, 255, 0)  # Yellow for medium confidence
+            x: X coordinate in image pixels
+            y: Y coordinate in image pixels
+        """
+        # Show a tooltip for the hovered item
+        hovered = self.get_item_at(x, y, max(1, int(5 / self.zoom_level)))
+        if hovered != self.hovered_item:
+            self.hovered_item = hovered
+            if hovered is not None:
+                QToolTip.showText(QCursor.pos(), self._describe_item(hovered), self)
             else:
-                color = QColor(255, 0, 0)  # Red for low confidence
-            
-            pen = QPen(color)
-            pen.setWidth(2)
-            painter.setPen(pen)
-            
-            # Draw rectangle
-            painter.drawRect(x, y, w, h)
-            
-            # Draw name and confidence
-            painter.drawText(x, y - 5, f"{name} ({conf:.2f})")
-    
-    def _draw_ocr_regions(self, painter: QPainter) -> None:
-        """
-        Draw OCR regions on the image.
-        
-        Args:
-            painter: QPainter to use
-        """
-        for text, x, y, w, h in self.ocr_regions:
-            # Calculate position with zoom
-            x = int(x * self.zoom_level)
-            y = int(y * self.zoom_level)
-            w = int(w * self.zoom_level)
-            h = int(h * self.zoom_level)
-            
-            # Set pen for OCR region
-            pen = QPen(QColor(0, 0, 255))
-            pen.setWidth(2)
-            painter.setPen(pen)
-            
-            # Draw rectangle
-            painter.drawRect(x, y, w, h)
-            
-            # Draw text
-            painter.drawText(x, y - 5, text)
-    
-    def _draw_mouse_position(self, painter: QPainter) -> None:
-        """
-        Draw mouse position on the image.
-        
-        Args:
-            painter: QPainter to use
-        """
-        x, y = self.mouse_position
-        
-        # Calculate position with zoom
-        x = int(x * self.zoom_level)
-        y = int(y * self.zoom_level)
-        
-        # Set pen for mouse position
-        pen = QPen(QColor(255, 0, 255))
-        pen.setWidth(2)
-        painter.setPen(pen)
-        
-        # Draw crosshair
-        size = 15
-        painter.drawLine(x - size, y, x + size, y)
-        painter.drawLine(x, y - size, x, y + size)
-        
-        # Draw coordinates
-        painter.drawText(x + 10, y + 10, f"({int(x / self.zoom_level)}, {int(y / self.zoom_level)})")
-    
-    def mouseMoveEvent(self, event: QMouseEvent) -> None:
-        """
-        Handle mouse move event.
-        
-        Args:
-            event: Mouse event
-        """
-        if self.display_image and self.image_label.rect().contains(event.pos()):
-            # Calculate position relative to image
-            pos = event.pos() - self.image_label.pos()
-            
-            # Convert to original image coordinates
-            x = int(pos.x() / self.zoom_level)
-            y = int(pos.y() / self.zoom_level)
-            
-            # Emit signal
-            self.mouse_moved.emit(x, y)
-        
-        super().mouseMoveEvent(event)
-    
-    def mousePressEvent(self, event: QMouseEvent) -> None:
-        """
-        Handle mouse press event.
-        
-        Args:
-            event: Mouse event
-        """
-        if self.display_image and self.image_label.rect().contains(event.pos()):
-            # Calculate position relative to image
-            pos = event.pos() - self.image_label.pos()
-            
-            # Convert to original image coordinates
-            x = int(pos.x() / self.zoom_level)
-            y = int(pos.y() / self.zoom_level)
-            
-            # Emit signal
-            self.mouse_clicked.emit(x, y, event.button())
+                QToolTip.hideText()
         
-        super().mousePressEvent(event)
+        # Emit signal
+        self.mouse_moved.emit(x, y)
     
     def clear(self) -> None:
         """Clear all content."""
@@ -404,4 +248,6 @@ class PreviewWidget(QWidget):
         self.template_matches = []
         self.ocr_regions = []
         self.mouse_position = None
-        self.image_label.clear()
\ No newline at end of file
+        self.hovered_item = None
+        self.item_index.clear()
+        self.view.clear()
\ No newline at end of file
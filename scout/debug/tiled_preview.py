@@ -0,0 +1,385 @@
+"""
+Tiled preview view for debug windows.
+
+This module provides a QGraphicsView based image preview that only renders
+what is visible. It handles:
+- Drawing the frame from cached mip-level tiles that intersect the viewport
+- Zooming and panning by changing the view transform (no image resizing)
+- Positions, template matches, OCR regions and the mouse marker as Qt items
+- Drawing the grid only over the visible area
+"""
+
+from typing import Optional, Dict, List, Tuple
+from collections import OrderedDict
+from PyQt6.QtWidgets import (
+    QGraphicsView, QGraphicsScene, QGraphicsItem, QGraphicsItemGroup,
+    QGraphicsRectItem, QGraphicsSimpleTextItem, QGraphicsEllipseItem,
+    QGraphicsPathItem, QStyleOptionGraphicsItem, QWidget
+)
+from PyQt6.QtCore import Qt, pyqtSignal, QRectF, QPointF
+from PyQt6.QtGui import (
+    QImage, QPixmap, QPainter, QPen, QColor, QBrush, QPainterPath,
+    QMouseEvent, QWheelEvent
+)
+import numpy as np
+import logging
+from scout.automation.core import AutomationPosition
+from scout.frame_pyramid import FramePyramid, TileKey
+
+logger = logging.getLogger(__name__)
+
+class TiledFrameItem(QGraphicsItem):
+    """
+    Graphics item that paints a frame from mip-level tiles.
+
+    Only the tiles intersecting the exposed area are painted, from the
+    pyramid level that matches the current zoom. Converted tiles are kept
+    as QPixmaps in an LRU cache until the frame changes.
+    """
+
+    def __init__(self, max_tiles: int = 256) -> None:
+        """
+        Initialize an empty frame item.
+
+        Args:
+            max_tiles: Maximum number of tile pixmaps kept in memory
+        """
+        super().__init__()
+        self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemUsesExtendedStyleOption)
+        self.pyramid: Optional[FramePyramid] = None
+        self.max_tiles = max_tiles
+        self._tiles: "OrderedDict[TileKey, QPixmap]" = OrderedDict()
+
+    def set_frame(self, frame: Optional[np.ndarray]) -> None:
+        """
+        Replace the displayed frame.
+
+        Args:
+            frame: BGR or grayscale frame (kept by reference), or None to clear
+        """
+        self.prepareGeometryChange()
+        self.pyramid = FramePyramid(frame) if frame is not None else None
+        self._tiles.clear()
+        self.update()
+
+    def boundingRect(self) -> QRectF:
+        """Get the frame area in scene coordinates (one unit per frame pixel)."""
+        if self.pyramid is None:
+            return QRectF()
+        return QRectF(0, 0, self.pyramid.width, self.pyramid.height)
+
+    def _tile_pixmap(self, key: TileKey) -> QPixmap:
+        """Get the (cached) pixmap of a tile."""
+        pixmap = self._tiles.get(key)
+        if pixmap is not None:
+            self._tiles.move_to_end(key)
+            return pixmap
+
+        pixels = self.pyramid.tile(key)
+        height, width = pixels.shape[:2]
+        if pixels.ndim == 3:
+            image = QImage(pixels.data, width, height, pixels.strides[0], QImage.Format.Format_RGB888)
+        else:
+            image = QImage(pixels.data, width, height, pixels.strides[0], QImage.Format.Format_Grayscale8)
+        # fromImage copies the pixels, so the numpy tile can be released
+        pixmap = QPixmap.fromImage(image)
+
+        self._tiles[key] = pixmap
+        if len(self._tiles) > self.max_tiles:
+            self._tiles.popitem(last=False)
+        return pixmap
+
+    def paint(self, painter: QPainter, option: QStyleOptionGraphicsItem,
+              widget: Optional[QWidget] = None) -> None:
+        """Paint the tiles intersecting the exposed area."""
+        if self.pyramid is None:
+            return
+
+        scale = option.levelOfDetailFromTransform(painter.worldTransform())
+        level = self.pyramid.level_for_scale(scale)
+        exposed = option.exposedRect
+
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform, scale < 1.0)
+        for key in self.pyramid.tiles_in(level, exposed.left(), exposed.top(),
+                                         exposed.right(), exposed.bottom()):
+            x, y, width, height = self.pyramid.tile_rect(key)
+            pixmap = self._tile_pixmap(key)
+            painter.drawPixmap(QRectF(x, y, width, height), pixmap,
+                               QRectF(0, 0, pixmap.width(), pixmap.height()))
+
+class TiledPreviewView(QGraphicsView):
+    """
+    Zoomable, pannable image preview with annotation layers.
+
+    The frame is shown through a TiledFrameItem and every annotation kind
+    lives in its own item group, so toggling a layer or replacing one kind
+    of annotation does not touch the frame or the other layers. Qt's scene
+    index culls annotations outside the viewport.
+
+    Signals:
+        mouse_moved: Emitted when the mouse moves over the frame (x, y in frame pixels)
+        mouse_clicked: Emitted when the frame is clicked (x, y, button)
+    """
+
+    mouse_moved = pyqtSignal(int, int)
+    mouse_clicked = pyqtSignal(int, int, int)
+
+    # Annotation colors
+    POSITION_COLOR = QColor(0, 255, 0)
+    OCR_COLOR = QColor(0, 0, 255)
+    MOUSE_COLOR = QColor(255, 0, 255)
+    GRID_COLOR = QColor(100, 100, 100, 100)
+
+    def __init__(self, parent: Optional[QWidget] = None) -> None:
+        """Initialize the view."""
+        super().__init__(parent)
+        self.setScene(QGraphicsScene(self))
+        self.setBackgroundBrush(QBrush(QColor(40, 40, 40)))
+        self.setDragMode(QGraphicsView.DragMode.ScrollHandDrag)
+        self.setTransformationAnchor(QGraphicsView.ViewportAnchor.AnchorUnderMouse)
+        self.setViewportUpdateMode(QGraphicsView.ViewportUpdateMode.SmartViewportUpdate)
+        self.setMouseTracking(True)
+
+        self.frame_item = TiledFrameItem()
+        self.frame_item.setZValue(0)
+        self.scene().addItem(self.frame_item)
+
+        # One group per annotation layer, drawn above the frame
+        self.layers: Dict[str, QGraphicsItemGroup] = {}
+        for z, name in enumerate(("positions", "matches", "ocr", "mouse"), start=1):
+            group = QGraphicsItemGroup()
+            group.setZValue(z)
+            self.scene().addItem(group)
+            self.layers[name] = group
+
+        self.show_grid = False
+        self.grid_size = 50
+        self.zoom_level = 1.0
+
+    def set_frame(self, frame: Optional[np.ndarray]) -> None:
+        """
+        Show a new frame.
+
+        Args:
+            frame: BGR or grayscale frame, or None to clear
+        """
+        previous = self.frame_item.boundingRect()
+        self.frame_item.set_frame(frame)
+        rect = self.frame_item.boundingRect()
+        if rect != previous:
+            self.scene().setSceneRect(rect)
+
+    def set_zoom(self, zoom: float) -> None:
+        """
+        Set the zoom level.
+
+        Args:
+            zoom: Zoom level (1.0 = 100%)
+        """
+        self.zoom_level = max(0.1, min(5.0, zoom))
+        self.resetTransform()
+        self.scale(self.zoom_level, self.zoom_level)
+
+    def set_layer_visible(self, layer: str, visible: bool) -> None:
+        """
+        Show or hide an annotation layer.
+
+        Args:
+            layer: "positions", "matches", "ocr" or "mouse"
+            visible: Whether the layer is shown
+        """
+        self.layers[layer].setVisible(visible)
+
+    def set_grid(self, show: bool, size: Optional[int] = None) -> None:
+        """
+        Configure the grid.
+
+        Args:
+            show: Whether the grid is shown
+            size: Optional grid spacing in frame pixels
+        """
+        self.show_grid = show
+        if size is not None:
+            self.grid_size = max(1, size)
+        self.viewport().update()
+
+    def _clear_layer(self, layer: str) -> QGraphicsItemGroup:
+        """Remove all items of a layer and return its group."""
+        group = self.layers[layer]
+        for item in group.childItems():
+            group.removeFromGroup(item)
+            self.scene().removeItem(item)
+        return group
+
+    def _pen(self, color: QColor, width: int = 2) -> QPen:
+        """Create a cosmetic pen (constant width at every zoom level)."""
+        pen = QPen(color)
+        pen.setWidth(width)
+        pen.setCosmetic(True)
+        return pen
+
+    def _label(self, group: QGraphicsItemGroup, text: str, x: float, y: float, color: QColor) -> None:
+        """Add a label that keeps its size at every zoom level."""
+        label = QGraphicsSimpleTextItem(text)
+        label.setBrush(QBrush(color))
+        label.setFlag(QGraphicsItem.GraphicsItemFlag.ItemIgnoresTransformations)
+        label.setPos(x, y)
+        group.addToGroup(label)
+
+    def _match_color(self, confidence: float) -> QColor:
+        """Get the color of a template match."""
+        if confidence > 0.9:
+            return QColor(0, 255, 0)  # Green for high confidence
+        if confidence > 0.7:
+            return QColor(255, 255, 0)  # Yellow for medium confidence
+        return QColor(255, 0, 0)  # Red for low confidence
+
+    def set_positions(self, positions: Dict[str, AutomationPosition]) -> None:
+        """
+        Replace the position markers.
+
+        Args:
+            positions: Dictionary of named positions
+        """
+        group = self._clear_layer("positions")
+        pen = self._pen(self.POSITION_COLOR)
+        size = 10
+        for name, pos in positions.items():
+            path = QPainterPath()
+            path.moveTo(pos.x - size, pos.y)
+            path.lineTo(pos.x + size, pos.y)
+            path.moveTo(pos.x, pos.y - size)
+            path.lineTo(pos.x, pos.y + size)
+            cross = QGraphicsPathItem(path)
+            cross.setPen(pen)
+            group.addToGroup(cross)
+            self._label(group, name, pos.x + 5, pos.y - 20, self.POSITION_COLOR)
+
+    def set_template_matches(self, matches: List[Tuple]) -> None:
+        """
+        Replace the template match boxes.
+
+        Args:
+            matches: List of template matches (name, x, y, w, h, conf)
+        """
+        group = self._clear_layer("matches")
+        for name, x, y, w, h, conf in matches:
+            color = self._match_color(conf)
+            rect = QGraphicsRectItem(x, y, w, h)
+            rect.setPen(self._pen(color))
+            group.addToGroup(rect)
+            self._label(group, f"{name} ({conf:.2f})", x, y - 18, color)
+
+    def set_ocr_regions(self, regions: List[Tuple]) -> None:
+        """
+        Replace the OCR region boxes.
+
+        Args:
+            regions: List of OCR regions (text, x, y, w, h)
+        """
+        group = self._clear_layer("ocr")
+        for text, x, y, w, h in regions:
+            rect = QGraphicsRectItem(x, y, w, h)
+            rect.setPen(self._pen(self.OCR_COLOR))
+            group.addToGroup(rect)
+            self._label(group, text, x, y - 18, self.OCR_COLOR)
+
+    def set_mouse_position(self, position: Optional[Tuple[int, int]]) -> None:
+        """
+        Move the mouse marker.
+
+        Args:
+            position: Mouse position in frame pixels, or None to hide the marker
+        """
+        group = self._clear_layer("mouse")
+        if position is None:
+            return
+        x, y = position
+        marker = QGraphicsEllipseItem(-5, -5, 10, 10)
+        marker.setPen(self._pen(self.MOUSE_COLOR))
+        marker.setBrush(QBrush(self.MOUSE_COLOR))
+        marker.setFlag(QGraphicsItem.GraphicsItemFlag.ItemIgnoresTransformations)
+        marker.setPos(x, y)
+        group.addToGroup(marker)
+        self._label(group, f"({x}, {y})", x + 10, y + 10, self.MOUSE_COLOR)
+
+    def clear(self) -> None:
+        """Remove the frame and all annotations."""
+        self.set_frame(None)
+        for layer in self.layers:
+            self._clear_layer(layer)
+
+    def drawForeground(self, painter: QPainter, rect: QRectF) -> None:
+        """Draw the grid over the visible part of the frame only."""
+        if not self.show_grid or self.frame_item.pyramid is None:
+            return
+        visible = rect.intersected(self.frame_item.boundingRect())
+        if visible.isEmpty():
+            return
+
+        painter.setPen(self._pen(self.GRID_COLOR, 1))
+        size = self.grid_size
+        x = int(visible.left()) // size * size
+        while x <= visible.right():
+            painter.drawLine(QPointF(x, visible.top()), QPointF(x, visible.bottom()))
+            x += size
+        y = int(visible.top()) // size * size
+        while y <= visible.bottom():
+            painter.drawLine(QPointF(visible.left(), y), QPointF(visible.right(), y))
+            y += size
+
+    def frame_position(self, event: QMouseEvent) -> Optional[Tuple[int, int]]:
+        """
+        Map a mouse event to frame pixel coordinates.
+
+        Args:
+            event: Mouse event on the viewport
+
+        Returns:
+            (x, y) in frame pixels, or None if the event is outside the frame
+        """
+        point = self.mapToScene(event.position().toPoint())
+        if not self.frame_item.boundingRect().contains(point):
+            return None
+        return (int(point.x()), int(point.y()))
+
+    def mouseMoveEvent(self, event: QMouseEvent) -> None:
+        """Emit the frame coordinates under the mouse."""
+        position = self.frame_position(event)
+        if position is not None:
+            self.mouse_moved.emit(*position)
+        super().mouseMoveEvent(event)
+
+    def mousePressEvent(self, event: QMouseEvent) -> None:
+        """Emit the frame coordinates of a click."""
+        position = self.frame_position(event)
+        if position is not None:
+            self.mouse_clicked.emit(position[0], position[1], event.button().value)
+        super().mousePressEvent(event)
+
+    def wheelEvent(self, event: QWheelEvent) -> None:
+        """Zoom around the mouse with Ctrl+wheel, scroll otherwise."""
+        if event.modifiers() & Qt.KeyboardModifier.ControlModifier:
+            factor = 1.25 if event.angleDelta().y() > 0 else 0.8
+            self.set_zoom(self.zoom_level * factor)
+            event.accept()
+            return
+        super().wheelEvent(event)
+
+    def render_pixmap(self) -> QPixmap:
+        """
+        Render the frame with all visible annotations at full resolution.
+
+        Returns:
+            Rendered pixmap (null if no frame is shown)
+        """
+        rect = self.frame_item.boundingRect()
+        if rect.isEmpty():
+            return QPixmap()
+        pixmap = QPixmap(int(rect.width()), int(rect.height()))
+        painter = QPainter(pixmap)
+        try:
+            self.scene().render(painter, QRectF(pixmap.rect()), rect)
+        finally:
+            painter.end()
+        return pixmap
@@ -0,0 +1,176 @@
+"""
+Debug Image Writer
+
+This module provides a background writer for debug images. It handles:
+- Encoding PNG or WebP images on a worker thread instead of the caller
+- Coalescing writes to the same file (only the newest image is written)
+- A bounded queue that drops new files instead of blocking the caller
+- Counters for written, superseded and dropped images
+
+Debug images are overwritten on every OCR tick, so writing only the latest
+image per file loses nothing while keeping the scan loop free of disk I/O.
+"""
+
+from typing import Optional, Dict, Any
+from collections import OrderedDict
+from pathlib import Path
+import threading
+import logging
+import cv2
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Supported formats and their encoder parameters (favoring speed over size)
+IMAGE_FORMATS = {
+    "png": [cv2.IMWRITE_PNG_COMPRESSION, 1],
+    "webp": [cv2.IMWRITE_WEBP_QUALITY, 101],  # > 100 selects lossless WebP
+}
+
+class DebugImageWriter:
+    """
+    Background writer with per-file coalescing and a bounded queue.
+
+    submit() never blocks: a newer image for a file that is still waiting
+    replaces the old one, and images for new files are dropped while the
+    queue is full.
+    """
+
+    def __init__(self, image_format: str = "png", max_pending: int = 8) -> None:
+        """
+        Initialize the writer (the worker thread starts on first use).
+
+        Args:
+            image_format: "png" or "webp"
+            max_pending: Maximum number of files waiting to be written
+
+        Raises:
+            ValueError: If the image format is not supported
+        """
+        if image_format not in IMAGE_FORMATS:
+            raise ValueError(f"Unsupported debug image format '{image_format}'")
+        self.image_format = image_format
+        self.max_pending = max(1, max_pending)
+
+        self._pending: "OrderedDict[Path, np.ndarray]" = OrderedDict()
+        self._condition = threading.Condition()
+        self._busy = False
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+
+        # Statistics
+        self.submitted = 0
+        self.written = 0
+        self.superseded = 0
+        self.dropped = 0
+        self.errors = 0
+
+    def _ensure_thread(self) -> None:
+        """Start the worker thread if it is not running."""
+        if self._thread is None or not self._thread.is_alive():
+            self._running = True
+            self._thread = threading.Thread(target=self._run, name="DebugImageWriter", daemon=True)
+            self._thread.start()
+
+    def submit(self, path: Path, image: np.ndarray) -> bool:
+        """
+        Queue an image for writing.
+
+        The image is written as-is later on, so the caller must not modify it
+        afterwards (pass a copy of reused buffers).
+
+        Args:
+            path: Target file path (the suffix is replaced by the image format)
+            image: Image to write
+
+        Returns:
+            True if the image was queued, False if it was dropped
+        """
+        path = Path(path).with_suffix(f".{self.image_format}")
+        with self._condition:
+            self._ensure_thread()
+            self.submitted += 1
+            if path in self._pending:
+                # Only the newest image of a file is worth writing
+                self._pending[path] = image
+                self.superseded += 1
+                return True
+            if len(self._pending) >= self.max_pending:
+                self.dropped += 1
+                return False
+            self._pending[path] = image
+            self._condition.notify()
+            return True
+
+    def _run(self) -> None:
+        """Worker loop: write pending images until stopped."""
+        while True:
+            with self._condition:
+                while self._running and not self._pending:
+                    self._condition.wait()
+                if not self._pending:
+                    return
+                path, image = self._pending.popitem(last=False)
+                self._busy = True
+
+            try:
+                if cv2.imwrite(str(path), image, IMAGE_FORMATS[self.image_format]):
+                    self.written += 1
+                else:
+                    self.errors += 1
+                    logger.warning(f"Could not write debug image {path}")
+            except Exception as e:
+                self.errors += 1
+                logger.error(f"Error writing debug image {path}: {e}")
+            finally:
+                with self._condition:
+                    self._busy = False
+                    self._condition.notify_all()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until all queued images are written.
+
+        Args:
+            timeout: Optional maximum wait in seconds
+
+        Returns:
+            True if the queue is empty, False on timeout
+        """
+        with self._condition:
+            return self._condition.wait_for(lambda: not self._pending and not self._busy, timeout)
+
+    def stop(self, flush: bool = True, timeout: float = 5.0) -> None:
+        """
+        Stop the worker thread.
+
+        Args:
+            flush: Whether to write the queued images first
+            timeout: Maximum wait in seconds
+        """
+        with self._condition:
+            if not flush:
+                self.dropped += len(self._pending)
+                self._pending.clear()
+            self._running = False
+            self._condition.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get writer statistics.
+
+        Returns:
+            Dictionary with submitted, written, superseded, dropped, errors and pending counts
+        """
+        with self._condition:
+            return {
+                "submitted": self.submitted,
+                "written": self.written,
+                "superseded": self.superseded,
+                "dropped": self.dropped,
+                "errors": self.errors,
+                "pending": len(self._pending),
+            }
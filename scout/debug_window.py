@@ -1,16 +1,23 @@
 from typing import Optional, Dict, Any, List, Tuple
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QTabWidget, QScrollArea
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, pyqtSignal, QTimer, QThread
 from PyQt6.QtGui import QImage, QPixmap
 import numpy as np
 import cv2
 from pathlib import Path
 import logging
+import threading
 from datetime import datetime
 from scout.config_manager import ConfigManager
+from scout.utils.frame_conversion import frame_cache, next_frame_id
+from scout.debug_image_writer import DebugImageWriter
+from scout.ocr_preprocessing import PreprocessingPipeline
 
 logger = logging.getLogger(__name__)
 
+# Size (width, height) image tabs scale their images to
+IMAGE_TAB_SIZE = (800, 600)
+
 class ImageTab(QWidget):
     """
     A tab for displaying a single image with metadata.
@@ -54,30 +61,21 @@ class ImageTab(QWidget):
         layout.addWidget(self.info_label)
         self.setLayout(layout)
         
-    def update_image(self, image: np.ndarray, metadata: Optional[Dict[str, Any]] = None) -> None:
+    def update_image(self, image: np.ndarray, metadata: Optional[Dict[str, Any]] = None,
+                     frame_id: Optional[int] = None) -> None:
         """
         Update the displayed image and metadata.
         
         Args:
             image: Image as numpy array
             metadata: Optional metadata to display
+            frame_id: Sequence number of the image (avoids checksumming it)
         """
         try:
-            # Convert image for display
-            if len(image.shape) == 2:  # Grayscale
-                h, w = image.shape
-                bytes_per_line = w
-                q_img = QImage(image.data, w, h, bytes_per_line, QImage.Format.Format_Grayscale8)
-            else:  # Color (assume BGR)
-                h, w, c = image.shape
-                bytes_per_line = 3 * w
-                rgb = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
-                q_img = QImage(rgb.data, w, h, bytes_per_line, QImage.Format.Format_RGB888)
+            h, w = image.shape[:2]
             
-            # Scale image while preserving aspect ratio
-            pixmap = QPixmap.fromImage(q_img)
-            scaled = pixmap.scaled(800, 600, Qt.AspectRatioMode.KeepAspectRatio, 
-                                 Qt.TransformationMode.SmoothTransformation)
+            # Convert and scale (shared with other views showing the same frame)
+            scaled = frame_cache.pixmap(image, IMAGE_TAB_SIZE, frame_id)
             
             # Update image
             self.image_label.setPixmap(scaled)
@@ -103,6 +101,10 @@ class DebugWindow(QWidget):
     - Image saving functionality
     - Support for overlays and annotations
     
+    Image updates can arrive much faster than they can be shown or saved.
+    Tabs are refreshed at most at the UI refresh rate with the newest image
+    (older ones are superseded), and saving happens on a background writer.
+    
     Signals:
         window_closed: Emitted when the debug window is closed by the user
     """
@@ -110,6 +112,9 @@ class DebugWindow(QWidget):
     # Add signal for window close
     window_closed = pyqtSignal()
     
+    # Emitted (from any thread) when the first update is queued since the last refresh
+    _updates_queued = pyqtSignal()
+    
     def __init__(self, window_manager=None, template_matcher=None, text_ocr=None, capture_manager=None) -> None:
         """
         Initialize debug window.
@@ -138,6 +143,28 @@ class DebugWindow(QWidget):
         self.debug_dir = Path(debug_settings["debug_screenshots_dir"])
         self.debug_dir.mkdir(exist_ok=True)
         
+        # Background writer for saved debug images
+        self.image_writer = DebugImageWriter(
+            image_format=debug_settings["image_format"],
+            max_pending=debug_settings["write_queue_size"]
+        )
+        
+        # Latest not yet displayed update per tab: name -> (image, metadata, frame id);
+        # written by worker threads, so guarded by a lock
+        self._pending_updates: Dict[str, Tuple[np.ndarray, Optional[Dict[str, Any]], int]] = {}
+        self._pending_lock = threading.Lock()
+        self.updates_displayed = 0
+        self.updates_superseded = 0
+        
+        # Apply pending updates at the UI refresh rate
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.setSingleShot(True)
+        self.refresh_timer.setInterval(int(1000 / max(1.0, debug_settings["ui_refresh_rate"])))
+        self.refresh_timer.timeout.connect(self._apply_pending_updates)
+        
+        # The timer belongs to the GUI thread, so it is started there
+        self._updates_queued.connect(self._schedule_refresh, Qt.ConnectionType.QueuedConnection)
+        
         # Create main layout
         layout = QVBoxLayout()
         
@@ -149,6 +176,16 @@ class DebugWindow(QWidget):
         # Initialize tab dictionary
         self.image_tabs: Dict[str, ImageTab] = {}
         
+        # OCR preprocessing tuning; changes apply to the live TextOCR and are saved
+        # (imported here: scout.debug imports scout.automation, which imports this module)
+        from scout.debug.ocr_tab import OCRTab
+        self.ocr_tab = OCRTab()
+        preprocessing = self.config_manager.get_ocr_settings()["preprocessing"]
+        if preprocessing is not None:
+            self.ocr_tab.set_ocr_parameters({"preprocessing": preprocessing})
+        self.ocr_tab.pipeline_changed.connect(self._on_ocr_pipeline_changed)
+        self.tabs.addTab(self.ocr_tab, "OCR Preprocessing")
+        
         # Set layout
         self.setLayout(layout)
         
@@ -166,31 +203,103 @@ class DebugWindow(QWidget):
         """
         Update or create an image tab.
         
+        The tab is refreshed on the next UI tick with the newest image given
+        for it; saving is done by the background writer. The image is copied,
+        so callers may reuse their buffers. Images given from worker threads
+        are converted for display right away on that thread.
+        
         Args:
             name: Name/identifier for the image tab
             image: Image data as numpy array
             metadata: Optional metadata to display
             save: Whether to save the image to disk
         """
+        if image is None:
+            return
+        self._submit(name, image.copy(), metadata, save)
+    
+    def _submit(self, name: str, image: np.ndarray,
+                metadata: Optional[Dict[str, Any]], save: bool) -> None:
+        """
+        Queue an image (owned by the window) for display and optionally saving.
+        
+        Args:
+            name: Name/identifier for the image tab
+            image: Image that is not modified afterwards
+            metadata: Optional metadata to display
+            save: Whether to save the image to disk
+        """
         try:
-            # Create tab if it doesn't exist
-            if name not in self.image_tabs:
-                tab = ImageTab(name)
-                self.image_tabs[name] = tab
-                self.tabs.addTab(tab, name)
+            if save:
+                self.image_writer.submit(self.debug_dir / name, image)
             
-            # Update tab
-            self.image_tabs[name].update_image(image, metadata)
+            # Number the frame once; views look conversions up by the number
+            frame_id = next_frame_id()
+            if QThread.currentThread() is not self.thread():
+                frame_cache.prefetch(image, IMAGE_TAB_SIZE, frame_id)
             
-            # Save image if requested
-            if save:
-                save_path = self.debug_dir / f"{name}.png"
-                cv2.imwrite(str(save_path), image)
-                logger.debug(f"Saved debug image to {save_path}")
+            with self._pending_lock:
+                first = not self._pending_updates
+                if name in self._pending_updates:
+                    self.updates_superseded += 1
+                self._pending_updates[name] = (image, metadata, frame_id)
+            
+            if first:
+                self._updates_queued.emit()
             
         except Exception as e:
             logger.error(f"Error updating debug image '{name}': {e}")
     
+    def _schedule_refresh(self) -> None:
+        """Start the refresh timer (GUI thread)."""
+        # Hidden windows are refreshed when they are shown again
+        if self.isVisible() and not self.refresh_timer.isActive():
+            self.refresh_timer.start()
+    
+    def _apply_pending_updates(self) -> None:
+        """Show the newest pending image of every tab."""
+        with self._pending_lock:
+            pending, self._pending_updates = self._pending_updates, {}
+        for name, (image, metadata, frame_id) in pending.items():
+            try:
+                # Create tab if it doesn't exist
+                if name not in self.image_tabs:
+                    tab = ImageTab(name)
+                    self.image_tabs[name] = tab
+                    self.tabs.addTab(tab, name)
+                
+                # Update tab
+                self.image_tabs[name].update_image(image, metadata, frame_id)
+                self.updates_displayed += 1
+                
+            except Exception as e:
+                logger.error(f"Error updating debug image '{name}': {e}")
+    
+    def showEvent(self, event) -> None:
+        """Show updates that arrived while the window was hidden."""
+        super().showEvent(event)
+        if self._pending_updates:
+            self._apply_pending_updates()
+    
+    def get_image_stats(self) -> Dict[str, Any]:
+        """
+        Get statistics of the display and save pipeline.
+        
+        Returns:
+            Dictionary with displayed and superseded tab updates plus the
+            writer's submitted, written, superseded, dropped, errors and pending counts
+        """
+        return {
+            "displayed": self.updates_displayed,
+            "display_superseded": self.updates_superseded,
+            **{f"save_{key}": value for key, value in self.image_writer.get_stats().items()}
+        }
+    
+    def shutdown(self) -> None:
+        """Write the queued debug images and stop the writer thread."""
+        self.refresh_timer.stop()
+        self.image_writer.stop(flush=True)
+    
     def update_region(self, name: str, image: np.ndarray, 
                      regions: List[Tuple[int, int, int, int]],
                      labels: Optional[List[str]] = None,
@@ -224,18 +333,26 @@ class DebugWindow(QWidget):
                     cv2.putText(display, labels[i], (x, y - 5),
                               cv2.FONT_HERSHEY_SIMPLEX, 0.5, color, 1)
             
-            # Update display
-            self.update_image(name, display, 
-                            metadata={"regions": len(regions)},
-                            save=True)
+            # Update display (the drawn copy is owned by the window already)
+            self._submit(name, display, metadata={"regions": len(regions)}, save=True)
             
         except Exception as e:
             logger.error(f"Error updating region display '{name}': {e}")
     
+    def _on_ocr_pipeline_changed(self, pipeline: Any) -> None:
+        """Use the preprocessing tuned in the OCR tab for live OCR and save it."""
+        params = self.ocr_tab.get_ocr_parameters()
+        if self.text_ocr is not None:
+            # Own instance: pipelines keep per-input buffers
+            self.text_ocr.set_preprocessing(PreprocessingPipeline.from_ocr_parameters(params))
+        self.config_manager.update_ocr_preprocessing(params["preprocessing"])
+    
     def clear(self) -> None:
-        """Clear all tabs."""
-        for _ in range(self.tabs.count()):
-            self.tabs.removeTab(0)
+        """Clear all image tabs."""
+        with self._pending_lock:
+            self._pending_updates.clear()
+        for tab in self.image_tabs.values():
+            self.tabs.removeTab(self.tabs.indexOf(tab))
         self.image_tabs.clear()
         
     def show_tab(self, name: str) -> None:
@@ -0,0 +1,165 @@
+"""
+Frame Pyramid
+
+This module provides mip levels and tiles of a captured frame for the debug
+previews. It handles:
+- Building downscaled levels (1/2, 1/4, ...) lazily, each from the level above
+- Choosing the level that matches a display scale
+- Cutting a level into fixed-size tiles, converted to RGB for Qt
+
+Previews only request the tiles that intersect the visible viewport, so
+zooming out of a large capture resizes it once per level instead of once
+per repaint, and zooming in only converts the few visible tiles.
+"""
+
+from typing import Optional, List, Tuple
+import logging
+import math
+import cv2
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+TileKey = Tuple[int, int, int]  # level, column, row
+
+class FramePyramid:
+    """
+    Lazily built mip pyramid of one frame, split into tiles.
+
+    Level 0 is the original frame. Level n is downscaled by 2**n. Levels and
+    tiles are only computed when they are first requested.
+    """
+
+    def __init__(self, frame: np.ndarray, tile_size: int = 256, min_level_size: int = 64) -> None:
+        """
+        Initialize the pyramid.
+
+        Args:
+            frame: BGR or grayscale frame (level 0, not copied)
+            tile_size: Width and height of a tile in level pixels
+            min_level_size: Levels are not reduced below this width or height
+        """
+        self.tile_size = tile_size
+        self.height, self.width = frame.shape[:2]
+        self.is_color = frame.ndim == 3
+
+        # Deepest level that is still at least min_level_size pixels on its short side
+        short_side = max(1, min(self.width, self.height))
+        self.max_level = max(0, int(math.log2(short_side / min_level_size))) if short_side > min_level_size else 0
+
+        self._levels: List[Optional[np.ndarray]] = [frame] + [None] * self.max_level
+
+    def level_for_scale(self, scale: float) -> int:
+        """
+        Get the level to display the frame at a scale.
+
+        The chosen level is never smaller than the displayed size, so the
+        level is only ever downscaled (or shown 1:1) by the painter.
+
+        Args:
+            scale: Display scale (1.0 = one frame pixel per screen pixel)
+
+        Returns:
+            Pyramid level
+        """
+        if scale >= 1.0 or scale <= 0:
+            return 0
+        return min(self.max_level, int(math.floor(math.log2(1.0 / scale))))
+
+    def level(self, index: int) -> np.ndarray:
+        """
+        Get a pyramid level, building it (and the levels above) if needed.
+
+        Args:
+            index: Level index (0 = original frame)
+
+        Returns:
+            Level image
+        """
+        index = max(0, min(index, self.max_level))
+        if self._levels[index] is None:
+            parent = self.level(index - 1)
+            height, width = parent.shape[:2]
+            self._levels[index] = cv2.resize(parent, (max(1, width // 2), max(1, height // 2)),
+                                             interpolation=cv2.INTER_AREA)
+        return self._levels[index]
+
+    def level_scale(self, index: int) -> Tuple[float, float]:
+        """
+        Get the size of a level pixel in frame pixels.
+
+        Args:
+            index: Level index
+
+        Returns:
+            Tuple of (x factor, y factor)
+        """
+        level = self.level(index)
+        return (self.width / level.shape[1], self.height / level.shape[0])
+
+    def tiles_in(self, index: int, left: float, top: float, right: float, bottom: float) -> List[TileKey]:
+        """
+        Get the tiles of a level that intersect an area of the frame.
+
+        Args:
+            index: Level index
+            left: Left edge in frame pixels
+            top: Top edge in frame pixels
+            right: Right edge in frame pixels
+            bottom: Bottom edge in frame pixels
+
+        Returns:
+            Keys of the intersecting tiles
+        """
+        level = self.level(index)
+        level_height, level_width = level.shape[:2]
+        fx, fy = self.level_scale(index)
+        size = self.tile_size
+
+        first_col = max(0, int(left / fx) // size)
+        first_row = max(0, int(top / fy) // size)
+        last_col = min((level_width - 1) // size, int(math.ceil(right / fx)) // size)
+        last_row = min((level_height - 1) // size, int(math.ceil(bottom / fy)) // size)
+
+        return [(index, col, row)
+                for row in range(first_row, last_row + 1)
+                for col in range(first_col, last_col + 1)]
+
+    def tile_rect(self, key: TileKey) -> Tuple[float, float, float, float]:
+        """
+        Get the area a tile covers.
+
+        Args:
+            key: Tile key
+
+        Returns:
+            Tuple of (x, y, width, height) in frame pixels
+        """
+        index, col, row = key
+        level = self.level(index)
+        fx, fy = self.level_scale(index)
+        x = col * self.tile_size
+        y = row * self.tile_size
+        width = min(self.tile_size, level.shape[1] - x)
+        height = min(self.tile_size, level.shape[0] - y)
+        return (x * fx, y * fy, width * fx, height * fy)
+
+    def tile(self, key: TileKey) -> np.ndarray:
+        """
+        Get the pixels of a tile, converted for display.
+
+        Args:
+            key: Tile key
+
+        Returns:
+            Contiguous RGB tile (or grayscale tile for grayscale frames)
+        """
+        index, col, row = key
+        level = self.level(index)
+        x = col * self.tile_size
+        y = row * self.tile_size
+        pixels = level[y:y + self.tile_size, x:x + self.tile_size]
+        if self.is_color:
+            code = cv2.COLOR_BGRA2RGB if pixels.shape[2] == 4 else cv2.COLOR_BGR2RGB
+            return cv2.cvtColor(pixels, code)
+        return np.ascontiguousarray(pixels)
@@ -552,6 +552,7 @@ class MainWindow(QMainWindow):
             if hasattr(self, 'debug_window'):
                 logger.debug("Closing debug window")
                 self.debug_window.close()
+                self.debug_window.shutdown()  # Write queued debug images
             
             # Disable debug mode and save settings
             debug_settings = {
@@ -0,0 +1,506 @@
+"""
+Input Dispatcher
+
+This module provides batched mouse and keyboard input for game actions.
+It handles:
+- Queueing mouse and keyboard events and sending them in batches
+- Coalescing consecutive mouse moves (only the last position is sent)
+- Explicit pauses: delays are queued per action instead of a global pause
+  after every call, and sleep on the clock and cancellation token of the
+  current execution
+- A SendInput backend (one SendInput call per batch, Windows only)
+- A dry-run backend that records batches without sending them (Linux, tests)
+
+Events queued inside InputDispatcher.batch() are sent when the batch ends
+(and dropped if the block raises); outside a batch every call is sent
+right away.
+"""
+
+from typing import Optional, List, Tuple, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+import ctypes
+import logging
+import sys
+import threading
+
+from scout.error_handling import AutomationError
+
+logger = logging.getLogger(__name__)
+
+# Operation kinds
+MOVE = "move"
+BUTTON_DOWN = "button_down"
+BUTTON_UP = "button_up"
+KEY_DOWN = "key_down"
+KEY_UP = "key_up"
+CHAR = "char"
+PAUSE = "pause"
+
+@dataclass
+class InputOp:
+    """
+    One queued input operation.
+
+    Attributes:
+        kind: Operation kind (MOVE, BUTTON_DOWN, BUTTON_UP, KEY_DOWN, KEY_UP, CHAR, PAUSE)
+        x: Screen X coordinate (MOVE)
+        y: Screen Y coordinate (MOVE)
+        button: Mouse button (BUTTON_DOWN, BUTTON_UP)
+        key: Key name (KEY_DOWN, KEY_UP) or character (CHAR)
+        seconds: Duration (PAUSE)
+    """
+    kind: str
+    x: int = 0
+    y: int = 0
+    button: str = "left"
+    key: str = ""
+    seconds: float = 0.0
+
+def coalesce(ops: List[InputOp]) -> List[InputOp]:
+    """
+    Drop mouse moves that are immediately followed by another move.
+
+    Moves separated by a pause (e.g. the steps of a drag) are kept.
+
+    Args:
+        ops: Queued operations
+
+    Returns:
+        Operations without redundant moves
+    """
+    result: List[InputOp] = []
+    for op in ops:
+        if op.kind == MOVE and result and result[-1].kind == MOVE:
+            result[-1] = op
+        else:
+            result.append(op)
+    return result
+
+class InputBackend:
+    """
+    Low-level input backend sending batches of operations.
+    """
+
+    def send(self, ops: List[InputOp]) -> None:
+        """
+        Send a batch of operations (no PAUSE operations).
+
+        Args:
+            ops: Operations to send, in order
+        """
+        raise NotImplementedError
+
+    def pause(self, seconds: float) -> bool:
+        """
+        Wait between batches.
+
+        The wait goes through the clock and cancellation token of the current
+        execution, so stopping a sequence cuts input pauses short and
+        simulations only advance their virtual clock.
+
+        Args:
+            seconds: Duration in seconds
+
+        Returns:
+            True if the full duration elapsed, False if the execution was cancelled
+        """
+        # Imported here: scout.automation imports GameActions, which imports this module
+        from scout.automation.cancellation import cancellable_sleep
+        return cancellable_sleep(seconds)
+
+class DryRunBackend(InputBackend):
+    """
+    Backend recording batches instead of sending them.
+    """
+
+    def __init__(self, sleep: bool = False):
+        """
+        Initialize the backend.
+
+        Args:
+            sleep: Whether pauses really sleep (False keeps tests fast)
+        """
+        self.sleep = sleep
+        self.batches: List[List[InputOp]] = []
+        self.pauses: List[float] = []
+
+    @property
+    def ops(self) -> List[InputOp]:
+        """All sent operations, in order."""
+        return [op for batch in self.batches for op in batch]
+
+    def send(self, ops: List[InputOp]) -> None:
+        self.batches.append(list(ops))
+
+    def pause(self, seconds: float) -> bool:
+        self.pauses.append(seconds)
+        if self.sleep:
+            return super().pause(seconds)
+        return True
+
+    def clear(self) -> None:
+        """Forget the recorded batches and pauses."""
+        self.batches.clear()
+        self.pauses.clear()
+
+# SendInput constants
+_INPUT_MOUSE = 0
+_INPUT_KEYBOARD = 1
+_MOUSEEVENTF_MOVE = 0x0001
+_MOUSEEVENTF_ABSOLUTE = 0x8000
+_MOUSEEVENTF_VIRTUALDESK = 0x4000
+_KEYEVENTF_KEYUP = 0x0002
+_KEYEVENTF_UNICODE = 0x0004
+_SM_XVIRTUALSCREEN, _SM_YVIRTUALSCREEN = 76, 77
+_SM_CXVIRTUALSCREEN, _SM_CYVIRTUALSCREEN = 78, 79
+
+# Button down/up flags
+_BUTTON_FLAGS = {
+    "left": (0x0002, 0x0004),
+    "right": (0x0008, 0x0010),
+    "middle": (0x0020, 0x0040),
+}
+
+# Virtual key codes of named keys (letters and digits use their character code)
+_VIRTUAL_KEYS = {
+    "backspace": 0x08, "tab": 0x09, "enter": 0x0D, "return": 0x0D,
+    "shift": 0x10, "ctrl": 0x11, "alt": 0x12, "esc": 0x1B, "escape": 0x1B,
+    "space": 0x20, "pageup": 0x21, "pagedown": 0x22, "end": 0x23, "home": 0x24,
+    "left": 0x25, "up": 0x26, "right": 0x27, "down": 0x28, "delete": 0x2E,
+}
+
+class _MouseInput(ctypes.Structure):
+    _fields_ = [("dx", ctypes.c_long), ("dy", ctypes.c_long), ("mouseData", ctypes.c_ulong),
+                ("dwFlags", ctypes.c_ulong), ("time", ctypes.c_ulong), ("dwExtraInfo", ctypes.c_size_t)]
+
+class _KeyboardInput(ctypes.Structure):
+    _fields_ = [("wVk", ctypes.c_ushort), ("wScan", ctypes.c_ushort), ("dwFlags", ctypes.c_ulong),
+                ("time", ctypes.c_ulong), ("dwExtraInfo", ctypes.c_size_t)]
+
+class _HardwareInput(ctypes.Structure):
+    _fields_ = [("uMsg", ctypes.c_ulong), ("wParamL", ctypes.c_ushort), ("wParamH", ctypes.c_ushort)]
+
+class _InputUnion(ctypes.Union):
+    _fields_ = [("mi", _MouseInput), ("ki", _KeyboardInput), ("hi", _HardwareInput)]
+
+class _Input(ctypes.Structure):
+    _fields_ = [("type", ctypes.c_ulong), ("union", _InputUnion)]
+
+class _Point(ctypes.Structure):
+    _fields_ = [("x", ctypes.c_long), ("y", ctypes.c_long)]
+
+class SendInputBackend(InputBackend):
+    """
+    Backend sending each batch with a single Win32 SendInput call.
+
+    Batches are inserted into the input stream as a whole, so other input
+    cannot interleave with a click or a typed text.
+    """
+
+    def __init__(self, failsafe: bool = True):
+        """
+        Initialize the backend.
+
+        Args:
+            failsafe: Whether to refuse input while the cursor is in the
+                      top-left screen corner (like pyautogui's fail-safe)
+        """
+        self.failsafe = failsafe
+        self._user32 = ctypes.windll.user32
+
+    def send(self, ops: List[InputOp]) -> None:
+        if self.failsafe and self._cursor_position() == (0, 0):
+            raise AutomationError("Input aborted", "Mouse cursor is in the fail-safe corner (0, 0)")
+
+        inputs: List[_Input] = []
+        for op in ops:
+            inputs.extend(self._convert(op))
+        if not inputs:
+            return
+        array = (_Input * len(inputs))(*inputs)
+        sent = self._user32.SendInput(len(inputs), array, ctypes.sizeof(_Input))
+        if sent != len(inputs):
+            raise AutomationError("Input was not sent",
+                                  f"SendInput inserted {sent} of {len(inputs)} events (blocked by UIPI?)")
+
+    def _cursor_position(self) -> Tuple[int, int]:
+        """Get the cursor position in screen coordinates."""
+        point = _Point()
+        self._user32.GetCursorPos(ctypes.byref(point))
+        return point.x, point.y
+
+    def _convert(self, op: InputOp) -> List[_Input]:
+        """Convert an operation to SendInput events."""
+        if op.kind == MOVE:
+            return [self._mouse(_MOUSEEVENTF_MOVE | _MOUSEEVENTF_ABSOLUTE | _MOUSEEVENTF_VIRTUALDESK,
+                                *self._normalize(op.x, op.y))]
+        if op.kind in (BUTTON_DOWN, BUTTON_UP):
+            down, up = _BUTTON_FLAGS[op.button]
+            return [self._mouse(down if op.kind == BUTTON_DOWN else up)]
+        if op.kind in (KEY_DOWN, KEY_UP):
+            flags = _KEYEVENTF_KEYUP if op.kind == KEY_UP else 0
+            return [self._key(self._virtual_key(op.key), 0, flags)]
+        if op.kind == CHAR:
+            if op.key in ("\n", "\r"):
+                vk = _VIRTUAL_KEYS["enter"]
+                return [self._key(vk, 0, 0), self._key(vk, 0, _KEYEVENTF_KEYUP)]
+            # Unicode input types the character independent of the keyboard layout
+            scan = ord(op.key)
+            return [self._key(0, scan, _KEYEVENTF_UNICODE),
+                    self._key(0, scan, _KEYEVENTF_UNICODE | _KEYEVENTF_KEYUP)]
+        raise ValueError(f"Cannot send input operation: {op.kind}")
+
+    def _normalize(self, x: int, y: int) -> Tuple[int, int]:
+        """Convert screen coordinates to absolute coordinates (0-65535) on the virtual desktop."""
+        metrics = self._user32.GetSystemMetrics
+        left, top = metrics(_SM_XVIRTUALSCREEN), metrics(_SM_YVIRTUALSCREEN)
+        width, height = metrics(_SM_CXVIRTUALSCREEN), metrics(_SM_CYVIRTUALSCREEN)
+        return ((x - left) * 65535 // max(1, width - 1),
+                (y - top) * 65535 // max(1, height - 1))
+
+    @staticmethod
+    def _virtual_key(name: str) -> int:
+        """Get the virtual key code of a key name."""
+        key = name.lower()
+        if key in _VIRTUAL_KEYS:
+            return _VIRTUAL_KEYS[key]
+        if len(key) == 1 and key.isalnum():
+            return ord(key.upper())
+        raise ValueError(f"Unknown key: {name}")
+
+    @staticmethod
+    def _mouse(flags: int, dx: int = 0, dy: int = 0) -> _Input:
+        event = _Input(type=_INPUT_MOUSE)
+        event.union.mi = _MouseInput(dx, dy, 0, flags, 0, 0)
+        return event
+
+    @staticmethod
+    def _key(vk: int, scan: int, flags: int) -> _Input:
+        event = _Input(type=_INPUT_KEYBOARD)
+        event.union.ki = _KeyboardInput(vk, scan, flags, 0, 0)
+        return event
+
+def default_backend() -> InputBackend:
+    """
+    Get the input backend for this platform.
+
+    Returns:
+        SendInputBackend on Windows, DryRunBackend elsewhere
+    """
+    if sys.platform == "win32":
+        return SendInputBackend()
+    logger.warning("SendInput is only available on Windows, input is recorded but not sent")
+    return DryRunBackend()
+
+class InputDispatcher:
+    """
+    Queues input operations and sends them to a backend in batches.
+    """
+
+    def __init__(self, backend: Optional[InputBackend] = None, drag_step: float = 0.01):
+        """
+        Initialize the dispatcher.
+
+        Args:
+            backend: Backend to send input with (default: default_backend())
+            drag_step: Seconds between the intermediate moves of a drag
+        """
+        self.backend = backend or default_backend()
+        self.drag_step = drag_step
+        self._queue: List[InputOp] = []
+        self._depth = 0
+        self._lock = threading.RLock()
+
+        # Statistics
+        self.batches_sent = 0
+        self.ops_sent = 0
+        self.moves_coalesced = 0
+
+    @contextmanager
+    def batch(self) -> Iterator['InputDispatcher']:
+        """
+        Queue all input of the enclosed code and send it when the block ends.
+
+        Batches nest; input is sent when the outermost batch ends. The
+        dispatcher is locked for the duration, so input of concurrent
+        callers does not interleave.
+
+        Yields:
+            The dispatcher
+        """
+        with self._lock:
+            self._depth += 1
+            try:
+                yield self
+            except BaseException:
+                # Never send half of a batch
+                if self._depth == 1:
+                    self._queue.clear()
+                raise
+            finally:
+                self._depth -= 1
+                if self._depth == 0:
+                    self.flush()
+
+    def move(self, x: int, y: int) -> None:
+        """
+        Move the cursor.
+
+        Args:
+            x: Screen X coordinate
+            y: Screen Y coordinate
+        """
+        self._push(InputOp(MOVE, x=int(x), y=int(y)))
+
+    def mouse_down(self, button: str = "left") -> None:
+        """Press a mouse button."""
+        self._push(InputOp(BUTTON_DOWN, button=button))
+
+    def mouse_up(self, button: str = "left") -> None:
+        """Release a mouse button."""
+        self._push(InputOp(BUTTON_UP, button=button))
+
+    def click(self, x: Optional[int] = None, y: Optional[int] = None, button: str = "left",
+              clicks: int = 1, settle: float = 0.0, interval: float = 0.0) -> None:
+        """
+        Click, optionally after moving the cursor.
+
+        Args:
+            x: Screen X coordinate (None clicks at the current position)
+            y: Screen Y coordinate
+            button: Mouse button ('left', 'right', 'middle')
+            clicks: Number of clicks
+            settle: Pause between the move and the first press
+            interval: Pause between clicks
+        """
+        if button not in _BUTTON_FLAGS:
+            raise ValueError(f"Unknown mouse button: {button}")
+        ops: List[InputOp] = []
+        if x is not None and y is not None:
+            ops.append(InputOp(MOVE, x=int(x), y=int(y)))
+            if settle > 0:
+                ops.append(InputOp(PAUSE, seconds=settle))
+        for index in range(clicks):
+            if index and interval > 0:
+                ops.append(InputOp(PAUSE, seconds=interval))
+            ops.append(InputOp(BUTTON_DOWN, button=button))
+            ops.append(InputOp(BUTTON_UP, button=button))
+        self._push(*ops)
+
+    def drag(self, start_x: int, start_y: int, end_x: int, end_y: int, duration: float = 0.5,
+             button: str = "left", settle: float = 0.0) -> None:
+        """
+        Drag from one point to another.
+
+        Args:
+            start_x: Starting screen X coordinate
+            start_y: Starting screen Y coordinate
+            end_x: Ending screen X coordinate
+            end_y: Ending screen Y coordinate
+            duration: Duration of the movement in seconds
+            button: Mouse button to hold
+            settle: Pause between moving to the start and pressing the button
+        """
+        ops = [InputOp(MOVE, x=int(start_x), y=int(start_y))]
+        if settle > 0:
+            ops.append(InputOp(PAUSE, seconds=settle))
+        ops.append(InputOp(BUTTON_DOWN, button=button))
+        steps = max(1, int(duration / self.drag_step)) if duration > 0 else 1
+        for step in range(1, steps + 1):
+            if duration > 0:
+                ops.append(InputOp(PAUSE, seconds=duration / steps))
+            ops.append(InputOp(MOVE,
+                               x=round(start_x + (end_x - start_x) * step / steps),
+                               y=round(start_y + (end_y - start_y) * step / steps)))
+        ops.append(InputOp(BUTTON_UP, button=button))
+        self._push(*ops)
+
+    def key(self, name: str) -> None:
+        """
+        Press and release a key.
+
+        Args:
+            name: Key name (e.g. 'enter', 'backspace', 'a')
+        """
+        self._push(InputOp(KEY_DOWN, key=name), InputOp(KEY_UP, key=name))
+
+    def hotkey(self, *names: str) -> None:
+        """
+        Press keys in order and release them in reverse order (e.g. 'ctrl', 'a').
+
+        Args:
+            names: Key names
+        """
+        ops = [InputOp(KEY_DOWN, key=name) for name in names]
+        ops.extend(InputOp(KEY_UP, key=name) for name in reversed(names))
+        self._push(*ops)
+
+    def write(self, text: str, interval: float = 0.0) -> None:
+        """
+        Type text.
+
+        Args:
+            text: Text to type
+            interval: Pause between characters (0 sends the text in one batch)
+        """
+        ops: List[InputOp] = []
+        for index, char in enumerate(text):
+            if index and interval > 0:
+                ops.append(InputOp(PAUSE, seconds=interval))
+            ops.append(InputOp(CHAR, key=char))
+        self._push(*ops)
+
+    def pause(self, seconds: float) -> None:
+        """
+        Wait before the following input.
+
+        Args:
+            seconds: Duration in seconds
+        """
+        if seconds > 0:
+            self._push(InputOp(PAUSE, seconds=seconds))
+
+    def flush(self) -> None:
+        """
+        Send all queued operations (pauses split them into batches).
+
+        If a pause is cut short because the execution was cancelled, the
+        remaining operations are dropped except for button and key releases.
+        """
+        with self._lock:
+            queued, self._queue = self._queue, []
+            if not queued:
+                return
+            ops = coalesce(queued)
+            self.moves_coalesced += len(queued) - len(ops)
+
+            batch: List[InputOp] = []
+            for position, op in enumerate(ops):
+                if op.kind != PAUSE:
+                    batch.append(op)
+                    continue
+                self._send(batch)
+                batch = []
+                if not self.backend.pause(op.seconds):
+                    # Cancelled: drop the rest, but never leave a button or key held down
+                    remaining = ops[position + 1:]
+                    batch = [rest for rest in remaining if rest.kind in (BUTTON_UP, KEY_UP)]
+                    logger.debug(f"Input cancelled, dropped {len(remaining) - len(batch)} operations")
+                    break
+            self._send(batch)
+
+    def _send(self, batch: List[InputOp]) -> None:
+        """Send one batch to the backend."""
+        if not batch:
+            return
+        self.backend.send(batch)
+        self.batches_sent += 1
+        self.ops_sent += len(batch)
+
+    def _push(self, *ops: InputOp) -> None:
+        """Queue operations (sending them right away outside of batches)."""
+        with self._lock:
+            self._queue.extend(ops)
+            if self._depth == 0:
+                self.flush()
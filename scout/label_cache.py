@@ -0,0 +1,179 @@
+"""
+Label Sprite Cache
+
+This module provides an LRU cache of rasterized text labels for the overlay.
+It handles:
+- Rendering a label (text, font, scale, color, thickness, background) once
+- Blitting the cached sprite onto a canvas with clipping
+- Evicting the least recently used labels when the cache is full
+
+Template names and rounded confidences repeat constantly, so most overlay
+labels become a masked copy instead of a cv2.getTextSize/cv2.putText call.
+"""
+
+from typing import Optional, Tuple
+from collections import OrderedDict
+from dataclasses import dataclass
+import logging
+import cv2
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+Color = Tuple[int, int, int]
+
+@dataclass
+class LabelSprite:
+    """
+    A rasterized label.
+
+    Attributes:
+        image: BGR pixels of the label
+        mask: 8-bit mask of the painted pixels (text and background)
+        offset_x: X position of the sprite relative to the text origin
+        offset_y: Y position of the sprite relative to the text baseline
+    """
+    image: np.ndarray
+    mask: np.ndarray
+    offset_x: int
+    offset_y: int
+
+    @property
+    def width(self) -> int:
+        """Sprite width in pixels."""
+        return self.image.shape[1]
+
+    @property
+    def height(self) -> int:
+        """Sprite height in pixels."""
+        return self.image.shape[0]
+
+    def bounds(self, x: int, y: int) -> Tuple[int, int, int, int]:
+        """
+        Get the area the sprite covers when drawn at a text origin.
+
+        Args:
+            x: Text origin x
+            y: Text baseline y
+
+        Returns:
+            Rectangle (x1, y1, x2, y2), x2/y2 exclusive
+        """
+        left = x + self.offset_x
+        top = y + self.offset_y
+        return (left, top, left + self.width, top + self.height)
+
+    def blit(self, canvas: np.ndarray, x: int, y: int) -> None:
+        """
+        Copy the sprite onto a canvas, clipped to the canvas.
+
+        Args:
+            canvas: Target BGR image
+            x: Text origin x in canvas coordinates
+            y: Text baseline y in canvas coordinates
+        """
+        left, top, right, bottom = self.bounds(x, y)
+        canvas_height, canvas_width = canvas.shape[:2]
+
+        # Clip to the canvas
+        x1, y1 = max(0, left), max(0, top)
+        x2, y2 = min(canvas_width, right), min(canvas_height, bottom)
+        if x1 >= x2 or y1 >= y2:
+            return
+
+        sx1, sy1 = x1 - left, y1 - top
+        sx2, sy2 = sx1 + (x2 - x1), sy1 + (y2 - y1)
+        # cv2.copyTo writes into the canvas view (much faster than a numpy masked copy)
+        cv2.copyTo(self.image[sy1:sy2, sx1:sx2], self.mask[sy1:sy2, sx1:sx2], canvas[y1:y2, x1:x2])
+
+class LabelSpriteCache:
+    """
+    LRU cache of label sprites keyed by (text, font, scale, color, thickness, background).
+    """
+
+    def __init__(self, max_entries: int = 512) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of sprites kept in memory
+        """
+        self.max_entries = max_entries
+        self._sprites: "OrderedDict[tuple, LabelSprite]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, text: str, font: int = cv2.FONT_HERSHEY_SIMPLEX, font_scale: float = 0.5,
+            color: Color = (255, 255, 255), thickness: int = 1,
+            background: Optional[Color] = None) -> LabelSprite:
+        """
+        Get the sprite of a label, rendering it on first use.
+
+        Args:
+            text: Label text
+            font: OpenCV Hershey font
+            font_scale: Font scale
+            color: BGR text color
+            thickness: Text thickness
+            background: Optional BGR background color behind the text
+
+        Returns:
+            Cached label sprite
+        """
+        key = (text, font, font_scale, color, thickness, background)
+        sprite = self._sprites.get(key)
+        if sprite is not None:
+            self._sprites.move_to_end(key)
+            self.hits += 1
+            return sprite
+
+        self.misses += 1
+        sprite = self._render(text, font, font_scale, color, thickness, background)
+        self._sprites[key] = sprite
+        if len(self._sprites) > self.max_entries:
+            self._sprites.popitem(last=False)
+        return sprite
+
+    def clear(self) -> None:
+        """Remove all cached sprites."""
+        self._sprites.clear()
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def __len__(self) -> int:
+        return len(self._sprites)
+
+    @staticmethod
+    def _render(text: str, font: int, font_scale: float, color: Color,
+                thickness: int, background: Optional[Color]) -> LabelSprite:
+        """Rasterize a label into a sprite."""
+        (text_width, text_height), baseline = cv2.getTextSize(text, font, font_scale, thickness)
+
+        # Thick strokes extend beyond the nominal text box
+        pad = max(1, thickness) // 2 + 1
+        below = max(baseline, 5 if background is not None else 0)
+        width = text_width + 2 * pad
+        height = text_height + below + 2 * pad
+        origin = (pad, pad + text_height)
+
+        image = np.zeros((height, width, 3), dtype=np.uint8)
+        mask = np.zeros((height, width), dtype=np.uint8)
+
+        if background is not None:
+            # Same box as drawn directly: text top to 5px below the baseline
+            top_left = (pad, pad)
+            bottom_right = (pad + text_width, pad + text_height + 5)
+            cv2.rectangle(image, top_left, bottom_right, background, -1)
+            cv2.rectangle(mask, top_left, bottom_right, 255, -1)
+
+        cv2.putText(image, text, origin, font, font_scale, color, thickness)
+        cv2.putText(mask, text, origin, font, font_scale, 255, thickness)
+
+        return LabelSprite(image=image, mask=mask, offset_x=-pad, offset_y=-(pad + text_height))
+
+# Shared cache used by the overlay scene
+label_cache = LabelSpriteCache()
@@ -29,6 +29,8 @@ from scout.window_interface import WindowInterface
 from scout.overlay import Overlay
 from scout.template_matcher import TemplateMatcher
 from scout.text_ocr import TextOCR
+from scout.ocr_regions import OCRRegionRegistry, minimap_coordinate_regions, REFRESH_ON_DEMAND
+from scout.ocr_preprocessing import PreprocessingPipeline
 from scout.actions import GameActions
 from scout.config_manager import ConfigManager
 from scout.sound_manager import SoundManager
@@ -204,10 +206,32 @@ def main() -> None:
         overlay_settings["cross_thickness"] = 1
     if "cross_scale" not in overlay_settings:
         overlay_settings["cross_scale"] = 1.0
+    if "backend" not in overlay_settings:
+        overlay_settings["backend"] = config_manager.get_overlay_settings()["backend"]  # "opencv" or "qt"
+    if "display_rate" not in overlay_settings:
+        overlay_settings["display_rate"] = config_manager.get_overlay_settings()["display_rate"]
+    if "interpolate" not in overlay_settings:
+        overlay_settings["interpolate"] = config_manager.get_overlay_settings()["interpolate"]
+    for key in ("perf_hud", "perf_export_path"):
+        if key not in overlay_settings:
+            overlay_settings[key] = config_manager.get_overlay_settings()[key]
+    
+    # Match tracking settings (persistence, hysteresis, smoothing)
+    tracking_settings = config_manager.get_template_matching_settings()
+    for key in ("match_persistence", "distance_threshold", "appear_frames", "kalman_smoothing"):
+        if key not in template_settings:
+            template_settings[key] = tracking_settings[key]
     
     # Create overlay with required settings
     overlay = Overlay(window_manager, template_settings, overlay_settings)
     
+    # Publish newly tracked matches so other components react to new matches, not raw frames
+    overlay.match_appeared.connect(
+        lambda track: signal_bus.template_match_found.emit(
+            track.name, [track.x, track.y, track.width, track.height], track.confidence
+        )
+    )
+    
     # Create debug window first (before text_ocr)
     debug_window = DebugWindow(
         window_manager=window_manager,
@@ -222,6 +246,26 @@ def main() -> None:
     # Update debug_window with text_ocr
     debug_window.text_ocr = text_ocr
     
+    # Configure OCR triggering and refresh OCR whenever automation moves the view
+    ocr_settings = config_manager.get_ocr_settings()
+    text_ocr.set_trigger_mode(
+        ocr_settings["trigger_mode"],
+        safety_poll_interval=ocr_settings["safety_poll_interval"],
+        change_threshold=ocr_settings["change_threshold"]
+    )
+    if ocr_settings["preprocessing"] is not None:
+        # Preprocessing tuned in the OCR debug tab
+        text_ocr.set_preprocessing(PreprocessingPipeline.from_ocr_parameters(ocr_settings))
+    game_actions.register_on_movement(text_ocr.request_update)
+    
+    # Named OCR regions shared by OCR consumers; one capture per scheduler tick
+    ocr_regions = OCRRegionRegistry()
+    text_ocr.set_region_registry(ocr_regions)
+    for region in minimap_coordinate_regions(config_manager.get_scanner_settings()):
+        region.refresh_policy = REFRESH_ON_DEMAND
+        ocr_regions.register(region)
+    ocr_regions.start()
+    
     # Create automation components
     progress_tracker = ProgressTracker()
     automation_core = AutomationCore(
@@ -230,9 +274,16 @@ def main() -> None:
         text_ocr=text_ocr,
         game_actions=game_actions,
         template_search=template_search,
-        signal_bus=signal_bus
+        signal_bus=signal_bus,
+        ocr_regions=ocr_regions,
+        overlay=overlay
     )
     
+    # Action profiling (Debug section); the JSON profile is rewritten after each sequence
+    debug_settings = config_manager.get_debug_settings()
+    automation_core.profiler.set_enabled(debug_settings["action_profiler"])
+    automation_core.profile_export_path = debug_settings["action_profile_path"]
+    
     # Create main window
     main_window = MainWindow(
         window_manager=window_manager,
@@ -0,0 +1,266 @@
+"""
+Match Tracker
+
+This module tracks template matches across frames. It handles:
+- Assigning stable IDs to matches using a uniform grid for O(1) association
+- Hysteresis: a match must be seen for several frames before it appears and
+  missed for several frames before it disappears
+- Optional Kalman smoothing of match positions
+- "New match" / "lost match" events for sounds, automation and the overlay
+
+Matches use the same tuple format as the overlay and template matcher:
+(name, x, y, width, height, confidence).
+"""
+
+from typing import Optional, Dict, List, Tuple
+from dataclasses import dataclass, field
+import logging
+import time
+import cv2
+import numpy as np
+
+from scout.spatial_index import SpatialGridIndex
+
+logger = logging.getLogger(__name__)
+
+Match = Tuple[str, int, int, int, int, float]  # name, x, y, width, height, confidence
+
+@dataclass
+class TrackedMatch:
+    """
+    A match followed across frames.
+
+    Attributes:
+        track_id: Stable identifier of the track
+        name: Template name
+        x: Left edge (smoothed if Kalman smoothing is enabled)
+        y: Top edge (smoothed if Kalman smoothing is enabled)
+        width: Match width
+        height: Match height
+        confidence: Confidence of the latest detection
+        hits: Number of consecutive frames the match was detected
+        misses: Number of consecutive frames the match was not detected
+        confirmed: Whether the track passed the appear hysteresis
+        first_seen: time.time() of the first detection
+        last_seen: time.time() of the latest detection
+    """
+    track_id: int
+    name: str
+    x: int
+    y: int
+    width: int
+    height: int
+    confidence: float
+    hits: int = 1
+    misses: int = 0
+    confirmed: bool = False
+    first_seen: float = 0.0
+    last_seen: float = 0.0
+    kalman: Optional[cv2.KalmanFilter] = field(default=None, repr=False)
+
+    @property
+    def center(self) -> Tuple[int, int]:
+        """Center of the match."""
+        return (self.x + self.width // 2, self.y + self.height // 2)
+
+    def as_tuple(self) -> Match:
+        """Convert to the (name, x, y, width, height, confidence) match format."""
+        return (self.name, self.x, self.y, self.width, self.height, self.confidence)
+
+@dataclass
+class TrackerUpdate:
+    """
+    Changes produced by one tracker update.
+
+    Attributes:
+        appeared: Tracks that became confirmed in this update
+        disappeared: Confirmed tracks that were dropped in this update
+    """
+    appeared: List[TrackedMatch] = field(default_factory=list)
+    disappeared: List[TrackedMatch] = field(default_factory=list)
+
+def _create_kalman(cx: float, cy: float) -> cv2.KalmanFilter:
+    """Create a constant-velocity Kalman filter for a match center."""
+    kalman = cv2.KalmanFilter(4, 2)  # state: cx, cy, vx, vy - measurement: cx, cy
+    kalman.transitionMatrix = np.array([[1, 0, 1, 0],
+                                        [0, 1, 0, 1],
+                                        [0, 0, 1, 0],
+                                        [0, 0, 0, 1]], dtype=np.float32)
+    kalman.measurementMatrix = np.array([[1, 0, 0, 0],
+                                         [0, 1, 0, 0]], dtype=np.float32)
+    kalman.processNoiseCov = np.eye(4, dtype=np.float32) * 0.03
+    kalman.measurementNoiseCov = np.eye(2, dtype=np.float32) * 1.0
+    kalman.errorCovPost = np.eye(4, dtype=np.float32)
+    kalman.statePost = np.array([[cx], [cy], [0], [0]], dtype=np.float32)
+    return kalman
+
+class MatchTracker:
+    """
+    Associates template matches between frames and keeps stable track IDs.
+
+    Track centers are kept in a spatial grid index with a cell size equal to
+    the association distance, so each detection only has to be compared with
+    the tracks in its own and the neighbouring cells. The same index answers
+    hit-tests and viewport queries for the overlay.
+    """
+
+    def __init__(self, distance_threshold: int = 100, appear_frames: int = 1,
+                 disappear_frames: int = 3, kalman_smoothing: bool = False,
+                 group_across_templates: bool = False) -> None:
+        """
+        Initialize the tracker.
+
+        Args:
+            distance_threshold: Maximum center distance (pixels) to associate a detection with a track
+            appear_frames: Consecutive detections needed before a match appears
+            disappear_frames: Consecutive misses after which a match disappears
+            kalman_smoothing: Whether to smooth positions with a Kalman filter
+            group_across_templates: Whether detections of different templates may continue a track
+        """
+        self.distance_threshold = max(1, distance_threshold)
+        self.appear_frames = max(1, appear_frames)
+        self.disappear_frames = max(1, disappear_frames)
+        self.kalman_smoothing = kalman_smoothing
+        self.group_across_templates = group_across_templates
+
+        self.tracks: Dict[int, TrackedMatch] = {}
+        self.index = SpatialGridIndex(cell_size=self.distance_threshold)
+        self._next_id = 1
+
+    def reset(self) -> TrackerUpdate:
+        """
+        Drop all tracks.
+
+        Returns:
+            Update listing all confirmed tracks as disappeared
+        """
+        update = TrackerUpdate(disappeared=[t for t in self.tracks.values() if t.confirmed])
+        self.tracks.clear()
+        self.index.clear()
+        return update
+
+    def _nearest_track(self, name: str, cx: float, cy: float, taken: set) -> Optional[TrackedMatch]:
+        """Find the closest unassigned track within the distance threshold."""
+        def is_candidate(track_id: int) -> bool:
+            if track_id in taken:
+                return False
+            return self.group_across_templates or self.tracks[track_id].name == name
+
+        track_id = self.index.nearest(cx, cy, self.distance_threshold, is_candidate)
+        return self.tracks[track_id] if track_id is not None else None
+
+    def update(self, matches: List[Match], timestamp: Optional[float] = None) -> TrackerUpdate:
+        """
+        Feed the detections of a new frame.
+
+        Args:
+            matches: Detections as (name, x, y, width, height, confidence)
+            timestamp: Optional frame time (default: now)
+
+        Returns:
+            Tracks that appeared or disappeared in this frame
+        """
+        now = time.time() if timestamp is None else timestamp
+        update = TrackerUpdate()
+        taken = set()
+
+        # Advance Kalman predictions once per frame
+        if self.kalman_smoothing:
+            for track in self.tracks.values():
+                if track.kalman is not None:
+                    track.kalman.predict()
+
+        # Associate the strongest detections first
+        for name, x, y, w, h, confidence in sorted(matches, key=lambda m: m[5], reverse=True):
+            cx, cy = x + w / 2, y + h / 2
+            track = self._nearest_track(name, cx, cy, taken)
+
+            if track is None:
+                track = TrackedMatch(track_id=self._next_id, name=name, x=x, y=y, width=w, height=h,
+                                     confidence=confidence, first_seen=now, last_seen=now)
+                self._next_id += 1
+                if self.kalman_smoothing:
+                    track.kalman = _create_kalman(cx, cy)
+                self.tracks[track.track_id] = track
+            else:
+                track.hits += 1
+                track.misses = 0
+                track.name = name
+                track.width, track.height = w, h
+                track.confidence = confidence
+                track.last_seen = now
+                if track.kalman is not None:
+                    state = track.kalman.correct(np.array([[cx], [cy]], dtype=np.float32))
+                    cx, cy = float(state[0, 0]), float(state[1, 0])
+                track.x = int(round(cx - w / 2))
+                track.y = int(round(cy - h / 2))
+
+            self.index.insert_point(track.track_id, *track.center)
+            taken.add(track.track_id)
+
+            # Appear hysteresis
+            if not track.confirmed and track.hits >= self.appear_frames:
+                track.confirmed = True
+                update.appeared.append(track)
+
+        # Disappear hysteresis for tracks without a detection in this frame
+        for track_id in list(self.tracks.keys()):
+            if track_id in taken:
+                continue
+            track = self.tracks[track_id]
+            track.misses += 1
+            if track.misses >= self.disappear_frames or not track.confirmed:
+                del self.tracks[track_id]
+                self.index.remove(track_id)
+                if track.confirmed:
+                    update.disappeared.append(track)
+
+        if update.appeared or update.disappeared:
+            logger.debug(f"Match tracker: {len(update.appeared)} appeared, "
+                         f"{len(update.disappeared)} disappeared, {len(self.tracks)} tracked")
+        return update
+
+    def get_tracks(self) -> List[TrackedMatch]:
+        """Get all confirmed tracks."""
+        return [track for track in self.tracks.values() if track.confirmed]
+
+    def get_matches(self) -> List[Match]:
+        """Get all confirmed tracks in the (name, x, y, width, height, confidence) format."""
+        return [track.as_tuple() for track in self.tracks.values() if track.confirmed]
+
+    def track_at(self, x: int, y: int, radius: int = 0) -> Optional[TrackedMatch]:
+        """
+        Get the confirmed track whose box contains (or is near) a point.
+
+        Args:
+            x: X coordinate
+            y: Y coordinate
+            radius: Extra distance (pixels) around the match boxes
+
+        Returns:
+            Closest matching track, or None
+        """
+        # The index holds centers, so search far enough to reach the corner of the largest box
+        reach = radius + max((max(t.width, t.height) for t in self.tracks.values()), default=0)
+        for track_id in self.index.query_point(x, y, reach):
+            track = self.tracks[track_id]
+            if (track.confirmed and track.x - radius <= x < track.x + track.width + radius
+                    and track.y - radius <= y < track.y + track.height + radius):
+                return track
+        return None
+
+    def tracks_in(self, left: int, top: int, right: int, bottom: int) -> List[TrackedMatch]:
+        """
+        Get the confirmed tracks whose center lies in a rectangle.
+
+        Args:
+            left: Left edge
+            top: Top edge
+            right: Right edge (exclusive)
+            bottom: Bottom edge (exclusive)
+
+        Returns:
+            Tracks inside the rectangle
+        """
+        return [self.tracks[track_id] for track_id in self.index.query_rect((left, top, right, bottom))
+                if self.tracks[track_id].confirmed]
@@ -0,0 +1,385 @@
+"""
+OCR Benchmark
+
+This standalone script measures OCR accuracy and speed on a labelled corpus
+of image crops. It handles:
+- Running every crop through each OCR backend and preprocessing profile
+- Reporting exact-match and character accuracy, p50/p99 latency and throughput
+- Writing machine-readable JSON results
+- Comparing against a previous result file to catch regressions
+
+It only depends on OpenCV, numpy and the stock tesseract binary, so it runs
+headless on Linux (no Qt, no window capture).
+
+Corpus layout:
+    corpus/
+        labels.json      {"crop_001.png": "X:512 Y:488", "crop_002.png": {"text": "1024", "kind": "digits"}}
+        crop_001.png
+        crop_002.png
+
+The optional "kind" selects the Tesseract settings (see KIND_SETTINGS).
+
+Usage:
+    python -m scout.ocr_benchmark corpus/ --output results.json
+    python -m scout.ocr_benchmark corpus/ --baseline results.json --max-regression 0.02
+"""
+
+from typing import Optional, Dict, Any, List, Tuple, Callable
+from dataclasses import dataclass, field, asdict
+from difflib import SequenceMatcher
+from pathlib import Path
+import argparse
+import json
+import logging
+import platform
+import shutil
+import subprocess
+import sys
+import time
+import cv2
+import numpy as np
+
+from scout.ocr_preprocessing import PREPROCESSING_PROFILES, create_pipeline
+
+logger = logging.getLogger(__name__)
+
+# Tesseract settings per crop kind (page segmentation mode, character whitelist)
+KIND_SETTINGS: Dict[str, Dict[str, Any]] = {
+    "coordinates": {"psm": 6, "whitelist": ""},
+    "digits": {"psm": 7, "whitelist": "0123456789"},
+    "text": {"psm": 6, "whitelist": ""}
+}
+
+# Profile name used for running OCR on the unprocessed crop
+RAW_PROFILE = "none"
+
+@dataclass
+class Sample:
+    """A labelled crop of the corpus."""
+    path: Path
+    expected: str
+    kind: str = "coordinates"
+    image: Optional[np.ndarray] = None
+
+@dataclass
+class BenchmarkResult:
+    """
+    Results for one backend/profile combination.
+
+    Attributes:
+        backend: OCR backend name
+        profile: Preprocessing profile name
+        samples: Number of crops processed
+        exact_accuracy: Fraction of crops read exactly (whitespace-insensitive)
+        char_accuracy: Mean character similarity (0-1)
+        p50_ms: Median latency (preprocessing + OCR)
+        p99_ms: 99th percentile latency
+        preprocess_p50_ms: Median preprocessing latency
+        throughput: Crops per second
+        errors: Number of crops that raised an error
+        failures: Crops that were not read exactly (file, expected, actual)
+    """
+    backend: str
+    profile: str
+    samples: int = 0
+    exact_accuracy: float = 0.0
+    char_accuracy: float = 0.0
+    p50_ms: float = 0.0
+    p99_ms: float = 0.0
+    preprocess_p50_ms: float = 0.0
+    throughput: float = 0.0
+    errors: int = 0
+    failures: List[Tuple[str, str, str]] = field(default_factory=list)
+
+    @property
+    def key(self) -> str:
+        """Identifier used to compare runs."""
+        return f"{self.backend}/{self.profile}"
+
+def normalize_text(text: str) -> str:
+    """Normalize OCR output for comparison (drop all whitespace)."""
+    return "".join(text.split())
+
+def percentile(values: List[float], percent: float) -> float:
+    """Calculate a percentile of a list of values (0 for an empty list)."""
+    if not values:
+        return 0.0
+    return float(np.percentile(np.asarray(values, dtype=np.float64), percent))
+
+def build_tesseract_config(kind: str) -> str:
+    """Build the Tesseract configuration string for a crop kind."""
+    settings = KIND_SETTINGS.get(kind, KIND_SETTINGS["text"])
+    config = f"--psm {settings['psm']} --oem 3"
+    if settings["whitelist"]:
+        config += f" -c tessedit_char_whitelist={settings['whitelist']}"
+    return config
+
+def load_corpus(corpus_dir: Path) -> List[Sample]:
+    """
+    Load the labelled crops of a corpus folder.
+
+    Args:
+        corpus_dir: Folder containing labels.json and the crops
+
+    Returns:
+        Loaded samples
+
+    Raises:
+        FileNotFoundError: If labels.json does not exist
+    """
+    labels_path = corpus_dir / "labels.json"
+    if not labels_path.exists():
+        raise FileNotFoundError(f"No labels.json in {corpus_dir}")
+
+    with open(labels_path, "r", encoding="utf-8") as f:
+        labels = json.load(f)
+
+    samples = []
+    for file_name, label in sorted(labels.items()):
+        if isinstance(label, str):
+            label = {"text": label}
+        path = corpus_dir / file_name
+        image = cv2.imread(str(path), cv2.IMREAD_UNCHANGED)
+        if image is None:
+            logger.warning(f"Could not read {path}, skipping")
+            continue
+        samples.append(Sample(path=path, expected=label.get("text", ""),
+                              kind=label.get("kind", "coordinates"), image=image))
+
+    logger.info(f"Loaded {len(samples)} samples from {corpus_dir}")
+    return samples
+
+def _tesseract_cli_backend(tesseract_cmd: str) -> Callable[[np.ndarray, str], str]:
+    """Create a backend that calls the tesseract binary directly (stdin/stdout)."""
+    def run(image: np.ndarray, config: str) -> str:
+        ok, encoded = cv2.imencode(".png", image)
+        if not ok:
+            raise ValueError("Failed to encode image")
+        result = subprocess.run(
+            [tesseract_cmd, "stdin", "stdout"] + config.split(),
+            input=encoded.tobytes(),
+            capture_output=True,
+            check=True
+        )
+        return result.stdout.decode("utf-8", errors="replace")
+    return run
+
+def _pytesseract_backend() -> Optional[Callable[[np.ndarray, str], str]]:
+    """Create a backend using pytesseract, or None if it is not installed."""
+    try:
+        import pytesseract
+    except ImportError:
+        return None
+
+    def run(image: np.ndarray, config: str) -> str:
+        return pytesseract.image_to_string(image, config=config)
+    return run
+
+def get_backends(names: List[str], tesseract_cmd: str) -> Dict[str, Callable[[np.ndarray, str], str]]:
+    """
+    Resolve OCR backends by name.
+
+    Args:
+        names: Backend names ("tesseract_cli", "pytesseract")
+        tesseract_cmd: Path or name of the tesseract binary
+
+    Returns:
+        Mapping of available backend names to callables (image, config) -> text
+    """
+    backends = {}
+    for name in names:
+        if name == "tesseract_cli":
+            if shutil.which(tesseract_cmd) is None:
+                logger.warning(f"tesseract binary '{tesseract_cmd}' not found, skipping {name}")
+                continue
+            backends[name] = _tesseract_cli_backend(tesseract_cmd)
+        elif name == "pytesseract":
+            backend = _pytesseract_backend()
+            if backend is None:
+                logger.warning("pytesseract not installed, skipping pytesseract backend")
+                continue
+            backends[name] = backend
+        else:
+            logger.warning(f"Unknown OCR backend '{name}'")
+    return backends
+
+def run_benchmark(samples: List[Sample], backend_name: str,
+                  backend: Callable[[np.ndarray, str], str], profile: str,
+                  warmup: int = 1) -> BenchmarkResult:
+    """
+    Run all samples through one backend and preprocessing profile.
+
+    Args:
+        samples: Labelled crops
+        backend_name: Name of the backend (for the report)
+        backend: Callable (image, config) -> text
+        profile: Preprocessing profile name or RAW_PROFILE
+        warmup: Number of untimed runs before measuring
+
+    Returns:
+        Benchmark result for this combination
+    """
+    result = BenchmarkResult(backend=backend_name, profile=profile, samples=len(samples))
+    pipeline = None if profile == RAW_PROFILE else create_pipeline(profile)
+
+    def prepare(image: np.ndarray) -> np.ndarray:
+        return pipeline.process(image) if pipeline else image
+
+    # Warm up (process startup, buffer allocation)
+    for sample in samples[:warmup]:
+        try:
+            backend(prepare(sample.image), build_tesseract_config(sample.kind))
+        except Exception:
+            pass
+
+    latencies = []
+    preprocess_latencies = []
+    similarities = []
+    exact = 0
+    total_start = time.perf_counter()
+
+    for sample in samples:
+        start = time.perf_counter()
+        try:
+            processed = prepare(sample.image)
+            preprocessed = time.perf_counter()
+            text = backend(processed, build_tesseract_config(sample.kind))
+        except Exception as e:
+            logger.error(f"{backend_name}/{profile} failed on {sample.path.name}: {e}")
+            result.errors += 1
+            similarities.append(0.0)
+            continue
+        end = time.perf_counter()
+
+        latencies.append((end - start) * 1000)
+        preprocess_latencies.append((preprocessed - start) * 1000)
+
+        expected = normalize_text(sample.expected)
+        actual = normalize_text(text)
+        similarities.append(SequenceMatcher(None, expected, actual).ratio())
+        if actual == expected:
+            exact += 1
+        else:
+            result.failures.append((sample.path.name, sample.expected, text.strip()))
+
+    total_seconds = time.perf_counter() - total_start
+
+    if samples:
+        result.exact_accuracy = exact / len(samples)
+        result.char_accuracy = float(np.mean(similarities))
+    result.p50_ms = percentile(latencies, 50)
+    result.p99_ms = percentile(latencies, 99)
+    result.preprocess_p50_ms = percentile(preprocess_latencies, 50)
+    result.throughput = len(latencies) / total_seconds if total_seconds > 0 else 0.0
+    return result
+
+def compare_with_baseline(results: List[BenchmarkResult], baseline_path: Path,
+                          max_regression: float) -> List[str]:
+    """
+    Compare results against a previous result file.
+
+    Args:
+        results: Current results
+        baseline_path: JSON file written by an earlier run
+        max_regression: Allowed drop of exact accuracy (fraction)
+
+    Returns:
+        Descriptions of all regressions (empty if none)
+    """
+    with open(baseline_path, "r", encoding="utf-8") as f:
+        baseline = {f"{r['backend']}/{r['profile']}": r for r in json.load(f)["results"]}
+
+    regressions = []
+    for result in results:
+        previous = baseline.get(result.key)
+        if not previous:
+            continue
+        drop = previous["exact_accuracy"] - result.exact_accuracy
+        if drop > max_regression:
+            regressions.append(
+                f"{result.key}: exact accuracy {previous['exact_accuracy']:.3f} -> {result.exact_accuracy:.3f}"
+            )
+    return regressions
+
+def format_report(results: List[BenchmarkResult]) -> str:
+    """Format results as a plain text table."""
+    lines = [
+        f"{'backend/profile':<32} {'n':>5} {'exact':>7} {'chars':>7} "
+        f"{'p50 ms':>8} {'p99 ms':>8} {'prep ms':>8} {'crops/s':>8} {'err':>4}"
+    ]
+    for r in results:
+        lines.append(
+            f"{r.key:<32} {r.samples:>5} {r.exact_accuracy:>7.3f} {r.char_accuracy:>7.3f} "
+            f"{r.p50_ms:>8.1f} {r.p99_ms:>8.1f} {r.preprocess_p50_ms:>8.2f} {r.throughput:>8.1f} {r.errors:>4}"
+        )
+    return "\n".join(lines)
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the benchmark from the command line."""
+    parser = argparse.ArgumentParser(description="Benchmark OCR accuracy and speed on a labelled corpus")
+    parser.add_argument("corpus", type=Path, help="Folder with labels.json and image crops")
+    parser.add_argument("--backends", nargs="+", default=["tesseract_cli", "pytesseract"],
+                        help="OCR backends to run (tesseract_cli, pytesseract)")
+    parser.add_argument("--profiles", nargs="+",
+                        default=[RAW_PROFILE] + list(PREPROCESSING_PROFILES.keys()),
+                        help="Preprocessing profiles to run ('none' for raw crops)")
+    parser.add_argument("--tesseract-cmd", default="tesseract", help="Tesseract binary")
+    parser.add_argument("--output", type=Path, help="Write JSON results to this file")
+    parser.add_argument("--baseline", type=Path, help="Compare with a previous JSON result file")
+    parser.add_argument("--max-regression", type=float, default=0.0,
+                        help="Allowed drop of exact accuracy before failing")
+    parser.add_argument("--verbose", action="store_true", help="Log failed crops")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        datefmt='%H:%M:%S'
+    )
+
+    samples = load_corpus(args.corpus)
+    if not samples:
+        logger.error("Corpus is empty")
+        return 2
+
+    backends = get_backends(args.backends, args.tesseract_cmd)
+    if not backends:
+        logger.error("No OCR backend available")
+        return 2
+
+    results = []
+    for backend_name, backend in backends.items():
+        for profile in args.profiles:
+            if profile != RAW_PROFILE and profile not in PREPROCESSING_PROFILES:
+                logger.warning(f"Unknown preprocessing profile '{profile}', skipping")
+                continue
+            result = run_benchmark(samples, backend_name, backend, profile)
+            results.append(result)
+            if args.verbose:
+                for name, expected, actual in result.failures:
+                    logger.debug(f"{result.key} {name}: expected '{expected}', got '{actual}'")
+
+    print(format_report(results))
+
+    if args.output:
+        report = {
+            "corpus": str(args.corpus),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "platform": platform.platform(),
+            "results": [asdict(r) for r in results]
+        }
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        logger.info(f"Results written to {args.output}")
+
+    if args.baseline:
+        regressions = compare_with_baseline(results, args.baseline, args.max_regression)
+        for regression in regressions:
+            logger.error(f"Regression: {regression}")
+        if regressions:
+            return 1
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
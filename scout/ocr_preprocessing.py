@@ -0,0 +1,424 @@
+"""
+OCR Preprocessing Pipeline
+
+This module provides a configurable image preprocessing pipeline for OCR.
+It handles:
+- Named, ordered preprocessing stages (grayscale, contrast, blur, thresholds)
+- Reuse of preallocated output buffers between calls
+- Caching of the stage graph per input size
+- Per-stage timing statistics
+
+The same pipeline is used by TextOCR, the scanner's coordinate reader and the
+OCR debug tab, so a preprocessing profile tuned in the debug tab behaves exactly
+like it will at runtime.
+"""
+
+from typing import Optional, Dict, Any, List, Tuple, Callable
+from collections import OrderedDict
+from dataclasses import dataclass, field
+import time
+import logging
+import cv2
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of input sizes to keep compiled stage graphs for
+MAX_CACHED_GRAPHS = 8
+
+@dataclass
+class PreprocessStage:
+    """
+    A single named step of a preprocessing pipeline.
+
+    Attributes:
+        name: Unique name of the stage inside its pipeline (used for timings)
+        op: Operation to perform (see PreprocessingPipeline.OPERATIONS)
+        params: Operation specific parameters
+        enabled: Whether the stage is executed
+    """
+    name: str
+    op: str
+    params: Dict[str, Any] = field(default_factory=dict)
+    enabled: bool = True
+
+@dataclass
+class StageTiming:
+    """Timing statistics for one pipeline stage (milliseconds)."""
+    last_ms: float = 0.0
+    total_ms: float = 0.0
+    calls: int = 0
+
+    @property
+    def average_ms(self) -> float:
+        """Average duration of the stage in milliseconds."""
+        return self.total_ms / self.calls if self.calls else 0.0
+
+class _CompiledStage:
+    """A stage bound to a preallocated output buffer for one input size."""
+
+    __slots__ = ("stage", "func", "buffer")
+
+    def __init__(self, stage: PreprocessStage, func: Callable, buffer: Optional[np.ndarray]) -> None:
+        self.stage = stage
+        self.func = func
+        self.buffer = buffer
+
+class PreprocessingPipeline:
+    """
+    Ordered chain of image preprocessing stages with reusable buffers.
+
+    For every distinct input shape the pipeline compiles a stage graph once:
+    each stage gets an output buffer of the right shape that is passed to
+    OpenCV through ``dst=``. Later calls with the same input size reuse those
+    buffers, so steady-state OCR preprocessing allocates no new arrays.
+
+    The array returned by process() is owned by the pipeline and is
+    overwritten by the next call with the same input size. Copy it if it
+    has to outlive that call (e.g. when emitting it through a Qt signal).
+    """
+
+    # Operations that write their result into the input buffer
+    IN_PLACE_OPERATIONS = ("auto_invert", "invert")
+
+    OPERATIONS = (
+        "grayscale", "resize", "contrast", "blur", "median_blur",
+        "threshold", "otsu", "adaptive_threshold", "auto_invert", "invert"
+    )
+
+    def __init__(self, stages: Optional[List[PreprocessStage]] = None, name: str = "custom") -> None:
+        """
+        Initialize the pipeline.
+
+        Args:
+            stages: Ordered list of stages to execute
+            name: Name of the pipeline (used in logs and benchmark results)
+        """
+        self.name = name
+        self.stages: List[PreprocessStage] = []
+        self._graphs: "OrderedDict[Tuple, List[_CompiledStage]]" = OrderedDict()
+        self.timings: Dict[str, StageTiming] = {}
+        self.last_total_ms = 0.0
+
+        for stage in stages or []:
+            self.add_stage(stage)
+
+    def add_stage(self, stage: PreprocessStage) -> None:
+        """
+        Append a stage to the pipeline.
+
+        Args:
+            stage: Stage to append
+
+        Raises:
+            ValueError: If the operation is unknown or the name is already used
+        """
+        if stage.op not in self.OPERATIONS:
+            raise ValueError(f"Unknown preprocessing operation: {stage.op}")
+        if any(existing.name == stage.name for existing in self.stages):
+            raise ValueError(f"Duplicate preprocessing stage name: {stage.name}")
+
+        self.stages.append(stage)
+        self.timings[stage.name] = StageTiming()
+        self.invalidate()
+
+    def set_stage_params(self, name: str, enabled: Optional[bool] = None, **params: Any) -> None:
+        """
+        Update the parameters of an existing stage.
+
+        Args:
+            name: Name of the stage to update
+            enabled: Optional new enabled state
+            **params: Parameters to update
+
+        Raises:
+            KeyError: If no stage with that name exists
+        """
+        for stage in self.stages:
+            if stage.name == name:
+                stage.params.update(params)
+                if enabled is not None:
+                    stage.enabled = enabled
+                self.invalidate()
+                return
+        raise KeyError(f"No preprocessing stage named '{name}'")
+
+    def invalidate(self) -> None:
+        """Drop all compiled stage graphs (called after configuration changes)."""
+        self._graphs.clear()
+
+    def process(self, image: np.ndarray) -> np.ndarray:
+        """
+        Run the image through all enabled stages.
+
+        Args:
+            image: Input image (BGR, BGRA or grayscale)
+
+        Returns:
+            Processed image (pipeline-owned buffer, see class docstring)
+        """
+        graph = self._get_graph(image)
+
+        start = time.perf_counter()
+        current = image
+        for compiled in graph:
+            stage_start = time.perf_counter()
+            current = compiled.func(current, compiled.buffer, compiled.stage.params)
+            elapsed = (time.perf_counter() - stage_start) * 1000.0
+
+            timing = self.timings[compiled.stage.name]
+            timing.last_ms = elapsed
+            timing.total_ms += elapsed
+            timing.calls += 1
+
+        self.last_total_ms = (time.perf_counter() - start) * 1000.0
+        return current
+
+    def get_timings(self) -> Dict[str, Dict[str, float]]:
+        """
+        Get per-stage timing statistics.
+
+        Returns:
+            Dictionary mapping stage names to last/average durations (ms) and call counts
+        """
+        return {
+            name: {
+                "last_ms": timing.last_ms,
+                "average_ms": timing.average_ms,
+                "calls": timing.calls
+            }
+            for name, timing in self.timings.items()
+        }
+
+    def format_timings(self) -> str:
+        """Format the last run's stage timings as a compact single line."""
+        parts = [
+            f"{stage.name}={self.timings[stage.name].last_ms:.2f}ms"
+            for stage in self.stages if stage.enabled
+        ]
+        parts.append(f"total={self.last_total_ms:.2f}ms")
+        return ", ".join(parts)
+
+    def reset_timings(self) -> None:
+        """Reset all timing statistics."""
+        for name in self.timings:
+            self.timings[name] = StageTiming()
+        self.last_total_ms = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the pipeline configuration to a dictionary."""
+        return {
+            "name": self.name,
+            "stages": [
+                {"name": s.name, "op": s.op, "params": dict(s.params), "enabled": s.enabled}
+                for s in self.stages
+            ]
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'PreprocessingPipeline':
+        """
+        Create a pipeline from a dictionary created by to_dict().
+
+        Args:
+            data: Dictionary representation of the pipeline
+
+        Returns:
+            PreprocessingPipeline instance
+        """
+        stages = [
+            PreprocessStage(
+                name=s["name"],
+                op=s["op"],
+                params=dict(s.get("params", {})),
+                enabled=s.get("enabled", True)
+            )
+            for s in data.get("stages", [])
+        ]
+        return cls(stages, name=data.get("name", "custom"))
+
+    @classmethod
+    def from_ocr_parameters(cls, params: Dict[str, Any]) -> 'PreprocessingPipeline':
+        """
+        Create a pipeline from the parameter dictionary of the OCR debug tab.
+
+        Args:
+            params: Dictionary as returned by OCRTab.get_ocr_parameters()
+
+        Returns:
+            PreprocessingPipeline instance
+        """
+        preprocessing = params.get("preprocessing", {})
+        threshold = preprocessing.get("threshold", {})
+        noise = preprocessing.get("noise_reduction", {})
+
+        # Median blur requires an odd kernel size
+        kernel_size = int(noise.get("kernel_size", 3)) | 1
+
+        stages = [
+            PreprocessStage("grayscale", "grayscale",
+                            enabled=preprocessing.get("grayscale", True)),
+            PreprocessStage("noise_reduction", "median_blur", {"ksize": kernel_size},
+                            enabled=noise.get("enabled", False)),
+            PreprocessStage("threshold", "threshold", {"value": int(threshold.get("value", 127))},
+                            enabled=threshold.get("enabled", True)),
+        ]
+        return cls(stages, name="ocr_tab")
+
+    def _get_graph(self, image: np.ndarray) -> List[_CompiledStage]:
+        """Get (or compile) the stage graph for the input's shape and type."""
+        key = (image.shape, image.dtype.str)
+        graph = self._graphs.get(key)
+        if graph is not None:
+            self._graphs.move_to_end(key)
+            return graph
+
+        graph = self._compile(image.shape, image.dtype)
+        self._graphs[key] = graph
+        if len(self._graphs) > MAX_CACHED_GRAPHS:
+            self._graphs.popitem(last=False)
+        logger.debug(f"Compiled preprocessing graph '{self.name}' for input {image.shape}")
+        return graph
+
+    def _compile(self, shape: Tuple[int, ...], dtype: np.dtype) -> List[_CompiledStage]:
+        """
+        Build the stage graph for one input shape.
+
+        Infers the output shape of every enabled stage and preallocates its
+        output buffer. In-place stages reuse the previous stage's buffer.
+        """
+        graph: List[_CompiledStage] = []
+        current_shape = tuple(shape)
+
+        for stage in self.stages:
+            if not stage.enabled:
+                continue
+
+            func = getattr(self, f"_op_{stage.op}")
+            out_shape = self._output_shape(stage, current_shape)
+
+            if stage.op in self.IN_PLACE_OPERATIONS:
+                # First stage must not modify the caller's image
+                buffer = None if graph else np.empty(out_shape, dtype=dtype)
+            else:
+                buffer = np.empty(out_shape, dtype=np.uint8)
+
+            graph.append(_CompiledStage(stage, func, buffer))
+            current_shape = out_shape
+
+        return graph
+
+    def _output_shape(self, stage: PreprocessStage, shape: Tuple[int, ...]) -> Tuple[int, ...]:
+        """Compute the output shape of a stage for a given input shape."""
+        if stage.op == "grayscale":
+            return tuple(shape[:2])
+        if stage.op == "resize":
+            fx = float(stage.params.get("fx", 2.0))
+            fy = float(stage.params.get("fy", fx))
+            height = max(1, int(round(shape[0] * fy)))
+            width = max(1, int(round(shape[1] * fx)))
+            return (height, width) + tuple(shape[2:])
+        return tuple(shape)
+
+    # Stage implementations. Each takes (src, dst, params) and returns the output.
+
+    def _op_grayscale(self, src: np.ndarray, dst: np.ndarray, params: Dict[str, Any]) -> np.ndarray:
+        if src.ndim == 2:
+            np.copyto(dst, src)
+            return dst
+        code = cv2.COLOR_BGRA2GRAY if src.shape[2] == 4 else cv2.COLOR_BGR2GRAY
+        return cv2.cvtColor(src, code, dst=dst)
+
+    def _op_resize(self, src: np.ndarray, dst: np.ndarray, params: Dict[str, Any]) -> np.ndarray:
+        interpolation = params.get("interpolation", cv2.INTER_CUBIC)
+        return cv2.resize(src, (dst.shape[1], dst.shape[0]), dst=dst, interpolation=interpolation)
+
+    def _op_contrast(self, src: np.ndarray, dst: np.ndarray, params: Dict[str, Any]) -> np.ndarray:
+        return cv2.convertScaleAbs(src, dst=dst, alpha=params.get("alpha", 2.0), beta=params.get("beta", 0))
+
+    def _op_blur(self, src: np.ndarray, dst: np.ndarray, params: Dict[str, Any]) -> np.ndarray:
+        ksize = int(params.get("ksize", 3))
+        return cv2.GaussianBlur(src, (ksize, ksize), 0, dst=dst)
+
+    def _op_median_blur(self, src: np.ndarray, dst: np.ndarray, params: Dict[str, Any]) -> np.ndarray:
+        return cv2.medianBlur(src, int(params.get("ksize", 3)), dst=dst)
+
+    def _op_threshold(self, src: np.ndarray, dst: np.ndarray, params: Dict[str, Any]) -> np.ndarray:
+        cv2.threshold(src, params.get("value", 127), 255, cv2.THRESH_BINARY, dst=dst)
+        return dst
+
+    def _op_otsu(self, src: np.ndarray, dst: np.ndarray, params: Dict[str, Any]) -> np.ndarray:
+        cv2.threshold(src, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU, dst=dst)
+        return dst
+
+    def _op_adaptive_threshold(self, src: np.ndarray, dst: np.ndarray, params: Dict[str, Any]) -> np.ndarray:
+        return cv2.adaptiveThreshold(
+            src, 255,
+            cv2.ADAPTIVE_THRESH_GAUSSIAN_C,
+            cv2.THRESH_BINARY,
+            int(params.get("block_size", 11)),
+            params.get("c", 2),
+            dst=dst
+        )
+
+    def _op_invert(self, src: np.ndarray, dst: Optional[np.ndarray], params: Dict[str, Any]) -> np.ndarray:
+        return cv2.bitwise_not(src, dst=src if dst is None else dst)
+
+    def _op_auto_invert(self, src: np.ndarray, dst: Optional[np.ndarray], params: Dict[str, Any]) -> np.ndarray:
+        # Invert if text is black (majority of pixels are white). countNonZero
+        # avoids the temporary boolean array of np.sum(binary == 255).
+        out = src if dst is None else dst
+        if cv2.countNonZero(src) > src.size / 2:
+            return cv2.bitwise_not(src, dst=out)
+        if out is not src:
+            np.copyto(out, src)
+        return out
+
+def create_coordinate_pipeline() -> PreprocessingPipeline:
+    """
+    Create the pipeline used by TextOCR for the coordinate region.
+
+    Grayscale, Otsu binarization and inversion so that text is always white
+    on black.
+    """
+    return PreprocessingPipeline([
+        PreprocessStage("grayscale", "grayscale"),
+        PreprocessStage("otsu", "otsu"),
+        PreprocessStage("invert", "auto_invert"),
+    ], name="coordinates")
+
+def create_scanner_digits_pipeline() -> PreprocessingPipeline:
+    """
+    Create the pipeline used by the scanner for the minimap coordinate digits.
+
+    Grayscale, contrast boost, Gaussian blur and adaptive threshold.
+    """
+    return PreprocessingPipeline([
+        PreprocessStage("grayscale", "grayscale"),
+        PreprocessStage("contrast", "contrast", {"alpha": 2.0, "beta": 0}),
+        PreprocessStage("blur", "blur", {"ksize": 3}),
+        PreprocessStage("threshold", "adaptive_threshold", {"block_size": 11, "c": 2}),
+    ], name="scanner_digits")
+
+# Named preprocessing profiles
+PREPROCESSING_PROFILES: Dict[str, Callable[[], PreprocessingPipeline]] = {
+    "coordinates": create_coordinate_pipeline,
+    "scanner_digits": create_scanner_digits_pipeline,
+}
+
+def create_pipeline(profile: str) -> PreprocessingPipeline:
+    """
+    Create a new pipeline for a named profile.
+
+    Args:
+        profile: Name of the profile (see PREPROCESSING_PROFILES)
+
+    Returns:
+        New PreprocessingPipeline instance
+
+    Raises:
+        KeyError: If the profile is unknown
+    """
+    if profile not in PREPROCESSING_PROFILES:
+        raise KeyError(f"Unknown preprocessing profile: {profile}")
+    return PREPROCESSING_PROFILES[profile]()
@@ -0,0 +1,540 @@
+"""
+OCR Region Registry
+
+This module provides a central registry of named OCR regions and a scheduler
+that keeps their values up to date. It handles:
+- Named regions with per-region preprocessing profiles and character whitelists
+- Refresh policies (fixed interval, on change, on demand)
+- Capturing each frame once and running OCR on every due region from it
+- Caching the latest text per region so automation can read values
+  without triggering its own capture and OCR
+- Looking up the regions at a point or inside an area (spatial index)
+
+Regions are defined in physical screen coordinates, like TextOCR.region.
+"""
+
+from typing import Optional, Dict, Any, List, Iterable, Tuple
+from dataclasses import dataclass, field
+import logging
+import threading
+import time
+import numpy as np
+import pytesseract
+import mss
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+
+from scout.ocr_preprocessing import PreprocessingPipeline, create_pipeline
+from scout.change_detector import RegionChangeDetector
+from scout.spatial_index import SpatialGridIndex
+
+logger = logging.getLogger(__name__)
+
+# Refresh policies
+REFRESH_INTERVAL = "interval"    # OCR every refresh_interval seconds
+REFRESH_ON_CHANGE = "change"     # OCR when the region pixels changed (checked every tick)
+REFRESH_ON_DEMAND = "on_demand"  # OCR only when explicitly requested
+REFRESH_POLICIES = (REFRESH_INTERVAL, REFRESH_ON_CHANGE, REFRESH_ON_DEMAND)
+
+@dataclass
+class OCRRegion:
+    """
+    A named screen region that is read with OCR.
+
+    Attributes:
+        name: Unique region name
+        left: Left edge in physical screen coordinates
+        top: Top edge in physical screen coordinates
+        width: Region width in pixels
+        height: Region height in pixels
+        profile: Name of the preprocessing profile (see PREPROCESSING_PROFILES)
+        whitelist: Characters Tesseract may recognize (empty for all)
+        psm: Tesseract page segmentation mode
+        refresh_policy: One of REFRESH_POLICIES
+        refresh_interval: Seconds between refreshes for the interval policy
+    """
+    name: str
+    left: int
+    top: int
+    width: int
+    height: int
+    profile: str = "coordinates"
+    whitelist: str = ""
+    psm: int = 7
+    refresh_policy: str = REFRESH_INTERVAL
+    refresh_interval: float = 1.0
+
+    @property
+    def bounds(self) -> Dict[str, int]:
+        """Region as an mss-style dictionary."""
+        return {'left': self.left, 'top': self.top, 'width': self.width, 'height': self.height}
+
+    def tesseract_config(self) -> str:
+        """Build the Tesseract configuration string for this region."""
+        config = f"--psm {self.psm} --oem 3"
+        if self.whitelist:
+            config += f" -c tessedit_char_whitelist={self.whitelist}"
+        return config
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the region to a dictionary for serialization."""
+        return {
+            'name': self.name,
+            'left': self.left,
+            'top': self.top,
+            'width': self.width,
+            'height': self.height,
+            'profile': self.profile,
+            'whitelist': self.whitelist,
+            'psm': self.psm,
+            'refresh_policy': self.refresh_policy,
+            'refresh_interval': self.refresh_interval
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'OCRRegion':
+        """Create a region from a dictionary."""
+        return cls(
+            name=data['name'],
+            left=int(data.get('left', 0)),
+            top=int(data.get('top', 0)),
+            width=int(data.get('width', 0)),
+            height=int(data.get('height', 0)),
+            profile=data.get('profile', "coordinates"),
+            whitelist=data.get('whitelist', ""),
+            psm=int(data.get('psm', 7)),
+            refresh_policy=data.get('refresh_policy', REFRESH_INTERVAL),
+            refresh_interval=float(data.get('refresh_interval', 1.0))
+        )
+
+@dataclass
+class OCRRegionResult:
+    """
+    Latest OCR result for a region.
+
+    Attributes:
+        text: Recognized text (stripped)
+        timestamp: time.time() when the region was captured
+        duration_ms: Time spent on preprocessing and OCR
+    """
+    text: str = ""
+    timestamp: float = 0.0
+    duration_ms: float = 0.0
+
+    @property
+    def age(self) -> float:
+        """Seconds since the result was captured."""
+        return time.time() - self.timestamp
+
+@dataclass
+class _RegionState:
+    """Internal per-region state kept by the registry."""
+    region: OCRRegion
+    pipeline: PreprocessingPipeline
+    detector: RegionChangeDetector = field(default_factory=RegionChangeDetector)
+    result: Optional[OCRRegionResult] = None
+    last_refresh: float = 0.0
+    requested: bool = False
+
+def union_bounds(regions: Iterable[Dict[str, int]]) -> Optional[Dict[str, int]]:
+    """
+    Calculate the bounding box of several regions.
+
+    Args:
+        regions: Regions as dictionaries with left, top, width, height
+
+    Returns:
+        Bounding box as dictionary, or None if no regions were given
+    """
+    regions = list(regions)
+    if not regions:
+        return None
+    left = min(r['left'] for r in regions)
+    top = min(r['top'] for r in regions)
+    right = max(r['left'] + r['width'] for r in regions)
+    bottom = max(r['top'] + r['height'] for r in regions)
+    return {'left': left, 'top': top, 'width': right - left, 'height': bottom - top}
+
+def capture_regions(regions: Dict[str, Dict[str, int]],
+                    sct: Optional[Any] = None) -> Dict[str, np.ndarray]:
+    """
+    Capture several regions with a single screen grab.
+
+    The bounding box of all regions is grabbed once and each region is
+    returned as a view into that frame, not a copy: overlapping regions share
+    pixels, so consumers must not write into the crops (preprocessing
+    pipelines never modify their input, their first stage writes into its own
+    buffer).
+
+    Args:
+        regions: Mapping of name to region dictionary (left, top, width, height)
+        sct: Optional open mss instance to reuse
+
+    Returns:
+        Mapping of name to captured image (BGRA views into the shared frame)
+    """
+    bounds = union_bounds(regions.values())
+    if bounds is None or bounds['width'] <= 0 or bounds['height'] <= 0:
+        return {}
+
+    if sct is None:
+        with mss.mss() as own_sct:
+            frame = np.array(own_sct.grab(bounds))
+    else:
+        frame = np.array(sct.grab(bounds))
+
+    crops = {}
+    for name, region in regions.items():
+        x = region['left'] - bounds['left']
+        y = region['top'] - bounds['top']
+        crops[name] = frame[y:y + region['height'], x:x + region['width']]
+    return crops
+
+def minimap_coordinate_regions(scanner_settings: Dict[str, Any]) -> List[OCRRegion]:
+    """
+    Build the coordinate regions below the minimap from scanner settings.
+
+    Args:
+        scanner_settings: Settings from ConfigManager.get_scanner_settings()
+
+    Returns:
+        Regions named 'x', 'y' and 'k' using the scanner digits profile
+    """
+    minimap_left = scanner_settings.get('minimap_left', 0)
+    minimap_top = scanner_settings.get('minimap_top', 0)
+    minimap_width = scanner_settings.get('minimap_width', 0)
+    minimap_height = scanner_settings.get('minimap_height', 0)
+
+    regions = []
+    for index, name in enumerate(('x', 'y', 'k')):
+        regions.append(OCRRegion(
+            name=name,
+            left=minimap_left + (index * minimap_width) // 3,
+            top=minimap_top + minimap_height,
+            width=minimap_width // 3,
+            height=20,
+            profile="scanner_digits",
+            whitelist="0123456789",
+            psm=7
+        ))
+    return regions
+
+class OCRRegionRegistry(QObject):
+    """
+    Registry of named OCR regions with a shared capture-once scheduler.
+
+    On every tick the registry determines which regions are due according to
+    their refresh policy, grabs the bounding box of those regions once and
+    runs OCR on each of them. Results are cached and can be read from any
+    thread with get_text() / get_result().
+    """
+
+    # Signals
+    region_updated = pyqtSignal(str, str)  # region name, text
+
+    def __init__(self, tick_interval: float = 0.2) -> None:
+        """
+        Initialize the registry.
+
+        Args:
+            tick_interval: Seconds between scheduler ticks
+        """
+        super().__init__()
+        self.tick_interval = tick_interval
+        self._states: Dict[str, _RegionState] = {}
+        self._index = SpatialGridIndex(cell_size=128)
+        self._lock = threading.RLock()
+
+        # Statistics
+        self.captures = 0
+        self.ocr_runs = 0
+
+        self.timer = QTimer()
+        self.timer.timeout.connect(self.process_due_regions)
+
+        logger.debug("OCRRegionRegistry initialized")
+
+    def register(self, region: OCRRegion, pipeline: Optional[PreprocessingPipeline] = None) -> None:
+        """
+        Register or replace a region.
+
+        Args:
+            region: Region definition
+            pipeline: Optional preprocessing pipeline (default: built from region.profile)
+
+        Raises:
+            ValueError: If the refresh policy is unknown
+        """
+        if region.refresh_policy not in REFRESH_POLICIES:
+            raise ValueError(f"Unknown refresh policy '{region.refresh_policy}'")
+
+        with self._lock:
+            previous = self._states.get(region.name)
+            if pipeline is None:
+                # Keep the existing pipeline (and its buffers) if the profile is unchanged
+                if previous and previous.region.profile == region.profile:
+                    pipeline = previous.pipeline
+                else:
+                    pipeline = create_pipeline(region.profile)
+
+            state = _RegionState(region=region, pipeline=pipeline)
+            if previous and previous.region.bounds == region.bounds:
+                state.result = previous.result
+                state.last_refresh = previous.last_refresh
+            self._states[region.name] = state
+            self._index_region(region)
+
+        logger.debug(f"Registered OCR region '{region.name}': {region.bounds} "
+                     f"(profile={region.profile}, refresh={region.refresh_policy})")
+
+    def unregister(self, name: str) -> None:
+        """
+        Remove a region.
+
+        Args:
+            name: Region name
+        """
+        with self._lock:
+            self._index.remove(name)
+            if self._states.pop(name, None):
+                logger.debug(f"Unregistered OCR region '{name}'")
+
+    def update_bounds(self, name: str, bounds: Dict[str, int]) -> None:
+        """
+        Move or resize a registered region.
+
+        Args:
+            name: Region name
+            bounds: Dictionary with left, top, width, height
+        """
+        with self._lock:
+            state = self._states.get(name)
+            if not state:
+                logger.warning(f"Cannot update unknown OCR region '{name}'")
+                return
+            state.region.left = bounds['left']
+            state.region.top = bounds['top']
+            state.region.width = bounds['width']
+            state.region.height = bounds['height']
+            self._index_region(state.region)
+            state.result = None
+            state.detector.reset()
+
+    def _index_region(self, region: OCRRegion) -> None:
+        """Insert or move a region in the spatial index."""
+        self._index.insert(region.name, (region.left, region.top,
+                                         region.left + region.width, region.top + region.height))
+
+    def get_regions_at(self, x: int, y: int) -> List[OCRRegion]:
+        """
+        Get the regions containing a point.
+
+        Args:
+            x: X coordinate (physical screen pixels)
+            y: Y coordinate (physical screen pixels)
+
+        Returns:
+            Regions containing the point
+        """
+        with self._lock:
+            return [self._states[name].region for name in self._index.query_point(x, y)]
+
+    def get_regions_in(self, bounds: Dict[str, int]) -> List[OCRRegion]:
+        """
+        Get the regions overlapping an area.
+
+        Args:
+            bounds: Dictionary with left, top, width, height
+
+        Returns:
+            Regions overlapping the area
+        """
+        rect = (bounds['left'], bounds['top'],
+                bounds['left'] + bounds['width'], bounds['top'] + bounds['height'])
+        with self._lock:
+            return [self._states[name].region for name in self._index.query_rect(rect)]
+
+    def get_region(self, name: str) -> Optional[OCRRegion]:
+        """Get a region definition by name."""
+        with self._lock:
+            state = self._states.get(name)
+            return state.region if state else None
+
+    def get_region_names(self) -> List[str]:
+        """Get the names of all registered regions."""
+        with self._lock:
+            return list(self._states.keys())
+
+    def get_result(self, name: str) -> Optional[OCRRegionResult]:
+        """
+        Get the cached result of a region.
+
+        Args:
+            name: Region name
+
+        Returns:
+            Latest result, or None if the region was never read
+        """
+        with self._lock:
+            state = self._states.get(name)
+            return state.result if state else None
+
+    def get_text(self, name: str, max_age: Optional[float] = None) -> Optional[str]:
+        """
+        Get the cached text of a region.
+
+        If the cached value is missing or older than max_age a refresh is
+        requested for the next tick and None is returned.
+
+        Args:
+            name: Region name
+            max_age: Optional maximum age of the value in seconds
+
+        Returns:
+            Cached text, or None if no fresh value is available
+        """
+        with self._lock:
+            state = self._states.get(name)
+            if not state:
+                return None
+            result = state.result
+            if result is None or (max_age is not None and result.age > max_age):
+                state.requested = True
+                return None
+            return result.text
+
+    def publish(self, name: str, text: str, duration_ms: float = 0.0) -> None:
+        """
+        Store a result that was produced outside the scheduler.
+
+        Used by components that already run OCR on a region (e.g. TextOCR)
+        so their values are available to automation without a second OCR.
+
+        Args:
+            name: Region name
+            text: Recognized text
+            duration_ms: Optional time spent producing the result
+        """
+        now = time.time()
+        with self._lock:
+            state = self._states.get(name)
+            if not state:
+                logger.warning(f"Cannot publish result for unknown OCR region '{name}'")
+                return
+            state.result = OCRRegionResult(text=text.strip(), timestamp=now, duration_ms=duration_ms)
+            state.last_refresh = now
+            state.requested = False
+        self.region_updated.emit(name, text.strip())
+
+    def request_refresh(self, names: Optional[Iterable[str]] = None) -> None:
+        """
+        Request regions to be read on the next tick regardless of their policy.
+
+        Args:
+            names: Region names (default: all regions)
+        """
+        with self._lock:
+            for name in (names if names is not None else list(self._states.keys())):
+                state = self._states.get(name)
+                if state:
+                    state.requested = True
+
+    def start(self) -> None:
+        """Start the scheduler."""
+        self.timer.start(int(self.tick_interval * 1000))
+        logger.info(f"OCR region scheduler started ({len(self._states)} regions)")
+
+    def stop(self) -> None:
+        """Stop the scheduler."""
+        self.timer.stop()
+        logger.info(f"OCR region scheduler stopped ({self.captures} captures, {self.ocr_runs} OCR runs)")
+
+    def _due_regions(self, now: float) -> Tuple[List[_RegionState], List[_RegionState]]:
+        """
+        Split regions into ones that must be read and ones that need a change check.
+
+        Returns:
+            Tuple of (due states, change-check states)
+        """
+        due = []
+        check = []
+        for state in self._states.values():
+            region = state.region
+            if region.width <= 0 or region.height <= 0:
+                continue
+            if state.requested or (state.result is None and region.refresh_policy != REFRESH_ON_DEMAND):
+                due.append(state)
+            elif region.refresh_policy == REFRESH_INTERVAL:
+                if now - state.last_refresh >= region.refresh_interval:
+                    due.append(state)
+            elif region.refresh_policy == REFRESH_ON_CHANGE:
+                check.append(state)
+        return due, check
+
+    def process_due_regions(self) -> int:
+        """
+        Capture once and OCR every region that is due.
+
+        The lock is only held to pick the due regions and to publish the
+        results; capture and OCR run unlocked, so get_text() and publish()
+        from other threads do not wait for Tesseract.
+
+        Returns:
+            Number of regions that were read
+        """
+        try:
+            now = time.time()
+            with self._lock:
+                due, check = self._due_regions(now)
+                if not due and not check:
+                    return 0
+                # Bounds as scheduled; results of regions moved meanwhile are dropped
+                bounds = {s.region.name: dict(s.region.bounds) for s in due + check}
+                for state in due:
+                    state.requested = False
+
+            # Views into one grabbed frame (see capture_regions), read only
+            crops = capture_regions(bounds)
+
+            # Change-policy regions only need OCR if their pixels changed
+            for state in check:
+                crop = crops.get(state.region.name)
+                if crop is not None and state.detector.has_changed(crop):
+                    due.append(state)
+
+            results = []
+            for state in due:
+                crop = crops.get(state.region.name)
+                if crop is not None:
+                    results.append((state, self._read_region(state, crop, now)))
+
+            updated = []
+            with self._lock:
+                self.captures += 1
+                self.ocr_runs += len(results)
+                for state, result in results:
+                    name = state.region.name
+                    if self._states.get(name) is not state or state.region.bounds != bounds[name]:
+                        continue
+                    state.result = result
+                    state.last_refresh = now
+                    updated.append((name, result.text))
+
+            # Emit outside the lock so slots can query the registry
+            for name, text in updated:
+                self.region_updated.emit(name, text)
+            return len(updated)
+
+        except Exception as e:
+            logger.error(f"Error processing OCR regions: {e}", exc_info=True)
+            return 0
+
+    def _read_region(self, state: _RegionState, crop: np.ndarray, timestamp: float) -> OCRRegionResult:
+        """Preprocess and OCR a single captured region (called without the lock)."""
+        start = time.perf_counter()
+        processed = state.pipeline.process(crop)
+        text = pytesseract.image_to_string(processed, config=state.region.tesseract_config())
+        duration_ms = (time.perf_counter() - start) * 1000
+
+        result = OCRRegionResult(text=text.strip(), timestamp=timestamp, duration_ms=duration_ms)
+        logger.debug(f"OCR region '{state.region.name}': '{result.text}' ({duration_ms:.1f}ms)")
+        return result
@@ -0,0 +1,328 @@
+"""
+OCR Word-Box Index
+
+This module provides a searchable index of the words Tesseract finds in an
+image. It handles:
+- Building word boxes from a single pytesseract.image_to_data (TSV) pass
+- Finding words and multi-word phrases, returning their location
+- Answering several queries from the same OCR pass
+- Reusing OCR results of unchanged tiles between captures of the same region
+"""
+
+from typing import Optional, Dict, Any, List, Tuple, Iterable
+from dataclasses import dataclass
+import logging
+import cv2
+import numpy as np
+import pytesseract
+
+from scout.change_detector import RegionChangeDetector
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class WordBox:
+    """
+    A single word recognized by Tesseract.
+
+    Attributes:
+        text: Recognized word
+        left: Left edge in image coordinates
+        top: Top edge in image coordinates
+        width: Box width in pixels
+        height: Box height in pixels
+        confidence: Tesseract word confidence (0-100)
+        line_key: Identifier of the text line the word belongs to
+        word_num: Position of the word in its line
+    """
+    text: str
+    left: int
+    top: int
+    width: int
+    height: int
+    confidence: float
+    line_key: Tuple[int, int, int, int] = (0, 0, 0, 0)
+    word_num: int = 0
+
+    def offset(self, dx: int, dy: int) -> 'WordBox':
+        """Return a copy of the box moved by (dx, dy)."""
+        return WordBox(self.text, self.left + dx, self.top + dy, self.width, self.height,
+                       self.confidence, self.line_key, self.word_num)
+
+@dataclass
+class TextMatch:
+    """
+    Location of a word or phrase found in the index.
+
+    Attributes:
+        text: The query that matched
+        left: Left edge of the matched words
+        top: Top edge of the matched words
+        width: Width of the matched words
+        height: Height of the matched words
+        confidence: Lowest word confidence of the matched words
+    """
+    text: str
+    left: int
+    top: int
+    width: int
+    height: int
+    confidence: float
+
+    @property
+    def center(self) -> Tuple[int, int]:
+        """Center of the match, e.g. as a click target."""
+        return (self.left + self.width // 2, self.top + self.height // 2)
+
+class WordBoxIndex:
+    """
+    Searchable collection of word boxes from one OCR pass.
+
+    Phrases are matched against consecutive words of the same text line, so a
+    query like "Attack now" finds the two words even though Tesseract reports
+    them as separate boxes.
+    """
+
+    def __init__(self, words: Iterable[WordBox]) -> None:
+        """
+        Initialize the index.
+
+        Args:
+            words: Recognized words in reading order
+        """
+        self.words: List[WordBox] = list(words)
+
+        # Group words by line (keeps reading order within a line)
+        self._lines: Dict[Tuple[int, int, int, int], List[WordBox]] = {}
+        for word in self.words:
+            self._lines.setdefault(word.line_key, []).append(word)
+
+    @classmethod
+    def from_image(cls, image: np.ndarray, config: str = '--psm 11',
+                   min_confidence: float = 0.0) -> 'WordBoxIndex':
+        """
+        Run OCR once and build an index of the recognized words.
+
+        Args:
+            image: Image to read (grayscale, BGR or BGRA)
+            config: Tesseract configuration string
+            min_confidence: Words below this confidence are ignored
+
+        Returns:
+            Index of the recognized words
+        """
+        if image.ndim == 3 and image.shape[2] == 4:
+            image = cv2.cvtColor(image, cv2.COLOR_BGRA2BGR)
+
+        data = pytesseract.image_to_data(image, config=config, output_type=pytesseract.Output.DICT)
+        return cls(cls._parse_data(data, min_confidence))
+
+    @staticmethod
+    def _parse_data(data: Dict[str, List[Any]], min_confidence: float) -> List[WordBox]:
+        """Convert image_to_data output into word boxes."""
+        words = []
+        for i, text in enumerate(data.get('text', [])):
+            text = str(text).strip()
+            if not text:
+                continue
+            confidence = float(data['conf'][i])
+            if confidence < min_confidence:
+                continue
+            words.append(WordBox(
+                text=text,
+                left=int(data['left'][i]),
+                top=int(data['top'][i]),
+                width=int(data['width'][i]),
+                height=int(data['height'][i]),
+                confidence=confidence,
+                line_key=(int(data['page_num'][i]), int(data['block_num'][i]),
+                          int(data['par_num'][i]), int(data['line_num'][i])),
+                word_num=int(data['word_num'][i])
+            ))
+        return words
+
+    @property
+    def text(self) -> str:
+        """Full text of the index, one line per text line."""
+        return "\n".join(" ".join(w.text for w in line) for line in self._lines.values())
+
+    def find(self, query: str, case_sensitive: bool = False) -> Optional[TextMatch]:
+        """
+        Find the first occurrence of a word or phrase.
+
+        The last query word may be a prefix/substring of a recognized word and
+        single-word queries match as substrings, mirroring the old
+        "text in ocr_result" behaviour.
+
+        Args:
+            query: Word or phrase to find
+            case_sensitive: Whether the search is case sensitive
+
+        Returns:
+            Location of the match, or None if not found
+        """
+        terms = query.split()
+        if not terms:
+            return None
+        if not case_sensitive:
+            terms = [t.lower() for t in terms]
+
+        for line in self._lines.values():
+            texts = [w.text if case_sensitive else w.text.lower() for w in line]
+            for start in range(len(texts) - len(terms) + 1):
+                if self._matches_at(texts, start, terms):
+                    return self._make_match(query, line[start:start + len(terms)])
+        return None
+
+    def find_all(self, queries: Iterable[str], case_sensitive: bool = False) -> Dict[str, Optional[TextMatch]]:
+        """
+        Look up several words or phrases in this OCR pass.
+
+        Args:
+            queries: Words or phrases to find
+            case_sensitive: Whether the search is case sensitive
+
+        Returns:
+            Mapping of query to its match (None if not found)
+        """
+        return {query: self.find(query, case_sensitive) for query in queries}
+
+    def find_first(self, queries: Iterable[str], case_sensitive: bool = False) -> Optional[TextMatch]:
+        """
+        Find the first of several queries that is present.
+
+        Args:
+            queries: Words or phrases in priority order
+            case_sensitive: Whether the search is case sensitive
+
+        Returns:
+            Match of the first query found, or None
+        """
+        for query in queries:
+            match = self.find(query, case_sensitive)
+            if match:
+                return match
+        return None
+
+    @staticmethod
+    def _matches_at(texts: List[str], start: int, terms: List[str]) -> bool:
+        """Check whether the terms match the line words starting at index start."""
+        if len(terms) == 1:
+            return terms[0] in texts[start]
+        # Inner words must match completely, outer words may be partial
+        for offset, term in enumerate(terms):
+            word = texts[start + offset]
+            if offset == 0:
+                if not word.endswith(term):
+                    return False
+            elif offset == len(terms) - 1:
+                if not word.startswith(term):
+                    return False
+            elif word != term:
+                return False
+        return True
+
+    @staticmethod
+    def _make_match(query: str, words: List[WordBox]) -> TextMatch:
+        """Build a match covering the given words."""
+        left = min(w.left for w in words)
+        top = min(w.top for w in words)
+        right = max(w.left + w.width for w in words)
+        bottom = max(w.top + w.height for w in words)
+        return TextMatch(query, left, top, right - left, bottom - top,
+                         min(w.confidence for w in words))
+
+class TiledWordIndexer:
+    """
+    Builds word indexes for repeated captures of the same region.
+
+    The region is split into horizontal bands that overlap by `overlap`
+    pixels. Each band keeps its own change detector and word boxes; only
+    bands whose pixels changed since the previous capture are sent to
+    Tesseract again. Changes are detected on the largest pixel difference at
+    full resolution, so a single changed glyph is enough to re-read its band. Words are assigned to the band whose core area contains
+    their vertical center, so words on band borders are neither lost nor
+    duplicated.
+    """
+
+    def __init__(self, band_height: int = 96, overlap: int = 32,
+                 config: str = '--psm 11', min_confidence: float = 0.0,
+                 change_threshold: float = 32.0) -> None:
+        """
+        Initialize the indexer.
+
+        Args:
+            band_height: Height of the core area of each band in pixels
+            overlap: Extra pixels captured above and below each band
+            config: Tesseract configuration string
+            min_confidence: Words below this confidence are ignored
+            change_threshold: Largest pixel difference (0-255) at which a band is re-read
+        """
+        self.band_height = max(16, band_height)
+        self.overlap = max(0, overlap)
+        self.config = config
+        self.min_confidence = min_confidence
+        self.change_threshold = change_threshold
+
+        self._shape: Optional[Tuple[int, ...]] = None
+        self._detectors: List[RegionChangeDetector] = []
+        self._band_words: List[List[WordBox]] = []
+
+        # Statistics
+        self.bands_read = 0
+        self.bands_reused = 0
+
+    def reset(self) -> None:
+        """Drop all cached bands."""
+        self._shape = None
+        self._detectors = []
+        self._band_words = []
+
+    def index(self, image: np.ndarray) -> WordBoxIndex:
+        """
+        Build the word index of an image, re-reading only changed bands.
+
+        Args:
+            image: Captured region (always the same region for one indexer)
+
+        Returns:
+            Index of all words in the image
+        """
+        height = image.shape[0]
+        band_count = max(1, (height + self.band_height - 1) // self.band_height)
+
+        # A different region size invalidates all cached bands
+        if self._shape != image.shape:
+            self._shape = image.shape
+            self._detectors = [RegionChangeDetector(threshold=self.change_threshold, downsample=1,
+                                                    metric="max")
+                               for _ in range(band_count)]
+            self._band_words = [[] for _ in range(band_count)]
+
+        words: List[WordBox] = []
+        for band in range(band_count):
+            core_top = band * self.band_height
+            core_bottom = min(height, core_top + self.band_height)
+            top = max(0, core_top - self.overlap)
+            bottom = min(height, core_bottom + self.overlap)
+            crop = image[top:bottom]
+
+            if self._detectors[band].has_changed(crop):
+                band_index = WordBoxIndex.from_image(crop, self.config, self.min_confidence)
+                band_words = []
+                for word in band_index.words:
+                    center_y = top + word.top + word.height // 2
+                    if core_top <= center_y < core_bottom:
+                        # Keep lines of different bands apart
+                        line_key = (band,) + word.line_key[1:]
+                        moved = word.offset(0, top)
+                        moved.line_key = line_key
+                        band_words.append(moved)
+                self._band_words[band] = band_words
+                self.bands_read += 1
+            else:
+                self.bands_reused += 1
+
+            words.extend(self._band_words[band])
+
+        return WordBoxIndex(words)
@@ -16,9 +16,14 @@ import win32con
 import win32api
 from scout.window_manager import WindowManager
 from scout.template_matcher import TemplateMatch, GroupedMatch, TemplateMatcher
+from scout.overlay_scene import OverlayScene, SceneItem, FrameTiming
+from scout.perf_stats import perf_stats
+from scout.overlay_qt import QtOverlayWindow
+from scout.overlay_motion import PanVelocityEstimator
+from scout.match_tracker import MatchTracker, TrackedMatch
 import logging
 from PyQt6.QtWidgets import QWidget
-from PyQt6.QtCore import QTimer, pyqtSignal, QRectF
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QRectF
 import time
 from PyQt6.QtGui import QColor, QPen
 from datetime import datetime
@@ -50,6 +55,8 @@ class Overlay(QWidget):
     
     # Signals
     visibility_changed = pyqtSignal(bool)  # Emitted when overlay visibility changes
+    match_appeared = pyqtSignal(object)  # TrackedMatch that passed the appear hysteresis
+    match_disappeared = pyqtSignal(object)  # TrackedMatch that was lost
     
     def __init__(self, window_manager: WindowManager, 
                  template_settings: Dict[str, Any], overlay_settings: Dict[str, Any]) -> None:
@@ -72,6 +79,10 @@ class Overlay(QWidget):
         self.window_hwnd = None  # Store window handle
         self.window_created = False  # Flag to track if window has been created
         
+        # Drawing backend: "opencv" (color-keyed HighGUI window) or "qt" (QPainter widget)
+        self.backend = overlay_settings.get("backend", "opencv")
+        self.qt_window: Optional[QtOverlayWindow] = None
+        
         # Add opacity attribute (default 0.7 = 70%)
         self.opacity = overlay_settings.get("opacity", 0.7)
         
@@ -87,9 +98,26 @@ class Overlay(QWidget):
         self.template_matching_timer = QTimer()
         self.template_matching_timer.timeout.connect(self._update_template_matching)
         
+        # Paced draw loop: renders the latest match snapshot at a fixed display rate,
+        # independent of how long template matching takes
+        self.display_rate = max(1.0, float(overlay_settings.get("display_rate", 30.0)))
         self.draw_timer = QTimer()
+        self.draw_timer.setTimerType(Qt.TimerType.PreciseTimer)
         self.draw_timer.timeout.connect(self._draw_overlay)
-        self.draw_timer.setInterval(33)  # ~30 FPS for drawing
+        self.draw_timer.setInterval(int(1000 / self.display_rate))
+        
+        # Opt-in performance HUD (rolling per-stage timings, refreshed twice per second
+        # so the changing numbers do not force a redraw on every frame)
+        self.perf_hud = overlay_settings.get("perf_hud", False)
+        self.perf_export_path = overlay_settings.get("perf_export_path", "")
+        self._hud_lines: List[str] = []
+        self._hud_updated = 0.0
+        if self.perf_hud:
+            perf_stats.set_enabled(True)
+        
+        # Extrapolate match boxes with the estimated pan velocity between match updates
+        self.interpolate_matches = overlay_settings.get("interpolate", True)
+        self.motion = PanVelocityEstimator()
         
         # Add match caching with group persistence
         self.cached_matches: List[Tuple[str, int, int, int, int, float]] = []  # Current cached matches
@@ -98,9 +126,16 @@ class Overlay(QWidget):
         self.match_persistence = template_settings.get("match_persistence", 3)  # Default to 3 frames if not in config
         self.distance_threshold = template_settings.get("distance_threshold", 100)  # Default to 100 pixels if not in config
         
-        # Reduce persistence for more responsive updates
-        self.match_persistence = 1  # Force to 1 frame to make matches disappear more quickly when moving
-        logger.info(f"Using match persistence of {self.match_persistence} frames for more responsive updates")
+        # Track matches across frames with stable IDs. Persistence is the disappear
+        # hysteresis; tracks follow moving matches, so it no longer has to be forced to 1
+        self.match_tracker = MatchTracker(
+            distance_threshold=self.distance_threshold,
+            appear_frames=template_settings.get("appear_frames", 1),
+            disappear_frames=self.match_persistence,
+            kalman_smoothing=template_settings.get("kalman_smoothing", False)
+        )
+        logger.info(f"Using match persistence of {self.match_persistence} frames "
+                    f"(appear after {self.match_tracker.appear_frames})")
         
         # Convert QColor to BGR format for OpenCV
         rect_color = overlay_settings["rect_color"]
@@ -122,6 +157,10 @@ class Overlay(QWidget):
         # Track last movement time for more frequent updates when moving
         self.last_movement_time = 0.0
         
+        # Retained-mode scene with a persistent canvas (only dirty areas are repainted)
+        self.scene = OverlayScene()
+        self._last_scene_content: List[SceneItem] = []
+        
         # Create template matcher and make it accessible
         self.template_matcher = TemplateMatcher(
             window_manager=self.window_manager,
@@ -198,6 +237,10 @@ class Overlay(QWidget):
         
         logger.debug(f"Creating overlay window at ({x}, {y}) with size {width}x{height}")
         
+        if self.backend == "qt":
+            self._create_qt_window(x, y, width, height)
+            return
+        
         try:
             # Create initial transparent overlay
             overlay = np.zeros((height, width, 3), dtype=np.uint8)
@@ -277,8 +320,26 @@ class Overlay(QWidget):
             logger.error(f"Error creating overlay window: {e}")
             return
 
+    def _create_qt_window(self, x: int, y: int, width: int, height: int) -> None:
+        """Create the Qt-native overlay window."""
+        if self.qt_window is None:
+            self.qt_window = QtOverlayWindow(self.window_name)
+        self.qt_window.setGeometry(x, y, width, height)
+        self.window_hwnd = int(self.qt_window.winId())
+        self.window_created = True
+        logger.debug(f"Created Qt overlay window with handle: {self.window_hwnd}")
+        
+        if self.active:
+            self.qt_window.show()
+            self._draw_overlay()
+        
     def _draw_empty_overlay(self) -> None:
         """Draw an empty transparent overlay to ensure window is properly initialized."""
+        if self.qt_window is not None:
+            self.qt_window.clear()
+            self._last_scene_content = []
+            return
+            
         if not self.window_hwnd or not win32gui.IsWindow(self.window_hwnd):
             return
             
@@ -293,12 +354,14 @@ class Overlay(QWidget):
             width = right - left
             height = bottom - top
             
-            # Create empty magenta background (for transparency)
-            overlay = np.zeros((height, width, 3), dtype=np.uint8)
-            overlay[:] = (255, 0, 255)  # Set background to magenta
+            # Clear the persistent canvas to magenta (for transparency); the next
+            # draw has to repaint everything
+            self.scene.resize(width, height)
+            self.scene.invalidate()
+            self._last_scene_content = []
             
             # Show the empty overlay
-            cv2.imshow(self.window_name, overlay)
+            cv2.imshow(self.window_name, self.scene.canvas)
             try:
                 cv2.waitKey(1)
             except (cv2.error, Exception) as e:
@@ -350,11 +413,15 @@ class Overlay(QWidget):
                 self.last_movement_time = time.time()
             
             # Update window position, size and ensure it's topmost
-            win32gui.SetWindowPos(
-                self.window_hwnd, win32con.HWND_TOPMOST,
-                x, y, width, height,
-                win32con.SWP_SHOWWINDOW | win32con.SWP_NOACTIVATE  # IMPORTANT: SWP_NOACTIVATE prevents stealing focus
-            )
+            if self.qt_window is not None:
+                if window_moved:
+                    self.qt_window.setGeometry(x, y, width, height)
+            else:
+                win32gui.SetWindowPos(
+                    self.window_hwnd, win32con.HWND_TOPMOST,
+                    x, y, width, height,
+                    win32con.SWP_SHOWWINDOW | win32con.SWP_NOACTIVATE  # IMPORTANT: SWP_NOACTIVATE prevents stealing focus
+                )
             
             # Calculate time since last movement
             since_last_movement = time.time() - self.last_movement_time
@@ -387,6 +454,8 @@ class Overlay(QWidget):
                         logger.debug("Significant window movement detected, clearing match cache")
                         if hasattr(self, 'cached_matches'):
                             self.cached_matches = []
+                            self.motion.reset()
+                            self._reset_tracks()
                         self.last_significant_pos = (x, y, width, height)
                 else:
                     self.last_significant_pos = (x, y, width, height)
@@ -396,6 +465,10 @@ class Overlay(QWidget):
 
     def _hide_window(self) -> None:
         """Hide the overlay window."""
+        if self.qt_window is not None:
+            self.qt_window.hide()
+            return
+            
         if not self.window_created or not self.window_hwnd:
             return
             
@@ -414,6 +487,11 @@ class Overlay(QWidget):
 
     def _show_window(self) -> None:
         """Show the overlay window."""
+        if self.qt_window is not None:
+            self._update_window_position()
+            self.qt_window.show()
+            return
+            
         if not self.window_created or not self.window_hwnd:
             # Create window if it doesn't exist
             self.create_overlay_window()
@@ -509,8 +587,10 @@ class Overlay(QWidget):
             # Force an immediate update to populate matches
             QTimer.singleShot(100, self._update_template_matching)
             
-            # Also force a redraw
-            QTimer.singleShot(200, self._draw_overlay)
+            # Start the paced draw loop
+            self.motion.reset()
+            self.draw_timer.start()
+            logger.info(f"Overlay draw loop started at {self.display_rate:.0f} FPS")
         else:
             logger.debug("Template matching already active")
             
@@ -618,19 +698,18 @@ class Overlay(QWidget):
             return
             
         try:
-            # Start with empty matches list
-            self.cached_matches = []
-            
             # Get current time and check if we're in a movement state
             current_time = time.time()
             is_moving = (current_time - self.last_movement_time) < 1.0
+            perf_stats.tick("match", self.template_matching_timer.interval() / 1000.0)
             
             # Always get a completely fresh screenshot - clear any caches first
             if hasattr(self.window_manager, 'clear_screenshot_cache'):
                 self.window_manager.clear_screenshot_cache()
                 
             # Get fresh screenshot
-            screenshot = self.window_manager.capture_screenshot(force_update=True)
+            with perf_stats.measure("capture"):
+                screenshot = self.window_manager.capture_screenshot(force_update=True)
             
             if screenshot is None:
                 logger.warning("Failed to capture screenshot for template matching")
@@ -680,11 +759,14 @@ class Overlay(QWidget):
                             
                         filtered_matches.append(match)
                         
-                    self.cached_matches = filtered_matches
                     logger.debug(f"After filtering, kept {len(filtered_matches)} matches")
                 else:
+                    filtered_matches = []
                     logger.debug("No matches found in this update")
                 
+                # Associate with tracked matches (stable IDs, appear/disappear hysteresis)
+                self.cached_matches = self._update_tracks(filtered_matches, current_time)
+                
                 # If we're in debug mode, log detailed match info
                 if self.debug_mode and self.cached_matches:
                     match_info = []
@@ -693,8 +775,13 @@ class Overlay(QWidget):
                         match_info.append(f"{name} at ({x},{y}) conf={conf:.2f}")
                     logger.debug(f"Match details: {', '.join(match_info)}")
                 
-                # Update the overlay display
-                self._draw_overlay()
+                # Publish the snapshot for the draw loop (velocity is used to
+                # interpolate boxes until the next snapshot arrives)
+                self.motion.update(self.cached_matches, current_time)
+                
+                # Without the paced draw loop, draw right away
+                if not self.draw_timer.isActive():
+                    self._draw_overlay()
                 
                 # If we're moving, schedule another update soon to keep matches fresh
                 if is_moving:
@@ -707,6 +794,171 @@ class Overlay(QWidget):
             # Clear matches on error
             self.cached_matches = []
 
+    def _update_tracks(self, matches: List[Tuple[str, int, int, int, int, float]],
+                       timestamp: float) -> List[Tuple[str, int, int, int, int, float]]:
+        """
+        Feed new detections to the match tracker and emit appear/disappear events.
+        
+        Args:
+            matches: Filtered detections of the current frame
+            timestamp: Capture time of the frame
+            
+        Returns:
+            Confirmed tracked matches in the (name, x, y, w, h, conf) format
+        """
+        update = self.match_tracker.update(matches, timestamp)
+        for track in update.appeared:
+            logger.debug(f"New match #{track.track_id}: {track.name} at ({track.x}, {track.y})")
+            self.match_appeared.emit(track)
+        for track in update.disappeared:
+            logger.debug(f"Lost match #{track.track_id}: {track.name}")
+            self.match_disappeared.emit(track)
+        return self.match_tracker.get_matches()
+
+    def get_match_at(self, x: int, y: int, radius: int = 0) -> Optional[TrackedMatch]:
+        """
+        Hit-test the tracked matches.
+        
+        Args:
+            x: X coordinate in overlay window pixels
+            y: Y coordinate in overlay window pixels
+            radius: Extra distance (pixels) around the match boxes
+            
+        Returns:
+            Tracked match at the point, or None
+        """
+        return self.match_tracker.track_at(x, y, radius)
+
+    def _visible_matches(self, width: int, height: int) -> List[Tuple[str, int, int, int, int, float]]:
+        """
+        Get the tracked matches that can be visible in the window, moved to their current position.
+        
+        Args:
+            width: Overlay width in pixels
+            height: Overlay height in pixels
+            
+        Returns:
+            Matches in the (name, x, y, w, h, conf) format
+        """
+        now = time.time()
+        dx, dy = self.motion.offset_at(now) if self.interpolate_matches else (0, 0)
+        
+        # The tracker index holds match centers, so widen the window by the largest match
+        margin = max((max(m[3], m[4]) for m in self.cached_matches), default=0)
+        tracks = self.match_tracker.tracks_in(-dx - margin, -dy - margin,
+                                              width - dx + margin, height - dy + margin)
+        matches = [track.as_tuple() for track in tracks]
+        if self.interpolate_matches and matches:
+            matches = self.motion.extrapolate(matches, now)
+        return matches
+
+    def _reset_tracks(self) -> None:
+        """Drop all tracked matches, emitting disappear events."""
+        for track in self.match_tracker.reset().disappeared:
+            self.match_disappeared.emit(track)
+
+    def _build_scene_items(self, width: int, height: int) -> Tuple[List[SceneItem], int]:
+        """
+        Build the overlay content as scene items.
+        
+        Args:
+            width: Overlay width in pixels
+            height: Overlay height in pixels
+            
+        Returns:
+            Tuple of (items in painting order, number of drawn matches)
+        """
+        items: List[SceneItem] = []
+        
+        # Always draw a testing circle in the corner to verify overlay is working
+        items.append(SceneItem("circle", 50, 50, color=(0, 0, 255), thickness=-1, radius=20))  # Red circle
+        items.append(SceneItem("text", 80, 55, color=(0, 255, 255), thickness=2, text="OVERLAY ACTIVE", font_scale=0.7))
+        
+        # Draw template matches in the window (moved to their estimated current position)
+        draw_count = 0
+        matches = self._visible_matches(width, height) if self.cached_matches else []
+        if matches:
+            # Sort matches by confidence (highest first)
+            sorted_matches = sorted(matches, key=lambda m: m[5], reverse=True)
+            
+            # Limit to top 50 matches to avoid clutter and ensure performance
+            if not self.debug_visuals:
+                sorted_matches = sorted_matches[:50]
+            
+            labels: List[SceneItem] = []
+            for i, match in enumerate(sorted_matches):
+                # Extract match information
+                template_name, x, y, match_width, match_height, confidence = match
+                
+                # Validate coordinates and size
+                if match_width <= 0 or match_height <= 0:
+                    logger.warning(f"Invalid match dimensions: {match_width}x{match_height} for {template_name}")
+                    continue
+                    
+                if x < 0 or y < 0:
+                    # Adjust to visible area
+                    match_width = match_width + x if x < 0 else match_width
+                    match_height = match_height + y if y < 0 else match_height
+                    x = max(0, x)
+                    y = max(0, y)
+                    if match_width <= 0 or match_height <= 0:
+                        continue
+                        
+                # Skip if position is outside the window
+                if x >= width or y >= height:
+                    continue
+                
+                # Choose color based on confidence - using much brighter colors for visibility
+                if confidence >= 0.8:
+                    rect_color = (0, 255, 0)  # Green for high confidence
+                elif confidence >= 0.7:
+                    rect_color = (0, 255, 255)  # Yellow for medium confidence
+                elif confidence >= 0.5 or self.debug_visuals:
+                    rect_color = (0, 0, 255)  # Red for low confidence
+                else:
+                    # Skip drawing if confidence is too low and not in debug mode
+                    continue
+                
+                # Draw rectangle with thicker lines for better visibility
+                thickness = 3 if confidence >= 0.8 else 2
+                items.append(SceneItem("rect", x, y, match_width, match_height, color=rect_color, thickness=thickness))
+                
+                # Draw text label (black background, white text) above the rectangle
+                if self.debug_visuals or confidence >= 0.7:
+                    labels.append(SceneItem(
+                        "text", x, y - 5, color=(255, 255, 255), thickness=2,
+                        text=f"{template_name} ({confidence:.2f})", font_scale=0.6, background=(0, 0, 0)
+                    ))
+                
+                draw_count += 1
+            
+            # Labels are painted on top of all rectangles
+            items.extend(labels)
+        
+        # Draw debug visuals if enabled
+        if self.debug_visuals:
+            # Draw circle at top-left corner for debugging
+            items.append(SceneItem("circle", 10, 10, color=(0, 0, 255), thickness=-1, radius=5))
+            items.append(SceneItem("text", 20, 20, color=(0, 255, 255), text=f"Overlay Active - Matches: {draw_count}"))
+            items.append(SceneItem("text", 20, 40, color=(0, 255, 255), text=f"Time: {time.strftime('%H:%M:%S')}"))
+            
+            # Draw red rectangles at each corner for debugging
+            for corner_x, corner_y in ((0, 0), (width - 20, 0), (0, height - 20), (width - 20, height - 20)):
+                items.append(SceneItem("rect", corner_x, corner_y, 20, 20, color=(0, 0, 255), thickness=1))
+        
+        # Draw debug info if enabled
+        if self.show_debug_info:
+            left, top = getattr(self, 'last_window_pos', (0, 0, 0, 0))[:2]
+            info_lines = [
+                f"Window: {self.window_manager.window_title} ({self.window_hwnd})",
+                f"Position: ({left}, {top}) Size: {width}x{height}",
+                f"Matches: {len(self.cached_matches)} (Drawn: {draw_count})"
+            ]
+            for i, line in enumerate(info_lines):
+                items.append(SceneItem("text", 20, height - 60 + i * 20, color=(0, 255, 255), text=line))
+        
+        return items, draw_count
+
     def _draw_overlay(self) -> None:
         """Draw the overlay with all registered elements."""
         if not self.window_hwnd or not win32gui.IsWindow(self.window_hwnd):
@@ -714,6 +966,9 @@ class Overlay(QWidget):
             return
             
         try:
+            perf_stats.tick("draw", 1.0 / self.display_rate if self.draw_timer.isActive() else None)
+            draw_start = time.perf_counter()
+            
             # Get window position and size - ensure position is synced
             pos = self.window_manager.get_window_rect()
             if not pos:
@@ -725,136 +980,41 @@ class Overlay(QWidget):
             width = right - left
             height = bottom - top
             
-            # Create a transparent overlay
-            overlay_image = np.zeros((height, width, 3), dtype=np.uint8)
-            overlay_image[:] = (255, 0, 255)  # Magenta for transparency
-            
-            # Always draw a testing circle in the corner to verify overlay is working
-            cv2.circle(overlay_image, (50, 50), 20, (0, 0, 255), -1)  # Red circle
-            cv2.putText(overlay_image, "OVERLAY ACTIVE", (80, 55), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 255), 2)
+            # Keep the persistent canvas in sync with the window size
+            if self.qt_window is None:
+                self.scene.resize(width, height)
             
-            # Draw template matches if available
-            draw_count = 0
-            if hasattr(self, 'cached_matches') and self.cached_matches:
-                match_count = len(self.cached_matches)
-                logger.debug(f"Drawing {match_count} template matches")
-                
-                # Sort matches by confidence (highest first)
-                sorted_matches = sorted(self.cached_matches, key=lambda m: m[5], reverse=True)
-                
-                # Limit to top 50 matches to avoid clutter and ensure performance
-                if not self.debug_visuals:
-                    sorted_matches = sorted_matches[:50]
-                
-                # Count matches by confidence range
-                high_conf_count = 0
-                med_conf_count = 0
-                low_conf_count = 0
-                
-                for i, match in enumerate(sorted_matches):
-                    try:
-                        # Extract match information
-                        template_name, x, y, width, height, confidence = match
-                        
-                        # Validate coordinates and size
-                        if width <= 0 or height <= 0:
-                            logger.warning(f"Invalid match dimensions: {width}x{height} for {template_name}")
-                            continue
-                            
-                        if x < 0 or y < 0:
-                            logger.warning(f"Negative coordinates: ({x}, {y}) for {template_name}")
-                            # Adjust to visible area
-                            width = width + x if x < 0 else width
-                            height = height + y if y < 0 else height
-                            x = max(0, x)
-                            y = max(0, y)
-                            if width <= 0 or height <= 0:
-                                continue
-                                
-                        # Skip if position is outside the window
-                        if x >= right - left or y >= bottom - top:
-                            logger.warning(f"Coordinates outside window: ({x}, {y}) for {template_name}")
-                            continue
-                        
-                        # Choose color based on confidence - using much brighter colors for visibility
-                        if confidence >= 0.8:
-                            rect_color = (0, 255, 0)  # Green for high confidence
-                            high_conf_count += 1
-                        elif confidence >= 0.7:
-                            rect_color = (0, 255, 255)  # Yellow for medium confidence
-                            med_conf_count += 1
-                        elif confidence >= 0.5 or self.debug_visuals:
-                            rect_color = (0, 0, 255)  # Red for low confidence
-                            low_conf_count += 1
-                        else:
-                            # Skip drawing if confidence is too low and not in debug mode
-                            continue
-                        
-                        # Draw rectangle with thicker lines for better visibility
-                        thickness = 3 if confidence >= 0.8 else 2  # Thicker lines for visibility
-                        cv2.rectangle(overlay_image, (x, y), (x + width, y + height), rect_color, thickness)
-                        
-                        # Draw text label
-                        if self.debug_visuals or confidence >= 0.7:
-                            # Prepare text
-                            text = f"{template_name} ({confidence:.2f})"
-                            
-                            # Calculate text size and position
-                            font = cv2.FONT_HERSHEY_SIMPLEX
-                            font_scale = 0.6  # Slightly larger font
-                            text_thickness = 2  # Thicker text for visibility
-                            (text_width, text_height), _ = cv2.getTextSize(text, font, font_scale, text_thickness)
-                            
-                            # Draw background for text
-                            text_bg_color = (0, 0, 0)  # Black background for text
-                            cv2.rectangle(overlay_image, (x, y - text_height - 5), (x + text_width, y), text_bg_color, -1)
-                            
-                            # Draw text
-                            cv2.putText(overlay_image, text, (x, y - 5), font, font_scale, (255, 255, 255), text_thickness)
-                        
-                        draw_count += 1
-                    except Exception as e:
-                        logger.warning(f"Error drawing match {i}: {e}")
-                
-                # Log counts by confidence level
-                logger.debug(f"Match confidence breakdown - High: {high_conf_count}, Medium: {med_conf_count}, Low: {low_conf_count}")
+            items, draw_count = self._build_scene_items(width, height)
+            if self.perf_hud:
+                items.extend(self._build_hud_items(width))
             
-            # Draw debug visuals if enabled
-            if self.debug_visuals:
-                # Draw circle at top-left corner for debugging
-                cv2.circle(overlay_image, (10, 10), 5, (0, 0, 255), -1)
-                
-                # Draw debug text
-                debug_text = f"Overlay Active - Matches: {draw_count}"
-                cv2.putText(overlay_image, debug_text, (20, 20), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 255), 1)
-                
-                # Show current time
-                time_text = f"Time: {time.strftime('%H:%M:%S')}"
-                cv2.putText(overlay_image, time_text, (20, 40), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 255), 1)
-                
-                # Draw red rectangles at each corner for debugging
-                cv2.rectangle(overlay_image, (0, 0), (20, 20), (0, 0, 255), 1)
-                cv2.rectangle(overlay_image, (width-20, 0), (width, 20), (0, 0, 255), 1)
-                cv2.rectangle(overlay_image, (0, height-20), (20, height), (0, 0, 255), 1)
-                cv2.rectangle(overlay_image, (width-20, height-20), (width, height), (0, 0, 255), 1)
+            # Skip the redraw entirely if the content did not change
+            if items == self._last_scene_content:
+                self._render_timing().frames_skipped += 1
+                return
+            self._last_scene_content = items
             
-            # Draw debug info if enabled
+            # Frame timing of the previous render (only shown when content changes,
+            # otherwise the changing numbers would force a redraw every frame)
             if self.show_debug_info:
-                # Draw debug information at bottom of screen
-                window_text = f"Window: {self.window_manager.window_title} ({self.window_hwnd})"
-                cv2.putText(overlay_image, window_text, (20, height - 60), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 255), 1)
-                
-                # Show window position and size
-                pos_text = f"Position: ({left}, {top}) Size: {width}x{height}"
-                cv2.putText(overlay_image, pos_text, (20, height - 40), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 255), 1)
-                
-                # Show match count
-                if hasattr(self, 'cached_matches'):
-                    match_text = f"Matches: {len(self.cached_matches)} (Drawn: {draw_count})"
-                    cv2.putText(overlay_image, match_text, (20, height - 20), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 255), 1)
+                items = items + [SceneItem("text", 20, height - 80, color=(0, 255, 255),
+                                           text=self._render_timing().format())]
+            
+            # Qt backend: invalidate the changed items, Qt repaints only those areas
+            if self.qt_window is not None:
+                perf_stats.record("draw", (time.perf_counter() - draw_start) * 1000)
+                with perf_stats.measure("present"):
+                    self.qt_window.set_items(items)
+                return
+            
+            if not self.scene.update(items):
+                return
+            logger.debug(f"Overlay scene updated with {draw_count} matches: {self.scene.timing.format()}")
+            perf_stats.record("draw", (time.perf_counter() - draw_start) * 1000)
+            present_start = time.perf_counter()
             
             # Display the overlay
-            cv2.imshow(self.window_name, overlay_image)
+            cv2.imshow(self.window_name, self.scene.canvas)
             cv2.waitKey(1)  # Update the window, required for OpenCV
             
             # Ensure the window stays on top
@@ -873,11 +1033,70 @@ class Overlay(QWidget):
                 180,  # Alpha (0-255), higher value makes non-magenta pixels more visible
                 win32con.LWA_COLORKEY | win32con.LWA_ALPHA
             )
+            perf_stats.record("present", (time.perf_counter() - present_start) * 1000)
             
-            logger.debug(f"Overlay drawing completed successfully")
         except Exception as e:
             logger.error(f"Error drawing overlay: {e}", exc_info=True)
 
+    def _build_hud_items(self, width: int) -> List[SceneItem]:
+        """
+        Build the performance HUD (top right of the overlay).
+        
+        Args:
+            width: Overlay width in pixels
+            
+        Returns:
+            Text items with the rolling stage timings, loop rates and dropped frames
+        """
+        now = time.time()
+        if now - self._hud_updated >= 0.5:
+            self._hud_lines = ["Perf (p50 / p95)"] + perf_stats.format_lines()
+            self._hud_updated = now
+        
+        x = max(20, width - 420)
+        return [SceneItem("text", x, 100 + i * 18, color=(255, 255, 0), text=line,
+                          font_scale=0.45, background=(0, 0, 0))
+                for i, line in enumerate(self._hud_lines)]
+
+    def set_perf_hud(self, enabled: bool) -> None:
+        """
+        Show or hide the performance HUD (enables timing collection while shown).
+        
+        Args:
+            enabled: Whether the HUD is shown
+        """
+        self.perf_hud = enabled
+        perf_stats.set_enabled(enabled)
+        self._hud_updated = 0.0
+        self._last_scene_content = None
+        logger.info(f"Performance HUD {'enabled' if enabled else 'disabled'}")
+
+    def export_perf_stats(self, path: Optional[str] = None) -> bool:
+        """
+        Export the collected timing statistics to a JSON file.
+        
+        Args:
+            path: Target file (default: the configured perf_export_path)
+            
+        Returns:
+            True if the file was written
+        """
+        path = path or self.perf_export_path
+        if not path:
+            logger.warning("No performance export path configured")
+            return False
+        return perf_stats.export(path, extra={
+            "target_frequency": self.update_rate,
+            "display_rate": self.display_rate,
+            "confidence": getattr(self.template_matcher, 'confidence_threshold', None),
+            "match_persistence": self.match_persistence,
+            "distance_threshold": self.distance_threshold,
+        })
+
+    def _render_timing(self) -> FrameTiming:
+        """Get the frame timing of the active drawing backend."""
+        return self.qt_window.timing if self.qt_window is not None else self.scene.timing
+
     def stop_template_matching(self) -> None:
         """Stop template matching."""
         logger.info("Stopping template matching")
@@ -906,12 +1125,18 @@ class Overlay(QWidget):
             self.draw_timer.stop()
             logger.debug("Stopped draw timer")
         
+        # Keep the timing data of this session for tuning
+        if self.perf_hud and self.perf_export_path:
+            self.export_perf_stats()
+        
         # Reset template matcher frequency
         self.template_matcher.update_frequency = 0.0
         self.template_matcher.last_update_time = 0.0
         
         # Clear match cache
         self.cached_matches = []
+        self.motion.reset()
+        self._reset_tracks()
         self.match_counters.clear()
         
         # Hide window but never destroy it
@@ -959,6 +1184,8 @@ class Overlay(QWidget):
         logger.debug("Clearing overlay matches")
         # Clear match cache
         self.cached_matches = []
+        self.motion.reset()
+        self._reset_tracks()
         self.match_counters.clear()
         
         # Force redraw
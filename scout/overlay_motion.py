@@ -0,0 +1,141 @@
+"""
+Overlay Motion Estimation
+
+This module estimates how fast the game view is panning from consecutive
+template matching results. It handles:
+- Pairing matches of the same template between two match snapshots
+- Estimating the global pan velocity (median displacement, smoothed)
+- Extrapolating match boxes to the current time for the overlay draw loop
+
+With this the overlay can be drawn at a fixed display rate while template
+matching runs at its own (slower, irregular) rate.
+"""
+
+from typing import List, Tuple, Optional
+import logging
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+Match = Tuple[str, int, int, int, int, float]  # name, x, y, width, height, confidence
+
+class PanVelocityEstimator:
+    """
+    Estimates the global pan velocity of the game view in pixels per second.
+
+    Matches of the same template in two consecutive snapshots are paired by
+    nearest center. The median displacement of all pairs is robust against
+    a few wrong pairings and against objects that appear or disappear.
+    """
+
+    def __init__(self, max_pair_distance: float = 150.0, smoothing: float = 0.5,
+                 max_extrapolation: float = 0.5) -> None:
+        """
+        Initialize the estimator.
+
+        Args:
+            max_pair_distance: Maximum center distance (pixels) for pairing two matches
+            smoothing: Weight of the new measurement in the moving average (0-1)
+            max_extrapolation: Maximum time (seconds) boxes are extrapolated ahead
+        """
+        self.max_pair_distance = max_pair_distance
+        self.smoothing = smoothing
+        self.max_extrapolation = max_extrapolation
+
+        self.velocity = (0.0, 0.0)  # pixels per second
+        self._previous: List[Match] = []
+        self._previous_time: Optional[float] = None
+
+    def reset(self) -> None:
+        """Forget previous snapshots and set the velocity to zero."""
+        self.velocity = (0.0, 0.0)
+        self._previous = []
+        self._previous_time = None
+
+    def update(self, matches: List[Match], timestamp: float) -> Tuple[float, float]:
+        """
+        Feed a new match snapshot and update the velocity estimate.
+
+        Args:
+            matches: Matches of the new snapshot
+            timestamp: Time the snapshot was captured (seconds)
+
+        Returns:
+            Smoothed velocity (vx, vy) in pixels per second
+        """
+        if self._previous_time is not None and timestamp > self._previous_time:
+            displacement = self._median_displacement(self._previous, matches)
+            dt = timestamp - self._previous_time
+            if displacement is not None:
+                measured = (displacement[0] / dt, displacement[1] / dt)
+            else:
+                # Nothing to pair - assume the view stopped
+                measured = (0.0, 0.0)
+            a = self.smoothing
+            self.velocity = (self.velocity[0] * (1 - a) + measured[0] * a,
+                             self.velocity[1] * (1 - a) + measured[1] * a)
+            # Snap tiny velocities to zero so a resting view does not drift
+            if abs(self.velocity[0]) < 1.0 and abs(self.velocity[1]) < 1.0:
+                self.velocity = (0.0, 0.0)
+
+        self._previous = list(matches)
+        self._previous_time = timestamp
+        return self.velocity
+
+    def offset_at(self, timestamp: float) -> Tuple[int, int]:
+        """
+        Get the extrapolated offset of the last snapshot at a given time.
+
+        Args:
+            timestamp: Current time (seconds)
+
+        Returns:
+            Offset (dx, dy) in whole pixels
+        """
+        if self._previous_time is None:
+            return (0, 0)
+        dt = min(max(0.0, timestamp - self._previous_time), self.max_extrapolation)
+        return (int(round(self.velocity[0] * dt)), int(round(self.velocity[1] * dt)))
+
+    def extrapolate(self, matches: List[Match], timestamp: float) -> List[Match]:
+        """
+        Move matches by the extrapolated pan offset.
+
+        Args:
+            matches: Matches of the last snapshot
+            timestamp: Current time (seconds)
+
+        Returns:
+            Matches moved to their estimated current position
+        """
+        dx, dy = self.offset_at(timestamp)
+        if dx == 0 and dy == 0:
+            return matches
+        return [(name, x + dx, y + dy, w, h, conf) for name, x, y, w, h, conf in matches]
+
+    def _median_displacement(self, previous: List[Match], current: List[Match]) -> Optional[Tuple[float, float]]:
+        """Median displacement of matches paired by template name and nearest center."""
+        if not previous or not current:
+            return None
+
+        displacements = []
+        for name, x, y, w, h, _ in current:
+            cx, cy = x + w / 2, y + h / 2
+            best = None
+            best_distance = self.max_pair_distance
+            for p_name, px, py, pw, ph, _ in previous:
+                if p_name != name:
+                    continue
+                dx = cx - (px + pw / 2)
+                dy = cy - (py + ph / 2)
+                distance = (dx * dx + dy * dy) ** 0.5
+                if distance <= best_distance:
+                    best_distance = distance
+                    best = (dx, dy)
+            if best is not None:
+                displacements.append(best)
+
+        if not displacements:
+            return None
+        values = np.asarray(displacements, dtype=np.float64)
+        return (float(np.median(values[:, 0])), float(np.median(values[:, 1])))
@@ -0,0 +1,181 @@
+"""
+Qt Overlay Window
+
+This module provides a Qt-native overlay backend as an alternative to the
+OpenCV HighGUI window. It handles:
+- A frameless, translucent, click-through top-level QWidget
+- Painting overlay scene items as vector primitives with QPainter
+- Invalidating only the areas of items that were added or removed
+
+Because Qt only repaints invalidated regions, the drawing cost scales with
+the number of changed matches instead of the window area, and there is no
+full-frame copy or color-keyed composite.
+"""
+
+from typing import Optional, List, Set, Tuple
+import logging
+import time
+from PyQt6.QtWidgets import QWidget
+from PyQt6.QtCore import Qt, QRect, QPoint
+from PyQt6.QtGui import QPainter, QPen, QColor, QFont, QFontMetrics, QPaintEvent
+
+from scout.overlay_scene import SceneItem, FrameTiming
+
+logger = logging.getLogger(__name__)
+
+# Pixel height of Hershey simplex text at font scale 1.0 (used to size Qt fonts)
+HERSHEY_PIXEL_HEIGHT = 22
+
+def _qcolor(bgr: Tuple[int, int, int]) -> QColor:
+    """Convert an OpenCV BGR tuple into a QColor."""
+    return QColor(bgr[2], bgr[1], bgr[0])
+
+class QtOverlayWindow(QWidget):
+    """
+    Transparent click-through overlay window painted with QPainter.
+
+    The window accepts the same SceneItems as the OpenCV overlay scene, so
+    the Overlay class can switch backends without changing what it draws.
+    """
+
+    def __init__(self, title: str = "TB Scout Overlay") -> None:
+        """
+        Initialize the overlay window (hidden).
+
+        Args:
+            title: Window title
+        """
+        super().__init__(None, Qt.WindowType.FramelessWindowHint |
+                         Qt.WindowType.WindowStaysOnTopHint |
+                         Qt.WindowType.Tool |
+                         Qt.WindowType.WindowTransparentForInput)
+        self.setWindowTitle(title)
+        self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
+        self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+        self.setAttribute(Qt.WidgetAttribute.WA_ShowWithoutActivating)
+        self.setAttribute(Qt.WidgetAttribute.WA_NoSystemBackground)
+
+        self.items: List[SceneItem] = []
+        self._item_set: Set[SceneItem] = set()
+        self._fonts = {}
+        self.timing = FrameTiming()
+
+        logger.debug("Qt overlay window created")
+
+    def set_items(self, items: List[SceneItem]) -> bool:
+        """
+        Replace the displayed items, invalidating only the changed areas.
+
+        Args:
+            items: Items in painting order (later items are drawn on top)
+
+        Returns:
+            True if a repaint was scheduled, False if nothing changed
+        """
+        new_set = set(items)
+        if new_set == self._item_set and items == self.items:
+            self.timing.frames_skipped += 1
+            return False
+
+        changed = (self._item_set - new_set) | (new_set - self._item_set)
+        if not changed:
+            # Only the order changed
+            changed = new_set
+
+        self.items = list(items)
+        self._item_set = new_set
+
+        dirty_area = 0
+        for item in changed:
+            rect = self._item_rect(item)
+            dirty_area += rect.width() * rect.height()
+            self.update(rect)
+
+        window_area = max(1, self.width() * self.height())
+        self.timing.last_dirty_fraction = min(1.0, dirty_area / window_area)
+        return True
+
+    def clear(self) -> None:
+        """Remove all items."""
+        self.set_items([])
+
+    def _font(self, item: SceneItem) -> QFont:
+        """Get the (cached) font for a text item."""
+        key = (item.font_scale, item.thickness)
+        font = self._fonts.get(key)
+        if font is None:
+            font = QFont("Arial")
+            font.setPixelSize(max(6, int(HERSHEY_PIXEL_HEIGHT * item.font_scale)))
+            font.setBold(item.thickness >= 2)
+            self._fonts[key] = font
+        return font
+
+    def _item_rect(self, item: SceneItem) -> QRect:
+        """Get the widget area an item paints (with a small margin)."""
+        if item.kind == "text":
+            metrics = QFontMetrics(self._font(item))
+            width = metrics.horizontalAdvance(item.text)
+            top = item.y - metrics.ascent()
+            bottom = item.y + max(metrics.descent(), 5 if item.background else 0)
+            return QRect(item.x - 2, top - 2, width + 4, bottom - top + 4)
+        x1, y1, x2, y2 = item.bounds()
+        return QRect(x1 - 1, y1 - 1, x2 - x1 + 2, y2 - y1 + 2)
+
+    def paintEvent(self, event: QPaintEvent) -> None:
+        """Paint all items that intersect the invalidated region."""
+        start = time.perf_counter()
+        painter = QPainter(self)
+        try:
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing, False)
+            painter.setRenderHint(QPainter.RenderHint.TextAntialiasing, True)
+            clip = event.rect()
+
+            # Clear the invalidated area to fully transparent
+            painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_Source)
+            painter.fillRect(clip, Qt.GlobalColor.transparent)
+            painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_SourceOver)
+
+            for item in self.items:
+                if self._item_rect(item).intersects(clip):
+                    self._paint_item(painter, item)
+        finally:
+            painter.end()
+
+        elapsed = (time.perf_counter() - start) * 1000
+        self.timing.frames_rendered += 1
+        self.timing.last_render_ms = elapsed
+        self.timing.average_render_ms = (elapsed if self.timing.frames_rendered == 1
+                                         else self.timing.average_render_ms * 0.9 + elapsed * 0.1)
+
+    def _paint_item(self, painter: QPainter, item: SceneItem) -> None:
+        """Paint a single scene item."""
+        color = _qcolor(item.color)
+
+        if item.kind in ("rect", "filled_rect"):
+            if item.kind == "filled_rect" or item.thickness < 0:
+                painter.fillRect(item.x, item.y, item.width, item.height, color)
+            else:
+                painter.setPen(QPen(color, item.thickness))
+                painter.setBrush(Qt.BrushStyle.NoBrush)
+                painter.drawRect(item.x, item.y, item.width, item.height)
+
+        elif item.kind == "circle":
+            center = QPoint(item.x, item.y)
+            if item.thickness < 0:
+                painter.setPen(Qt.PenStyle.NoPen)
+                painter.setBrush(color)
+            else:
+                painter.setPen(QPen(color, item.thickness))
+                painter.setBrush(Qt.BrushStyle.NoBrush)
+            painter.drawEllipse(center, item.radius, item.radius)
+
+        elif item.kind == "text":
+            font = self._font(item)
+            painter.setFont(font)
+            if item.background is not None:
+                metrics = QFontMetrics(font)
+                painter.fillRect(item.x, item.y - metrics.ascent(),
+                                 metrics.horizontalAdvance(item.text), metrics.ascent() + 5,
+                                 _qcolor(item.background))
+            painter.setPen(color)
+            painter.drawText(item.x, item.y, item.text)
@@ -0,0 +1,241 @@
+"""
+Overlay Scene
+
+This module provides a retained-mode scene for the overlay window.
+It handles:
+- Describing overlay content as immutable drawing items
+- Keeping a persistent canvas between redraws
+- Diffing the previous and the new item set
+- Repainting only the dirty rectangles (or nothing if the scene is unchanged)
+- Frame timing statistics for the overlay debug info
+"""
+
+from typing import Optional, List, Tuple, Iterable, Set
+from dataclasses import dataclass
+import logging
+import time
+import cv2
+import numpy as np
+
+from scout.label_cache import LabelSprite, label_cache
+
+logger = logging.getLogger(__name__)
+
+# Background color of the overlay canvas (BGR), keyed out by the overlay window
+TRANSPARENT_COLOR = (255, 0, 255)
+
+# If more than this fraction of the canvas is dirty, repaint everything at once
+FULL_REDRAW_FRACTION = 0.5
+
+Rect = Tuple[int, int, int, int]  # x1, y1, x2, y2 (exclusive)
+
+@dataclass(frozen=True)
+class SceneItem:
+    """
+    A single drawing primitive of the overlay scene.
+
+    Items are immutable and hashable so two scenes can be diffed with set
+    operations. Coordinates are in overlay window pixels.
+
+    Attributes:
+        kind: "rect", "filled_rect", "circle" or "text"
+        x: Left edge (rect), center x (circle) or text origin x
+        y: Top edge (rect), center y (circle) or text baseline y
+        width: Rectangle width (unused for circle and text)
+        height: Rectangle height (unused for circle and text)
+        color: BGR color
+        thickness: Line thickness (-1 fills rectangles and circles)
+        radius: Circle radius
+        text: Text to draw
+        font_scale: Hershey font scale for text
+        background: Optional BGR background color drawn behind text
+    """
+    kind: str
+    x: int
+    y: int
+    width: int = 0
+    height: int = 0
+    color: Tuple[int, int, int] = (255, 255, 255)
+    thickness: int = 1
+    radius: int = 0
+    text: str = ""
+    font_scale: float = 0.5
+    background: Optional[Tuple[int, int, int]] = None
+
+    def bounds(self) -> Rect:
+        """Get the area this item paints, including line thickness."""
+        pad = max(1, self.thickness) // 2 + 1
+        if self.kind in ("rect", "filled_rect"):
+            return (self.x - pad, self.y - pad, self.x + self.width + pad + 1, self.y + self.height + pad + 1)
+        if self.kind == "circle":
+            r = self.radius + pad
+            return (self.x - r, self.y - r, self.x + r + 1, self.y + r + 1)
+        if self.kind == "text":
+            return self._sprite().bounds(self.x, self.y)
+        return (self.x, self.y, self.x, self.y)
+
+    def draw(self, canvas: np.ndarray, offset_x: int = 0, offset_y: int = 0) -> None:
+        """
+        Draw the item onto a canvas.
+
+        Args:
+            canvas: Target image (may be a view of a larger canvas)
+            offset_x: X position of the canvas inside the overlay
+            offset_y: Y position of the canvas inside the overlay
+        """
+        x = self.x - offset_x
+        y = self.y - offset_y
+        if self.kind == "rect":
+            cv2.rectangle(canvas, (x, y), (x + self.width, y + self.height), self.color, self.thickness)
+        elif self.kind == "filled_rect":
+            cv2.rectangle(canvas, (x, y), (x + self.width, y + self.height), self.color, -1)
+        elif self.kind == "circle":
+            cv2.circle(canvas, (x, y), self.radius, self.color, self.thickness)
+        elif self.kind == "text":
+            # Labels are rasterized once and blitted from the sprite cache
+            self._sprite().blit(canvas, x, y)
+
+    def _sprite(self) -> LabelSprite:
+        """Get the cached sprite of a text item."""
+        return label_cache.get(self.text, cv2.FONT_HERSHEY_SIMPLEX, self.font_scale,
+                               self.color, self.thickness, self.background)
+
+@dataclass
+class FrameTiming:
+    """Timing statistics of the overlay scene (milliseconds)."""
+    last_render_ms: float = 0.0
+    average_render_ms: float = 0.0
+    last_dirty_fraction: float = 0.0
+    frames_rendered: int = 0
+    frames_skipped: int = 0
+    full_redraws: int = 0
+
+    def format(self) -> str:
+        """Format the timing for the overlay debug info."""
+        return (f"Render: {self.last_render_ms:.2f}ms (avg {self.average_render_ms:.2f}ms) "
+                f"dirty {self.last_dirty_fraction * 100:.1f}% "
+                f"frames {self.frames_rendered} skipped {self.frames_skipped} "
+                f"labels {label_cache.hit_rate * 100:.0f}% cached")
+
+def _intersects(a: Rect, b: Rect) -> bool:
+    """Check whether two rectangles overlap."""
+    return a[0] < b[2] and b[0] < a[2] and a[1] < b[3] and b[1] < a[3]
+
+def _merge_rects(rects: Iterable[Rect]) -> List[Rect]:
+    """Merge overlapping rectangles until no two of them overlap."""
+    merged: List[Rect] = []
+    for rect in rects:
+        while True:
+            for i, other in enumerate(merged):
+                if _intersects(rect, other):
+                    rect = (min(rect[0], other[0]), min(rect[1], other[1]),
+                            max(rect[2], other[2]), max(rect[3], other[3]))
+                    merged.pop(i)
+                    break
+            else:
+                break
+        merged.append(rect)
+    return merged
+
+class OverlayScene:
+    """
+    Retained-mode scene with a persistent canvas.
+
+    Each call to update() receives the complete list of items that should be
+    visible. The scene diffs it against the previous list, clears and repaints
+    only the areas covered by removed or added items and leaves the rest of
+    the canvas untouched. When nothing changed no drawing happens at all.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty scene."""
+        self.canvas: Optional[np.ndarray] = None
+        self.items: List[SceneItem] = []
+        self._item_set: Set[SceneItem] = set()
+        self.timing = FrameTiming()
+
+    def resize(self, width: int, height: int) -> None:
+        """
+        Set the canvas size, reallocating it only if the size changed.
+
+        Args:
+            width: Canvas width in pixels
+            height: Canvas height in pixels
+        """
+        if self.canvas is not None and self.canvas.shape[:2] == (height, width):
+            return
+        self.canvas = np.empty((height, width, 3), dtype=np.uint8)
+        self.canvas[:] = TRANSPARENT_COLOR
+        # Everything has to be painted again on the new canvas
+        self._item_set = set()
+        self.items = []
+
+    def invalidate(self) -> None:
+        """Force a full repaint on the next update."""
+        if self.canvas is not None:
+            self.canvas[:] = TRANSPARENT_COLOR
+        self._item_set = set()
+        self.items = []
+
+    def update(self, items: List[SceneItem]) -> bool:
+        """
+        Update the scene to show exactly the given items.
+
+        Args:
+            items: Items in painting order (later items are drawn on top)
+
+        Returns:
+            True if the canvas changed, False if the redraw was skipped
+        """
+        if self.canvas is None:
+            raise RuntimeError("OverlayScene.resize() must be called before update()")
+
+        start = time.perf_counter()
+        new_set = set(items)
+
+        # Nothing changed (same items in the same order) - skip the redraw
+        if new_set == self._item_set and items == self.items:
+            self.timing.frames_skipped += 1
+            return False
+
+        height, width = self.canvas.shape[:2]
+        canvas_rect = (0, 0, width, height)
+
+        changed = (self._item_set - new_set) | (new_set - self._item_set)
+        if not changed:
+            # Only the order changed, repaint the area of all items
+            changed = new_set
+        dirty = _merge_rects(self._clip(item.bounds(), canvas_rect) for item in changed)
+        dirty = [rect for rect in dirty if rect[2] > rect[0] and rect[3] > rect[1]]
+
+        dirty_area = sum((r[2] - r[0]) * (r[3] - r[1]) for r in dirty)
+        if dirty_area > FULL_REDRAW_FRACTION * width * height:
+            dirty = [canvas_rect]
+            dirty_area = width * height
+            self.timing.full_redraws += 1
+
+        for rect in dirty:
+            x1, y1, x2, y2 = rect
+            region = self.canvas[y1:y2, x1:x2]
+            region[:] = TRANSPARENT_COLOR
+            for item in items:
+                if _intersects(item.bounds(), rect):
+                    item.draw(region, x1, y1)
+
+        self.items = list(items)
+        self._item_set = new_set
+
+        elapsed = (time.perf_counter() - start) * 1000
+        self.timing.frames_rendered += 1
+        self.timing.last_render_ms = elapsed
+        self.timing.last_dirty_fraction = dirty_area / float(width * height) if width and height else 0.0
+        # Exponential moving average keeps the debug info stable
+        self.timing.average_render_ms = (elapsed if self.timing.frames_rendered == 1
+                                         else self.timing.average_render_ms * 0.9 + elapsed * 0.1)
+        return True
+
+    @staticmethod
+    def _clip(rect: Rect, bounds: Rect) -> Rect:
+        """Clip a rectangle to the canvas."""
+        return (max(rect[0], bounds[0]), max(rect[1], bounds[1]),
+                min(rect[2], bounds[2]), min(rect[3], bounds[3]))
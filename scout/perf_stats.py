@@ -0,0 +1,219 @@
+"""
+Performance Statistics
+
+This module provides a lightweight timing instrumentation API for the
+capture → match → draw pipeline. It handles:
+- Recording stage durations (capture, match preparation, match, NMS,
+  OCR preprocessing, OCR, draw, present)
+- Rolling p50/p95 per stage over the most recent samples
+- Loop rates (effective Hz) and dropped frames per loop
+- Formatting the numbers for the overlay HUD
+- Exporting a snapshot to a JSON file for offline tuning
+
+Recording is a perf_counter() call and a deque append, and does nothing at
+all while disabled, so instrumentation can stay in the hot paths.
+"""
+
+from typing import Optional, Dict, Any, List, Deque
+from collections import deque
+from contextlib import contextmanager
+from pathlib import Path
+import json
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# Pipeline stages in display order ("match_prep" is the template matcher's
+# grayscale conversion, "ocr_prep" the OCR preprocessing pipeline)
+STAGES = ("capture", "match_prep", "match", "nms", "ocr_prep", "ocr", "draw", "present")
+
+def _percentile(sorted_values: List[float], fraction: float) -> float:
+    """Get a percentile of sorted values (nearest rank)."""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, int(round(fraction * (len(sorted_values) - 1)))))
+    return sorted_values[index]
+
+class PerfStats:
+    """
+    Rolling timing statistics shared by the capture, matching, OCR and overlay code.
+    """
+
+    def __init__(self, window: int = 240, enabled: bool = False) -> None:
+        """
+        Initialize the statistics.
+
+        Args:
+            window: Number of recent samples kept per stage and loop
+            enabled: Whether recording is active
+        """
+        self.window = window
+        self.enabled = enabled
+        self._durations: Dict[str, Deque[float]] = {}
+        self._ticks: Dict[str, Deque[float]] = {}
+        self._dropped: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def set_enabled(self, enabled: bool) -> None:
+        """
+        Enable or disable recording.
+
+        Args:
+            enabled: Whether recording is active
+        """
+        self.enabled = enabled
+        logger.debug(f"Performance statistics {'enabled' if enabled else 'disabled'}")
+
+    def reset(self) -> None:
+        """Drop all samples and counters."""
+        with self._lock:
+            self._durations.clear()
+            self._ticks.clear()
+            self._dropped.clear()
+
+    def record(self, stage: str, duration_ms: float) -> None:
+        """
+        Record the duration of a stage.
+
+        Args:
+            stage: Stage name (see STAGES)
+            duration_ms: Duration in milliseconds
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            samples = self._durations.get(stage)
+            if samples is None:
+                samples = self._durations[stage] = deque(maxlen=self.window)
+            samples.append(duration_ms)
+
+    @contextmanager
+    def measure(self, stage: str):
+        """
+        Context manager that records the duration of its block.
+
+        Args:
+            stage: Stage name (see STAGES)
+        """
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, (time.perf_counter() - start) * 1000)
+
+    def tick(self, loop: str, interval: Optional[float] = None) -> None:
+        """
+        Mark one iteration of a loop (used for effective Hz and dropped frames).
+
+        Args:
+            loop: Loop name (e.g. "match", "draw")
+            interval: Optional expected interval in seconds; iterations that
+                      arrive later than 1.5 intervals count the missed ones as dropped
+        """
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        with self._lock:
+            ticks = self._ticks.get(loop)
+            if ticks is None:
+                ticks = self._ticks[loop] = deque(maxlen=self.window)
+            if interval and ticks:
+                gap = now - ticks[-1]
+                if gap > 1.5 * interval:
+                    self._dropped[loop] = self._dropped.get(loop, 0) + int(round(gap / interval)) - 1
+            ticks.append(now)
+
+    def drop(self, loop: str, count: int = 1) -> None:
+        """
+        Count frames of a loop that were skipped.
+
+        Args:
+            loop: Loop name
+            count: Number of dropped frames
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            self._dropped[loop] = self._dropped.get(loop, 0) + count
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Get the current statistics.
+
+        Returns:
+            Dictionary with "stages" (count, p50_ms, p95_ms, max_ms per stage)
+            and "loops" (hz, dropped per loop)
+        """
+        with self._lock:
+            durations = {stage: sorted(samples) for stage, samples in self._durations.items()}
+            ticks = {loop: list(samples) for loop, samples in self._ticks.items()}
+            dropped = dict(self._dropped)
+
+        stages = {}
+        for stage in list(STAGES) + sorted(set(durations) - set(STAGES)):
+            values = durations.get(stage)
+            if not values:
+                continue
+            stages[stage] = {
+                "count": len(values),
+                "p50_ms": round(_percentile(values, 0.5), 3),
+                "p95_ms": round(_percentile(values, 0.95), 3),
+                "max_ms": round(values[-1], 3),
+            }
+
+        loops = {}
+        for loop in sorted(set(ticks) | set(dropped)):
+            samples = ticks.get(loop, [])
+            hz = 0.0
+            if len(samples) >= 2 and samples[-1] > samples[0]:
+                hz = (len(samples) - 1) / (samples[-1] - samples[0])
+            loops[loop] = {"hz": round(hz, 2), "dropped": dropped.get(loop, 0)}
+
+        return {"stages": stages, "loops": loops}
+
+    def format_lines(self) -> List[str]:
+        """
+        Format the statistics for the overlay HUD.
+
+        Returns:
+            One line per stage and one line for the loops
+        """
+        summary = self.summary()
+        lines = [f"{stage:<10} p50 {values['p50_ms']:6.2f}ms  p95 {values['p95_ms']:6.2f}ms"
+                 for stage, values in summary["stages"].items()]
+        if summary["loops"]:
+            lines.append("  ".join(f"{loop} {values['hz']:.1f}Hz drop {values['dropped']}"
+                                   for loop, values in summary["loops"].items()))
+        return lines or ["No timing samples yet"]
+
+    def export(self, path: str, extra: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        Write the current statistics to a JSON file.
+
+        Args:
+            path: Target file path
+            extra: Optional additional data (e.g. the settings in use)
+
+        Returns:
+            True if the file was written
+        """
+        data = {"timestamp": time.strftime("%Y-%m-%d %H:%M:%S"), **self.summary()}
+        if extra:
+            data["settings"] = extra
+        try:
+            target = Path(path)
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_text(json.dumps(data, indent=2), encoding="utf-8")
+            logger.info(f"Exported performance statistics to {target}")
+            return True
+        except Exception as e:
+            logger.error(f"Error exporting performance statistics: {e}")
+            return False
+
+# Shared statistics used by the whole pipeline
+perf_stats = PerfStats()
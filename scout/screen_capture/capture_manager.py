@@ -18,6 +18,7 @@ from PyQt6.QtGui import QScreen, QPixmap, QGuiApplication, QImage
 from PyQt6.QtWidgets import QApplication
 
 from scout.window_interface import WindowInterface
+from scout.utils.frame_conversion import next_frame_id
 
 logger = logging.getLogger(__name__)
 
@@ -87,6 +88,7 @@ class CaptureManager(QObject):
         
         # Capture state
         self._last_frame: Optional[np.ndarray] = None
+        self.frame_id: Optional[int] = None  # Sequence number of the last frame (see frame_conversion)
         self._capture_timer = QTimer(self)
         self._capture_timer.timeout.connect(self._take_capture)
         self._capture_active = False
@@ -435,6 +437,17 @@ class CaptureManager(QObject):
         except Exception as e:
             self.error_occurred.emit(f"Capture error: {str(e)}")
     
+    def _publish_frame(self, frame: np.ndarray) -> None:
+        """
+        Number a captured frame, keep it as the last frame and emit it.
+        
+        Args:
+            frame: Captured frame
+        """
+        self.frame_id = next_frame_id()
+        self._last_frame = frame
+        self.frame_captured.emit(frame)
+    
     def _capture_screen(self) -> None:
         """Capture the current screen."""
         try:
@@ -454,10 +467,7 @@ class CaptureManager(QObject):
             
             # Convert to numpy array
             image = pixmap.toImage()
-            self._last_frame = qimage_to_numpy(image)
-            
-            # Emit signal
-            self.frame_captured.emit(self._last_frame)
+            self._publish_frame(qimage_to_numpy(image))
         except Exception as e:
             self.error_occurred.emit(f"Screen capture error: {str(e)}")
     
@@ -472,8 +482,7 @@ class CaptureManager(QObject):
                 frame = self._window_interface.capture_screenshot()
                 if frame is not None:
                     logger.debug(f"Successfully captured frame via window interface: {frame.shape}")
-                    self._last_frame = frame
-                    self.frame_captured.emit(self._last_frame)
+                    self._publish_frame(frame)
                     return
                 else:
                     logger.warning("Window interface's capture_screenshot returned None")
@@ -561,11 +570,8 @@ class CaptureManager(QObject):
                 else:
                     logger.debug(f"Captured image dimensions match expected: {width}x{height}")
                 
-                self._last_frame = frame
-                logger.debug(f"Successfully captured window: {self._last_frame.shape}")
-                
-                # Emit signal
-                self.frame_captured.emit(self._last_frame)
+                logger.debug(f"Successfully captured window: {frame.shape}")
+                self._publish_frame(frame)
             else:
                 logger.warning("Cannot capture window: No window handle or geometry available")
                 self.error_occurred.emit("Cannot capture window: No window handle or geometry")
@@ -5,6 +5,8 @@ This module provides the CaptureTab class which implements the UI for
 selecting and capturing screens and windows.
 """
 
+from typing import Optional
+
 from PyQt6.QtCore import Qt, QTimer
 from PyQt6.QtGui import QPixmap, QImage, QPainter, QColor, QGuiApplication
 from PyQt6.QtWidgets import (
@@ -19,7 +21,7 @@ import cv2
 from scout.screen_capture.capture_manager import CaptureManager
 from scout.screen_capture.screen_list_model import ScreenListModel
 from scout.screen_capture.window_list_model import WindowListModel
-from scout.screen_capture.utils import numpy_to_qimage
+from scout.utils.frame_conversion import frame_cache
 
 
 class ImageViewer(QLabel):
@@ -34,49 +36,43 @@ class ImageViewer(QLabel):
         self.setMinimumSize(320, 240)
         self.setStyleSheet("background-color: #222; border: 1px solid #444;")
         self.setText("No image captured")
-        self._pixmap = None
+        self._image = None
+        self._frame_id = None
     
-    def set_image(self, image: np.ndarray) -> None:
+    def set_image(self, image: np.ndarray, frame_id: Optional[int] = None) -> None:
         """
         Set the image to display.
         
         Args:
             image: Numpy array containing the image
+            frame_id: Sequence number of the frame (avoids checksumming it)
         """
         if image is None:
             self.clear()
             return
             
-        # Convert numpy array to QImage
-        qimage = numpy_to_qimage(image)
-        
-        # Convert to pixmap and set
-        self._pixmap = QPixmap.fromImage(qimage)
+        # Conversion happens in _update_display, once per frame and size
+        self._image = image
+        self._frame_id = frame_id
         self._update_display()
     
     def clear(self) -> None:
         """Clear the displayed image."""
-        self._pixmap = None
+        self._image = None
         self.setText("No image captured")
     
     def _update_display(self) -> None:
         """Update the display with the current pixmap."""
-        if self._pixmap is None:
+        if self._image is None:
             return
             
-        # Scale pixmap to fit the label while maintaining aspect ratio
-        scaled_pixmap = self._pixmap.scaled(
-            self.width(), self.height(),
-            Qt.AspectRatioMode.KeepAspectRatio,
-            Qt.TransformationMode.SmoothTransformation
-        )
-        
-        self.setPixmap(scaled_pixmap)
+        # Convert and scale to fit the label while maintaining aspect ratio
+        self.setPixmap(frame_cache.pixmap(self._image, (self.width(), self.height()), self._frame_id))
     
     def resizeEvent(self, event) -> None:
         """Handle resize events to update the displayed image."""
         super().resizeEvent(event)
-        if self._pixmap is not None:
+        if self._image is not None:
             self._update_display()
 
 
@@ -292,7 +288,7 @@ class CaptureTab(QWidget):
         Args:
             frame: Captured frame as numpy array
         """
-        self.image_viewer.set_image(frame)
+        self.image_viewer.set_image(frame, self.capture_manager.frame_id)
     
     def _on_error(self, error_msg: str) -> None:
         """
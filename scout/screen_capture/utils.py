@@ -5,6 +5,7 @@ from PyQt6.QtGui import QImage, QPixmap
 from PyQt6.QtCore import QRect, QPoint, QSize, Qt
 import cv2
 import logging
+from scout.utils.frame_conversion import wrap_frame, frame_cache
 
 # Set up logging
 logger = logging.getLogger(__name__)
@@ -47,22 +48,11 @@ def numpy_to_qimage(arr: np.ndarray) -> QImage:
         arr: The numpy array in BGR format (OpenCV standard)
         
     Returns:
-        A QImage in RGB format
+        A QImage that owns its pixels
     """
     try:
-        # Convert BGR to RGB
-        if arr.shape[2] == 3:  # BGR format
-            rgb = cv2.cvtColor(arr, cv2.COLOR_BGR2RGB)
-        elif arr.shape[2] == 4:  # BGRA format
-            rgb = cv2.cvtColor(arr, cv2.COLOR_BGRA2RGBA)
-        else:
-            logger.error(f"Unsupported array shape: {arr.shape}")
-            return QImage()
-            
-        # Create QImage from numpy array
-        height, width, channels = rgb.shape
-        bytes_per_line = channels * width
-        return QImage(rgb.data, width, height, bytes_per_line, QImage.Format.Format_RGB888)
+        # Qt reads the BGR/BGRA buffer directly; copy() detaches it from the array
+        return wrap_frame(arr).copy()
     except Exception as e:
         logger.error(f"Error converting numpy array to QImage: {e}")
         return QImage()
@@ -78,8 +68,7 @@ def numpy_to_qpixmap(arr: np.ndarray) -> QPixmap:
         A QPixmap for display in Qt widgets
     """
     try:
-        qimage = numpy_to_qimage(arr)
-        return QPixmap.fromImage(qimage)
+        return frame_cache.pixmap(arr)
     except Exception as e:
         logger.error(f"Error converting numpy array to QPixmap: {e}")
         return QPixmap()
@@ -0,0 +1,231 @@
+"""
+Spatial Index
+
+This module provides a uniform grid index for hit-testing and culling.
+It handles:
+- Storing axis-aligned boxes (or points) under arbitrary hashable keys
+- Incremental insert, move and remove (only the touched cells change)
+- Rectangle queries for viewport culling
+- Point and nearest-item queries for mouse hit-testing
+
+Positions, template matches and OCR regions are all small compared to the
+game window, so a uniform grid with a cell size close to the typical item
+size keeps every query down to a handful of cells instead of a scan over
+all items.
+"""
+
+from typing import Optional, Dict, List, Set, Tuple, Hashable, Callable, Iterator
+import logging
+import math
+
+logger = logging.getLogger(__name__)
+
+Box = Tuple[float, float, float, float]  # x1, y1, x2, y2 (x2/y2 exclusive)
+Cell = Tuple[int, int]
+
+class SpatialGridIndex:
+    """
+    Uniform grid over axis-aligned boxes.
+
+    Each key is stored in every cell its box overlaps. Moving an item only
+    touches the cells that it enters or leaves, so items can be updated on
+    every frame or mouse move without rebuilding the index.
+    """
+
+    def __init__(self, cell_size: int = 64) -> None:
+        """
+        Initialize an empty index.
+
+        Args:
+            cell_size: Width and height of a grid cell in pixels
+        """
+        self.cell_size = max(1, int(cell_size))
+        self._boxes: Dict[Hashable, Box] = {}
+        self._cells: Dict[Hashable, Tuple[Cell, ...]] = {}
+        self._grid: Dict[Cell, Set[Hashable]] = {}
+
+    def __len__(self) -> int:
+        return len(self._boxes)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._boxes
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(self._boxes)
+
+    def get_box(self, key: Hashable) -> Optional[Box]:
+        """Get the box stored for a key."""
+        return self._boxes.get(key)
+
+    def clear(self) -> None:
+        """Remove all items."""
+        self._boxes.clear()
+        self._cells.clear()
+        self._grid.clear()
+
+    def _cell_range(self, box: Box) -> Tuple[Cell, ...]:
+        """Get all cells a box overlaps."""
+        size = self.cell_size
+        x1, y1, x2, y2 = box
+        # A point (zero-sized box) still occupies the cell it lies in
+        right = max(x1, x2 - 1)
+        bottom = max(y1, y2 - 1)
+        return tuple((cx, cy)
+                     for cx in range(int(x1 // size), int(right // size) + 1)
+                     for cy in range(int(y1 // size), int(bottom // size) + 1))
+
+    def insert(self, key: Hashable, box: Box) -> None:
+        """
+        Insert or move an item.
+
+        Args:
+            key: Item key
+            box: Item area (x1, y1, x2, y2), x2/y2 exclusive
+        """
+        box = tuple(box)
+        if self._boxes.get(key) == box:
+            return
+
+        new_cells = self._cell_range(box)
+        old_cells = self._cells.get(key, ())
+        if new_cells != old_cells:
+            new_set = set(new_cells)
+            for cell in old_cells:
+                if cell not in new_set:
+                    members = self._grid.get(cell)
+                    if members is not None:
+                        members.discard(key)
+                        if not members:
+                            del self._grid[cell]
+            old_set = set(old_cells)
+            for cell in new_cells:
+                if cell not in old_set:
+                    self._grid.setdefault(cell, set()).add(key)
+            self._cells[key] = new_cells
+
+        self._boxes[key] = box
+
+    def insert_point(self, key: Hashable, x: float, y: float) -> None:
+        """
+        Insert or move a point item.
+
+        Args:
+            key: Item key
+            x: X coordinate
+            y: Y coordinate
+        """
+        self.insert(key, (x, y, x, y))
+
+    def remove(self, key: Hashable) -> bool:
+        """
+        Remove an item.
+
+        Args:
+            key: Item key
+
+        Returns:
+            True if the item was indexed
+        """
+        if key not in self._boxes:
+            return False
+        for cell in self._cells.pop(key, ()):
+            members = self._grid.get(cell)
+            if members is not None:
+                members.discard(key)
+                if not members:
+                    del self._grid[cell]
+        del self._boxes[key]
+        return True
+
+    def sync(self, boxes: Dict[Hashable, Box]) -> None:
+        """
+        Make the index contain exactly the given items.
+
+        Unchanged items are not touched, moved items are re-bucketed and
+        missing items are removed.
+
+        Args:
+            boxes: Dictionary of key to box
+        """
+        for key in [key for key in self._boxes if key not in boxes]:
+            self.remove(key)
+        for key, box in boxes.items():
+            self.insert(key, box)
+
+    def query_rect(self, rect: Box) -> List[Hashable]:
+        """
+        Get all items whose box intersects a rectangle.
+
+        Args:
+            rect: Query area (x1, y1, x2, y2), x2/y2 exclusive
+
+        Returns:
+            Keys of the intersecting items
+        """
+        x1, y1, x2, y2 = rect
+        result = []
+        seen = set()
+        for cell in self._cell_range(rect):
+            for key in self._grid.get(cell, ()):
+                if key in seen:
+                    continue
+                seen.add(key)
+                bx1, by1, bx2, by2 = self._boxes[key]
+                # Points (zero-sized boxes) are treated as a single pixel
+                if bx1 < x2 and x1 < max(bx2, bx1 + 1) and by1 < y2 and y1 < max(by2, by1 + 1):
+                    result.append(key)
+        return result
+
+    def query_point(self, x: float, y: float, radius: float = 0.0) -> List[Hashable]:
+        """
+        Get all items within a distance of a point.
+
+        Args:
+            x: X coordinate
+            y: Y coordinate
+            radius: Maximum distance between the point and an item's box
+
+        Returns:
+            Keys of the items, closest first
+        """
+        hits = []
+        for key in self.query_rect((x - radius, y - radius, x + radius + 1, y + radius + 1)):
+            distance = self._distance(self._boxes[key], x, y)
+            if distance <= radius:
+                hits.append((distance, key))
+        hits.sort(key=lambda hit: hit[0])
+        return [key for _, key in hits]
+
+    def nearest(self, x: float, y: float, max_distance: float,
+                predicate: Optional[Callable[[Hashable], bool]] = None) -> Optional[Hashable]:
+        """
+        Get the item closest to a point.
+
+        Args:
+            x: X coordinate
+            y: Y coordinate
+            max_distance: Maximum distance between the point and an item's box
+            predicate: Optional filter for candidate keys
+
+        Returns:
+            Key of the closest item, or None if no item is close enough
+        """
+        best = None
+        best_distance = max_distance
+        for key in self.query_rect((x - max_distance, y - max_distance,
+                                    x + max_distance + 1, y + max_distance + 1)):
+            if predicate is not None and not predicate(key):
+                continue
+            distance = self._distance(self._boxes[key], x, y)
+            if distance <= best_distance:
+                best_distance = distance
+                best = key
+        return best
+
+    @staticmethod
+    def _distance(box: Box, x: float, y: float) -> float:
+        """Distance between a point and a box (0 inside the box)."""
+        x1, y1, x2, y2 = box
+        dx = max(x1 - x, 0.0, x - max(x1, x2 - 1))
+        dy = max(y1 - y, 0.0, y - max(y1, y2 - 1))
+        return math.hypot(dx, dy)
@@ -14,7 +14,9 @@ from pathlib import Path
 from dataclasses import dataclass
 from scout.window_manager import WindowManager
 from scout.sound_manager import SoundManager
+from scout.perf_stats import perf_stats
 import os
+import time
 
 logger = logging.getLogger(__name__)
 
@@ -446,6 +448,10 @@ class TemplateMatcher:
         
         # Initialize list for matches
         matches = []
+        timed = perf_stats.enabled
+        stage_start = time.perf_counter() if timed else 0.0
+        match_ms = 0.0
+        nms_ms = 0.0
         
         # Convert image to grayscale if it's color
         if len(image.shape) == 3:
@@ -453,6 +459,8 @@ class TemplateMatcher:
             logger.debug("Converted image to grayscale for template matching")
         else:
             gray_image = image
+        if timed:
+            perf_stats.record("match_prep", (time.perf_counter() - stage_start) * 1000)
             
         # Tracking stats for logging
         total_raw_matches = 0
@@ -475,6 +483,8 @@ class TemplateMatcher:
                 template = cv2.cvtColor(template, cv2.COLOR_BGR2GRAY)
             
             # Apply template matching
+            if timed:
+                stage_start = time.perf_counter()
             try:
                 result = cv2.matchTemplate(gray_image, template, self.method)
             except Exception as e:
@@ -483,6 +493,9 @@ class TemplateMatcher:
             
             # Find matches above threshold
             locations = np.where(result >= self.confidence_threshold)
+            if timed:
+                match_ms += (time.perf_counter() - stage_start) * 1000
+                stage_start = time.perf_counter()
             raw_match_count = len(locations[0]) if len(locations[0]) > 0 else 0
             total_raw_matches += raw_match_count
             
@@ -548,10 +561,16 @@ class TemplateMatcher:
                         logger.debug(f"  Match {template_match_count}: Position=({x}, {y}), Confidence={confidence:.4f}")
                     
                 logger.debug(f"Added {template_match_count} matches for {template_name}")
+            if timed:
+                nms_ms += (time.perf_counter() - stage_start) * 1000
             
             # Extend the list of all matches
             matches.extend(template_matches)
         
+        if timed:
+            perf_stats.record("match", match_ms)
+            perf_stats.record("nms", nms_ms)
+        
         # Sort matches by confidence (highest first)
         matches.sort(key=lambda m: m[5], reverse=True)
         
@@ -8,6 +8,10 @@ import re
 from dataclasses import dataclass
 from scout.debug_window import DebugWindow
 from scout.window_manager import WindowManager
+from scout.ocr_preprocessing import PreprocessingPipeline, create_coordinate_pipeline
+from scout.change_detector import RegionChangeDetector
+from scout.ocr_regions import OCRRegion, OCRRegionRegistry, REFRESH_ON_DEMAND
+from scout.perf_stats import perf_stats
 import mss
 
 logger = logging.getLogger(__name__)
@@ -43,11 +47,25 @@ class TextOCR(QObject):
     - Coordinate extraction and validation
     - Debug visualization of the captured region and OCR results
     - Configurable update frequency
+    - Change-triggered mode that only runs OCR when the region changes
+    
+    Trigger modes:
+    - "timer": OCR runs at the configured update frequency
+    - "change": a cheap pixel-change check runs at the update frequency and
+      OCR only runs when the region changed, when an automation event requests
+      an update (see request_update) or when the slow safety poll fires
     """
     
     # Signals
     debug_image = pyqtSignal(str, object, dict)  # name, image, metadata
     coordinates_updated = pyqtSignal(GameCoordinates)  # Emits when coordinates are read
+    # Internal signal so request_update() can be called from worker threads
+    _update_requested = pyqtSignal(int)  # delay in ms
+    
+    TRIGGER_MODES = ("timer", "change")
+    
+    # Name under which the coordinate region is published in an OCR region registry
+    REGION_NAME = "game_coordinates"
     
     def __init__(self, debug_window: DebugWindow, window_manager: WindowManager) -> None:
         """
@@ -70,9 +88,29 @@ class TextOCR(QObject):
         # Initialize coordinates
         self.current_coords = GameCoordinates()
         
+        # Preprocessing pipeline (reuses its buffers between OCR ticks)
+        self.preprocessing = create_coordinate_pipeline()
+        
+        # Change-triggered mode settings
+        self.trigger_mode = "timer"
+        self.safety_poll_interval = 10.0  # Seconds between forced OCR runs in change mode
+        self.event_settle_delay = 150  # Milliseconds to wait after an automation event
+        self.change_detector = RegionChangeDetector(threshold=2.0)
+        self.ocr_runs = 0
+        self.change_checks = 0
+        
         # Create timer for updates
         self.update_timer = QTimer()
-        self.update_timer.timeout.connect(self._process_region)
+        self.update_timer.timeout.connect(self._on_update_timer)
+        
+        # Safety poll timer for change-triggered mode
+        self.safety_timer = QTimer()
+        self.safety_timer.timeout.connect(self._process_region)
+        
+        self._update_requested.connect(self._schedule_update)
+        
+        # Optional region registry that receives the OCR results
+        self.region_registry: Optional[OCRRegionRegistry] = None
         
         logger.debug("TextOCR initialized")
     
@@ -120,11 +158,111 @@ class TextOCR(QObject):
         """
         self.region = region
         logger.info(f"OCR region set to: {region}")
+        self._register_region()
         
         # If active, force an immediate capture
         if self.active:
             self._process_region()
     
+    def set_region_registry(self, registry: OCRRegionRegistry) -> None:
+        """
+        Publish OCR results into a region registry.
+        
+        The coordinate region is registered with the on-demand policy, the
+        registry never runs OCR on it itself but serves the values read here.
+        
+        Args:
+            registry: Registry to publish to
+        """
+        self.region_registry = registry
+        self._register_region()
+    
+    def _register_region(self) -> None:
+        """
+        Register the current coordinate region in the registry.
+        
+        The registry gets its own copy of the preprocessing pipeline: pipelines
+        reuse their output buffers, and the registry's on-demand refreshes may
+        run while the live OCR tick is still reading the buffers of this one.
+        """
+        if not self.region_registry or not self.region:
+            return
+        self.region_registry.register(
+            OCRRegion(
+                name=self.REGION_NAME,
+                left=self.region['left'],
+                top=self.region['top'],
+                width=self.region['width'],
+                height=self.region['height'],
+                profile="coordinates",
+                psm=6,
+                refresh_policy=REFRESH_ON_DEMAND
+            ),
+            pipeline=PreprocessingPipeline.from_dict(self.preprocessing.to_dict())
+        )
+    
+    def set_preprocessing(self, pipeline: PreprocessingPipeline) -> None:
+        """
+        Set the preprocessing pipeline applied before OCR.
+        
+        Args:
+            pipeline: Pipeline to use (e.g. one tuned in the OCR debug tab)
+        """
+        self.preprocessing = pipeline
+        self._register_region()
+        logger.debug(f"OCR preprocessing set to '{pipeline.name}'")
+    
+    def set_trigger_mode(self, mode: str, safety_poll_interval: Optional[float] = None,
+                         change_threshold: Optional[float] = None) -> None:
+        """
+        Set how OCR runs are triggered.
+        
+        Args:
+            mode: "timer" for fixed-frequency OCR, "change" for change-triggered OCR
+            safety_poll_interval: Optional seconds between forced OCR runs in change mode
+            change_threshold: Optional mean pixel difference that counts as a change
+        """
+        if mode not in self.TRIGGER_MODES:
+            logger.warning(f"Unknown OCR trigger mode '{mode}', using 'timer'")
+            mode = "timer"
+            
+        self.trigger_mode = mode
+        if safety_poll_interval is not None:
+            self.safety_poll_interval = max(1.0, safety_poll_interval)
+        if change_threshold is not None:
+            self.change_detector.threshold = change_threshold
+        self.change_detector.reset()
+        
+        # Restart safety poll with the new settings
+        if self.active:
+            self._update_safety_timer()
+        logger.debug(f"OCR trigger mode set to '{mode}' (safety poll {self.safety_poll_interval}s)")
+    
+    def request_update(self, delay_ms: Optional[int] = None) -> None:
+        """
+        Request an OCR run, e.g. after the view was moved by automation.
+        
+        Safe to call from any thread. The run is delayed slightly so the game
+        has time to render the new coordinates.
+        
+        Args:
+            delay_ms: Optional delay before the run (default: event_settle_delay)
+        """
+        self._update_requested.emit(self.event_settle_delay if delay_ms is None else delay_ms)
+    
+    def _schedule_update(self, delay_ms: int) -> None:
+        """Schedule a requested OCR run on the Qt thread."""
+        if not self.active:
+            return
+        QTimer.singleShot(max(0, delay_ms), self._process_region)
+    
+    def _update_safety_timer(self) -> None:
+        """Start or stop the safety poll depending on the trigger mode."""
+        if self.trigger_mode == "change":
+            self.safety_timer.start(int(self.safety_poll_interval * 1000))
+        else:
+            self.safety_timer.stop()
+    
     def start(self) -> None:
         """Start OCR processing."""
         if not self.region:
@@ -134,7 +272,10 @@ class TextOCR(QObject):
         self.active = True
         interval = int(1000 / self.update_frequency)
         self.update_timer.start(interval)
-        logger.info(f"OCR processing started with {self.update_frequency} updates/sec")
+        self.change_detector.reset()
+        self._update_safety_timer()
+        logger.info(f"OCR processing started with {self.update_frequency} updates/sec "
+                    f"(trigger mode: {self.trigger_mode})")
         
         # Force initial capture
         self._process_region()
@@ -143,7 +284,9 @@ class TextOCR(QObject):
         """Stop OCR processing."""
         self.active = False
         self.update_timer.stop()
-        logger.info("OCR processing stopped")
+        self.safety_timer.stop()
+        logger.info(f"OCR processing stopped ({self.ocr_runs} OCR runs, "
+                    f"{self.change_checks} change checks)")
     
     def _validate_coordinate(self, value: Optional[int], coord_type: str) -> Optional[int]:
         """
@@ -236,54 +379,98 @@ class TextOCR(QObject):
             
         return coords
 
-    def _process_region(self) -> None:
-        """Capture and process the OCR region."""
+    def _capture_region(self) -> Optional[np.ndarray]:
+        """
+        Capture the OCR region.
+        
+        Returns:
+            Captured region as numpy array, or None on failure
+        """
+        # Get window position from window manager
+        if not self.window_manager.find_window():
+            logger.warning("Target window not found")
+            return None
+        
+        # Set up capture region using the coordinates directly
+        capture_region = {
+            'left': self.region['left'],
+            'top': self.region['top'],
+            'width': self.region['width'],
+            'height': self.region['height']
+        }
+        
+        logger.debug(f"Capturing region at: {capture_region}")
+        
+        # Capture region using mss
+        with mss.mss() as sct:
+            return np.array(sct.grab(capture_region))
+    
+    def _on_update_timer(self) -> None:
+        """Handle the update timer according to the trigger mode."""
+        if self.trigger_mode != "change":
+            self._process_region()
+            return
+            
         if not self.region:
             return
             
         try:
-            # Get window position from window manager
-            if not self.window_manager.find_window():
-                logger.warning("Target window not found")
+            screenshot = self._capture_region()
+            if screenshot is None:
                 return
             
-            # Set up capture region using the coordinates directly
-            capture_region = {
-                'left': self.region['left'],
-                'top': self.region['top'],
-                'width': self.region['width'],
-                'height': self.region['height']
-            }
-            
-            logger.debug(f"Capturing region at: {capture_region}")
+            self.change_checks += 1
+            if self.change_detector.has_changed(screenshot):
+                logger.debug(f"OCR region changed (diff={self.change_detector.last_difference:.2f})")
+                self._process_screenshot(screenshot)
+        except Exception as e:
+            logger.error(f"Error checking OCR region for changes: {e}", exc_info=True)
+    
+    def _process_region(self) -> None:
+        """Capture and process the OCR region."""
+        if not self.region:
+            return
             
-            # Capture region using mss
-            with mss.mss() as sct:
-                screenshot = np.array(sct.grab(capture_region))
+        try:
+            screenshot = self._capture_region()
             
             if screenshot is None:
                 logger.warning("Failed to capture OCR region")
                 return
             
-            # Process image to get white text on black background
-            # Convert to grayscale
-            gray = cv2.cvtColor(screenshot, cv2.COLOR_BGR2GRAY)
+            # Keep the change detector in sync so the same content is not OCR'd twice
+            self.change_detector.has_changed(screenshot)
+            self._process_screenshot(screenshot)
             
-            # Apply binary threshold to get black and white image
-            _, binary = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+        except Exception as e:
+            logger.error(f"Error processing OCR region: {e}", exc_info=True)
+    
+    def _process_screenshot(self, screenshot: np.ndarray) -> None:
+        """
+        Run OCR on a captured region and publish the results.
+        
+        Args:
+            screenshot: Captured OCR region
+        """
+        try:
+            self.ocr_runs += 1
             
-            # Invert if text is black (majority of pixels are white)
-            white_pixel_count = np.sum(binary == 255)
-            total_pixels = binary.size
-            if white_pixel_count > total_pixels / 2:
-                logger.debug("Inverting image (black text detected)")
-                binary = cv2.bitwise_not(binary)
+            # Restart the safety poll, a fresh result was just produced
+            if self.trigger_mode == "change" and self.active:
+                self.safety_timer.start(int(self.safety_poll_interval * 1000))
+            
+            # Process image to get white text on black background
+            # (grayscale, Otsu threshold, invert if text is black)
+            with perf_stats.measure("ocr_prep"):
+                binary = self.preprocessing.process(screenshot)
+            logger.debug(f"Preprocessing timings: {self.preprocessing.format_timings()}")
             
             # Perform OCR on the processed image
-            text = pytesseract.image_to_string(
-                binary,
-                config='--psm 6'  # Assume uniform block of text
-            )
+            with perf_stats.measure("ocr"):
+                text = pytesseract.image_to_string(
+                    binary,
+                    config='--psm 6'  # Assume uniform block of text
+                )
             
             # Clean text
             raw_text = text.strip()
@@ -295,6 +482,9 @@ class TextOCR(QObject):
             self.current_coords = new_coords
             self.coordinates_updated.emit(new_coords)
             
+            if self.region_registry:
+                self.region_registry.publish(self.REGION_NAME, raw_text)
+            
             # Log OCR results
             logger.info("OCR Results:")
             logger.info(f"  Raw text: '{raw_text}'")
@@ -319,7 +509,8 @@ class TextOCR(QObject):
                 binary,
                 metadata={
                     "text": raw_text,
-                    "coordinates": str(new_coords)
+                    "coordinates": str(new_coords),
+                    "preprocess": f"{self.preprocessing.last_total_ms:.2f}ms"
                 },
                 save=True
             )
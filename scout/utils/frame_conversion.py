@@ -0,0 +1,231 @@
+"""
+Frame conversion utilities for TB Scout.
+
+This module provides a shared cache for converting OpenCV frames into Qt
+images for the debug views. It handles:
+- Wrapping BGR, BGRA and grayscale numpy buffers as QImages without a copy
+- Identifying frames by an explicit sequence number (see next_frame_id) or
+  a content checksum
+- Converting and scaling each frame once per target size, no matter how
+  many tabs show it
+- Preparing scaled QImages on worker threads, so the GUI thread only has
+  to upload them as QPixmaps
+"""
+
+from typing import Optional, Tuple, Hashable
+from collections import OrderedDict
+import itertools
+import threading
+import zlib
+import logging
+import numpy as np
+from PyQt6.QtGui import QImage, QPixmap
+from PyQt6.QtCore import Qt
+
+logger = logging.getLogger(__name__)
+
+Size = Tuple[int, int]  # width, height
+
+def wrap_frame(frame: np.ndarray) -> QImage:
+    """
+    Wrap a numpy frame as a QImage without copying the pixels.
+
+    The QImage reads directly from the numpy buffer, so the frame must stay
+    alive and unchanged while the QImage is used. Call .copy() on the result
+    (or convert it with QPixmap.fromImage / QImage.scaled, which create new
+    images) before the frame can be released or reused.
+
+    Args:
+        frame: Contiguous uint8 frame (grayscale, BGR or BGRA)
+
+    Returns:
+        QImage sharing the frame's memory (null image for unsupported frames)
+    """
+    if frame is None or frame.dtype != np.uint8 or frame.ndim not in (2, 3):
+        return QImage()
+    if not frame.flags['C_CONTIGUOUS']:
+        frame = np.ascontiguousarray(frame)
+
+    height, width = frame.shape[:2]
+    stride = frame.strides[0]
+    if frame.ndim == 2:
+        return QImage(frame.data, width, height, stride, QImage.Format.Format_Grayscale8)
+    channels = frame.shape[2]
+    if channels == 3:
+        # Qt reads BGR directly, no cv2.cvtColor needed
+        return QImage(frame.data, width, height, stride, QImage.Format.Format_BGR888)
+    if channels == 4:
+        # BGRA in memory is ARGB32 on little-endian machines
+        return QImage(frame.data, width, height, stride, QImage.Format.Format_RGB32)
+    logger.error(f"Unsupported frame shape: {frame.shape}")
+    return QImage()
+
+_frame_ids = itertools.count(1)
+
+def next_frame_id() -> int:
+    """
+    Get a new frame sequence number.
+
+    Producers number their frames once and pass the number along with the
+    frame, so views can look conversions up without checksumming the pixels.
+    Numbers are unique across all producers.
+
+    Returns:
+        Frame sequence number
+    """
+    return next(_frame_ids)
+
+def frame_checksum(frame: np.ndarray) -> int:
+    """
+    Get a checksum of a frame's content.
+
+    Used as frame identity when the caller has no sequence number. It costs
+    a fraction of a convert-and-scale pass and also detects buffers that are
+    reused for new content; callers with sequence numbers should pass them.
+
+    Args:
+        frame: Frame as numpy array
+
+    Returns:
+        Checksum of shape and pixel data
+    """
+    data = frame if frame.flags['C_CONTIGUOUS'] else np.ascontiguousarray(frame)
+    return zlib.crc32(memoryview(data).cast("B"), zlib.crc32(str(frame.shape).encode()))
+
+class FrameConversionCache:
+    """
+    Cache of converted frames keyed by frame identity and target size.
+
+    Scaled QImages can be prepared from any thread; QPixmaps are created on
+    the GUI thread and shared by every view that shows the same frame at the
+    same size.
+    """
+
+    def __init__(self, max_entries: int = 32) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of converted images kept in memory
+        """
+        self.max_entries = max_entries
+        self._images: "OrderedDict[Tuple[Hashable, Optional[Size]], QImage]" = OrderedDict()
+        self._pixmaps: "OrderedDict[Tuple[Hashable, Optional[Size]], QPixmap]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        # Statistics
+        self.conversions = 0
+        self.hits = 0
+
+    @staticmethod
+    def frame_key(frame: np.ndarray, frame_id: Optional[Hashable] = None) -> Hashable:
+        """
+        Get the identity of a frame.
+
+        Args:
+            frame: Frame as numpy array
+            frame_id: Optional sequence number or other unique frame id
+
+        Returns:
+            Cache key of the frame
+        """
+        return ("id", frame_id) if frame_id is not None else ("sum", frame_checksum(frame))
+
+    def _remember(self, cache: OrderedDict, key: tuple, value) -> None:
+        """Insert a value into an LRU dictionary."""
+        cache[key] = value
+        cache.move_to_end(key)
+        while len(cache) > self.max_entries:
+            cache.popitem(last=False)
+
+    def image(self, frame: np.ndarray, target_size: Optional[Size] = None,
+              frame_id: Optional[Hashable] = None) -> QImage:
+        """
+        Get a converted (and optionally scaled) QImage of a frame.
+
+        Thread-safe; can be called from worker threads to prepare images
+        before the GUI thread asks for the pixmap.
+
+        Args:
+            frame: Frame as numpy array (grayscale, BGR or BGRA)
+            target_size: Optional (width, height) to fit the image into, keeping the aspect ratio
+            frame_id: Optional sequence number of the frame
+
+        Returns:
+            QImage that owns its pixels (null image for unsupported frames)
+        """
+        return self._image((self.frame_key(frame, frame_id), target_size), frame, target_size)
+
+    def _image(self, key: tuple, frame: np.ndarray, target_size: Optional[Size]) -> QImage:
+        """Get or create the converted image of a cache key."""
+        with self._lock:
+            image = self._images.get(key)
+            if image is not None:
+                self._images.move_to_end(key)
+                self.hits += 1
+                return image
+
+        wrapped = wrap_frame(frame)
+        if wrapped.isNull():
+            return wrapped
+
+        # scaled() and copy() both detach from the numpy buffer
+        if target_size is not None:
+            image = wrapped.scaled(target_size[0], target_size[1],
+                                   Qt.AspectRatioMode.KeepAspectRatio,
+                                   Qt.TransformationMode.SmoothTransformation)
+        else:
+            image = wrapped.copy()
+
+        with self._lock:
+            self.conversions += 1
+            self._remember(self._images, key, image)
+        return image
+
+    def prefetch(self, frame: np.ndarray, target_size: Optional[Size] = None,
+                 frame_id: Optional[Hashable] = None) -> None:
+        """
+        Convert a frame ahead of time (for worker threads).
+
+        Args:
+            frame: Frame as numpy array
+            target_size: Optional (width, height) to fit the image into
+            frame_id: Optional sequence number of the frame
+        """
+        self.image(frame, target_size, frame_id)
+
+    def pixmap(self, frame: np.ndarray, target_size: Optional[Size] = None,
+               frame_id: Optional[Hashable] = None) -> QPixmap:
+        """
+        Get a shared QPixmap of a frame (GUI thread only).
+
+        Args:
+            frame: Frame as numpy array (grayscale, BGR or BGRA)
+            target_size: Optional (width, height) to fit the pixmap into, keeping the aspect ratio
+            frame_id: Optional sequence number of the frame
+
+        Returns:
+            Converted pixmap (null pixmap for unsupported frames)
+        """
+        key = (self.frame_key(frame, frame_id), target_size)
+        pixmap = self._pixmaps.get(key)
+        if pixmap is not None:
+            self._pixmaps.move_to_end(key)
+            self.hits += 1
+            return pixmap
+
+        image = self._image(key, frame, target_size)
+        if image.isNull():
+            return QPixmap()
+        pixmap = QPixmap.fromImage(image)
+        self._remember(self._pixmaps, key, pixmap)
+        return pixmap
+
+    def clear(self) -> None:
+        """Remove all cached images and pixmaps."""
+        with self._lock:
+            self._images.clear()
+        self._pixmaps.clear()
+
+# Shared cache used by all debug image views
+frame_cache = FrameConversionCache()
@@ -7,13 +7,14 @@ import logging
 from time import sleep
 from pathlib import Path
 import pytesseract
-from mss import mss
 import time
 from PyQt6.QtCore import QObject, pyqtSignal, QTimer
 from scout.template_matcher import TemplateMatcher
 from scout.config_manager import ConfigManager
 from scout.debug_window import DebugWindow
 from scout.window_manager import WindowManager
+from scout.ocr_preprocessing import create_scanner_digits_pipeline
+from scout.ocr_regions import minimap_coordinate_regions, capture_regions
 from datetime import datetime
 
 # Set Tesseract executable path
@@ -382,6 +383,8 @@ class ScanWorker(QObject):
         self.scanner.debug_image = self.debug_image
         self.last_debug_update = 0
         self.debug_update_interval = 0.5  # Update debug images every 0.5 seconds
+        # Preprocessing pipeline for the coordinate digits (buffers reused per region size)
+        self.preprocessing = create_scanner_digits_pipeline()
         
     def run(self) -> None:
         """Run the scanning process."""
@@ -462,62 +465,34 @@ class ScanWorker(QObject):
             config = ConfigManager()
             scanner_settings = config.get_scanner_settings()
             
-            # Get minimap dimensions
-            minimap_left = scanner_settings.get('minimap_left', 0)
-            minimap_top = scanner_settings.get('minimap_top', 0)
-            minimap_width = scanner_settings.get('minimap_width', 0)
-            minimap_height = scanner_settings.get('minimap_height', 0)
+            # Coordinate regions below the minimap, captured with a single grab
+            regions = minimap_coordinate_regions(scanner_settings)
+            crops = capture_regions({region.name: region.bounds for region in regions})
             
-            # Define regions relative to minimap
-            coordinate_regions = {
-                'x': {
-                    'left': minimap_left,
-                    'top': minimap_top + minimap_height,
-                    'width': minimap_width // 3,
-                    'height': 20
-                },
-                'y': {
-                    'left': minimap_left + minimap_width // 3,
-                    'top': minimap_top + minimap_height,
-                    'width': minimap_width // 3,
-                    'height': 20
-                },
-                'k': {
-                    'left': minimap_left + (2 * minimap_width) // 3,
-                    'top': minimap_top + minimap_height,
-                    'width': minimap_width // 3,
-                    'height': 20
-                }
-            }
-            
-            with mss() as sct:
-                for coord_type, region in coordinate_regions.items():
-                    # Capture and process image
-                    screenshot = np.array(sct.grab(region))
-                    gray = cv2.cvtColor(screenshot, cv2.COLOR_BGR2GRAY)
-                    gray = cv2.convertScaleAbs(gray, alpha=2.0, beta=0)
-                    blurred = cv2.GaussianBlur(gray, (3, 3), 0)
-                    thresh = cv2.adaptiveThreshold(
-                        blurred, 255,
-                        cv2.ADAPTIVE_THRESH_GAUSSIAN_C,
-                        cv2.THRESH_BINARY,
-                        11, 2
-                    )
-                    
-                    # Try OCR
-                    text = pytesseract.image_to_string(
-                        thresh,
-                        config='--psm 7 --oem 3 -c tessedit_char_whitelist=0123456789'
-                    )
-                    
-                    # Clean text and get value
-                    try:
-                        value = int(''.join(filter(str.isdigit, text.strip())))
-                    except ValueError:
-                        value = 0
-                    
-                    # Emit image and value
-                    self.debug_image.emit(thresh, coord_type, value)
+            for region in regions:
+                coord_type = region.name
+                screenshot = crops.get(coord_type)
+                if screenshot is None:
+                    continue
+                thresh = self.preprocessing.process(screenshot)
+                
+                # Try OCR
+                text = pytesseract.image_to_string(
+                    thresh,
+                    config=region.tesseract_config()
+                )
+                
+                # Clean text and get value
+                try:
+                    value = int(''.join(filter(str.isdigit, text.strip())))
+                except ValueError:
+                    value = 0
+                
+                logger.debug(f"{coord_type} preprocessing: {self.preprocessing.format_timings()}")
+                
+                # Emit image and value (copy, the pipeline reuses its buffer
+                # for the next region of the same size)
+                self.debug_image.emit(thresh.copy(), coord_type, value)
                     
         except Exception as e:
             logger.error(f"Error updating debug images: {e}")
@@ -0,0 +1,26 @@
+"""
+Tests for the automation expression language.
+"""
+
+from scout.automation.expressions import evaluate, evaluate_condition
+
+
+def test_unset_bare_name_condition_is_false():
+    assert not evaluate_condition("found", {})
+    assert not evaluate_condition("keep_going", None)
+    assert not evaluate_condition("found or ready", {})
+    assert evaluate_condition("not found", {})
+    assert evaluate_condition("found", {"found": True})
+
+
+def test_bare_name_operand_is_literal_text():
+    assert evaluate_condition("${state} == idle", {"state": "idle"})
+    assert evaluate_condition("${state} in [idle, busy]", {"state": "busy"})
+    assert evaluate("idle", {}) == "idle"
+
+
+def test_true_false_strings_equal_keywords():
+    assert evaluate_condition("${a} == true", {"a": "true"})
+    assert evaluate_condition("${a} == true", {"a": True})
+    assert evaluate_condition("${a} == false", {"a": "False"})
+    assert not evaluate_condition("${a} != true", {"a": "true"})
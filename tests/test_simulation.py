@@ -0,0 +1,38 @@
+"""
+Tests for the fast-forward simulation runtime.
+"""
+
+import numpy as np
+
+from scout.automation.core import AutomationCore
+from scout.automation.simulation import SimulationRuntime, StaticFrameSource
+
+
+def _core() -> AutomationCore:
+    """Create an automation core without game, window or OCR components."""
+    return AutomationCore(None, None, None, None, None, None)
+
+
+def test_run_records_inputs_of_executed_sequence():
+    core = _core()
+    sequence = core.create_sequence("login")
+    sequence.actions.extend([
+        {"type": "click", "params": {"x": 10, "y": 20}},
+        {"type": "type_text", "params": {"text": "name"}},
+        {"type": "wait", "params": {"duration": 5}},
+        {"type": "click", "params": {"x": 30, "y": 40, "button": "right"}},
+    ])
+    runtime = SimulationRuntime(core, StaticFrameSource(np.zeros((10, 10, 3), dtype=np.uint8)))
+
+    result = runtime.run("login")
+
+    assert result.success
+    assert not result.timed_out
+    assert [(event.kind, event.args) for event in result.inputs] == [
+        ("click", {"x": 10, "y": 20, "button": "left", "clicks": 1}),
+        ("type", {"text": "name"}),
+        ("click", {"x": 30, "y": 40, "button": "right", "clicks": 1}),
+    ]
+    # The wait passes on the virtual clock between the two clicks
+    assert result.inputs[1].time < 5 <= result.inputs[2].time
+    assert result.simulated_time >= 5